@@ -1,57 +1,190 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
 from pydantic.networks import HttpUrl
 
 from iamcore.client.api_key import Client as ApiKeyClient
 from iamcore.client.application import Client as AppClient
 from iamcore.client.application_resource_type import Client as AppResourceTypeClient
 from iamcore.client.auth import Client as AuthClient
+from iamcore.client.base.breaker import CircuitBreakerPolicy, CircuitBreakerTransport, CircuitEvent, CircuitState
+from iamcore.client.base.bulk import BulkResult, FailurePolicy
+from iamcore.client.base.cache import CacheBackend, MemoryCacheBackend, ReferenceCache
+from iamcore.client.base.changefeed import ChangeEvent, ChangeFeed, ChangeType
+from iamcore.client.base.conditional import ConditionalTransport
+from iamcore.client.base.hedging import HedgePolicy, HedgingTransport
+from iamcore.client.base.irn import LazyIRN, lazy_irns_context
+from iamcore.client.base.irn_index import IRNIndex
+from iamcore.client.base.limits import ADMIN, EVALUATE, EndpointLimit, LimitedTransport
+from iamcore.client.base.retry import RetryBudget, RetryPolicy, RetryTransport
+from iamcore.client.base.singleflight import SingleFlightTransport
+from iamcore.client.base.snapshot import SnapshotStore
+from iamcore.client.base.transport import PooledTransport, Transport
 from iamcore.client.config import BaseConfig
 from iamcore.client.evaluate import Client as EvaluateClient
+from iamcore.client.evaluate import DecisionCache, OfflineEvaluator, PolicyEngine, PolicySnapshot
 from iamcore.client.group import Client as GroupClient
 from iamcore.client.policy import Client as PolicyClient
 from iamcore.client.resource import Client as ResourceClient
+from iamcore.client.resource import ReconcilePlan, ResourceReconciler
 from iamcore.client.tenant import Client as TenantClient
 from iamcore.client.user import Client as UserClient
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+    from typing_extensions import Self
+
 
 class Client:
     """Iamcore client."""
 
-    def __init__(self, iamcore_url: str, iamcore_issuer_url: str, iamcore_client_timeout: int = 10) -> None:
-        # Client configuration
+    def __init__(
+        self,
+        iamcore_url: str,
+        iamcore_issuer_url: str,
+        iamcore_client_timeout: int = 10,
+        *,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_idle_timeout: Optional[float] = None,
+        transport: Optional[Transport] = None,
+        decision_cache: Optional[DecisionCache] = None,
+        reference_cache: Optional[ReferenceCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        limits: Optional[Mapping[str, EndpointLimit]] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        on_circuit_change: Optional[Callable[[CircuitEvent], None]] = None,
+        hedging: Optional[HedgePolicy] = None,
+        single_flight: bool = False,
+        conditional_requests: bool = False,
+        lazy_irns: bool = False,
+    ) -> None:
+        # Client configuration; pool settings left unset fall back to IAMCORE_CLIENT_POOL_* variables
+        pool_settings: dict[str, Any] = {
+            "iamcore_client_pool_connections": pool_connections,
+            "iamcore_client_pool_maxsize": pool_maxsize,
+            "iamcore_client_pool_idle_timeout": pool_idle_timeout,
+        }
         self.config = BaseConfig(
             iamcore_url=HttpUrl(iamcore_url),
             iamcore_issuer_url=HttpUrl(iamcore_issuer_url),
             iamcore_client_timeout=iamcore_client_timeout,
+            **{name: value for name, value in pool_settings.items() if value is not None},
+        )
+        # Keep-alive transport shared by every sub-client
+        transport = transport or PooledTransport(
+            pool_connections=self.config.iamcore_client_pool_connections,
+            pool_maxsize=self.config.iamcore_client_pool_maxsize,
+            idle_timeout=self.config.iamcore_client_pool_idle_timeout,
         )
+        if limits:
+            transport = LimitedTransport(transport, limits)
+        if circuit_breaker is not None:
+            listeners = [on_circuit_change] if on_circuit_change else []
+            transport = CircuitBreakerTransport(transport, circuit_breaker, listeners=listeners)
+        if hedging is not None:
+            transport = HedgingTransport(transport, hedging)
+        if retry is not None:
+            transport = RetryTransport(transport, retry, retry_budget)
+        if conditional_requests:
+            transport = ConditionalTransport(transport)
+        if single_flight:
+            transport = SingleFlightTransport(transport)
+        self.transport: Transport = transport
+        url = self.config.iamcore_url_str
+        timeout = self.config.iamcore_client_timeout
         # Authentication client
-        self.auth = AuthClient(self.config.get_iamcore_issuer_url, self.config.iamcore_client_timeout)
+        self.auth = AuthClient(self.config.get_iamcore_issuer_url, timeout, self.transport)
         # Resource clients
-        self.api_key = ApiKeyClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.application = AppClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.application_resource_type = AppResourceTypeClient(
-            self.config.iamcore_url_str, self.config.iamcore_client_timeout
-        )
-        self.evaluate = EvaluateClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.group = GroupClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.policy = PolicyClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.resource = ResourceClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.tenant = TenantClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
-        self.user = UserClient(self.config.iamcore_url_str, self.config.iamcore_client_timeout)
+        self.api_key = ApiKeyClient(url, timeout, self.transport)
+        self.application = AppClient(url, timeout, self.transport, reference_cache)
+        self.application_resource_type = AppResourceTypeClient(url, timeout, self.transport, reference_cache)
+        self.evaluate = EvaluateClient(url, timeout, self.transport, decision_cache)
+        self.group = GroupClient(url, timeout, self.transport)
+        self.policy = PolicyClient(url, timeout, self.transport)
+        self.resource = ResourceClient(url, timeout, self.transport)
+        self.tenant = TenantClient(url, timeout, self.transport, reference_cache)
+        self.user = UserClient(url, timeout, self.transport)
+        for sub_client in (
+            self.auth,
+            self.api_key,
+            self.application,
+            self.application_resource_type,
+            self.evaluate,
+            self.group,
+            self.policy,
+            self.resource,
+            self.tenant,
+            self.user,
+        ):
+            sub_client.lazy_irns = lazy_irns
+
+    def close(self) -> None:
+        """Close the shared transport and its pooled connections."""
+        self.transport.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
 
 __all__ = [
+    "ADMIN",
+    "EVALUATE",
     "ApiKeyClient",
     "AppClient",
     "AppResourceTypeClient",
     "AuthClient",
     "BaseConfig",
+    "BulkResult",
+    "CacheBackend",
+    "ChangeEvent",
+    "ChangeFeed",
+    "ChangeType",
+    "CircuitBreakerPolicy",
+    "CircuitBreakerTransport",
+    "CircuitEvent",
+    "CircuitState",
     "Client",
+    "ConditionalTransport",
+    "DecisionCache",
+    "EndpointLimit",
     "EvaluateClient",
+    "FailurePolicy",
     "GroupClient",
+    "HedgePolicy",
+    "HedgingTransport",
+    "IRNIndex",
+    "LazyIRN",
+    "LimitedTransport",
+    "MemoryCacheBackend",
+    "OfflineEvaluator",
     "PolicyClient",
+    "PolicyEngine",
+    "PolicySnapshot",
+    "PooledTransport",
+    "ReconcilePlan",
+    "ReferenceCache",
     "ResourceClient",
+    "ResourceReconciler",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryTransport",
+    "SingleFlightTransport",
+    "SnapshotStore",
     "TenantClient",
+    "Transport",
     "UserClient",
+    "lazy_irns_context",
 ]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from pydantic.networks import HttpUrl
+
+from iamcore.client.config import BaseConfig
+
+from .api_key import Client as ApiKeyClient
+from .application import Client as AppClient
+from .application_resource_type import Client as AppResourceTypeClient
+from .auth import Client as AuthClient
+from .base import AsyncHTTPClientWithTimeout
+from .breaker import AsyncCircuitBreakerTransport
+from .conditional import AsyncConditionalTransport
+from .evaluate import Client as EvaluateClient
+from .group import Client as GroupClient
+from .hedging import AsyncHedgingTransport
+from .limits import AsyncLimitedTransport
+from .policy import Client as PolicyClient
+from .resource import Client as ResourceClient
+from .retry import AsyncRetryTransport
+from .singleflight import AsyncSingleFlightTransport
+from .tenant import Client as TenantClient
+from .transport import DEFAULT_MAX_CONNECTIONS, AsyncTransport, HttpxAsyncTransport
+from .user import Client as UserClient
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from iamcore.client.base.breaker import CircuitBreakerPolicy, CircuitEvent
+    from iamcore.client.base.cache import ReferenceCache
+    from iamcore.client.base.hedging import HedgePolicy
+    from iamcore.client.base.limits import EndpointLimit
+    from iamcore.client.base.retry import RetryBudget, RetryPolicy
+    from iamcore.client.evaluate.cache import DecisionCache
+
+
+class Client:
+    """Asyncio iamcore client."""
+
+    def __init__(
+        self,
+        iamcore_url: str,
+        iamcore_issuer_url: str,
+        iamcore_client_timeout: int = 10,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[AsyncTransport] = None,
+        decision_cache: Optional[DecisionCache] = None,
+        reference_cache: Optional[ReferenceCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        limits: Optional[Mapping[str, EndpointLimit]] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        on_circuit_change: Optional[Callable[[CircuitEvent], None]] = None,
+        hedging: Optional[HedgePolicy] = None,
+        single_flight: bool = False,
+        conditional_requests: bool = False,
+        lazy_irns: bool = False,
+    ) -> None:
+        # Client configuration
+        self.config = BaseConfig(
+            iamcore_url=HttpUrl(iamcore_url),
+            iamcore_issuer_url=HttpUrl(iamcore_issuer_url),
+            iamcore_client_timeout=iamcore_client_timeout,
+        )
+        # Keep-alive transport shared by every sub-client
+        transport = transport or HttpxAsyncTransport(
+            max_connections=max_connections,
+            max_keepalive_connections=self.config.iamcore_client_pool_maxsize,
+            idle_timeout=self.config.iamcore_client_pool_idle_timeout,
+        )
+        if limits:
+            transport = AsyncLimitedTransport(transport, limits)
+        if circuit_breaker is not None:
+            listeners = [on_circuit_change] if on_circuit_change else []
+            transport = AsyncCircuitBreakerTransport(transport, circuit_breaker, listeners=listeners)
+        if hedging is not None:
+            transport = AsyncHedgingTransport(transport, hedging)
+        if retry is not None:
+            transport = AsyncRetryTransport(transport, retry, retry_budget)
+        if conditional_requests:
+            transport = AsyncConditionalTransport(transport)
+        if single_flight:
+            transport = AsyncSingleFlightTransport(transport)
+        self.transport: AsyncTransport = transport
+        url = self.config.iamcore_url_str
+        timeout = self.config.iamcore_client_timeout
+        # Authentication client
+        self.auth = AuthClient(self.config.get_iamcore_issuer_url, timeout, self.transport)
+        # Resource clients
+        self.api_key = ApiKeyClient(url, timeout, self.transport)
+        self.application = AppClient(url, timeout, self.transport, reference_cache)
+        self.application_resource_type = AppResourceTypeClient(url, timeout, self.transport, reference_cache)
+        self.evaluate = EvaluateClient(url, timeout, self.transport, decision_cache)
+        self.group = GroupClient(url, timeout, self.transport)
+        self.policy = PolicyClient(url, timeout, self.transport)
+        self.resource = ResourceClient(url, timeout, self.transport)
+        self.tenant = TenantClient(url, timeout, self.transport, reference_cache)
+        self.user = UserClient(url, timeout, self.transport)
+        for sub_client in (
+            self.auth,
+            self.api_key,
+            self.application,
+            self.application_resource_type,
+            self.evaluate,
+            self.group,
+            self.policy,
+            self.resource,
+            self.tenant,
+            self.user,
+        ):
+            sub_client.lazy_irns = lazy_irns
+
+    async def aclose(self) -> None:
+        """Close the shared transport and its pooled connections."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+
+__all__ = [
+    "ApiKeyClient",
+    "AppClient",
+    "AppResourceTypeClient",
+    "AsyncCircuitBreakerTransport",
+    "AsyncConditionalTransport",
+    "AsyncHTTPClientWithTimeout",
+    "AsyncHedgingTransport",
+    "AsyncLimitedTransport",
+    "AsyncRetryTransport",
+    "AsyncSingleFlightTransport",
+    "AsyncTransport",
+    "AuthClient",
+    "Client",
+    "EvaluateClient",
+    "GroupClient",
+    "HttpxAsyncTransport",
+    "PolicyClient",
+    "ResourceClient",
+    "TenantClient",
+    "UserClient",
+]
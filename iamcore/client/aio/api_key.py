@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.api_key.dto import ApiKey, IamApiKeysResponse
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.exceptions import IAMException, err_chain
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from iamcore.client.base.models import PaginatedSearchFilter
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core API Keys."""
+
+    BASE_PATH = "principals"
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+
+    @err_chain(IAMException)
+    async def create(self, auth_headers: dict[str, str], principal_id: str) -> None:
+        path = f"{principal_id}/api-keys"
+        headers = {"Content-Type": "application/json", **auth_headers}
+        await self._post(path, headers=headers)
+
+    @err_chain(IAMException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        principal_id: str,
+        search_filter: Optional[PaginatedSearchFilter] = None,
+    ) -> IamApiKeysResponse:
+        query = search_filter.model_dump(by_alias=True, exclude_none=True) if search_filter else None
+        path = f"{principal_id}/api-keys"
+        response = await self._get(path, headers=headers, params=query)
+        return IamApiKeysResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        principal_id: str,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[ApiKey, None]:
+        return generic_search_all(
+            auth_headers,
+            lambda headers, search_filter: self.search(
+                headers,
+                principal_id,
+                search_filter=search_filter,
+            ),
+            None,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
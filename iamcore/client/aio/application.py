@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.application.dto import (
+    Application,
+    ApplicationSearchFilter,
+    CreateApplication,
+    IamApplicationResponse,
+    IamApplicationsResponse,
+)
+from iamcore.client.base.cache import APPLICATION, aread_through, invalidate
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.exceptions import IAMException, err_chain
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.base.cache import ReferenceCache
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Application API."""
+
+    BASE_PATH = "applications"
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[AsyncTransport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
+
+    @err_chain(IAMException)
+    async def create(self, auth_headers: dict[str, str], params: CreateApplication) -> str:
+        payload = params.model_dump_json(by_alias=True, exclude_none=True)
+        created_response = await self._post(data=payload, headers=auth_headers)
+        location: Optional[str] = created_response.headers.get("Location")
+        if not location:
+            msg = "Location header is missing"
+            raise IAMException(msg)
+
+        return location.split("/")[-1]
+
+    @err_chain(IAMException)
+    async def get(self, auth_headers: dict[str, str], irn: IRN) -> Application:
+        async def load() -> Application:
+            response = await self._get(irn.to_base64(), headers=auth_headers)
+            return IamApplicationResponse.from_response(response).data
+
+        return await aread_through(self.cache, APPLICATION, f"{irn}/", auth_headers, load)
+
+    @err_chain(IAMException)
+    async def policies_attach(
+        self,
+        auth_headers: dict[str, str],
+        application_irn: IRN,
+        policies_ids: list[str],
+    ) -> None:
+        path = f"{application_irn.to_base64()}/policies/attach"
+        payload = {"policyIDs": policies_ids}
+        await self._put(path, data=json.dumps(payload), headers=auth_headers)
+        invalidate(self.cache, APPLICATION, f"{application_irn}/")
+
+    @err_chain(IAMException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        application_filter: Optional[ApplicationSearchFilter] = None,
+    ) -> IamApplicationsResponse:
+        query = application_filter.model_dump(by_alias=True, exclude_none=True) if application_filter else None
+        response = await self._get(headers=headers, params=query)
+        return IamApplicationsResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        application_filter: Optional[ApplicationSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Application, None]:
+        return generic_search_all(
+            auth_headers, self.search, application_filter, concurrency=concurrency, ordered=ordered
+        )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.application_resource_type.dto import (
+    ApplicationResourceType,
+    CreateApplicationResourceType,
+    IamApplicationResourceTypeResponse,
+    IamApplicationResourceTypesResponse,
+)
+from iamcore.client.base.cache import APPLICATION_RESOURCE_TYPE, aread_through, invalidate, query_scope
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.exceptions import IAMException, err_chain
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.base.cache import ReferenceCache
+    from iamcore.client.base.models import PaginatedSearchFilter
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Application Resource Type API."""
+
+    BASE_PATH: str = "applications"
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[AsyncTransport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
+
+    @err_chain(IAMException)
+    async def create(
+        self,
+        auth_headers: dict[str, str],
+        application_irn: IRN,
+        params: CreateApplicationResourceType,
+    ) -> str:
+        path = f"{application_irn.to_base64()}/resource-types"
+        payload = params.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(path, data=payload, headers=auth_headers)
+        invalidate(self.cache, APPLICATION_RESOURCE_TYPE, f"{application_irn}/")
+        location: Optional[str] = response.headers.get("Location")
+        if not location:
+            msg = "Location header not found in response"
+            raise IAMException(msg)
+
+        return location.split("/")[-1]
+
+    @err_chain(IAMException)
+    async def get(
+        self,
+        auth_headers: dict[str, str],
+        application_irn: IRN,
+        type_irn: IRN,
+    ) -> ApplicationResourceType:
+        path = f"{application_irn.to_base64()}/resource-types/{type_irn.to_base64()}"
+
+        async def load() -> ApplicationResourceType:
+            response = await self._get(path, headers=auth_headers)
+            return IamApplicationResourceTypeResponse.from_response(response).data
+
+        scope = f"{application_irn}/{type_irn}/"
+        return await aread_through(self.cache, APPLICATION_RESOURCE_TYPE, scope, auth_headers, load)
+
+    @err_chain(IAMException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        application_irn: IRN,
+        resource_type_filter: Optional[PaginatedSearchFilter] = None,
+    ) -> IamApplicationResourceTypesResponse:
+        path = f"{application_irn.to_base64()}/resource-types"
+        query = resource_type_filter.model_dump(by_alias=True, exclude_none=True) if resource_type_filter else None
+        response = await self._get(path, headers=headers, params=query)
+        return IamApplicationResourceTypesResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        application_irn: IRN,
+        resource_type_filter: Optional[PaginatedSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[ApplicationResourceType, None]:
+        def search_all() -> AsyncGenerator[ApplicationResourceType, None]:
+            return generic_search_all(
+                auth_headers,
+                lambda headers, search_filter: self.search(
+                    headers,
+                    application_irn,
+                    search_filter,
+                ),
+                resource_type_filter,
+                concurrency=concurrency,
+                ordered=ordered,
+            )
+
+        if self.cache is None:
+            return search_all()
+        query = resource_type_filter.model_dump(by_alias=True, exclude_none=True) if resource_type_filter else None
+        scope = f"{application_irn}/?{query_scope(query)}"
+        return self._cached_search_all(self.cache, scope, auth_headers, search_all)
+
+    @staticmethod
+    async def _cached_search_all(
+        cache: ReferenceCache,
+        scope: str,
+        auth_headers: dict[str, str],
+        search_all: Callable[[], AsyncGenerator[ApplicationResourceType, None]],
+    ) -> AsyncGenerator[ApplicationResourceType, None]:
+        async def load() -> list[ApplicationResourceType]:
+            return [item async for item in search_all()]
+
+        for item in await cache.aget_or_load(APPLICATION_RESOURCE_TYPE, scope, auth_headers, load):
+            yield item
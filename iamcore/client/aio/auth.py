@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import http.client
+import logging
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlencode
+
+from iamcore.client.auth.dto import TokenResponse
+from iamcore.client.exceptions import IAMException, IAMUnauthorizedException, err_chain
+
+from .base import AsyncHTTPClientWithTimeout
+
+if TYPE_CHECKING:
+    from .transport import AsyncTransport
+
+logger = logging.getLogger(__name__)
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async IAMCore auth client."""
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, api_version=None, transport=transport)
+
+    @err_chain(error=IAMException)
+    async def get_token_with_password(
+        self,
+        *,
+        realm: str,
+        client_id: str,
+        username: str,
+        password: str,
+    ) -> TokenResponse:
+        """
+        Retrieves an OAuth2 token using the password grant type.
+
+        Args:
+            realm: The realm name (tenant ID).
+            client_id: The client ID.
+            username: The username.
+            password: The password.
+
+        Returns:
+            The OAuth2 token.
+        """
+        return await self._request_token(
+            realm,
+            {
+                "grant_type": "password",
+                "client_id": client_id,
+                "username": username,
+                "password": password,
+            },
+        )
+
+    @err_chain(error=IAMException)
+    async def get_token_with_refresh_token(
+        self,
+        *,
+        realm: str,
+        client_id: str,
+        refresh_token: str,
+    ) -> TokenResponse:
+        """
+        Retrieves a new OAuth2 token using the refresh_token grant type.
+
+        Args:
+            realm: The realm name (tenant ID).
+            client_id: The client ID.
+            refresh_token: The refresh token of a previously issued token.
+
+        Returns:
+            The OAuth2 token.
+        """
+        return await self._request_token(
+            realm,
+            {
+                "grant_type": "refresh_token",
+                "client_id": client_id,
+                "refresh_token": refresh_token,
+            },
+        )
+
+    async def _request_token(self, realm: str, payload_dict: dict[str, str]) -> TokenResponse:
+        url = f"realms/{realm}/protocol/openid-connect/token"
+        payload = urlencode(payload_dict)
+        response = await self._post(
+            url,
+            data=payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        if response.status_code == http.client.OK:
+            logger.debug("Token response: %s", response.text)
+            return TokenResponse.from_response(response)
+
+        msg = (
+            f"Unauthorized: {response.json()}"
+            if response.status_code == http.client.UNAUTHORIZED
+            else f"Unexpected error code: {response.status_code}"
+        )
+        raise IAMUnauthorizedException(msg)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+from collections import deque
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from iamcore.client.base.client import APIVersion, HTTPMethod, append_path_to_url
+from iamcore.client.base.exception_handler import ResponseHandler
+from iamcore.client.base.irn import LAZY_IRNS
+from iamcore.client.base.models import SEARCH_ALL_PAGE_SIZE, IamEntitiesResponse, PaginatedSearchFilter
+from iamcore.client.exceptions import IAMUnauthorizedException
+
+from .transport import AsyncTransport, HttpxAsyncTransport
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+
+class AsyncHTTPClientWithTimeout:
+    """Asynchronous HTTP client with timeout."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        api_version: Optional[APIVersion] = APIVersion.V1,
+        transport: Optional[AsyncTransport] = None,
+    ) -> None:
+        self.base_url: str = base_url
+        if api_version:
+            self.base_url = append_path_to_url(self.base_url, api_version)
+        self.timeout: int = timeout
+        # Parse response IRNs lazily, see `LazyIRN`.
+        self.lazy_irns = False
+        self.transport: AsyncTransport = transport or HttpxAsyncTransport()
+
+    async def _request(
+        self,
+        method: HTTPMethod,
+        path: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a request to the HTTP server."""
+        if not headers:
+            msg = "Missing authorization headers"
+            raise IAMUnauthorizedException(msg)
+
+        if "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json"
+
+        url = append_path_to_url(self.base_url, path)
+        resp = await self.transport.request(
+            method.value,
+            url,
+            data=data,
+            headers=headers,
+            timeout=self.timeout,
+            params=_stringify_params(params),
+        )
+        if self.lazy_irns:
+            setattr(resp, LAZY_IRNS, True)
+        return ResponseHandler.handle_response(resp)
+
+    async def _get(
+        self,
+        path: str = "",
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a GET request to the HTTP server."""
+        return await self._request(HTTPMethod.GET, path, data=data, headers=headers, params=params)
+
+    async def _post(
+        self,
+        path: str = "",
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a POST request to the HTTP server."""
+        return await self._request(HTTPMethod.POST, path, data=data, headers=headers, params=params)
+
+    async def _put(
+        self,
+        path: str = "",
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a PUT request to the HTTP server."""
+        return await self._request(HTTPMethod.PUT, path, data=data, headers=headers, params=params)
+
+    async def _patch(
+        self,
+        path: str = "",
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a PATCH request to the HTTP server."""
+        return await self._request(HTTPMethod.PATCH, path, data=data, headers=headers, params=params)
+
+    async def _delete(
+        self,
+        path: str = "",
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+    ) -> httpx.Response:
+        """Make a DELETE request to the HTTP server."""
+        return await self._request(HTTPMethod.DELETE, path, data=data, headers=headers, params=params)
+
+
+def _stringify_params(params: RequestParams) -> RequestParams:
+    """Render query values the way `requests` does, so both clients send identical query strings."""
+    if params is None or isinstance(params, str):
+        return params
+    return {key: str(value) for key, value in params.items()}
+
+
+T = TypeVar("T")
+
+_AsyncSearchFunc = Callable[[dict[str, str], PaginatedSearchFilter], Awaitable[IamEntitiesResponse[T]]]
+
+
+async def generic_search_all(
+    auth_headers: dict[str, str],
+    func: _AsyncSearchFunc[T],
+    search_filter: Optional[PaginatedSearchFilter] = None,
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> AsyncGenerator[T, None]:
+    """
+    Generic async generator to handle paginated search requests and yield all results.
+
+    Args:
+        auth_headers: Authentication headers for the API call.
+        func: The specific async search function to call for each page.
+        search_filter: An optional filter. A copy will be used to avoid side effects.
+        concurrency: Maximum number of pages fetched in parallel once the first page has
+            revealed the total count. `1` fetches pages strictly one after another.
+        ordered: When prefetching concurrently, yield items in page order. Otherwise pages
+            are yielded as soon as they arrive.
+
+    Yields:
+        All entities of type T from the paginated search.
+    """
+    paginator_filter = search_filter.model_copy(deep=True) if search_filter else PaginatedSearchFilter()
+    paginator_filter.page_size = SEARCH_ALL_PAGE_SIZE
+
+    if concurrency > 1:
+        async for item in _prefetch_search_all(auth_headers, func, paginator_filter, concurrency, ordered=ordered):
+            yield item
+        return
+
+    page = 1
+    items_yielded = 0
+    total_items = -1
+
+    while True:
+        paginator_filter.page = page
+        resp = await func(auth_headers, paginator_filter)
+
+        if total_items == -1:
+            total_items = resp.count
+
+        if not resp.data:
+            break
+
+        for item in resp.data:
+            yield item
+        items_yielded += len(resp.data)
+
+        if items_yielded >= total_items:
+            break
+
+        page += 1
+
+
+async def _prefetch_search_all(
+    auth_headers: dict[str, str],
+    func: _AsyncSearchFunc[T],
+    paginator_filter: PaginatedSearchFilter,
+    concurrency: int,
+    *,
+    ordered: bool,
+) -> AsyncGenerator[T, None]:
+    """Fetch the first page, then the remaining ones as tasks with at most `concurrency` in flight."""
+    paginator_filter.page = 1
+    first = await func(auth_headers, paginator_filter)
+    if not first.data:
+        return
+    for item in first.data:
+        yield item
+
+    page_size = first.page_size or paginator_filter.page_size or SEARCH_ALL_PAGE_SIZE
+    last_page = math.ceil(first.count / page_size)
+    if last_page <= 1:
+        return
+
+    async def fetch(page: int) -> IamEntitiesResponse[T]:
+        return await func(auth_headers, paginator_filter.model_copy(update={"page": page}))
+
+    pages = iter(range(2, last_page + 1))
+    in_flight = deque(asyncio.ensure_future(fetch(page)) for page in itertools.islice(pages, concurrency))
+    try:
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                completed, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                done = [task for task in in_flight if task in completed]
+                for task in done:
+                    in_flight.remove(task)
+            for task in done:
+                data = (await task).data
+                # Keep the window full while the caller consumes this page.
+                in_flight.extend(asyncio.ensure_future(fetch(page)) for page in itertools.islice(pages, 1))
+                for item in data:
+                    yield item
+    finally:
+        # Drop pages nobody is going to read if the consumer stops early or a page fails.
+        for task in in_flight:
+            task.cancel()
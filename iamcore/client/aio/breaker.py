@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.base.breaker import SERVER_ERROR_STATUS, CircuitBreakerBase, CircuitBreakerPolicy, CircuitEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+
+class AsyncCircuitBreakerTransport(CircuitBreakerBase):
+    """
+    Async transport wrapper failing fast on endpoints that keep failing or timing out.
+
+    Same rules as `CircuitBreakerTransport`.
+
+    Args:
+        transport: The async transport actually sending the requests.
+        policy: Breaker rules. Defaults to `CircuitBreakerPolicy()`.
+        listeners: Called with a `CircuitEvent` on every state change.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        policy: Optional[CircuitBreakerPolicy] = None,
+        *,
+        listeners: Iterable[Callable[[CircuitEvent], None]] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, listeners, clock)
+        self.transport = transport
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request unless the circuit of its endpoint is open."""
+        circuit = self._circuit(method, url)
+        self._emit(circuit.before_call())
+        started = self._clock()
+        try:
+            resp = await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+        except Exception:
+            self._emit(circuit.after_call(failed=True, duration=self._clock() - started))
+            raise
+        self._emit(circuit.after_call(failed=resp.status_code >= SERVER_ERROR_STATUS, duration=self._clock() - started))
+        return resp
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from iamcore.client.base.bulk import UNSENT_ERRORS, BulkResult, FailurePolicy, chunked, is_transient
+from iamcore.client.base.retry import RetryPolicy
+from iamcore.client.exceptions import IAMException
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Iterable, Iterator
+
+T = TypeVar("T")
+X = TypeVar("X")
+
+
+async def call_with_retry(
+    policy: Optional[RetryPolicy],
+    func: Callable[..., Awaitable[T]],
+    *args: Any,
+    idempotent: bool = True,
+) -> T:
+    """Async counterpart of `iamcore.client.base.bulk.call_with_retry`."""
+    import httpx  # noqa: PLC0415
+
+    unsent = (*UNSENT_ERRORS, httpx.ConnectError, httpx.ConnectTimeout)
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            result = await func(*args)
+        except IAMException as e:
+            if (
+                policy is None
+                or attempt >= policy.max_attempts
+                or not is_transient(e, policy, idempotent=idempotent, unsent=unsent)
+            ):
+                raise
+            delay = policy.backoff(attempt)
+        else:
+            return result
+        await asyncio.sleep(delay)
+
+
+async def run_bulk(
+    work: Callable[[int, X], Awaitable[BulkResult]],
+    items: Iterable[X],
+    *,
+    concurrency: int,
+    on_failure: FailurePolicy,
+) -> AsyncGenerator[BulkResult, None]:
+    """Async counterpart of `iamcore.client.base.bulk.run_bulk`, running items as tasks."""
+    if concurrency < 1:
+        msg = f"concurrency must be positive, got {concurrency}"
+        raise ValueError(msg)
+    pending: Iterator[tuple[int, X]] = enumerate(items)
+    in_flight = {asyncio.ensure_future(work(index, item)) for index, item in itertools.islice(pending, concurrency)}
+    try:
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if not result.ok and on_failure == FailurePolicy.ABORT:
+                    pending = iter(())
+                in_flight.update(
+                    asyncio.ensure_future(work(index, item)) for index, item in itertools.islice(pending, 1)
+                )
+                yield result
+    finally:
+        # Items in flight are cancelled if the consumer stops early.
+        for task in in_flight:
+            task.cancel()
+
+
+def run_chunked(
+    send: Callable[[list[X]], Awaitable[object]],
+    items: Iterable[X],
+    *,
+    chunk_size: int,
+    concurrency: int,
+    on_failure: FailurePolicy,
+    retry: Optional[RetryPolicy],
+) -> AsyncGenerator[BulkResult, None]:
+    """Async counterpart of `iamcore.client.base.bulk.run_chunked`."""
+    if on_failure != FailurePolicy.RETRY:
+        retry = None
+    elif retry is None:
+        retry = RetryPolicy()
+
+    async def run_chunk(position: int, chunk: list[X]) -> BulkResult:
+        try:
+            await call_with_retry(retry, send, chunk)
+        except IAMException as e:
+            return BulkResult(position, chunk, error=e)
+        return BulkResult(position, chunk)
+
+    return run_bulk(run_chunk, chunked(items, chunk_size), concurrency=concurrency, on_failure=on_failure)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.base.conditional import DEFAULT_MAX_VALIDATED_RESPONSES, ConditionalBase, is_conditional
+from iamcore.client.base.singleflight import request_key
+
+if TYPE_CHECKING:
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+
+class AsyncConditionalTransport(ConditionalBase["httpx.Response"]):
+    """
+    Async transport wrapper revalidating GET responses with their ETag / Last-Modified validators.
+
+    Same rules as `ConditionalTransport`.
+
+    Args:
+        transport: The async transport actually sending the requests.
+        max_entries: Most responses kept; the least recently used are dropped first.
+    """
+
+    def __init__(self, transport: AsyncTransport, max_entries: int = DEFAULT_MAX_VALIDATED_RESPONSES) -> None:
+        super().__init__(max_entries)
+        self.transport = transport
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request, revalidating the response kept for it if there is one."""
+        if not is_conditional(method, headers, data):
+            return await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+        key = request_key(method, url, params, headers)
+        entry = self._lookup(key)
+        resp = await self.transport.request(
+            method, url, headers=self._with_validators(headers, entry), params=params, timeout=timeout
+        )
+        settled = self._settle(key, entry, resp)
+        if settled is not resp:
+            await resp.aclose()
+        return settled
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
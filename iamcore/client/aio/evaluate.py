@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Optional
+
+from iamcore.client.base.models import IamIRNsResponse, PaginatedSearchFilter
+from iamcore.client.evaluate.client import (
+    DEFAULT_BATCH_CHUNK_SIZE,
+    DEFAULT_BATCH_CONCURRENCY,
+    Chunk,
+    Decisions,
+    chunk_payload,
+    collect_batch,
+    plan_batch,
+    read_chunk_decisions,
+)
+from iamcore.client.exceptions import IAMForbiddenException
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.evaluate.cache import DecisionCache
+    from iamcore.client.evaluate.dto import EvaluationResult
+
+    from .transport import AsyncTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async IAMCore evaluation client."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[AsyncTransport] = None,
+        decision_cache: Optional[DecisionCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.decision_cache = decision_cache
+
+    async def evaluate(self, auth_headers: dict[str, str], action: str, resources: list[IRN]) -> None:
+        if self.decision_cache is not None:
+            await self._evaluate_cached(self.decision_cache, auth_headers, action, resources)
+            return
+
+        payload = {"action": action, "resources": [str(r) for r in resources if r]}
+        logger.debug("Going to evaluate resources: json=%s", payload)
+        await self._post("evaluate", data=json.dumps(payload), headers=auth_headers)
+
+    async def _evaluate_cached(
+        self,
+        cache: DecisionCache,
+        auth_headers: dict[str, str],
+        action: str,
+        resources: list[IRN],
+    ) -> None:
+        """Answer from cached decisions and only send the resources with no cached decision."""
+        principal = cache.principal_of(auth_headers)
+        pending: list[str] = []
+        for irn in (str(r) for r in resources if r):
+            allowed = cache.get(principal, action, irn)
+            if allowed is False:
+                msg = f"Access denied (cached decision): {action} on {irn}"
+                raise IAMForbiddenException(msg, status_code=HTTPStatus.FORBIDDEN)
+            if allowed is None:
+                pending.append(irn)
+
+        if not pending:
+            return
+
+        payload = {"action": action, "resources": pending}
+        logger.debug("Going to evaluate resources: json=%s", payload)
+        try:
+            await self._post("evaluate", data=json.dumps(payload), headers=auth_headers)
+        except IAMForbiddenException:
+            # A deny on several resources does not say which one was denied.
+            if len(pending) == 1:
+                cache.put(principal, action, pending[0], allowed=False)
+            raise
+
+        for irn in pending:
+            cache.put(principal, action, irn, allowed=True)
+
+    async def evaluate_batch(
+        self,
+        auth_headers: dict[str, str],
+        checks: Iterable[tuple[str, IRN]],
+        *,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[EvaluationResult]:
+        """Evaluate many (action, IRN) pairs with few requests. See the sync client for details."""
+        checks = list(checks)
+        cache = self.decision_cache
+        principal = cache.principal_of(auth_headers) if cache is not None else ""
+        decisions, chunks = plan_batch(checks, chunk_size, cache, principal)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def evaluate_chunk(chunk: Chunk) -> Decisions:
+            async with semaphore:
+                return await self._evaluate_chunk(auth_headers, *chunk)
+
+        for chunk_decisions in await asyncio.gather(*(evaluate_chunk(chunk) for chunk in chunks)):
+            decisions.update(chunk_decisions)
+
+        return collect_batch(checks, decisions, cache, principal)
+
+    async def _evaluate_chunk(self, auth_headers: dict[str, str], action: str, resources: list[str]) -> Decisions:
+        data = chunk_payload(action, resources)
+        response = await self._post("evaluate/actions", data=data, headers=dict(auth_headers))
+        return read_chunk_decisions(action, resources, response.json())
+
+    async def evaluate_actions(
+        self,
+        auth_headers: dict[str, str],
+        actions: list[str],
+        irns: list[IRN],
+    ) -> dict[str, Any]:
+        payload = {"actions": actions, "irns": [str(r) for r in irns if r]}
+        logger.debug("Going to evaluate resources: json=%s", payload)
+        response = await self._post("evaluate/actions", data=json.dumps(payload), headers=auth_headers)
+        results: dict[str, Any] = response.json()
+        return results
+
+    async def evaluate_resources(
+        self,
+        auth_headers: dict[str, str],
+        *,
+        application: str,
+        action: str,
+        resource_type: str,
+        search_filter: Optional[PaginatedSearchFilter] = None,
+    ) -> IamIRNsResponse:
+        payload = {"application": application, "action": action, "resourceType": resource_type}
+        logger.debug("Going to evaluate resource type: json=%s", payload)
+        response = await self._post(
+            "evaluate/resources",
+            data=json.dumps(payload),
+            headers=auth_headers,
+            params=search_filter.model_dump(by_alias=True, exclude_none=True) if search_filter else None,
+        )
+        return IamIRNsResponse.from_response(response)
+
+    def evaluate_all_resources(
+        self,
+        auth_headers: dict[str, str],
+        *,
+        application: str,
+        action: str,
+        resource_type: str,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[IRN, None]:
+        async def search_func(headers: dict[str, str], search_filter: PaginatedSearchFilter) -> IamIRNsResponse:
+            return await self.evaluate_resources(
+                headers,
+                application=application,
+                action=action,
+                resource_type=resource_type,
+                search_filter=search_filter,
+            )
+
+        return generic_search_all(auth_headers, search_func, None, concurrency=concurrency, ordered=ordered)
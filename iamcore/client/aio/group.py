@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.base.records import RecordPage
+from iamcore.client.exceptions import IAMException, IAMGroupException, err_chain
+from iamcore.client.group.dto import (
+    CreateGroup,
+    Group,
+    GroupRecord,
+    GroupSearchFilter,
+    IamGroupResponse,
+    IamGroupsResponse,
+)
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from iamcore.irn import IRN
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Group API."""
+
+    BASE_PATH = "groups"
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+
+    @err_chain(IAMGroupException)
+    async def create(self, auth_headers: dict[str, str], create_group: CreateGroup) -> Group:
+        payload = create_group.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(data=payload, headers=auth_headers)
+        return IamGroupResponse.from_response(response).data
+
+    @err_chain(IAMGroupException)
+    async def delete(self, auth_headers: dict[str, str], group_irn: IRN) -> None:
+        await self._delete(group_irn.to_base64(), headers=auth_headers)
+
+    @err_chain(IAMGroupException)
+    async def policies_attach(self, auth_headers: dict[str, str], group_irn: IRN, policies_ids: list[str]) -> None:
+        path = f"{group_irn.to_base64()}/policies/attach"
+        payload = {"policyIDs": policies_ids}
+        await self._put(path, data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMGroupException)
+    async def members_add(self, auth_headers: dict[str, str], group_irn: IRN, members_ids: list[str]) -> None:
+        path = f"{group_irn.to_base64()}/members/add"
+        payload = {"userIDs": members_ids}
+        await self._post(path, data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMGroupException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+    ) -> IamGroupsResponse:
+        querystring = group_filter.model_dump(by_alias=True, exclude_none=True) if group_filter else None
+        response = await self._get(headers=headers, params=querystring)
+        return IamGroupsResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Group, None]:
+        return generic_search_all(auth_headers, self.search, group_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMGroupException)
+    async def search_records(
+        self,
+        auth_headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+    ) -> RecordPage[GroupRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = group_filter.model_dump(by_alias=True, exclude_none=True) if group_filter else None
+        response = await self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, GroupRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[GroupRecord, None]:
+        """Like `search_all`, but yields `GroupRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            group_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
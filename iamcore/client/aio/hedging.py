@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.base.breaker import endpoint_template
+from iamcore.client.base.hedging import HedgePolicy, HedgingBase, is_hedgeable
+
+if TYPE_CHECKING:
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHedgingTransport(HedgingBase):
+    """
+    Async transport wrapper sending a duplicate of slow read-only requests and using whichever
+    response comes first.
+
+    Same rules as `HedgingTransport`; the slower attempt is cancelled.
+
+    Args:
+        transport: The async transport actually sending the requests.
+        policy: Hedging rules. Defaults to `HedgePolicy()`.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        policy: Optional[HedgePolicy] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, clock)
+        self.transport = transport
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request, hedging it if it is read-only and slower than usual."""
+        if not is_hedgeable(method, url):
+            return await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+        endpoint = endpoint_template(method, url)
+        delay = self._hedge_delay(endpoint)
+
+        async def send() -> httpx.Response:
+            started = self._clock()
+            resp = await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+            self._record(endpoint, self._clock() - started)
+            return resp
+
+        if delay is None:
+            return await send()
+        pending = {asyncio.ensure_future(send())}
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if not done and self._take_hedge():
+            logger.debug("Hedging %s %s after %.3fs", method, url, delay)
+            pending.add(asyncio.ensure_future(send()))
+        try:
+            while True:
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                if not pending:
+                    return next(iter(done)).result()
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.base.limits import OVERLOAD_STATUSES, EndpointLimit, FamilyState, LimitingTransportBase
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Mapping
+
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLimitedTransport(LimitingTransportBase):
+    """
+    Async transport wrapper throttling requests per endpoint family.
+
+    Same rules as `LimitedTransport`; httpx transport errors count as overload signals.
+
+    Args:
+        transport: The async transport actually sending the requests.
+        limits: Limits keyed by endpoint family (`EVALUATE` or `ADMIN`).
+        sleep: Awaited with the number of seconds to wait for a rate token.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        limits: Mapping[str, EndpointLimit],
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(limits, clock)
+        self.transport = transport
+        self._sleep = sleep
+        # Created on first use, inside the event loop running the requests.
+        self._slots: Optional[asyncio.Condition] = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request once its endpoint family has a free slot and a rate token."""
+        import httpx  # noqa: PLC0415
+
+        state = self._state(url)
+        if state is None:
+            return await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+        async with self._slot(state):
+            if state.bucket is not None:
+                delay = state.bucket.reserve()
+                if delay:
+                    logger.debug("Throttling %s %s for %.2fs", method, url, delay)
+                    await self._sleep(delay)
+            try:
+                resp = await self.transport.request(
+                    method, url, data=data, headers=headers, params=params, timeout=timeout
+                )
+            except httpx.TransportError:
+                state.record(overloaded=True)
+                raise
+            state.record(overloaded=resp.status_code in OVERLOAD_STATUSES)
+            return resp
+
+    @asynccontextmanager
+    async def _slot(self, state: FamilyState) -> AsyncGenerator[None, None]:
+        if self._slots is None:
+            self._slots = asyncio.Condition()
+        slots = self._slots
+        async with slots:
+            await slots.wait_for(state.has_room)
+            state.in_flight += 1
+        try:
+            yield
+        finally:
+            async with slots:
+                state.in_flight -= 1
+                slots.notify_all()
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.irn import IRN
+
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.exceptions import IAMException, IAMPolicyException, err_chain
+from iamcore.client.policy.dto import (
+    CreatePolicy,
+    IamPoliciesResponse,
+    IamPolicyResponse,
+    Policy,
+    PolicySearchFilter,
+    UpdatePolicy,
+)
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from .transport import AsyncTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Policy API."""
+
+    BASE_PATH = "policies"
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+
+    @err_chain(IAMPolicyException)
+    async def create(self, auth_headers: dict[str, str], params: CreatePolicy) -> Policy:
+        payload_dict = params.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(data=payload_dict, headers=auth_headers)
+        return IamPolicyResponse.from_response(response).data
+
+    @err_chain(IAMPolicyException)
+    async def delete(self, auth_headers: dict[str, str], policy_id: str) -> None:
+        await self._delete(IRN.of(policy_id).to_base64(), headers=auth_headers)
+
+    @err_chain(IAMPolicyException)
+    async def update(self, auth_headers: dict[str, str], policy_id: str, params: UpdatePolicy) -> None:
+        data = params.model_dump_json(by_alias=True, exclude_none=True)
+        await self._put(policy_id, data=data, headers=auth_headers)
+
+    @err_chain(IAMPolicyException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        policy_filter: Optional[PolicySearchFilter] = None,
+    ) -> IamPoliciesResponse:
+        query = policy_filter.model_dump(by_alias=True, exclude_none=True) if policy_filter else None
+        response = await self._get(headers=headers, params=query)
+        return IamPoliciesResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        policy_filter: Optional[PolicySearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Policy, None]:
+        return generic_search_all(auth_headers, self.search, policy_filter, concurrency=concurrency, ordered=ordered)
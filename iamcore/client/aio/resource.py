@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import functools
+import json
+from typing import TYPE_CHECKING, Optional, Union
+
+from iamcore.client.base.bulk import (
+    DEFAULT_DELETE_CHUNK_SIZE,
+    DEFAULT_DELETE_CONCURRENCY,
+    BulkResult,
+    FailurePolicy,
+    raise_first_error,
+)
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.base.records import RecordPage
+from iamcore.client.exceptions import IAMException, IAMResourceException, err_chain
+from iamcore.client.resource.dto import (
+    CreateResource,
+    IamResourceResponse,
+    IamResourcesResponse,
+    Resource,
+    ResourceRecord,
+    ResourceSearchFilter,
+    UpdateResource,
+)
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+from .bulk import run_chunked
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.base.retry import RetryPolicy
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Resource API."""
+
+    BASE_PATH = "resources"
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+
+    @err_chain(IAMResourceException)
+    async def create(self, auth_headers: dict[str, str], params: CreateResource) -> Resource:
+        payload = params.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(data=payload, headers=auth_headers)
+        return IamResourceResponse.from_response(response).data
+
+    @err_chain(IAMResourceException)
+    async def update(self, auth_headers: dict[str, str], irn: IRN, params: UpdateResource) -> None:
+        payload = params.model_dump_json(by_alias=True, exclude_none=True, exclude_unset=True)
+        await self._patch(irn.to_base64(), data=payload, headers=auth_headers)
+
+    @err_chain(IAMResourceException)
+    async def delete(self, auth_headers: dict[str, str], resources_irns: Union[list[IRN], IRN]) -> None:
+        if isinstance(resources_irns, list):
+            if len(resources_irns) == 0:
+                return
+
+            if len(resources_irns) > 1:
+                raise_first_error(
+                    [result async for result in self.delete_many(auth_headers, [r for r in resources_irns if r])]
+                )
+                return
+
+            resources_irns = resources_irns[0]
+
+        await self._delete(resources_irns.to_base64(), headers=auth_headers)
+
+    def delete_many(
+        self,
+        auth_headers: dict[str, str],
+        resources_irns: Iterable[IRN],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """Delete many resources with one request per chunk of `chunk_size` IRNs. See the sync `delete_many`."""
+        return run_chunked(
+            functools.partial(self._delete_chunk, dict(auth_headers)),
+            resources_irns,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            on_failure=on_failure,
+            retry=retry,
+        )
+
+    @err_chain(IAMResourceException)
+    async def _delete_chunk(self, auth_headers: dict[str, str], resources_irns: list[IRN]) -> None:
+        payload = {"resourceIDs": [irn.to_base64() for irn in resources_irns]}
+        await self._post("delete", data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMResourceException)
+    async def search(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+    ) -> IamResourcesResponse:
+        query = resource_filter.model_dump(by_alias=True, exclude_none=True) if resource_filter else None
+        response = await self._get(headers=auth_headers, params=query)
+        return IamResourcesResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Resource, None]:
+        return generic_search_all(auth_headers, self.search, resource_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMResourceException)
+    async def search_records(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+    ) -> RecordPage[ResourceRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = resource_filter.model_dump(by_alias=True, exclude_none=True) if resource_filter else None
+        response = await self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, ResourceRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[ResourceRecord, None]:
+        """Like `search_all`, but yields `ResourceRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            resource_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
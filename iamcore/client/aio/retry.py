@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.base.retry import RetryBudget, RetryingTransportBase, RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRetryTransport(RetryingTransportBase):
+    """
+    Async transport wrapper that resends failed idempotent requests.
+
+    Same rules as `RetryTransport`; httpx transport errors count as connection errors.
+
+    Args:
+        transport: The async transport actually sending the requests.
+        policy: Retry rules. Defaults to `RetryPolicy()`.
+        budget: Retry budget. Defaults to the process-wide `DEFAULT_RETRY_BUDGET`.
+        sleep: Awaited with the number of seconds to wait between attempts.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, budget, clock)
+        self.transport = transport
+        self._sleep = sleep
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        import httpx  # noqa: PLC0415
+
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = await self.transport.request(
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
+                )
+            except httpx.TransportError as e:
+                delay = self._delay_after_error(method, url, e, attempt, started)
+            else:
+                retry_delay = self._delay_after_response(method, resp, attempt, started)
+                if retry_delay is None:
+                    return resp
+                delay = retry_delay
+
+            logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, url, delay, attempt + 1)
+            await self._sleep(delay)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
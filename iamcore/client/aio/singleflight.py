@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.base.singleflight import RequestKey, request_key, share
+
+if TYPE_CHECKING:
+    import httpx
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+    from .transport import AsyncTransport
+
+
+class AsyncSingleFlightTransport:
+    """
+    Async transport wrapper coalescing identical in-flight GET requests into one network call.
+
+    Same rules as `SingleFlightTransport`. The shared request runs in its own task, so it
+    completes for the other callers even if the one that started it is cancelled.
+
+    Args:
+        transport: The async transport actually sending the requests.
+    """
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self.transport = transport
+        self._in_flight: dict[RequestKey, asyncio.Task[httpx.Response]] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request, or wait for the identical one already in flight."""
+        if data is not None or method.upper() != "GET":
+            return await self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+        key = request_key(method, url, params, headers)
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = self._in_flight[key] = asyncio.ensure_future(
+                self._fly(key, method, url, headers=headers, params=params, timeout=timeout)
+            )
+            # Retrieve the error even if every caller was cancelled, so it is not reported as lost.
+            flight.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return await asyncio.shield(flight)
+
+    async def _fly(
+        self,
+        key: RequestKey,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[dict[str, str]],
+        params: RequestParams,
+        timeout: Optional[float],
+    ) -> httpx.Response:
+        try:
+            resp = await self.transport.request(method, url, headers=headers, params=params, timeout=timeout)
+        finally:
+            # Requests made from now on start a new flight instead of reusing this response.
+            del self._in_flight[key]
+        share(resp)
+        return resp
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
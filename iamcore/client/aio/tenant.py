@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.base.cache import TENANT, TENANT_ISSUER, aread_through, invalidate, query_scope
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.exceptions import IAMException, IAMTenantException, err_chain
+from iamcore.client.tenant.dto import (
+    CreateTenant,
+    GetTenantIssuer,
+    GetTenantsFilter,
+    IamTenantIssuersResponse,
+    IamTenantResponse,
+    IamTenantsResponse,
+    Tenant,
+    TenantIssuer,
+)
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.base.cache import ReferenceCache
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core Tenant API."""
+
+    BASE_PATH = "tenants"
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[AsyncTransport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
+
+    def _invalidate(self) -> None:
+        invalidate(self.cache, TENANT)
+        invalidate(self.cache, TENANT_ISSUER)
+
+    @err_chain(IAMTenantException)
+    async def create(self, auth_headers: dict[str, str], params: CreateTenant) -> Tenant:
+        path = "issuer-types/iamcore"
+        payload = params.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(path, data=payload, headers=auth_headers)
+        self._invalidate()
+        return IamTenantResponse.from_response(response).data
+
+    @err_chain(IAMTenantException)
+    async def update(self, auth_headers: dict[str, str], irn: IRN, display_name: str) -> None:
+        payload = {"displayName": display_name}
+        await self._put(irn.to_base64(), data=json.dumps(payload), headers=auth_headers)
+        self._invalidate()
+
+    @err_chain(IAMTenantException)
+    async def delete(self, auth_headers: dict[str, str], irn: IRN) -> None:
+        await self._delete(irn.to_base64(), headers=auth_headers)
+        self._invalidate()
+
+    @err_chain(IAMTenantException)
+    async def get_issuer(self, headers: dict[str, str], params: GetTenantIssuer) -> TenantIssuer:
+        async def load() -> TenantIssuer:
+            response = await self._get("issuers", headers=headers, params=params.to_dict())
+            return IamTenantIssuersResponse.from_response(response).data.pop()
+
+        scope = query_scope(params.to_dict())
+        return await aread_through(self.cache, TENANT_ISSUER, scope, headers, load)
+
+    @err_chain(IAMTenantException)
+    async def search(
+        self,
+        headers: dict[str, str],
+        tenant_filter: Optional[GetTenantsFilter] = None,
+    ) -> IamTenantsResponse:
+        query = tenant_filter.model_dump(by_alias=True, exclude_none=True) if tenant_filter else None
+
+        async def load() -> IamTenantsResponse:
+            response = await self._get(headers=headers, params=query)
+            return IamTenantsResponse.from_response(response)
+
+        return await aread_through(self.cache, TENANT, query_scope(query), headers, load)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        tenant_filter: Optional[GetTenantsFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Tenant, None]:
+        return generic_search_all(auth_headers, self.search, tenant_filter, concurrency=concurrency, ordered=ordered)
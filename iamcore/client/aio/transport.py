@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Protocol
+
+from iamcore.client.base.transport import DEFAULT_POOL_IDLE_TIMEOUT, DEFAULT_POOL_MAXSIZE
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import httpx
+    from typing_extensions import Self
+
+    from iamcore.client.base.transport import RequestData, RequestParams
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncTransport(Protocol):
+    """Pluggable asynchronous HTTP transport shared by the async resource clients."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request and return the raw response, whatever its status code."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release every connection held by the transport."""
+        ...
+
+
+class HttpxAsyncTransport:
+    """
+    Keep-alive asynchronous transport backed by a single pooled `httpx.AsyncClient`.
+
+    Requires the optional `httpx` dependency (`pip install iamcore-sdk-py[aio]`).
+
+    Args:
+        max_connections: Maximum number of concurrent connections across all hosts.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        idle_timeout: Seconds after which idle keep-alive connections are dropped.
+        client: Pre-configured `httpx.AsyncClient` to use instead of building one.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_POOL_MAXSIZE,
+        idle_timeout: Optional[float] = DEFAULT_POOL_IDLE_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        if client is None:
+            try:
+                import httpx  # noqa: PLC0415
+            except ImportError as e:
+                msg = "The asyncio client requires httpx: pip install 'iamcore-sdk-py[aio]'"
+                raise ImportError(msg) from e
+
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=idle_timeout,
+            )
+            client = httpx.AsyncClient(limits=limits)
+        self.client: httpx.AsyncClient = client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request over a pooled keep-alive connection."""
+        return await self.client.request(
+            method,
+            url,
+            content=data,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying client and every pooled connection."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
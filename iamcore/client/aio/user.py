@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import functools
+import json
+from typing import TYPE_CHECKING, Optional
+
+from iamcore.client.base.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_DELETE_CHUNK_SIZE,
+    DEFAULT_DELETE_CONCURRENCY,
+    BulkResult,
+    FailurePolicy,
+    PerItem,
+    for_item,
+)
+from iamcore.client.base.client import append_path_to_url
+from iamcore.client.base.models import IamIRNResponse
+from iamcore.client.base.records import RecordPage
+from iamcore.client.base.retry import RetryPolicy
+from iamcore.client.exceptions import IAMException, IAMUserException, err_chain
+from iamcore.client.user.dto import (
+    CreateUser,
+    IamUserResponse,
+    IamUsersResponse,
+    UpdateUser,
+    User,
+    UserRecord,
+    UserSearchFilter,
+)
+
+from .base import AsyncHTTPClientWithTimeout, generic_search_all
+from .bulk import call_with_retry, run_bulk, run_chunked
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable
+
+    from iamcore.irn import IRN
+
+    from .transport import AsyncTransport
+
+
+class Client(AsyncHTTPClientWithTimeout):
+    """Async client for IAM Core User API."""
+
+    BASE_PATH = "users"
+
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[AsyncTransport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+
+    @err_chain(IAMUserException)
+    async def create(self, auth_headers: dict[str, str], params: CreateUser) -> User:
+        """Create a new user."""
+        data = params.model_dump_json(by_alias=True, exclude_none=True)
+        response = await self._post(data=data, headers=auth_headers)
+        return IamUserResponse.from_response(response).data
+
+    def create_many(
+        self,
+        auth_headers: dict[str, str],
+        users: Iterable[CreateUser],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        group_ids: PerItem[list[str]] = None,
+        policy_ids: PerItem[list[str]] = None,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """Create many users, with at most `concurrency` of them in flight. See the sync `create_many`."""
+        if on_failure == FailurePolicy.RETRY and retry is None:
+            retry = RetryPolicy()
+        elif on_failure != FailurePolicy.RETRY:
+            retry = None
+
+        async def provision(index: int, params: CreateUser) -> BulkResult:
+            try:
+                user = await call_with_retry(retry, self.create, dict(auth_headers), params, idempotent=False)
+            except IAMException as e:
+                return BulkResult(index, params, error=e)
+            try:
+                groups = for_item(group_ids, params)
+                if groups:
+                    await call_with_retry(retry, self.add_groups, dict(auth_headers), user.irn, groups)
+                policies = for_item(policy_ids, params)
+                if policies:
+                    await call_with_retry(retry, self.policies_attach, dict(auth_headers), user.irn, policies)
+            except IAMException as e:
+                return BulkResult(index, params, user, e)
+            return BulkResult(index, params, user)
+
+        return run_bulk(provision, users, concurrency=concurrency, on_failure=on_failure)
+
+    @err_chain(IAMUserException)
+    async def get_authenticated(self, auth_headers: dict[str, str]) -> User:
+        response = await self._get("me", headers=auth_headers)
+        return IamUserResponse.from_response(response).data
+
+    @err_chain(IAMUserException)
+    async def get_authenticated_irn(self, auth_headers: dict[str, str]) -> IRN:
+        response = await self._get("me/irn", headers=auth_headers)
+        return IamIRNResponse.from_response(response).data
+
+    @err_chain(IAMUserException)
+    async def update(self, auth_headers: dict[str, str], irn: IRN, params: UpdateUser) -> None:
+        payload = params.model_dump_json(by_alias=True, exclude_none=True)
+        await self._patch(irn.to_base64(), data=payload, headers=auth_headers)
+
+    @err_chain(IAMUserException)
+    async def delete(self, auth_headers: dict[str, str], user_irn: IRN) -> None:
+        data = json.dumps({"userIDS": [user_irn.to_base64()]})
+        await self._post("delete", data=data, headers=auth_headers)
+
+    def delete_many(
+        self,
+        auth_headers: dict[str, str],
+        user_irns: Iterable[IRN],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """Delete many users with one request per chunk of `chunk_size` IRNs. See the sync `delete_many`."""
+        return run_chunked(
+            functools.partial(self._delete_chunk, dict(auth_headers)),
+            user_irns,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            on_failure=on_failure,
+            retry=retry,
+        )
+
+    @err_chain(IAMUserException)
+    async def _delete_chunk(self, auth_headers: dict[str, str], user_irns: list[IRN]) -> None:
+        data = json.dumps({"userIDS": [irn.to_base64() for irn in user_irns]})
+        await self._post("delete", data=data, headers=auth_headers)
+
+    @err_chain(IAMUserException)
+    async def policies_attach(self, auth_headers: dict[str, str], user_irn: IRN, policies_ids: list[str]) -> None:
+        path = f"{user_irn.to_base64()}/policies/attach"
+        payload = {"policyIDs": policies_ids}
+        await self._put(path, data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMUserException)
+    async def policies_detach(self, auth_headers: dict[str, str], user_irn: IRN, policies_ids: list[str]) -> None:
+        path = f"{user_irn.to_base64()}/policies/detach"
+        payload = {"policyIDs": policies_ids}
+        await self._post(path, data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMUserException)
+    async def add_groups(self, auth_headers: dict[str, str], user_irn: IRN, group_ids: list[str]) -> None:
+        path = f"{user_irn.to_base64()}/groups/add"
+        payload = {"groupIDs": group_ids}
+        await self._post(path, data=json.dumps(payload), headers=auth_headers)
+
+    @err_chain(IAMUserException)
+    async def search(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+    ) -> IamUsersResponse:
+        query = user_filter.model_dump(by_alias=True, exclude_none=True) if user_filter else None
+        response = await self._get(headers=auth_headers, params=query)
+        return IamUsersResponse.from_response(response)
+
+    @err_chain(IAMException)
+    def search_all(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[User, None]:
+        return generic_search_all(auth_headers, self.search, user_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMUserException)
+    async def search_records(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+    ) -> RecordPage[UserRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = user_filter.model_dump(by_alias=True, exclude_none=True) if user_filter else None
+        response = await self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, UserRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncGenerator[UserRecord, None]:
+        """Like `search_all`, but yields `UserRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            user_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
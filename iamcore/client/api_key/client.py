@@ -11,14 +11,16 @@ from .dto import ApiKey, IamApiKeysResponse
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core API Keys."""
 
     BASE_PATH = "principals"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
 
     @err_chain(IAMException)
@@ -37,13 +39,16 @@ class Client(HTTPClientWithTimeout):
         query = search_filter.model_dump(by_alias=True, exclude_none=True) if search_filter else None
         path = f"{principal_id}/api-keys"
         response = self._get(path, headers=headers, params=query)
-        return IamApiKeysResponse(**response.json())
+        return IamApiKeysResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         principal_id: str,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[ApiKey, None, None]:
         return generic_search_all(
             auth_headers,
@@ -53,4 +58,6 @@ class Client(HTTPClientWithTimeout):
                 search_filter=search_filter,
             ),
             None,
+            concurrency=concurrency,
+            ordered=ordered,
         )
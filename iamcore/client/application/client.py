@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 
 from iamcore.irn import IRN
 
+from iamcore.client.base.cache import APPLICATION, invalidate, read_through
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import generic_search_all
 from iamcore.client.exceptions import IAMException, err_chain
@@ -20,15 +21,25 @@ from .dto import (
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from iamcore.client.base.cache import ReferenceCache
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core Application API."""
 
     BASE_PATH = "applications"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[Transport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
 
     @err_chain(IAMException)
     def create(self, auth_headers: dict[str, str], params: CreateApplication) -> str:
@@ -43,8 +54,11 @@ class Client(HTTPClientWithTimeout):
 
     @err_chain(IAMException)
     def get(self, auth_headers: dict[str, str], irn: IRN) -> Application:
-        response = self._get(irn.to_base64(), headers=auth_headers)
-        return IamApplicationResponse(**response.json()).data
+        def load() -> Application:
+            response = self._get(irn.to_base64(), headers=auth_headers)
+            return IamApplicationResponse.from_response(response).data
+
+        return read_through(self.cache, APPLICATION, f"{irn}/", auth_headers, load)
 
     @err_chain(IAMException)
     def policies_attach(
@@ -56,6 +70,7 @@ class Client(HTTPClientWithTimeout):
         path = f"{application_irn.to_base64()}/policies/attach"
         payload = {"policyIDs": policies_ids}
         self._put(path, data=json.dumps(payload), headers=auth_headers)
+        invalidate(self.cache, APPLICATION, f"{application_irn}/")
 
     @err_chain(IAMException)
     def search(
@@ -65,12 +80,17 @@ class Client(HTTPClientWithTimeout):
     ) -> IamApplicationsResponse:
         query = application_filter.model_dump(by_alias=True, exclude_none=True) if application_filter else None
         response = self._get(headers=headers, params=query)
-        return IamApplicationsResponse(**response.json())
+        return IamApplicationsResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         application_filter: Optional[ApplicationSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[Application, None, None]:
-        return generic_search_all(auth_headers, self.search, application_filter)
+        return generic_search_all(
+            auth_headers, self.search, application_filter, concurrency=concurrency, ordered=ordered
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from iamcore.client.base.cache import APPLICATION_RESOURCE_TYPE, invalidate, query_scope, read_through
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import PaginatedSearchFilter, generic_search_all
 from iamcore.client.exceptions import IAMException, err_chain
@@ -18,15 +19,25 @@ if TYPE_CHECKING:
 
     from iamcore.irn import IRN
 
+    from iamcore.client.base.cache import ReferenceCache
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core Application Resource Type API."""
 
     BASE_PATH: str = "applications"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[Transport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
 
     @err_chain(IAMException)
     def create(
@@ -38,6 +49,7 @@ class Client(HTTPClientWithTimeout):
         path = f"{application_irn.to_base64()}/resource-types"
         payload = params.model_dump_json(by_alias=True, exclude_none=True)
         response = self._post(path, data=payload, headers=auth_headers)
+        invalidate(self.cache, APPLICATION_RESOURCE_TYPE, f"{application_irn}/")
         location = response.headers.get("Location")
         if not location:
             msg = "Location header not found in response"
@@ -53,8 +65,13 @@ class Client(HTTPClientWithTimeout):
         type_irn: IRN,
     ) -> ApplicationResourceType:
         path = f"{application_irn.to_base64()}/resource-types/{type_irn.to_base64()}"
-        response = self._get(path, headers=auth_headers)
-        return IamApplicationResourceTypeResponse(**response.json()).data
+
+        def load() -> ApplicationResourceType:
+            response = self._get(path, headers=auth_headers)
+            return IamApplicationResourceTypeResponse.from_response(response).data
+
+        scope = f"{application_irn}/{type_irn}/"
+        return read_through(self.cache, APPLICATION_RESOURCE_TYPE, scope, auth_headers, load)
 
     @err_chain(IAMException)
     def search(
@@ -66,7 +83,7 @@ class Client(HTTPClientWithTimeout):
         path = f"{application_irn.to_base64()}/resource-types"
         query = resource_type_filter.model_dump(by_alias=True, exclude_none=True) if resource_type_filter else None
         response = self._get(path, headers=headers, params=query)
-        return IamApplicationResourceTypesResponse(**response.json())
+        return IamApplicationResourceTypesResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
@@ -74,13 +91,26 @@ class Client(HTTPClientWithTimeout):
         auth_headers: dict[str, str],
         application_irn: IRN,
         resource_type_filter: Optional[PaginatedSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[ApplicationResourceType, None, None]:
-        return generic_search_all(
-            auth_headers,
-            lambda headers, search_filter: self.search(
-                headers,
-                application_irn,
-                search_filter,
-            ),
-            resource_type_filter,
-        )
+        def search_all() -> Generator[ApplicationResourceType, None, None]:
+            return generic_search_all(
+                auth_headers,
+                lambda headers, search_filter: self.search(
+                    headers,
+                    application_irn,
+                    search_filter,
+                ),
+                resource_type_filter,
+                concurrency=concurrency,
+                ordered=ordered,
+            )
+
+        if self.cache is None:
+            return search_all()
+        query = resource_type_filter.model_dump(by_alias=True, exclude_none=True) if resource_type_filter else None
+        scope = f"{application_irn}/?{query_scope(query)}"
+        items = self.cache.get_or_load(APPLICATION_RESOURCE_TYPE, scope, auth_headers, lambda: list(search_all()))
+        return (item for item in items)
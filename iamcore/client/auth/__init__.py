@@ -1,8 +1,10 @@
 from .client import Client, get_api_key_auth_headers
 from .dto import TokenResponse
+from .provider import TokenProvider
 
 __all__ = [
     "Client",
+    "TokenProvider",
     "TokenResponse",
     "get_api_key_auth_headers",
 ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import http.client
 import logging
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlencode
 
 from iamcore.client.base.client import HTTPClientWithTimeout
@@ -9,6 +10,9 @@ from iamcore.client.exceptions import IAMException, IAMUnauthorizedException, er
 
 from .dto import TokenResponse
 
+if TYPE_CHECKING:
+    from iamcore.client.base.transport import Transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,8 +23,8 @@ def get_api_key_auth_headers(api_key: str) -> dict[str, str]:
 class Client(HTTPClientWithTimeout):
     """IAMCore auth client."""
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout, api_version=None)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, api_version=None, transport=transport)
 
     @err_chain(error=IAMException)
     def get_token_with_password(
@@ -43,13 +47,46 @@ class Client(HTTPClientWithTimeout):
         Returns:
             The OAuth2 token.
         """
+        return self._request_token(
+            realm,
+            {
+                "grant_type": "password",
+                "client_id": client_id,
+                "username": username,
+                "password": password,
+            },
+        )
+
+    @err_chain(error=IAMException)
+    def get_token_with_refresh_token(
+        self,
+        *,
+        realm: str,
+        client_id: str,
+        refresh_token: str,
+    ) -> TokenResponse:
+        """
+        Retrieves a new OAuth2 token using the refresh_token grant type.
+
+        Args:
+            realm: The realm name (tenant ID).
+            client_id: The client ID.
+            refresh_token: The refresh token of a previously issued token.
+
+        Returns:
+            The OAuth2 token.
+        """
+        return self._request_token(
+            realm,
+            {
+                "grant_type": "refresh_token",
+                "client_id": client_id,
+                "refresh_token": refresh_token,
+            },
+        )
+
+    def _request_token(self, realm: str, payload_dict: dict[str, str]) -> TokenResponse:
         url = f"realms/{realm}/protocol/openid-connect/token"
-        payload_dict = {
-            "grant_type": "password",
-            "client_id": client_id,
-            "username": username,
-            "password": password,
-        }
         payload = urlencode(payload_dict)
         response = self._post(
             url,
@@ -57,8 +94,8 @@ class Client(HTTPClientWithTimeout):
             headers={"Content-Type": "application/x-www-form-urlencoded"},
         )
         if response.status_code == http.client.OK:
-            logger.debug("Token response: %s", response.json())
-            return TokenResponse(**response.json())
+            logger.debug("Token response: %s", response.text)
+            return TokenResponse.from_response(response)
 
         msg = (
             f"Unauthorized: {response.json()}"
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from iamcore.client.exceptions import IAMException
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .dto import TokenResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_MARGIN = 30.0
+
+
+class TokenProvider:
+    """
+    Thread-safe token cache around the auth client.
+
+    The token is refreshed with the `refresh_token` grant shortly before it expires, falling
+    back to the password grant once the refresh token is expired or rejected. Concurrent
+    callers that find the token stale share a single refresh.
+
+    Args:
+        auth_client: The auth client used to obtain tokens.
+        realm: The realm name (tenant ID).
+        client_id: The client ID.
+        username: The username.
+        password: The password.
+        refresh_margin: Seconds before expiry at which the token is refreshed. Capped at half
+            the token lifetime for short-lived tokens.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        auth_client: Client,
+        *,
+        realm: str,
+        client_id: str,
+        username: str,
+        password: str,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.auth_client = auth_client
+        self.realm = realm
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._token: Optional[TokenResponse] = None
+        self._refresh_at = 0.0
+        self._refresh_token_expires_at = 0.0
+
+    @property
+    def token(self) -> TokenResponse:
+        """A valid token, refreshed first if it is about to expire."""
+        token = self._token
+        if token is not None and self._clock() < self._refresh_at:
+            return token
+
+        with self._lock:
+            # Another thread may have refreshed while we were waiting for the lock.
+            token = self._token
+            if token is None or self._clock() >= self._refresh_at:
+                token = self._refresh()
+            return token
+
+    @property
+    def access_headers(self) -> dict[str, str]:
+        """Authorization headers for any sub-client call. A fresh dict is returned on every access."""
+        return self.token.access_headers
+
+    def invalidate(self) -> None:
+        """Drop the cached token, e.g. after the server rejected it, so the next access fetches a new one."""
+        with self._lock:
+            self._token = None
+
+    def _refresh(self) -> TokenResponse:
+        issued_at = self._clock()
+        token = self._token
+        if token is not None and self._refresh_token_usable(issued_at):
+            try:
+                token = self.auth_client.get_token_with_refresh_token(
+                    realm=self.realm,
+                    client_id=self.client_id,
+                    refresh_token=token.refresh_token,
+                )
+            except IAMException:
+                logger.warning("Refresh token rejected, requesting a new token with the password grant")
+                token = self._password_grant()
+        else:
+            token = self._password_grant()
+
+        self._token = token
+        margin = min(self.refresh_margin, token.expires_in / 2)
+        self._refresh_at = issued_at + token.expires_in - margin
+        # Keycloak reports 0 for refresh tokens that do not expire on their own.
+        refresh_ttl = token.refresh_expires_in or float("inf")
+        self._refresh_token_expires_at = issued_at + refresh_ttl - margin
+        return token
+
+    def _refresh_token_usable(self, now: float) -> bool:
+        return now < self._refresh_token_expires_at
+
+    def _password_grant(self) -> TokenResponse:
+        token: TokenResponse = self.auth_client.get_token_with_password(
+            realm=self.realm,
+            client_id=self.client_id,
+            username=self.username,
+            password=self.password,
+        )
+        return token
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import binascii
+import logging
+import re
+import threading
+import time
+from base64 import b64decode
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+from urllib.parse import unquote, urlsplit
+
+from iamcore.client.exceptions import IAMCircuitOpenException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import requests
+
+    from .transport import RequestData, RequestParams, Transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MIN_CALLS = 10
+DEFAULT_WINDOW = 30.0
+DEFAULT_OPEN_DURATION = 30.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+_ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_IRN_PREFIX = b"irn:"
+# Responses from this status up count as failures.
+SERVER_ERROR_STATUS = 500
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitEvent(NamedTuple):
+    """A circuit changing state."""
+
+    endpoint: str
+    previous: CircuitState
+    state: CircuitState
+
+
+def _is_identifier(segment: str) -> bool:
+    if _ID_SEGMENT.fullmatch(segment):
+        return True
+    try:
+        return b64decode(segment + "=" * (-len(segment) % 4), validate=True).startswith(_IRN_PREFIX)
+    except (binascii.Error, ValueError):
+        return False
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """
+    Method and path of a request with identifiers replaced by `{id}`, e.g. `GET /api/v1/users/{id}`.
+
+    Base64 IRNs, UUIDs and numbers count as identifiers, so every request to the same endpoint
+    shares one template whatever resource it targets.
+    """
+    segments = [unquote(segment) for segment in urlsplit(url).path.split("/")]
+    path = "/".join("{id}" if segment and _is_identifier(segment) else segment for segment in segments)
+    return f"{method.upper()} {path}"
+
+
+class CircuitBreakerPolicy:
+    """
+    When circuits open and how they recover.
+
+    A circuit opens once at least `min_calls` calls within the last `window` seconds were
+    made and either `failure_rate` of them failed (connection error, timeout or 5xx) or
+    `slow_call_rate` of them took `slow_call_duration` or longer. It then rejects calls for
+    `open_duration` seconds, after which up to `half_open_probes` calls are let through: if
+    they all succeed the circuit closes, otherwise it opens again.
+
+    Args:
+        failure_rate: Share of failed calls that opens the circuit.
+        slow_call_duration: Seconds after which a call counts as slow. `None` ignores latency.
+        slow_call_rate: Share of slow calls that opens the circuit.
+        min_calls: Calls needed in the window before the rates are considered.
+        window: Length of the sliding window, in seconds.
+        open_duration: Seconds an open circuit rejects calls before probing.
+        half_open_probes: Calls let through while half-open.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 1.0,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        window: float = DEFAULT_WINDOW,
+        open_duration: float = DEFAULT_OPEN_DURATION,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+
+
+class Circuit:
+    """Breaker state of one endpoint template."""
+
+    def __init__(self, endpoint: str, policy: CircuitBreakerPolicy, clock: Callable[[], float]) -> None:
+        self.endpoint = endpoint
+        self.policy = policy
+        self.state = CircuitState.CLOSED
+        self._clock = clock
+        # (finished at, failed, slow) of the calls in the window
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> Optional[CircuitEvent]:
+        """Let a call through, or raise `IAMCircuitOpenException`."""
+        with self._lock:
+            event = None
+            if self.state is CircuitState.OPEN:
+                retry_in = self._opened_at + self.policy.open_duration - self._clock()
+                if retry_in > 0:
+                    raise IAMCircuitOpenException(self.endpoint, retry_in)
+                event = self._transition(CircuitState.HALF_OPEN)
+            if self.state is CircuitState.HALF_OPEN:
+                if self._probes >= self.policy.half_open_probes:
+                    raise IAMCircuitOpenException(self.endpoint, 0.0)
+                self._probes += 1
+            return event
+
+    def after_call(self, *, failed: bool, duration: float) -> Optional[CircuitEvent]:
+        """Record the outcome of a call let through by `before_call`."""
+        slow = self.policy.slow_call_duration is not None and duration >= self.policy.slow_call_duration
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                return self._after_probe(bad=failed or slow)
+            if self.state is CircuitState.CLOSED:
+                return self._after_closed_call(failed=failed, slow=slow)
+            # Finished after the circuit opened; it says nothing about the recovery.
+            return None
+
+    def _after_probe(self, *, bad: bool) -> Optional[CircuitEvent]:
+        self._probes = max(0, self._probes - 1)
+        if bad:
+            return self._transition(CircuitState.OPEN)
+        self._probe_successes += 1
+        if self._probe_successes >= self.policy.half_open_probes:
+            return self._transition(CircuitState.CLOSED)
+        return None
+
+    def _after_closed_call(self, *, failed: bool, slow: bool) -> Optional[CircuitEvent]:
+        now = self._clock()
+        self._calls.append((now, failed, slow))
+        while self._calls[0][0] < now - self.policy.window:
+            self._calls.popleft()
+        calls = len(self._calls)
+        if calls < self.policy.min_calls:
+            return None
+        failures = sum(1 for _, f, _ in self._calls if f)
+        slows = sum(1 for _, _, s in self._calls if s)
+        if failures >= self.policy.failure_rate * calls or (
+            self.policy.slow_call_duration is not None and slows >= self.policy.slow_call_rate * calls
+        ):
+            return self._transition(CircuitState.OPEN)
+        return None
+
+    def _transition(self, state: CircuitState) -> CircuitEvent:
+        event = CircuitEvent(self.endpoint, self.state, state)
+        self.state = state
+        self._calls.clear()
+        self._probes = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        return event
+
+
+class CircuitBreakerBase:
+    """Circuits and event listeners shared by the sync and async breaker transports."""
+
+    def __init__(
+        self,
+        policy: Optional[CircuitBreakerPolicy],
+        listeners: Iterable[Callable[[CircuitEvent], None]],
+        clock: Callable[[], float],
+    ) -> None:
+        self.policy = policy or CircuitBreakerPolicy()
+        self.circuits: dict[str, Circuit] = {}
+        self._listeners = list(listeners)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[CircuitEvent], None]) -> None:
+        """Call `listener` with a `CircuitEvent` whenever a circuit changes state."""
+        self._listeners.append(listener)
+
+    def _circuit(self, method: str, url: str) -> Circuit:
+        endpoint = endpoint_template(method, url)
+        with self._lock:
+            circuit = self.circuits.get(endpoint)
+            if circuit is None:
+                circuit = self.circuits[endpoint] = Circuit(endpoint, self.policy, self._clock)
+            return circuit
+
+    def _emit(self, event: Optional[CircuitEvent]) -> None:
+        if event is None:
+            return
+        level = logging.WARNING if event.state is CircuitState.OPEN else logging.INFO
+        logger.log(level, "Circuit for %s changed from %s to %s", event.endpoint, event.previous, event.state)
+        for listener in self._listeners:
+            listener(event)
+
+
+class CircuitBreakerTransport(CircuitBreakerBase):
+    """
+    Transport wrapper failing fast on endpoints that keep failing or timing out.
+
+    Each endpoint template (see `endpoint_template`) has its own circuit. While a circuit is
+    open, requests to it raise `IAMCircuitOpenException` without being sent.
+
+    Args:
+        transport: The transport actually sending the requests.
+        policy: Breaker rules. Defaults to `CircuitBreakerPolicy()`.
+        listeners: Called with a `CircuitEvent` on every state change.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        policy: Optional[CircuitBreakerPolicy] = None,
+        *,
+        listeners: Iterable[Callable[[CircuitEvent], None]] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, listeners, clock)
+        self.transport = transport
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request unless the circuit of its endpoint is open."""
+        circuit = self._circuit(method, url)
+        self._emit(circuit.before_call())
+        started = self._clock()
+        try:
+            resp = self.transport.request(
+                method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+            )
+        except Exception:
+            self._emit(circuit.after_call(failed=True, duration=self._clock() - started))
+            raise
+        self._emit(circuit.after_call(failed=resp.status_code >= SERVER_ERROR_STATUS, duration=self._clock() - started))
+        return resp
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
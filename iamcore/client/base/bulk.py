@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, TypeVar, Union
+
+from urllib3.exceptions import ConnectTimeoutError
+
+from iamcore.client.exceptions import IAMCircuitOpenException, IAMException
+
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+DEFAULT_BULK_CONCURRENCY = 8
+DEFAULT_DELETE_CHUNK_SIZE = 100
+DEFAULT_DELETE_CONCURRENCY = 4
+
+T = TypeVar("T")
+X = TypeVar("X")
+
+PerItem = Union[T, Callable[[Any], T], None]
+
+# Errors raised before the request reached the server: an open circuit, and connections that
+# could not be established (refused, unresolvable host, connect timeout).
+UNSENT_ERRORS: tuple[type[BaseException], ...] = (IAMCircuitOpenException, ConnectTimeoutError)
+
+
+class FailurePolicy(str, Enum):
+    """What a bulk operation does when an item fails."""
+
+    # Report the failure and go on with the other items.
+    CONTINUE = "continue"
+    # Report the failure, let the items already in flight finish, and start no new ones.
+    ABORT = "abort"
+    # Retry the failed step while the error is transient, then go on like CONTINUE.
+    RETRY = "retry"
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        position: Position of the item in the input.
+        item: The input item.
+        value: What the item produced, e.g. the created DTO. Set even on error when a later
+            step of the item failed after the first one succeeded.
+        error: The exception that stopped the item, if any.
+    """
+
+    position: int
+    item: Any
+    value: Any = None
+    error: Optional[IAMException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def chunked(items: Iterable[X], size: int) -> Iterator[list[X]]:
+    """Lists of up to `size` consecutive items, read from `items` lazily."""
+    if size < 1:
+        msg = f"chunk size must be positive, got {size}"
+        raise ValueError(msg)
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def raise_first_error(results: Iterable[BulkResult]) -> None:
+    """Wait for every result, then raise the error of the first failed item in input order, if any."""
+    errors = sorted((result.position, result.error) for result in results if result.error is not None)
+    if errors:
+        raise errors[0][1]
+
+
+def for_item(value: PerItem[T], item: object) -> Optional[T]:
+    """A bulk option given either once for all items, or as a function of the item."""
+    if callable(value):
+        # pyright also counts a callable `T` here, whose result it can only type as `object`.
+        return value(item)  # pyright: ignore[reportReturnType]
+    return value
+
+
+def was_sent(error: BaseException, unsent: tuple[type[BaseException], ...] = UNSENT_ERRORS) -> bool:
+    """Whether the failed request may have reached the server, judging by `error` and its causes."""
+    cause: Optional[BaseException] = error
+    while cause is not None:
+        if isinstance(cause, unsent):
+            return False
+        cause = cause.__cause__ or cause.__context__
+    return True
+
+
+def is_transient(
+    error: IAMException,
+    policy: RetryPolicy,
+    *,
+    idempotent: bool = True,
+    unsent: tuple[type[BaseException], ...] = UNSENT_ERRORS,
+) -> bool:
+    """
+    Whether retrying may help, without risking a duplicate write.
+
+    A request that never reached the server is always worth retrying. Otherwise, idempotent
+    calls are retried after a connection error or a retryable status, and the others (e.g. a
+    create) only when `policy.retry_post` says duplicates are harmless.
+    """
+    if not was_sent(error, unsent):
+        return True
+    if not idempotent and not policy.retry_post:
+        return False
+    return error.status_code is None or error.status_code in policy.retry_statuses
+
+
+def call_with_retry(
+    policy: Optional[RetryPolicy],
+    func: Callable[..., T],
+    *args: Any,
+    idempotent: bool = True,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Call `func(*args)`, retrying transient `IAMException`s as `policy` allows. No policy, no retry.
+
+    Pass `idempotent=False` for calls that must not be repeated once the server got them, see
+    `is_transient`.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            result = func(*args)
+        except IAMException as e:
+            if policy is None or attempt >= policy.max_attempts or not is_transient(e, policy, idempotent=idempotent):
+                raise
+            delay = policy.backoff(attempt)
+        else:
+            return result
+        sleep(delay)
+
+
+def run_bulk(
+    work: Callable[[int, X], BulkResult],
+    items: Iterable[X],
+    *,
+    concurrency: int,
+    on_failure: FailurePolicy,
+    thread_name_prefix: str = "iamcore-bulk",
+) -> Generator[BulkResult, None, None]:
+    """
+    Run `work(index, item)` for every item with at most `concurrency` items in flight.
+
+    Items are read from `items` lazily, as slots free up, and results are yielded as they
+    finish, so they come out of order; use `BulkResult.position` to put them back in order.
+    With `FailurePolicy.ABORT`, the first failure stops new items from starting; the items
+    already in flight still finish and are yielded, and the rest are never attempted.
+    """
+    if concurrency < 1:
+        msg = f"concurrency must be positive, got {concurrency}"
+        raise ValueError(msg)
+    pending: Iterator[tuple[int, X]] = enumerate(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix)
+    try:
+        in_flight: set[Future[BulkResult]] = {
+            executor.submit(work, index, item) for index, item in itertools.islice(pending, concurrency)
+        }
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result.ok and on_failure == FailurePolicy.ABORT:
+                    pending = iter(())
+                in_flight.update(executor.submit(work, index, item) for index, item in itertools.islice(pending, 1))
+                yield result
+    finally:
+        # Items not started yet are dropped if the consumer stops early.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_chunked(
+    send: Callable[[list[X]], object],
+    items: Iterable[X],
+    *,
+    chunk_size: int,
+    concurrency: int,
+    on_failure: FailurePolicy,
+    retry: Optional[RetryPolicy],
+    thread_name_prefix: str = "iamcore-bulk",
+) -> Generator[BulkResult, None, None]:
+    """
+    Call `send(chunk)` for every chunk of `chunk_size` items, with `run_bulk`.
+
+    `retry` is used with `FailurePolicy.RETRY` only, and defaults to `RetryPolicy()` then.
+    Yields one `BulkResult` per chunk, whose `item` is the chunk.
+    """
+    if on_failure != FailurePolicy.RETRY:
+        retry = None
+    elif retry is None:
+        retry = RetryPolicy()
+
+    def run_chunk(position: int, chunk: list[X]) -> BulkResult:
+        try:
+            call_with_retry(retry, send, chunk)
+        except IAMException as e:
+            return BulkResult(position, chunk, error=e)
+        return BulkResult(position, chunk)
+
+    return run_bulk(
+        run_chunk,
+        chunked(items, chunk_size),
+        concurrency=concurrency,
+        on_failure=on_failure,
+        thread_name_prefix=thread_name_prefix,
+    )
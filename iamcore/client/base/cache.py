@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Protocol, TypeVar, cast
+
+from .principal import PrincipalResolver, credential_principal
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+
+logger = logging.getLogger(__name__)
+
+TENANT = "tenant"
+TENANT_ISSUER = "tenant_issuer"
+APPLICATION = "application"
+APPLICATION_RESOURCE_TYPE = "application_resource_type"
+
+DEFAULT_REFERENCE_TTLS: Mapping[str, float] = {
+    TENANT: 300.0,
+    TENANT_ISSUER: 3600.0,
+    APPLICATION: 300.0,
+    APPLICATION_RESOURCE_TYPE: 300.0,
+}
+DEFAULT_STALE_TTL = 60.0
+DEFAULT_REFERENCE_CACHE_SIZE = 1000
+DEFAULT_REFRESH_WORKERS = 2
+
+_SEPARATOR = "\0"
+
+T = TypeVar("T")
+
+
+class CacheEntry(NamedTuple):
+    """A cached value with the wall-clock times until which it is fresh, then usable while stale."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class CacheBackend(Protocol):
+    """
+    Storage behind a `ReferenceCache`.
+
+    Keys are strings and values are `CacheEntry` tuples holding DTOs; a backend shared between
+    processes has to serialize them (pydantic models pickle). Times are wall-clock seconds, so
+    entries stay meaningful across processes.
+    """
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under `key`, if any."""
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry` under `key`."""
+        ...
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every entry whose key starts with `prefix`."""
+        ...
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    Thread-safe in-process LRU backend.
+
+    Args:
+        max_size: Maximum number of entries kept; the least recently used are evicted first.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_REFERENCE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ReferenceCache:
+    """
+    Read-through cache for reference data that rarely changes: tenants, tenant issuers,
+    applications and application resource types.
+
+    Entries are kept per principal, for the TTL of their entity type. Once expired, an entry is
+    still served for `stale_ttl` seconds while it is refreshed in the background. Concurrent
+    misses for the same entry share one load. Clients sharing the cache invalidate the
+    affected entries when they create, update or delete the entity.
+
+    Args:
+        backend: Where entries are stored. Defaults to a `MemoryCacheBackend`.
+        ttls: Seconds an entry stays fresh, per entity type. Missing types use
+            `DEFAULT_REFERENCE_TTLS`; a TTL of 0 disables caching for the type.
+        stale_ttl: Seconds an expired entry is still served while being refreshed.
+        principal_resolver: Maps auth headers to a principal identity. Defaults to a digest
+            of the presented credential.
+        refresh_workers: Threads refreshing stale entries for the sync clients.
+        clock: Wall-clock time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        principal_resolver: PrincipalResolver = credential_principal,
+        refresh_workers: int = DEFAULT_REFRESH_WORKERS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = {**DEFAULT_REFERENCE_TTLS, **(ttls or {})}
+        self.stale_ttl = stale_ttl
+        self.principal_resolver = principal_resolver
+        self._refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._loads: dict[str, Future[Any]] = {}
+        self._async_loads: dict[str, asyncio.Task[Any]] = {}
+        # Bumped by every invalidation; loads started before it must not store their result.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, entity: str, scope: str, auth_headers: dict[str, str]) -> str:
+        """Backend key of an entry; `scope` identifies the object or query within the entity type."""
+        return _SEPARATOR.join((entity, scope, self.principal_resolver(auth_headers)))
+
+    def get_or_load(self, entity: str, scope: str, auth_headers: dict[str, str], loader: Callable[[], T]) -> T:
+        """Return the cached value, calling `loader` on a miss and in the background once stale."""
+        if self.ttls.get(entity, 0) <= 0:
+            return loader()
+        key = self.key(entity, scope, auth_headers)
+        entry = self._lookup(key)
+        if entry is None:
+            return self._load(key, entity, loader)
+        if entry.fresh_until <= self._clock():
+            self._refresh(key, entity, loader)
+        return cast("T", entry.value)
+
+    async def aget_or_load(
+        self,
+        entity: str,
+        scope: str,
+        auth_headers: dict[str, str],
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Async counterpart of `get_or_load`; stale entries are refreshed in a task."""
+        if self.ttls.get(entity, 0) <= 0:
+            return await loader()
+        key = self.key(entity, scope, auth_headers)
+        entry = self._lookup(key)
+        if entry is None:
+            return await asyncio.shield(self._aload(key, entity, loader))
+        if entry.fresh_until <= self._clock():
+            self._aload(key, entity, loader)
+        return cast("T", entry.value)
+
+    def invalidate(self, entity: str, scope_prefix: str = "") -> None:
+        """Forget the entries of `entity` whose scope starts with `scope_prefix`, for every principal."""
+        with self._lock:
+            self._generation += 1
+        self.backend.delete_prefix(entity + _SEPARATOR + scope_prefix)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        with self._lock:
+            self._generation += 1
+        self.backend.clear()
+
+    def close(self) -> None:
+        """Stop the background refresh threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self.backend.get(key)
+        with self._lock:
+            if entry is None or entry.stale_until <= self._clock():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry
+
+    def _store(self, key: str, entity: str, value: object, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+        now = self._clock()
+        fresh_until = now + self.ttls[entity]
+        self.backend.set(key, CacheEntry(value, fresh_until, fresh_until + self.stale_ttl))
+
+    def _load(self, key: str, entity: str, loader: Callable[[], T]) -> T:
+        """Load an entry, or wait for the load of it already in progress."""
+        with self._lock:
+            load = self._loads.get(key)
+            leader = load is None
+            if load is None:
+                load = self._loads[key] = Future()
+            generation = self._generation
+        if not leader:
+            return cast("T", load.result())
+        try:
+            value = loader()
+        except BaseException as e:
+            self._land(key)
+            load.set_exception(e)
+            raise
+        self._store(key, entity, value, generation)
+        self._land(key)
+        load.set_result(value)
+        return value
+
+    def _land(self, key: str) -> None:
+        with self._lock:
+            del self._loads[key]
+
+    def _refresh(self, key: str, entity: str, loader: Callable[[], object]) -> None:
+        with self._lock:
+            if key in self._loads:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._refresh_workers, thread_name_prefix="iamcore-cache")
+            executor = self._executor
+        executor.submit(self._refresh_quietly, key, entity, loader)
+
+    def _refresh_quietly(self, key: str, entity: str, loader: Callable[[], object]) -> None:
+        try:
+            self._load(key, entity, loader)
+        except Exception:
+            logger.warning("Background refresh of %s failed, serving the stale entry", entity, exc_info=True)
+
+    def _aload(self, key: str, entity: str, loader: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """Task loading an entry, shared by every coroutine missing it."""
+        task = self._async_loads.get(key)
+        if task is None:
+            task = self._async_loads[key] = asyncio.ensure_future(self._aload_and_store(key, entity, loader))
+            # Retrieve the error even if nobody awaits the task, e.g. for a background refresh.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _aload_and_store(self, key: str, entity: str, loader: Callable[[], Awaitable[T]]) -> T:
+        generation = self._generation
+        try:
+            value = await loader()
+        finally:
+            del self._async_loads[key]
+        self._store(key, entity, value, generation)
+        return value
+
+
+def query_scope(query: Optional[Mapping[str, Any]]) -> str:
+    """Cache scope of a query: its parameters as canonical JSON."""
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+def read_through(
+    cache: Optional[ReferenceCache],
+    entity: str,
+    scope: str,
+    auth_headers: dict[str, str],
+    loader: Callable[[], T],
+) -> T:
+    """`cache.get_or_load(...)`, or just `loader()` when there is no cache."""
+    if cache is None:
+        return loader()
+    return cache.get_or_load(entity, scope, auth_headers, loader)
+
+
+async def aread_through(
+    cache: Optional[ReferenceCache],
+    entity: str,
+    scope: str,
+    auth_headers: dict[str, str],
+    loader: Callable[[], Awaitable[T]],
+) -> T:
+    """`await cache.aget_or_load(...)`, or just `await loader()` when there is no cache."""
+    if cache is None:
+        return await loader()
+    return await cache.aget_or_load(entity, scope, auth_headers, loader)
+
+
+def invalidate(cache: Optional[ReferenceCache], entity: str, scope_prefix: str = "") -> None:
+    """`cache.invalidate(...)`, if there is a cache."""
+    if cache is not None:
+        cache.invalidate(entity, scope_prefix)
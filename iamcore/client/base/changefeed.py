@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from .models import PaginatedSearchFilter, generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 60.0
+DEFAULT_FULL_SYNC_INTERVAL = 3600.0
+# Incremental polls expect few changes, so they read small pages.
+DEFAULT_POLL_PAGE_SIZE = 100
+
+SORT_FIELD = "updated"
+SORT_DESCENDING = "desc"
+
+# Fractional seconds beyond microseconds, which `datetime` cannot hold.
+_EXTRA_DIGITS = re.compile(r"(\.\d{6})\d+")
+
+SearchFunc = Callable[[dict[str, str], PaginatedSearchFilter], Any]
+
+
+class ChangeType(str, Enum):
+    """How an entity changed."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    REMOVED = "removed"
+
+
+class ChangeEvent(NamedTuple):
+    """
+    One change seen by a `ChangeFeed`.
+
+    Attributes:
+        type: How the entity changed.
+        source: Name of the watched entity type, e.g. `"users"`.
+        key: IRN of the entity, as a string.
+        entity: The entity as returned by the search; `None` when it was removed.
+    """
+
+    type: ChangeType
+    source: str
+    key: str
+    entity: Any = None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an iamcore `created`/`updated` timestamp, which may carry nanoseconds and a `Z` suffix."""
+    value = _EXTRA_DIGITS.sub(r"\1", value)
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def entity_key(entity: Any) -> str:
+    return str(entity.irn)
+
+
+def entity_version(entity: Any) -> str:
+    """The `updated` timestamp of an entity, or a digest of its content for those without one, like policies."""
+    updated: Optional[str] = getattr(entity, "updated", None)
+    if updated is not None:
+        return updated
+    content = json.dumps(entity.model_dump(by_alias=True), sort_keys=True, default=str).encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class _Source:
+    """State of one watched entity type."""
+
+    def __init__(
+        self,
+        name: str,
+        search: SearchFunc,
+        search_filter: Optional[PaginatedSearchFilter],
+        key: Callable[[Any], str],
+        *,
+        incremental: bool,
+    ) -> None:
+        self.name = name
+        self.search = search
+        self.search_filter = search_filter or PaginatedSearchFilter()
+        self.key = key
+        self.incremental = incremental
+        # Version of every known entity, by key: its parsed `updated` timestamp when
+        # incremental, its content digest otherwise.
+        self.known: dict[str, Union[datetime, str]] = {}
+        # Newest `updated` timestamp seen; entities older than it are unchanged.
+        self.watermark: Optional[datetime] = None
+        self.synced_at: Optional[float] = None
+
+    def version(self, entity: Any) -> Union[datetime, str]:
+        return parse_timestamp(entity.updated) if self.incremental else entity_version(entity)
+
+    def parse_version(self, version: str) -> Union[datetime, str]:
+        return parse_timestamp(version) if self.incremental else version
+
+
+class ChangeFeed:
+    """
+    Add, modify and remove events for users, groups, resources, tenants or applications,
+    found by polling rather than by scanning everything.
+
+    Each watched entity type has a watermark: the newest `updated` timestamp seen. A poll
+    searches sorted by `updated`, newest first, and stops paging at the first entity older than
+    the watermark, so it costs one small page plus one page per `page_size` changes. Deleted
+    entities do not show up in such a search; they are found by a full sync, which lists every
+    entity (keeping only its key and timestamp) and runs on the first poll and then every
+    `full_sync_interval` seconds. A full sync also catches changes a poll missed, e.g. because
+    of clock skew between server nodes.
+
+    Listeners are called synchronously, from the polling thread, with each `ChangeEvent`, and
+    full sync listeners with the name of every entity type fully synced, once its events were
+    delivered.
+
+    Args:
+        auth_headers: Authorization headers of the searches.
+        poll_interval: Seconds between background polls, see `start`.
+        full_sync_interval: Seconds between full syncs.
+        page_size: Page size of incremental polls.
+        emit_initial: Emit an `ADDED` event for every entity found by the first full sync.
+            Otherwise the first sync only sets the baseline.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        auth_headers: dict[str, str],
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        full_sync_interval: float = DEFAULT_FULL_SYNC_INTERVAL,
+        page_size: int = DEFAULT_POLL_PAGE_SIZE,
+        emit_initial: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.auth_headers = auth_headers
+        self.poll_interval = poll_interval
+        self.full_sync_interval = full_sync_interval
+        self.page_size = page_size
+        self.emit_initial = emit_initial
+        self._clock = clock
+        self._sources: dict[str, _Source] = {}
+        self._listeners: list[Callable[[ChangeEvent], None]] = []
+        self._sync_listeners: list[Callable[[str], None]] = []
+        # Guards the sources and their state; never held during a search.
+        self._lock = threading.Lock()
+        # Serializes polls, so that two of them never apply the same changes twice.
+        self._polling = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(
+        self,
+        name: str,
+        search: SearchFunc,
+        search_filter: Optional[PaginatedSearchFilter] = None,
+        *,
+        key: Callable[[Any], str] = entity_key,
+        incremental: bool = True,
+    ) -> None:
+        """
+        Watch the entities returned by `search`, e.g. `iam_client.user.search`.
+
+        Args:
+            name: Name of the entity type, reported as `ChangeEvent.source`.
+            search: Search method of a client, taking the auth headers and a filter.
+            search_filter: Restricts the watched entities, e.g. to one tenant. Its sort and
+                pagination are overridden.
+            key: Returns the key of an entity. Defaults to its IRN.
+            incremental: Poll by `updated` timestamp. Entities without one, like policies, set it
+                to `False`; every poll is then a full sync comparing content digests.
+        """
+        with self._lock:
+            self._sources[name] = _Source(name, search, search_filter, key, incremental=incremental)
+
+    def seed(self, name: str, versions: Mapping[str, str], *, age: float = 0.0) -> None:
+        """
+        Start watching `name` from known state instead of a full sync, e.g. a persisted snapshot.
+
+        Args:
+            name: A watched entity type.
+            versions: `entity_version` of every known entity, by key.
+            age: Seconds since `versions` were last complete. The next full sync, which finds
+                removed entities, is due `full_sync_interval - age` seconds from now.
+        """
+        with self._lock:
+            source = self._sources[name]
+            source.known = {key: source.parse_version(version) for key, version in versions.items()}
+            if source.incremental:
+                source.watermark = max(
+                    (version for version in source.known.values() if isinstance(version, datetime)), default=None
+                )
+            source.synced_at = self._clock() - age
+
+    def subscribe(self, listener: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+        """Call `listener` with every `ChangeEvent`; returns a function unsubscribing it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def on_full_sync(self, listener: Callable[[str], None]) -> Callable[[], None]:
+        """
+        Call `listener` with the name of every entity type after a full sync of it, e.g. to
+        record that a copy kept current by the events is complete. Returns a function
+        unsubscribing it.
+        """
+        self._sync_listeners.append(listener)
+        return lambda: self._sync_listeners.remove(listener)
+
+    def poll(self) -> list[ChangeEvent]:
+        """Check every watched entity type now, notify the listeners, and return the events."""
+        events: list[ChangeEvent] = []
+        synced: list[str] = []
+        with self._polling:
+            with self._lock:
+                sources = list(self._sources.values())
+            for source in sources:
+                if (
+                    not source.incremental
+                    or source.synced_at is None
+                    or self._clock() - source.synced_at >= self.full_sync_interval
+                ):
+                    events.extend(self._full_sync(source))
+                    synced.append(source.name)
+                else:
+                    events.extend(self._incremental(source))
+        for event in events:
+            for listener in list(self._listeners):
+                listener(event)
+        for name in synced:
+            for sync_listener in list(self._sync_listeners):
+                sync_listener(name)
+        return events
+
+    def _incremental(self, source: _Source) -> list[ChangeEvent]:
+        with self._lock:
+            watermark = source.watermark
+        changed: list[tuple[Any, datetime]] = []
+        for entity in self._newest_first(source):
+            updated = parse_timestamp(entity.updated)
+            if watermark is not None and updated < watermark:
+                break
+            changed.append((entity, updated))
+        events: list[ChangeEvent] = []
+        with self._lock:
+            for entity, updated in changed:
+                event = self._observe(source, entity, updated)
+                if event is not None:
+                    events.append(event)
+                if source.watermark is None or updated > source.watermark:
+                    source.watermark = updated
+        return events
+
+    def _newest_first(self, source: _Source) -> Iterator[Any]:
+        """Entities by descending `updated`, fetching the next page only when it is reached."""
+        search_filter = source.search_filter.model_copy(
+            update={"sort": SORT_FIELD, "sort_order": SORT_DESCENDING, "page_size": self.page_size}
+        )
+        page = 1
+        while True:
+            search_filter.page = page
+            response = source.search(self.auth_headers, search_filter)
+            yield from response.data
+            if not response.data or page * self.page_size >= response.count:
+                return
+            page += 1
+
+    def _full_sync(self, source: _Source) -> list[ChangeEvent]:
+        with self._lock:
+            initial = source.synced_at is None
+            previous = dict(source.known)
+            newest = source.watermark
+        known: dict[str, Union[datetime, str]] = {}
+        events: list[ChangeEvent] = []
+        for entity in generic_search_all(self.auth_headers, source.search, source.search_filter):
+            key = source.key(entity)
+            version = known[key] = source.version(entity)
+            if isinstance(version, datetime) and (newest is None or version > newest):
+                newest = version
+            seen = previous.pop(key, None)
+            if seen is None:
+                if not initial or self.emit_initial:
+                    events.append(ChangeEvent(ChangeType.ADDED, source.name, key, entity))
+            elif seen != version:
+                events.append(ChangeEvent(ChangeType.MODIFIED, source.name, key, entity))
+        events.extend(ChangeEvent(ChangeType.REMOVED, source.name, key) for key in previous)
+        with self._lock:
+            source.known = known
+            source.watermark = newest
+            source.synced_at = self._clock()
+        return events
+
+    @staticmethod
+    def _observe(source: _Source, entity: Any, updated: datetime) -> Optional[ChangeEvent]:
+        key = source.key(entity)
+        seen = source.known.get(key)
+        if seen == updated:
+            return None
+        source.known[key] = updated
+        change = ChangeType.ADDED if seen is None else ChangeType.MODIFIED
+        return ChangeEvent(change, source.name, key, entity)
+
+    def start(self) -> None:
+        """Poll every `poll_interval` seconds on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iamcore-change-feed", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        self._poll_quietly()
+        while not self._stop.wait(self.poll_interval):
+            self._poll_quietly()
+
+    def _poll_quietly(self) -> None:
+        try:
+            self.poll()
+        except Exception:
+            logger.warning("Change feed poll failed, retrying at the next interval", exc_info=True)
+
+    def close(self) -> None:
+        """Stop the background polls."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
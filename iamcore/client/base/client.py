@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 from urllib.parse import urljoin
 
-import requests
-
 from iamcore.client.exceptions import IAMUnauthorizedException
 
 from .exception_handler import ResponseHandler
+from .irn import LAZY_IRNS
+from .transport import PooledTransport, Transport
+
+if TYPE_CHECKING:
+    import requests
 
 
 class HTTPMethod(str, Enum):
@@ -35,11 +38,15 @@ class HTTPClientWithTimeout:
         base_url: str,
         timeout: int = 30,
         api_version: Optional[APIVersion] = APIVersion.V1,
+        transport: Optional[Transport] = None,
     ) -> None:
         self.base_url: str = base_url
         if api_version:
             self.base_url = append_path_to_url(self.base_url, api_version)
         self.timeout: int = timeout
+        # Parse response IRNs lazily, see `LazyIRN`.
+        self.lazy_irns = False
+        self.transport: Transport = transport or PooledTransport()
 
     def _request(
         self,
@@ -49,8 +56,9 @@ class HTTPClientWithTimeout:
         data: Optional[Union[str, bytes]] = None,
         headers: Optional[dict[str, str]] = None,
         params: Optional[Union[str, dict[str, Union[str, int, bool]]]] = None,
+        stream: bool = False,
     ) -> requests.Response:
-        """Make a request to the HTTP server."""
+        """Make a request to the HTTP server. With `stream`, the body of a successful response is left unread."""
         if not headers:
             msg = "Missing authorization headers"
             raise IAMUnauthorizedException(msg)
@@ -59,14 +67,17 @@ class HTTPClientWithTimeout:
             headers["Content-Type"] = "application/json"
 
         url = append_path_to_url(self.base_url, path)
-        resp = requests.request(
+        resp = self.transport.request(
             method,
             url,
             data=data,
             headers=headers,
             timeout=self.timeout,
             params=params,
+            stream=stream,
         )
+        if self.lazy_irns:
+            setattr(resp, LAZY_IRNS, True)
         return ResponseHandler.handle_response(resp)
 
     def _get(
@@ -76,9 +87,10 @@ class HTTPClientWithTimeout:
         data: Optional[Union[str, bytes]] = None,
         headers: Optional[dict[str, str]] = None,
         params: Optional[Union[str, dict[str, Union[str, int, bool]]]] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Make a GET request to the HTTP server."""
-        return self._request(HTTPMethod.GET, path, data=data, headers=headers, params=params)
+        return self._request(HTTPMethod.GET, path, data=data, headers=headers, params=params, stream=stream)
 
     def _post(
         self,
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, Optional, TypeVar, cast
+
+from .singleflight import RequestKey, request_key, share
+
+if TYPE_CHECKING:
+    import requests
+
+    from iamcore.client.exceptions import ResponseLike
+
+    from .transport import RequestData, RequestParams, Transport
+
+DEFAULT_MAX_VALIDATED_RESPONSES = 256
+
+NOT_MODIFIED_STATUS = 304
+OK_STATUS = 200
+CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since", "if-match", "if-unmodified-since"})
+
+R = TypeVar("R", bound="ResponseLike")
+
+
+class ValidatedResponse(NamedTuple):
+    """A stored response with the validators the server sent along with it."""
+
+    response: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def is_conditional(method: str, headers: Optional[dict[str, str]], data: RequestData) -> bool:
+    """GETs the transport may revalidate: no body, and no validators set by the caller."""
+    if data is not None or method.upper() != "GET":
+        return False
+    return not any(name.lower() in CONDITIONAL_HEADERS for name in headers or {})
+
+
+class ConditionalBase(Generic[R]):
+    """Validated responses store shared by the sync and async conditional transports."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.revalidated = 0
+        self._entries: OrderedDict[RequestKey, ValidatedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: RequestKey) -> Optional[ValidatedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def _with_validators(headers: Optional[dict[str, str]], entry: Optional[ValidatedResponse]) -> dict[str, str]:
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _settle(self, key: RequestKey, entry: Optional[ValidatedResponse], resp: R) -> R:
+        """Response to hand to the caller: the stored one if `resp` says it has not changed."""
+        if entry is not None and resp.status_code == NOT_MODIFIED_STATUS:
+            with self._lock:
+                self.revalidated += 1
+            return cast("R", entry.response)
+        if resp.status_code != OK_STATUS:
+            return resp
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return resp
+            # Callers revalidating this response later get the DTOs already parsed from it.
+            share(resp)
+            self._entries[key] = ValidatedResponse(resp, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return resp
+
+
+class ConditionalTransport(ConditionalBase["requests.Response"]):
+    """
+    Transport wrapper revalidating GET responses with their ETag / Last-Modified validators.
+
+    Successful GET responses carrying an `ETag` or `Last-Modified` header are kept, keyed by
+    URL, params and headers (hence per credential). The next identical GET is sent with
+    `If-None-Match` / `If-Modified-Since`; when the server answers 304 Not Modified, the kept
+    response is returned instead, along with the DTOs already parsed from it, so callers must
+    not mutate them. Requests already carrying conditional headers and streamed requests are
+    passed through untouched.
+
+    Args:
+        transport: The transport actually sending the requests.
+        max_entries: Most responses kept; the least recently used are dropped first.
+    """
+
+    def __init__(self, transport: Transport, max_entries: int = DEFAULT_MAX_VALIDATED_RESPONSES) -> None:
+        super().__init__(max_entries)
+        self.transport = transport
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request, revalidating the response kept for it if there is one."""
+        if stream or not is_conditional(method, headers, data):
+            return self.transport.request(
+                method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+            )
+        key = request_key(method, url, params, headers)
+        entry = self._lookup(key)
+        resp = self.transport.request(
+            method, url, headers=self._with_validators(headers, entry), params=params, timeout=timeout
+        )
+        settled = self._settle(key, entry, resp)
+        if settled is not resp:
+            resp.close()
+        return settled
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
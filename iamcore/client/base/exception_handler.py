@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from http.client import BAD_REQUEST, CONFLICT, FORBIDDEN, UNAUTHORIZED
-from typing import TYPE_CHECKING, Optional
+from typing import Optional, TypeVar
 
 from iamcore.client.exceptions import (
     IAMBedRequestException,
@@ -9,10 +9,10 @@ from iamcore.client.exceptions import (
     IAMException,
     IAMForbiddenException,
     IAMUnauthorizedException,
+    ResponseLike,
 )
 
-if TYPE_CHECKING:
-    from requests import Response
+Response = TypeVar("Response", bound=ResponseLike)
 
 
 class ResponseHandler:
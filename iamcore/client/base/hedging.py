@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .breaker import endpoint_template
+from .limits import EVALUATE, endpoint_family
+
+if TYPE_CHECKING:
+    import requests
+
+    from .transport import RequestData, RequestParams, Transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_MAX_SAMPLES = 200
+DEFAULT_MIN_DELAY = 0.01
+DEFAULT_MAX_EXTRA_LOAD = 0.05
+DEFAULT_MAX_WORKERS = 32
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class HedgePolicy:
+    """
+    When a request gets a duplicate.
+
+    A request is hedged once it has been outstanding for longer than the `percentile` of the
+    recent latencies of its endpoint, and only while hedges stay within `max_extra_load` of
+    all requests. Until `min_samples` latencies are known, requests are not hedged.
+
+    Args:
+        percentile: Latency percentile, between 0 and 1, after which a duplicate is sent.
+        min_delay: Shortest delay before hedging, in seconds.
+        min_samples: Latencies needed for an endpoint before it is hedged.
+        max_samples: Recent latencies kept per endpoint.
+        max_extra_load: Most hedges, as a share of all hedgeable requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = DEFAULT_PERCENTILE,
+        min_delay: float = DEFAULT_MIN_DELAY,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        max_extra_load: float = DEFAULT_MAX_EXTRA_LOAD,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            msg = "percentile must be in (0, 1]"
+            raise ValueError(msg)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.max_extra_load = max_extra_load
+
+
+def is_hedgeable(method: str, url: str) -> bool:
+    """Read-only requests: safe methods, and the evaluation endpoints, which are POSTs without side effects."""
+    return method.upper() in READ_ONLY_METHODS or endpoint_family(url) == EVALUATE
+
+
+class HedgingBase:
+    """Latency tracking and hedge budget shared by the sync and async hedging transports."""
+
+    def __init__(self, policy: Optional[HedgePolicy], clock: Callable[[], float]) -> None:
+        self.policy = policy or HedgePolicy()
+        self.hedged = 0
+        self._latencies: dict[str, deque[float]] = {}
+        # Every hedgeable request adds `max_extra_load` of a token, every hedge takes one.
+        self._tokens = 1.0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to `endpoint`, or `None` to never hedge it."""
+        with self._lock:
+            self._tokens = min(1.0, self._tokens + self.policy.max_extra_load)
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.policy.min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(self.policy.percentile * len(ordered)))
+        return max(self.policy.min_delay, ordered[index])
+
+    def _hedge_available(self) -> bool:
+        """Whether a hedge could be sent now, without taking it."""
+        with self._lock:
+            return self._tokens >= 1
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def _record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.policy.max_samples)
+            latencies.append(latency)
+
+
+class HedgingTransport(HedgingBase):
+    """
+    Transport wrapper sending a duplicate of slow read-only requests and using whichever
+    response comes first.
+
+    The duplicate goes out on another pooled connection, so a slow replica or a stalled
+    connection only costs the hedge delay. Streamed requests are never hedged.
+
+    A request that may be hedged runs on a worker thread, so that the caller can take the
+    duplicate's response while the first attempt is still outstanding. Up to `max_workers`
+    requests run that way at once, and each has a thread reserved for its duplicate, so a hedge
+    never waits behind other requests. Requests beyond that, and those that could not be hedged
+    anyway (no latency history yet, or no hedge left in the `max_extra_load` budget), are sent
+    from the caller's thread.
+
+    Args:
+        transport: The transport actually sending the requests.
+        policy: Hedging rules. Defaults to `HedgePolicy()`.
+        max_workers: Most requests sent from worker threads at once.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        policy: Optional[HedgePolicy] = None,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, clock)
+        self.transport = transport
+        # Two threads per request: one for the first attempt and one kept for its duplicate.
+        self._executor = ThreadPoolExecutor(max_workers=2 * max_workers, thread_name_prefix="iamcore-hedge")
+        self._threads = threading.BoundedSemaphore(2 * max_workers)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request, hedging it if it is read-only and slower than usual."""
+        if stream or not is_hedgeable(method, url):
+            return self.transport.request(
+                method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+            )
+        endpoint = endpoint_template(method, url)
+        delay = self._hedge_delay(endpoint)
+
+        def send() -> requests.Response:
+            started = self._clock()
+            resp = self.transport.request(method, url, data=data, headers=headers, params=params, timeout=timeout)
+            self._record(endpoint, self._clock() - started)
+            return resp
+
+        if delay is None or not self._hedge_available() or not self._reserve_threads():
+            return send()
+        done, pending = wait({self._submit(send)}, timeout=delay)
+        if not done and self._take_hedge():
+            logger.debug("Hedging %s %s after %.3fs", method, url, delay)
+            pending.add(self._submit(send))
+        else:
+            self._threads.release()
+        return self._first_response(done, pending)
+
+    def _reserve_threads(self) -> bool:
+        """Reserve a thread for the first attempt and one for the duplicate, if both are free."""
+        if not self._threads.acquire(blocking=False):
+            return False
+        if not self._threads.acquire(blocking=False):
+            self._threads.release()
+            return False
+        return True
+
+    def _submit(self, send: Callable[[], requests.Response]) -> Future[requests.Response]:
+        """Run `send` on a reserved thread, which is given back once it returns."""
+        future = self._executor.submit(send)
+        future.add_done_callback(lambda _: self._threads.release())
+        return future
+
+    @staticmethod
+    def _first_response(
+        done: set[Future[requests.Response]], pending: set[Future[requests.Response]]
+    ) -> requests.Response:
+        """Result of the first attempt to succeed, or the last error if all of them fail."""
+        while True:
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded:
+                for loser in [*succeeded[1:], *pending]:
+                    loser.add_done_callback(_close_response)
+                return succeeded[0].result()
+            if not pending:
+                return next(iter(done)).result()
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    def close(self) -> None:
+        """Stop the thread pool and close the wrapped transport."""
+        self._executor.shutdown(wait=False)
+        self.transport.close()
+
+
+def _close_response(future: Future[requests.Response]) -> None:
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from base64 import b64decode, b64encode
+from typing import TYPE_CHECKING, Any, Optional
+
+from iamcore.irn import IRN
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pydantic import ValidationInfo
+
+_IRN_PREFIX = "irn:"
+_WILDCARD = "*"
+
+# Attributes set by `IRN.__init__`; reading any of them triggers the deferred parse.
+_PARSED_ATTRIBUTES = frozenset(
+    f"_IRN__{name}"
+    for name in ("account_id", "application", "tenant_id", "pool", "resource_type", "resource_path", "resource_id")
+)
+
+# Key of the pydantic validation context, and attribute of marked responses, that make response
+# DTOs hold `LazyIRN` objects.
+LAZY_IRNS = "lazy_irns"
+
+
+class LazyIRN(IRN):  # type: ignore[misc]  # iamcore.irn ships no type information
+    """
+    IRN that keeps the string it was created from and only parses it on first use.
+
+    `str()` returns the string as received and `to_base64()` is computed once, so bulk listings
+    that never look inside an IRN skip parsing altogether. Since parsing is deferred, a malformed
+    IRN raises `IRNException` on first attribute access rather than during validation.
+
+    Unlike `IRN`, which compares by identity, a lazy IRN equals any IRN with the same string.
+    """
+
+    def __init__(self, value: str) -> None:
+        if not (value.startswith(_IRN_PREFIX) or value == _WILDCARD):
+            value = b64decode(value.encode()).decode()
+        self._raw = value
+        self._base64: Optional[str] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _PARSED_ATTRIBUTES:
+            raise AttributeError(name)
+        self.__dict__.update(IRN.from_irn_str(self._raw).__dict__)
+        return self.__dict__[name]
+
+    def __str__(self) -> str:
+        return self._raw
+
+    def __repr__(self) -> str:
+        return self._raw
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IRN):
+            return NotImplemented
+        return self._raw == str(other)
+
+    def __hash__(self) -> int:
+        return hash(self._raw)
+
+    def to_base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = b64encode(self._raw.encode()).decode()
+        return self._base64
+
+
+def lazy_irns_context(*, enabled: bool = True) -> dict[str, Any]:
+    """
+    Validation context making response DTOs hold `LazyIRN` instead of eagerly parsed `IRN` objects.
+
+        User.model_validate_json(data, context=lazy_irns_context())
+    """
+    return {LAZY_IRNS: enabled}
+
+
+def response_context(response: object) -> Optional[dict[str, Any]]:
+    """Validation context for the DTOs of a response: lazy IRNs when its client marked it with `LAZY_IRNS`."""
+    return lazy_irns_context() if getattr(response, "__dict__", {}).get(LAZY_IRNS) else None
+
+
+def parse_irn(value: str, info: Optional[ValidationInfo] = None) -> IRN:
+    """Turn an IRN string (plain or base64) from a response into an `IRN`, lazily if the validation context asks for it."""
+    context: Mapping[str, Any] = (info.context if info is not None else None) or {}
+    return LazyIRN(value) if context.get(LAZY_IRNS) else IRN.of(value)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Generic, TypeVar, Union
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from iamcore.irn import IRN
+
+    from iamcore.client.policy.dto import PolicyStatement
+
+WILDCARD = "*"
+_SEPARATOR = ":"
+_PATH_SEPARATOR = "/"
+# irn, account, application, tenant and pool, followed by the resource type, path and ID.
+_TOKENS = 5
+
+IRNLike = Union["IRN", str]
+T = TypeVar("T")
+X = TypeVar("X")
+
+
+def irn_segments(irn: IRNLike) -> list[str]:
+    """
+    Split an IRN into the segments the index is keyed on.
+
+    `irn:acc:app:tenant:pool:type/path/id` becomes `["irn", "acc", "app", "tenant", "pool",
+    "type", "path", "id"]`. Wildcard IRNs keep their trailing `*` in the last segment.
+    """
+    tokens = str(irn).split(_SEPARATOR, _TOKENS)
+    if len(tokens) <= _TOKENS:
+        return tokens
+    return [*tokens[:_TOKENS], *tokens[_TOKENS].split(_PATH_SEPARATOR)]
+
+
+class _Node(Generic[T]):
+    __slots__ = ("children", "partial", "values", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[T]] = {}
+        # Values of the IRNs ending at this node.
+        self.values: list[T] = []
+        # Values of patterns ending with a `*` segment here, matching any continuation.
+        self.wildcard: list[T] = []
+        # Values of patterns whose last segment is `prefix*`, with that prefix.
+        self.partial: list[tuple[str, T]] = []
+
+    def walk(self) -> Iterator[T]:
+        yield from self.values
+        for child in self.children.values():
+            yield from child.walk()
+
+
+class IRNIndex(Generic[T]):
+    """
+    Segment trie of IRNs and IRN patterns, each mapped to a value.
+
+    Lookups follow the IRN segment by segment (account, application, tenant, pool, resource
+    type, path and ID), so they take time proportional to the depth of the IRN rather than to
+    the number of entries. Patterns may end with the `*` wildcard, either as a whole segment
+    (`...::document/*`) or after a prefix (`...::document/draft-*`), and then match any IRN
+    starting with them, like iamcore does.
+
+    Use `match` to find the patterns an IRN matches, e.g. the statements granting access to a
+    resource, and `under` to list the IRNs below a prefix.
+    """
+
+    def __init__(self, entries: Iterable[tuple[IRNLike, T]] = ()) -> None:
+        self._root: _Node[T] = _Node()
+        self._size = 0
+        for irn, value in entries:
+            self.add(irn, value)
+
+    @classmethod
+    def of(cls, irns: Iterable[IRNLike]) -> IRNIndex[IRNLike]:
+        """Index of IRNs mapped to themselves, e.g. the `data` of an `IamIRNsResponse` or allowed resource patterns."""
+        return IRNIndex((irn, irn) for irn in irns)
+
+    @classmethod
+    def of_statements(cls, statements: Iterable[PolicyStatement]) -> IRNIndex[PolicyStatement]:
+        """Index of the resource patterns of policy statements, mapped to their statement."""
+        return IRNIndex((irn, statement) for statement in statements for irn in statement.resources)
+
+    def add(self, irn: IRNLike, value: T) -> None:
+        """Map `irn`, which may be a wildcard pattern, to `value`."""
+        *path, last = irn_segments(irn)
+        node = self._root
+        for segment in path:
+            node = node.children.setdefault(segment, _Node())
+        if last == WILDCARD:
+            node.wildcard.append(value)
+        elif last.endswith(WILDCARD):
+            node.partial.append((last[: -len(WILDCARD)], value))
+        else:
+            node.children.setdefault(last, _Node()).values.append(value)
+        self._size += 1
+
+    def match(self, irn: IRNLike) -> list[T]:
+        """Values of every entry matching `irn`: the IRN itself and the wildcard patterns covering it."""
+        matched: list[T] = []
+        node = self._root
+        for segment in irn_segments(irn):
+            if node.wildcard:
+                matched.extend(node.wildcard)
+            if node.partial:
+                matched.extend(value for prefix, value in node.partial if segment.startswith(prefix))
+            child = node.children.get(segment)
+            if child is None:
+                return matched
+            node = child
+        matched.extend(node.values)
+        return matched
+
+    def matches(self, irn: IRNLike) -> bool:
+        """Whether any entry matches `irn`."""
+        return bool(self.match(irn))
+
+    def under(self, prefix: IRNLike) -> Iterator[T]:
+        """
+        Values of the IRNs (not the patterns) at or below `prefix`.
+
+        `prefix` is an IRN, or a pattern ending with `*` to only list what is below it.
+        """
+        *path, last = irn_segments(prefix)
+        node = self._root
+        for segment in path:
+            parent = node.children.get(segment)
+            if parent is None:
+                return
+            node = parent
+        if not last.endswith(WILDCARD):
+            child = node.children.get(last)
+            if child is not None:
+                yield from child.walk()
+            return
+        start = last[: -len(WILDCARD)]
+        for segment, child in node.children.items():
+            if segment.startswith(start):
+                yield from child.walk()
+
+    def filter(self, items: Iterable[X], key: Callable[[X], IRNLike] = str) -> Iterator[X]:
+        """
+        Items whose IRN matches an entry, e.g. to keep the `evaluate_all_resources` results or
+        listed resources covered by a set of patterns.
+
+        Args:
+            items: IRNs, or objects holding one.
+            key: Returns the IRN of an item, e.g. `lambda resource: resource.irn`.
+        """
+        return (item for item in items if self.matches(key(item)))
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Optional
+from urllib.parse import urlsplit
+
+from .retry import RETRYABLE_ERRORS
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+
+    import requests
+
+    from .transport import RequestData, RequestParams, Transport
+
+logger = logging.getLogger(__name__)
+
+EVALUATE = "evaluate"
+ADMIN = "admin"
+
+# Statuses meaning the server is shedding load, as opposed to rejecting the request itself.
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+DEFAULT_BACKOFF_RATIO = 0.9
+
+
+def endpoint_family(url: str) -> str:
+    """Endpoint family of a request URL: `EVALUATE` for policy evaluation, `ADMIN` for the rest."""
+    return EVALUATE if EVALUATE in urlsplit(url).path.split("/") else ADMIN
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate` tokens per second, holding at most `burst`.
+
+    Callers reserve a token and wait for the returned delay, so waiters are served in order
+    and the bucket can go negative while they sleep.
+
+    Args:
+        rate: Tokens added per second.
+        burst: Capacity of the bucket. Defaults to one second worth of tokens.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AIMDLimit:
+    """
+    Concurrency limit adjusted by additive increase, multiplicative decrease.
+
+    Each request completed without overload raises the limit by `1 / limit`, i.e. by about one
+    per window of requests. Each overload signal multiplies it by `backoff_ratio`.
+
+    Args:
+        max_limit: Upper bound, and the starting point unless `initial` is given.
+        min_limit: Lower bound.
+        initial: Starting limit.
+        backoff_ratio: Factor applied on overload.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        initial: Optional[int] = None,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            msg = "limits must satisfy 1 <= min_limit <= max_limit"
+            raise ValueError(msg)
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(min(max_limit, max(min_limit, initial if initial is not None else max_limit)))
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def update(self, *, overloaded: bool) -> None:
+        """Adjust the limit after one completed request."""
+        with self._lock:
+            if overloaded:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+
+class EndpointLimit:
+    """
+    Client-side limits for one endpoint family.
+
+    Args:
+        rate: Requests per second. `None` disables rate limiting.
+        burst: Requests allowed at once above `rate`. Defaults to one second worth.
+        max_concurrency: Most requests in flight. The actual limit adapts between
+            `min_concurrency` and this value as the server signals overload (429/503 or
+            timeouts). `None` disables concurrency limiting.
+        min_concurrency: Floor of the adaptive concurrency limit.
+        backoff_ratio: Factor applied to the concurrency limit on overload.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.backoff_ratio = backoff_ratio
+
+
+class FamilyState:
+    """Rate and concurrency state of one endpoint family, shared by every request to it."""
+
+    def __init__(self, limit: EndpointLimit, clock: Callable[[], float]) -> None:
+        self.bucket = TokenBucket(limit.rate, limit.burst, clock=clock) if limit.rate else None
+        self.concurrency = (
+            AIMDLimit(limit.max_concurrency, min_limit=limit.min_concurrency, backoff_ratio=limit.backoff_ratio)
+            if limit.max_concurrency
+            else None
+        )
+        self.in_flight = 0
+
+    def has_room(self) -> bool:
+        return self.concurrency is None or self.in_flight < self.concurrency.limit
+
+    def record(self, *, overloaded: bool) -> None:
+        if self.concurrency is not None:
+            self.concurrency.update(overloaded=overloaded)
+
+
+class LimitingTransportBase:
+    """Per-family state shared by the sync and async limiting transports."""
+
+    def __init__(self, limits: Mapping[str, EndpointLimit], clock: Callable[[], float]) -> None:
+        unknown = set(limits) - {EVALUATE, ADMIN}
+        if unknown:
+            msg = f"Unknown endpoint families {sorted(unknown)}, expected {EVALUATE!r} or {ADMIN!r}"
+            raise ValueError(msg)
+        self.families = {family: FamilyState(limit, clock) for family, limit in limits.items()}
+
+    def _state(self, url: str) -> Optional[FamilyState]:
+        return self.families.get(endpoint_family(url))
+
+
+class LimitedTransport(LimitingTransportBase):
+    """
+    Transport wrapper throttling requests per endpoint family.
+
+    Each family in `limits` gets a token bucket and an adaptive concurrency limit, shared by
+    every sub-client using this transport. Requests to families missing from `limits` pass
+    straight through. Wrap it in a `RetryTransport` so that retries are throttled too.
+
+    Args:
+        transport: The transport actually sending the requests.
+        limits: Limits keyed by endpoint family (`EVALUATE` or `ADMIN`).
+        sleep: Called with the number of seconds to wait for a rate token.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        limits: Mapping[str, EndpointLimit],
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(limits, clock)
+        self.transport = transport
+        self._sleep = sleep
+        self._slots = threading.Condition()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request once its endpoint family has a free slot and a rate token."""
+        state = self._state(url)
+        if state is None:
+            return self.transport.request(
+                method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+            )
+        with self._slot(state):
+            if state.bucket is not None:
+                delay = state.bucket.reserve()
+                if delay:
+                    logger.debug("Throttling %s %s for %.2fs", method, url, delay)
+                    self._sleep(delay)
+            try:
+                resp = self.transport.request(
+                    method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+                )
+            except RETRYABLE_ERRORS:
+                state.record(overloaded=True)
+                raise
+            state.record(overloaded=resp.status_code in OVERLOAD_STATUSES)
+            return resp
+
+    @contextmanager
+    def _slot(self, state: FamilyState) -> Generator[None, None, None]:
+        with self._slots:
+            self._slots.wait_for(state.has_room)
+            state.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._slots:
+                state.in_flight -= 1
+                self._slots.notify_all()
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
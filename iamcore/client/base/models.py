@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import itertools
+import math
 import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Protocol, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Protocol, TypeVar, Union, cast
 
 from iamcore.irn import IRN
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
-from typing_extensions import Self
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, ValidationInfo, field_validator
 
 from iamcore.client.exceptions import IAMException
 
+from .irn import parse_irn, response_context
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, MutableMapping
+
+    from typing_extensions import Self
+
+    from iamcore.client.exceptions import ResponseLike
+
+
+# Set by the single-flight and conditional transports on responses shared by several callers,
+# so they also share the models parsed from them.
+SHARED_MODELS_ATTRIBUTE = "_iamcore_shared_models"
 
 
 class IAMCoreBaseModel(BaseModel):
@@ -40,6 +54,30 @@ class IAMCoreBaseModel(BaseModel):
             msg = f"Validation error for {cls.__name__}: {e}"
             raise IAMException(msg) from e
 
+    @classmethod
+    def from_response(cls, response: ResponseLike) -> Self:
+        """
+        Create model instance straight from the raw response body.
+
+        The bytes go through pydantic-core's JSON parser in a single pass, without building an
+        intermediate dict tree. Validation errors are left to the caller's `err_chain`, which maps
+        them to the client's exception type.
+
+        A response shared by coalesced requests is parsed once per model class, and every caller
+        gets the same instance. IRN fields are `LazyIRN` objects when the client that sent the
+        request has `lazy_irns` set.
+        """
+        shared: Optional[MutableMapping[type[IAMCoreBaseModel], IAMCoreBaseModel]] = getattr(
+            response, "__dict__", {}
+        ).get(SHARED_MODELS_ATTRIBUTE)
+        context = response_context(response)
+        if shared is None:
+            return cls.model_validate_json(response.content, context=context)
+        model = shared.get(cls)
+        if model is None:
+            model = shared.setdefault(cls, cls.model_validate_json(response.content, context=context))
+        return cast("Self", model)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary with optional field aliasing."""
         return self.model_dump(by_alias=True)
@@ -68,9 +106,9 @@ class IamIRNResponse(IAMCoreBaseModel):
 
     @field_validator("data", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
 
@@ -82,9 +120,9 @@ class IamIRNsResponse(IAMCoreBaseModel):
 
     @field_validator("data", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> list[IRN]:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> list[IRN]:
         if isinstance(v, list):
-            return [IRN.of(s) for s in v if isinstance(s, str)]
+            return [parse_irn(s, info) for s in v if isinstance(s, str)]
         return v
 
 
@@ -108,6 +146,10 @@ def generic_search_all(
     auth_headers: dict[str, str],
     func: _SearchFunc[T],
     search_filter: Optional[PaginatedSearchFilter] = None,
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+    start_page: int = 1,
 ) -> Generator[T, None, None]:
     """
     Generic generator to handle paginated search requests and yield all results.
@@ -116,9 +158,15 @@ def generic_search_all(
         auth_headers: Authentication headers for the API call.
         func: The specific search function to call for each page.
         search_filter: An optional filter. A copy will be used to avoid side effects.
+        concurrency: Maximum number of pages fetched in parallel once the first page has
+            revealed the total count. `1` fetches pages strictly one after another.
+        ordered: When prefetching concurrently, yield items in page order. Otherwise pages
+            are yielded as soon as they arrive.
+        start_page: First page to fetch, e.g. to resume an interrupted export. Pages hold
+            `SEARCH_ALL_PAGE_SIZE` items.
 
     Yields:
-        All entities of type T from the paginated search.
+        All entities of type T from the paginated search, from `start_page` on.
     """
     # Create a deep copy to avoid mutating the original object.
     # If no filter is provided, create a new one.
@@ -127,8 +175,14 @@ def generic_search_all(
     # Set our internal page size for this operation.
     paginator_filter.page_size = SEARCH_ALL_PAGE_SIZE
 
-    page = 1
-    items_yielded = 0
+    if concurrency > 1:
+        yield from _prefetch_search_all(
+            auth_headers, func, paginator_filter, concurrency, ordered=ordered, start_page=start_page
+        )
+        return
+
+    page = start_page
+    items_yielded = (start_page - 1) * SEARCH_ALL_PAGE_SIZE
     total_items = -1  # Initialize to a sentinel value
 
     while True:
@@ -151,3 +205,49 @@ def generic_search_all(
             break
 
         page += 1
+
+
+def _prefetch_search_all(
+    auth_headers: dict[str, str],
+    func: _SearchFunc[T],
+    paginator_filter: PaginatedSearchFilter,
+    concurrency: int,
+    *,
+    ordered: bool,
+    start_page: int = 1,
+) -> Generator[T, None, None]:
+    """Fetch `start_page`, then the following ones in parallel with at most `concurrency` in flight."""
+    paginator_filter.page = start_page
+    first = func(auth_headers, paginator_filter)
+    if not first.data:
+        return
+    yield from first.data
+
+    page_size = first.page_size or paginator_filter.page_size or SEARCH_ALL_PAGE_SIZE
+    last_page = math.ceil(first.count / page_size)
+    if last_page <= start_page:
+        return
+
+    def fetch(page: int) -> IamEntitiesResponse[T]:
+        return func(auth_headers, paginator_filter.model_copy(update={"page": page}))
+
+    pages = iter(range(start_page + 1, last_page + 1))
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="iamcore-search-all")
+    try:
+        in_flight = deque(executor.submit(fetch, page) for page in itertools.islice(pages, concurrency))
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [future for future in in_flight if future in completed]
+                for future in done:
+                    in_flight.remove(future)
+            for future in done:
+                data = future.result().data
+                # Keep the window full while the caller consumes this page.
+                in_flight.extend(executor.submit(fetch, page) for page in itertools.islice(pages, 1))
+                yield from data
+    finally:
+        # Drop pages nobody is going to read if the consumer stops early or a page fails.
+        executor.shutdown(wait=False, cancel_futures=True)
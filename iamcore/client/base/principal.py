@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+CREDENTIAL_HEADERS = ("Authorization", "X-iamcore-API-Key")
+
+PrincipalResolver = Callable[[dict[str, str]], str]
+
+
+def credential_principal(auth_headers: dict[str, str]) -> str:
+    """
+    Identify the principal by a digest of the credential it presents.
+
+    The raw token is never stored. Claims inside the token are deliberately not trusted,
+    because the cache answers without the server ever seeing (and verifying) the token.
+    """
+    digest = hashlib.sha256()
+    for header in CREDENTIAL_HEADERS:
+        digest.update(auth_headers.get(header, "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Optional, TypeVar, cast
+
+from iamcore.irn import IRN
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from .irn import LazyIRN
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from iamcore.client.exceptions import ResponseLike
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class Record(Generic[M]):
+    """
+    Immutable, slotted view of a DTO, built from decoded JSON without pydantic validation.
+
+    Subclasses set `MODEL` and list the model's field names in `__slots__`. Attributes have the
+    same names as on the model; IRN fields hold a `LazyIRN`. Since nothing is validated, a
+    record carries whatever the server sent, and `to_model()` validates it on demand.
+
+    Records compare equal when they have the same type and field values, and can be copied and
+    pickled, e.g. to hand them to worker processes.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    MODEL: ClassVar[type[BaseModel]]
+    # (attribute, JSON key, converter) for every slot.
+    _fields: ClassVar[tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model_fields = cls.MODEL.model_fields
+        if set(cls.__slots__) != set(model_fields):
+            msg = f"{cls.__name__}.__slots__ must list exactly the fields of {cls.MODEL.__name__}"
+            raise TypeError(msg)
+        cls._fields = tuple(
+            (name, model_fields[name].alias or name, LazyIRN if model_fields[name].annotation is IRN else None)
+            for name in cls.__slots__
+        )
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> Self:
+        """Build a record from one decoded JSON object; missing keys become `None`."""
+        record = cls.__new__(cls)
+        for name, key, convert in cls._fields:
+            value = data.get(key)
+            if convert is not None and isinstance(value, str):
+                value = convert(value)
+            object.__setattr__(record, name, value)
+        return record
+
+    def to_model(self) -> M:
+        """Validate the record into the full DTO."""
+        return cast("M", self.MODEL.model_validate({name: getattr(self, name) for name in self.__slots__}))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"{type(self).__name__} is read-only"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{type(self).__name__} is read-only"
+        raise AttributeError(msg)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        # Lists and objects (e.g. `metadata`) are left out, being unhashable.
+        values = (getattr(self, name) for name in self.__slots__)
+        return hash((type(self), *(value for value in values if not isinstance(value, (list, dict)))))
+
+    def __reduce__(self) -> tuple[Callable[[dict[str, Any]], Self], tuple[dict[str, Any]]]:
+        return type(self).from_data, ({key: getattr(self, name) for name, key, _ in self._fields},)
+
+
+R = TypeVar("R", bound=Record[Any])
+# `from_response` is called on the unparameterized class, so it binds its own type variable.
+S = TypeVar("S", bound=Record[Any])
+
+
+class RecordPage(Generic[R]):
+    """One page of search results as records, shaped like the `Iam*sResponse` DTOs."""
+
+    __slots__ = ("count", "data", "page", "page_size")
+
+    def __init__(self, data: list[R], count: int, page: int, page_size: int) -> None:
+        self.data = data
+        self.count = count
+        self.page = page
+        self.page_size = page_size
+
+    @staticmethod
+    def from_response(response: ResponseLike, record_type: type[S]) -> RecordPage[S]:
+        """Decode the body with pydantic-core's JSON parser and wrap every item in `record_type`."""
+        payload = from_json(response.content)
+        return RecordPage(
+            [record_type.from_data(item) for item in payload.get("data") or ()],
+            payload.get("count", 0),
+            payload.get("page", 0),
+            payload.get("pageSize", 0),
+        )
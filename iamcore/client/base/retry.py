@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+import requests
+
+from iamcore.client.exceptions import IAMException, ResponseLike
+
+from .exception_handler import ResponseHandler
+
+if TYPE_CHECKING:
+    from .transport import RequestData, RequestParams, Transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+ERROR_STATUS = 400
+
+DEFAULT_BUDGET_MAX_TOKENS = 100.0
+DEFAULT_BUDGET_TOKEN_RATIO = 0.1
+
+
+class RetryPolicy:
+    """
+    Rules deciding whether, and after how long, a failed request is sent again.
+
+    Args:
+        max_attempts: Total number of attempts, including the first one.
+        backoff_base: Upper bound of the first backoff, in seconds. It doubles with every attempt.
+        backoff_max: Cap on the backoff, in seconds.
+        retry_statuses: Response status codes worth retrying.
+        retry_post: Also retry POST and PATCH, which are not idempotent. Only enable this when
+            the server side deduplicates, or a duplicate is harmless.
+        max_retry_after: Longest `Retry-After` the client is willing to wait, in seconds. A
+            response asking for a longer pause is not retried.
+        rng: Random source for the jitter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        retry_post: bool = False,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.retry_post = retry_post
+        self.max_retry_after = max_retry_after
+        self._rng = rng or random.Random()  # noqa: S311 - jitter does not need a CSPRNG
+
+    def allows_method(self, method: str) -> bool:
+        """Whether requests with this method may be sent more than once."""
+        return method.upper() in IDEMPOTENT_METHODS or self.retry_post
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff after the given (1-based) failed attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self._rng.uniform(0, ceiling)
+
+    def delay(self, attempt: int, retry_after: Optional[str]) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or `None` if the server asked for a longer pause
+        than `max_retry_after`.
+        """
+        backoff = self.backoff(attempt)
+        wait = parse_retry_after(retry_after) if retry_after else None
+        if wait is None:
+            return backoff
+        if wait > self.max_retry_after:
+            return None
+        return max(wait, backoff)
+
+
+def parse_retry_after(value: str, now: Optional[datetime] = None) -> Optional[float]:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date into seconds from `now`."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries relative to normal traffic, so they cannot amplify an outage.
+
+    Every retryable failure takes a token and every success returns `token_ratio` of one. Retries
+    stop while the bucket is at most half full, and resume once enough requests succeed again.
+
+    Args:
+        max_tokens: Capacity of the bucket.
+        token_ratio: Tokens returned per successful request.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: float = DEFAULT_BUDGET_MAX_TOKENS,
+        token_ratio: float = DEFAULT_BUDGET_TOKEN_RATIO,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> bool:
+        """Take a token for a retryable failure and tell whether a retry is still allowed."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+# Shared by every retrying transport that is not given its own budget.
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+RETRYABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+class RetryingTransportBase:
+    """Retry decisions shared by the sync and async retrying transports."""
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy],
+        budget: Optional[RetryBudget],
+        clock: Callable[[], float],
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or DEFAULT_RETRY_BUDGET
+        self._clock = clock
+
+    def _delay_after_error(self, method: str, url: str, error: Exception, attempt: int, started: float) -> float:
+        """Delay before resending after a connection error. Raises once no attempt is left."""
+        if not self.policy.allows_method(method):
+            raise error
+        delay = self._next_delay(attempt, None)
+        if delay is None:
+            msg = f"{method} {url} failed after {attempt} attempt(s): {error}"
+            raise IAMException(msg, attempts=attempt, elapsed=self._clock() - started) from error
+        return delay
+
+    def _delay_after_response(self, method: str, resp: ResponseLike, attempt: int, started: float) -> Optional[float]:
+        """
+        Delay before resending, or `None` to hand the response to the caller.
+
+        Raises the annotated error of the response once no attempt is left, or when an error
+        response ends a request that was already retried.
+        """
+        retryable = resp.status_code in self.policy.retry_statuses
+        if not retryable:
+            self.budget.record_success()
+        if not retryable or not self.policy.allows_method(method):
+            # Not a 304, which the conditional transport above turns into its stored response.
+            if attempt > 1 and resp.status_code >= ERROR_STATUS:
+                self._raise_annotated(resp, attempt, started)
+            return None
+        delay = self._next_delay(attempt, resp.headers.get("Retry-After"))
+        if delay is None:
+            self._raise_annotated(resp, attempt, started)
+        return delay
+
+    def _raise_annotated(self, resp: ResponseLike, attempt: int, started: float) -> None:
+        """Raise the error of an unsuccessful response with the attempts made so far."""
+        try:
+            ResponseHandler.handle_response(resp)
+        except IAMException as e:
+            e.attempts = attempt
+            e.elapsed = self._clock() - started
+            raise
+
+    def _next_delay(self, attempt: int, retry_after: Optional[str]) -> Optional[float]:
+        if not self.budget.record_failure() or attempt >= self.policy.max_attempts:
+            return None
+        return self.policy.delay(attempt, retry_after)
+
+
+class RetryTransport(RetryingTransportBase):
+    """
+    Transport wrapper that resends failed idempotent requests.
+
+    Connection errors, timeouts and responses with a retryable status are retried according to
+    `policy`, within `budget`. Once attempts run out, the last error is raised as an
+    `IAMException` carrying `attempts` and `elapsed`, as is an error response ending a request
+    that was retried. Any other response is returned as is.
+
+    Args:
+        transport: The transport actually sending the requests.
+        policy: Retry rules. Defaults to `RetryPolicy()`.
+        budget: Retry budget. Defaults to the process-wide `DEFAULT_RETRY_BUDGET`.
+        sleep: Called with the number of seconds to wait between attempts.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(policy, budget, clock)
+        self.transport = transport
+        self._sleep = sleep
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request, retrying transient failures."""
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = self.transport.request(
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except RETRYABLE_ERRORS as e:
+                delay = self._delay_after_error(method, url, e, attempt, started)
+            else:
+                retry_delay = self._delay_after_response(method, resp, attempt, started)
+                if retry_delay is None:
+                    return resp
+                # The body of a discarded streamed response would otherwise hold the connection.
+                resp.close()
+                delay = retry_delay
+
+            logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, url, delay, attempt + 1)
+            self._sleep(delay)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional, Union
+
+from .models import SHARED_MODELS_ATTRIBUTE
+
+if TYPE_CHECKING:
+    import requests
+
+    from iamcore.client.exceptions import ResponseLike
+
+    from .transport import RequestData, RequestParams, Transport
+
+RequestKey = tuple[str, str, Union[str, tuple[tuple[str, str], ...], None], tuple[tuple[str, str], ...]]
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: RequestParams,
+    headers: Optional[dict[str, str]],
+) -> RequestKey:
+    """
+    Identity of a request for coalescing.
+
+    All headers are part of the key, so requests made with different credentials (or any other
+    difference in headers) never share a response.
+    """
+    frozen_params = tuple(sorted((k, str(v)) for k, v in params.items())) if isinstance(params, dict) else params
+    return method.upper(), url, frozen_params, tuple(sorted((headers or {}).items()))
+
+
+def share(response: ResponseLike) -> None:
+    """Make every caller handed `response` also share the models parsed from it."""
+    if SHARED_MODELS_ATTRIBUTE not in getattr(response, "__dict__", {}):
+        setattr(response, SHARED_MODELS_ATTRIBUTE, {})
+
+
+class SingleFlightTransport:
+    """
+    Transport wrapper coalescing identical in-flight GET requests into one network call.
+
+    While a GET is in flight, identical ones (same URL, params and headers, hence the same
+    credentials) wait for it instead of being sent, and all callers get the same response.
+    DTOs parsed from it with `from_response` are shared too, so callers must not mutate them.
+    Errors reach every waiting caller. Streamed requests are never coalesced.
+
+    Args:
+        transport: The transport actually sending the requests.
+    """
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+        self._in_flight: dict[RequestKey, Future[requests.Response]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request, or wait for the identical one already in flight."""
+        if stream or data is not None or method.upper() != "GET":
+            return self.transport.request(
+                method, url, data=data, headers=headers, params=params, timeout=timeout, stream=stream
+            )
+        key = request_key(method, url, params, headers)
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._in_flight[key] = Future()
+        if not leader:
+            return flight.result()
+
+        try:
+            resp = self.transport.request(method, url, headers=headers, params=params, timeout=timeout)
+        except BaseException as e:
+            self._land(key)
+            flight.set_exception(e)
+            raise
+        share(resp)
+        self._land(key)
+        flight.set_result(resp)
+        return resp
+
+    def _land(self, key: RequestKey) -> None:
+        # Requests made from now on start a new flight instead of reusing this response.
+        with self._lock:
+            del self._in_flight[key]
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .changefeed import ChangeType, entity_key, entity_version
+from .irn import lazy_irns_context
+from .models import generic_search_all
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from .changefeed import ChangeEvent, ChangeFeed, SearchFunc
+    from .models import PaginatedSearchFilter
+
+M = TypeVar("M", bound=BaseModel)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS kinds (
+    kind TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _row(kind: str, entity: BaseModel) -> tuple[str, str, str, str]:
+    data = json.dumps(entity.model_dump(by_alias=True), default=str)
+    return kind, entity_key(entity), entity_version(entity), data
+
+
+class SnapshotStore:
+    """
+    Local SQLite copy of SDK entities, for workers to start from disk instead of `search_all`.
+
+    Entities are stored per kind (e.g. `"policies"`), by IRN, with their JSON and their version:
+    the `updated` timestamp, or a content digest for entities without one. They are read back
+    as the DTOs the sub-clients return. Each kind also records when its whole content was last
+    known complete, so a kind that is legitimately empty is not fetched again.
+
+    `track` loads a kind and keeps it current through a `ChangeFeed`: the feed is seeded with the
+    stored versions, so the background revalidation only fetches what changed since, every
+    change it finds is written back, and each of its full syncs marks the kind complete again.
+
+    Args:
+        path: The database file, created if missing. `":memory:"` keeps it in memory.
+        lazy_irns: Load entities with `LazyIRN` fields, deferring IRN parsing to first use.
+        clock: Wall-clock time source, in seconds, persisted across processes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, PathLike[str]],
+        *,
+        lazy_irns: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self._context = lazy_irns_context(enabled=lazy_irns)
+        self._clock = clock
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._feeds: weakref.WeakSet[ChangeFeed] = weakref.WeakSet()
+
+    def load(self, kind: str, model: type[M]) -> list[M]:
+        """Every stored entity of `kind`, as `model` instances."""
+        with self._lock:
+            rows = self._connection.execute("SELECT data FROM entities WHERE kind = ?", (kind,)).fetchall()
+        return [model.model_validate_json(data, context=self._context) for (data,) in rows]
+
+    def get(self, kind: str, key: str, model: type[M]) -> Optional[M]:
+        """The stored entity of `kind` with IRN `key`, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM entities WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return None if row is None else model.model_validate_json(row[0], context=self._context)
+
+    def versions(self, kind: str) -> dict[str, str]:
+        """Version of every stored entity of `kind`, by IRN."""
+        with self._lock:
+            rows = self._connection.execute("SELECT key, version FROM entities WHERE kind = ?", (kind,)).fetchall()
+        return dict(rows)
+
+    def synced_at(self, kind: str) -> Optional[float]:
+        """When the content of `kind` was last known complete; `None` if it was never stored whole."""
+        with self._lock:
+            row = self._connection.execute("SELECT synced_at FROM kinds WHERE kind = ?", (kind,)).fetchone()
+        return None if row is None else row[0]
+
+    def replace(self, kind: str, entities: Iterable[BaseModel]) -> None:
+        """Make `entities` the whole content of `kind`, in one transaction."""
+        rows = [_row(kind, entity) for entity in entities]
+        with self._lock, self._transaction():
+            self._connection.execute("DELETE FROM entities WHERE kind = ?", (kind,))
+            self._connection.executemany("INSERT INTO entities VALUES (?, ?, ?, ?)", rows)
+            self._connection.execute("INSERT OR REPLACE INTO kinds VALUES (?, ?)", (kind, self._clock()))
+
+    def mark_synced(self, kind: str) -> None:
+        """
+        Record that the stored content of `kind` is complete as of now; use as a
+        `ChangeFeed.on_full_sync` listener. Kinds never stored whole with `replace` are ignored.
+        """
+        with self._lock:
+            self._connection.execute("UPDATE kinds SET synced_at = ? WHERE kind = ?", (self._clock(), kind))
+
+    def upsert(self, kind: str, entities: Iterable[BaseModel]) -> None:
+        """Store `entities`, replacing the stored versions of the same IRNs."""
+        rows = [_row(kind, entity) for entity in entities]
+        with self._lock, self._transaction():
+            self._connection.executemany("INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)", rows)
+
+    def remove(self, kind: str, keys: Iterable[str]) -> None:
+        """Delete the stored entities of `kind` with these IRNs."""
+        with self._lock, self._transaction():
+            self._connection.executemany(
+                "DELETE FROM entities WHERE kind = ? AND key = ?", [(kind, key) for key in keys]
+            )
+
+    def apply(self, event: ChangeEvent) -> None:
+        """Write a `ChangeEvent` back; use as a `ChangeFeed` listener."""
+        if event.type is ChangeType.REMOVED:
+            self.remove(event.source, [event.key])
+        else:
+            self.upsert(event.source, [event.entity])
+
+    def track(
+        self,
+        feed: ChangeFeed,
+        kind: str,
+        search: SearchFunc,
+        model: type[M],
+        search_filter: Optional[PaginatedSearchFilter] = None,
+    ) -> list[M]:
+        """
+        Load `kind` and keep it revalidated by `feed`.
+
+        When `kind` was never stored, every entity is fetched once with `search` and stored.
+        Either way `feed` watches `search` from the stored versions and this store applies its
+        events, so the next polls only fetch changes. The feed's first full sync, which finds
+        entities removed meanwhile, is due `full_sync_interval` after the kind was last fetched
+        whole, by `track` or a full sync of the feed, so right away when that is longer ago.
+
+        Args:
+            feed: The change feed revalidating the store, e.g. on its background thread.
+            kind: Name of the entity type, also used as the feed's source name.
+            search: Search method of a client, e.g. `iam_client.policy.search`.
+            model: DTO type of the entities, e.g. `Policy`.
+            search_filter: Restricts the stored entities, e.g. to one tenant.
+
+        Returns:
+            The entities, as loaded from disk or fetched.
+        """
+        synced_at = self.synced_at(kind)
+        if synced_at is None:
+            entities = list(generic_search_all(feed.auth_headers, search, search_filter))
+            self.replace(kind, entities)
+            age = 0.0
+        else:
+            entities = self.load(kind, model)
+            age = max(0.0, self._clock() - synced_at)
+        feed.watch(kind, search, search_filter, incremental="updated" in model.model_fields)
+        feed.seed(kind, self.versions(kind), age=age)
+        if feed not in self._feeds:
+            self._feeds.add(feed)
+            feed.subscribe(self.apply)
+            feed.on_full_sync(self.mark_synced)
+        return entities
+
+    def _transaction(self) -> sqlite3.Connection:
+        # The connection runs in autocommit mode; as a context manager it commits or rolls back
+        # the transaction opened by BEGIN.
+        self._connection.execute("BEGIN")
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
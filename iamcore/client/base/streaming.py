@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .irn import response_context
+from .models import SEARCH_ALL_PAGE_SIZE, PaginatedSearchFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+    import requests
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+_WHITESPACE = b" \t\r\n"
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPENERS = b"{["
+
+# States of the top-level object scanner.
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ITEMS, _AFTER_ITEM, _DONE = range(8)
+
+# Single-character transitions of the scanner; values and keys are read separately.
+_TRANSITIONS = {
+    (_START, "{"): _KEY,
+    (_KEY, "}"): _DONE,
+    (_COLON, ":"): _VALUE,
+    (_AFTER_VALUE, ","): _KEY,
+    (_AFTER_VALUE, "}"): _DONE,
+    (_ITEMS, "]"): _AFTER_VALUE,
+    (_AFTER_ITEM, ","): _ITEMS,
+    (_AFTER_ITEM, "]"): _AFTER_VALUE,
+}
+
+
+def _string_end(buf: bytearray, pos: int) -> Optional[int]:
+    """Index just past the string opening at `pos`, or `None` if the buffer ends first."""
+    i = pos + 1
+    while True:
+        match = _STRING_SPECIAL.search(buf, i)
+        if match is None:
+            return None
+        if buf[match.start()] == _BACKSLASH:
+            i = match.start() + 2
+            continue
+        return match.end()
+
+
+def _value_end(buf: bytearray, pos: int) -> Optional[int]:
+    """Index just past the JSON value starting at `pos`, or `None` if the buffer ends first."""
+    first = buf[pos]
+    if first == _QUOTE:
+        return _string_end(buf, pos)
+    if first not in _OPENERS:
+        match = _SCALAR_END.search(buf, pos)
+        return match.start() if match else None
+
+    depth = 0
+    i = pos
+    while True:
+        match = _STRUCTURAL.search(buf, i)
+        if match is None:
+            return None
+        char = buf[match.start()]
+        if char == _QUOTE:
+            end = _string_end(buf, match.start())
+            if end is None:
+                return None
+            i = end
+            continue
+        depth += 1 if char in _OPENERS else -1
+        i = match.end()
+        if depth == 0:
+            return i
+
+
+class _ArraySplitter:
+    """Scanner over a JSON object that picks out the items of one array field."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.state = _START
+        self.name = ""
+        self.fields: dict[str, Any] = {}
+        self.item: Optional[bytes] = None
+
+    @property
+    def done(self) -> bool:
+        return self.state == _DONE
+
+    def step(self, buf: bytearray, pos: int) -> Optional[int]:
+        """Consume the token at `pos` and return the position after it, or `None` if it is incomplete."""
+        char = chr(buf[pos])
+        if self.state == _VALUE and self.name == self.key and char == "[":
+            self.state = _ITEMS
+            return pos + 1
+        next_state = _TRANSITIONS.get((self.state, char))
+        if next_state is not None:
+            self.state = next_state
+            return pos + 1
+        if self.state == _KEY and char == '"':
+            return self._read(buf, pos, _COLON, self._set_name)
+        if self.state == _VALUE:
+            return self._read(buf, pos, _AFTER_VALUE, self._set_field)
+        if self.state == _ITEMS:
+            return self._read(buf, pos, _AFTER_ITEM, self._set_item)
+        msg = f"Unexpected {char!r} in JSON document"
+        raise ValueError(msg)
+
+    def _read(self, buf: bytearray, pos: int, next_state: int, store: Callable[[bytes], None]) -> Optional[int]:
+        end = _value_end(buf, pos)
+        if end is not None:
+            store(bytes(buf[pos:end]))
+            self.state = next_state
+        return end
+
+    def _set_name(self, raw: bytes) -> None:
+        self.name = json.loads(raw)
+
+    def _set_field(self, raw: bytes) -> None:
+        self.fields[self.name] = json.loads(raw)
+
+    def _set_item(self, raw: bytes) -> None:
+        self.item = raw
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Generator[bytes, None, dict[str, Any]]:
+    """
+    Incrementally split the `key` array of a JSON object into the raw bytes of its items.
+
+    Only the item being read (plus one chunk) is buffered at a time. The other top-level fields
+    may come before or after the array; they are decoded and returned as the generator's value.
+
+    Raises:
+        ValueError: If the document is not a JSON object or ends prematurely.
+    """
+    source = iter(chunks)
+    splitter = _ArraySplitter(key)
+    buf = bytearray()
+    pos = 0
+
+    while not splitter.done:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        end = splitter.step(buf, pos) if pos < len(buf) else None
+        if end is not None:
+            pos = end
+            if splitter.item is not None:
+                yield splitter.item
+                splitter.item = None
+            continue
+
+        # The buffer ends inside a token: drop what has been consumed and read on.
+        del buf[:pos]
+        pos = 0
+        chunk = next(source, None)
+        if chunk is None:
+            msg = "JSON document ended prematurely"
+            raise ValueError(msg)
+        buf += chunk
+
+    return splitter.fields
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class StreamedPage(Generic[M]):
+    """
+    One page of search results, validated item by item while the body is still downloading.
+
+    Iterate it once. Afterwards, `received` holds the number of items and `fields` the other
+    top-level fields of the page, such as `count`.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        item_type: type[M],
+        *,
+        key: str = "data",
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        self.response = response
+        self.item_type = item_type
+        self.key = key
+        self.chunk_size = chunk_size
+        self.received = 0
+        self.fields: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[M]:
+        items = iter_json_array(self.response.iter_content(self.chunk_size), self.key)
+        context = response_context(self.response)
+        try:
+            while True:
+                raw = next(items)
+                self.received += 1
+                yield self.item_type.model_validate_json(raw, context=context)
+        except StopIteration as stop:
+            self.fields = stop.value
+        finally:
+            # Release the connection even when the consumer stops early.
+            self.response.close()
+
+
+_StreamFunc = Callable[[dict[str, str], PaginatedSearchFilter], "requests.Response"]
+
+
+def generic_stream_all(
+    auth_headers: dict[str, str],
+    func: _StreamFunc,
+    item_type: type[M],
+    search_filter: Optional[PaginatedSearchFilter] = None,
+) -> Generator[M, None, None]:
+    """
+    Streaming counterpart of `generic_search_all`.
+
+    Pages are fetched one after another and each item is validated and yielded as soon as it
+    has been received, so memory is bounded by one item rather than one page.
+
+    Args:
+        auth_headers: Authentication headers for the API call.
+        func: Sends the search request for a page with `stream=True` and returns the response.
+        item_type: The model every item of the `data` array is validated into.
+        search_filter: An optional filter. A copy will be used to avoid side effects.
+
+    Yields:
+        All entities of `item_type` from the paginated search.
+    """
+    paginator_filter = search_filter.model_copy(deep=True) if search_filter else PaginatedSearchFilter()
+    paginator_filter.page_size = SEARCH_ALL_PAGE_SIZE
+
+    page = 1
+    items_yielded = 0
+    total_items: Optional[int] = None
+
+    while True:
+        paginator_filter.page = page
+        streamed = StreamedPage(func(auth_headers, paginator_filter), item_type)
+        yield from streamed
+
+        # The count may follow the data array, so it is only known once the page is read.
+        if total_items is None:
+            total_items = int(streamed.fields.get("count", 0))
+
+        items_yielded += streamed.received
+        if not streamed.received or items_yielded >= total_items:
+            break
+
+        page += 1
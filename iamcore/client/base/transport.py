@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Protocol, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 60.0
+
+RequestData = Optional[Union[str, bytes]]
+RequestParams = Optional[Union[str, dict[str, Union[str, int, bool]]]]
+
+
+class Transport(Protocol):
+    """Pluggable HTTP transport shared by the resource clients."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request and return the raw response, whatever its status code.
+
+        With `stream`, the body is left unread for the caller to consume incrementally.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release every connection held by the transport."""
+        ...
+
+
+class PooledTransport:
+    """
+    Keep-alive transport backed by a single pooled `requests.Session`.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        pool_block: Block callers once `pool_maxsize` connections to a host are busy
+            instead of opening extra, non-pooled connections.
+        idle_timeout: Seconds without traffic after which pooled connections are dropped,
+            since servers and load balancers usually close them by then. `None` disables it.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        idle_timeout: Optional[float] = DEFAULT_POOL_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._session = self._new_session()
+        self._last_used = clock()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session currently in use."""
+        return self._session
+
+    def _acquire_session(self) -> requests.Session:
+        with self._lock:
+            now = self._clock()
+            if self.idle_timeout is not None and now - self._last_used > self.idle_timeout:
+                self._session.close()
+                self._session = self._new_session()
+            self._last_used = now
+            return self._session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: RequestData = None,
+        headers: Optional[dict[str, str]] = None,
+        params: RequestParams = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request over a pooled keep-alive connection."""
+        session = self._acquire_session()
+        return session.request(
+            method,
+            url,
+            data=data,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        """Close the session and every pooled connection."""
+        with self._lock:
+            self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
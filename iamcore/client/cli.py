@@ -0,0 +1,560 @@
+"""
+`iamcore` command-line tool: export and import SDK entities as NDJSON.
+
+    iamcore export users -o users.ndjson.gz --concurrency 4
+    iamcore import users -i users.ndjson.gz --concurrency 16 --resume --password 'Initial-1'
+
+Exported records are turned back into create requests: policies get their `type` as `level`,
+groups are created under the parent named by their `path`, parents first, and users, whose
+passwords are never exported, all get `--password`/`IAMCORE_IMPORT_PASSWORD` and must change it
+at their first login.
+
+The connection is configured like `BaseConfig` (`IAMCORE_URL`, `IAMCORE_ISSUER_URL`, ...), and
+requests are authenticated with `--api-key`/`IAMCORE_API_KEY` or `--token`/`IAMCORE_TOKEN`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import itertools
+import json
+import math
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, NamedTuple, Optional, TypeVar, cast
+
+from iamcore.irn import IRN
+from pydantic import ValidationError
+
+from iamcore.client import Client
+from iamcore.client.application.dto import CreateApplication
+from iamcore.client.auth.client import get_api_key_auth_headers
+from iamcore.client.base.bulk import DEFAULT_BULK_CONCURRENCY, BulkResult, FailurePolicy, call_with_retry, run_bulk
+from iamcore.client.base.models import SEARCH_ALL_PAGE_SIZE, PaginatedSearchFilter, generic_search_all
+from iamcore.client.base.retry import RetryPolicy
+from iamcore.client.base.transport import DEFAULT_POOL_MAXSIZE
+from iamcore.client.config import BaseConfig
+from iamcore.client.exceptions import IAMConflictException, IAMException
+from iamcore.client.group.dto import CreateGroup
+from iamcore.client.policy.dto import CreatePolicy
+from iamcore.client.resource.dto import CreateResource
+from iamcore.client.tenant.dto import CreateTenant
+from iamcore.client.user.dto import CreateUser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from iamcore.client.base.models import IAMCoreBaseModel
+
+DEFAULT_EXPORT_CONCURRENCY = 4
+# Records between two checkpoints; with gzip, also the size of each compressed member.
+CHECKPOINT_EVERY = 1_000
+CHECKPOINT_SUFFIX = ".checkpoint"
+# Lines buffered between the page fetchers and the writer thread.
+WRITE_QUEUE_SIZE = 10_000
+PROGRESS_INTERVAL = 10.0
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_STDIO = "-"
+# `BulkResult.value` of imported lines whose entity already exists.
+_EXISTING = "existing"
+# Exports are sorted on a field fixed at creation, so that resuming one finds the same pages.
+SORT_ASCENDING = "asc"
+# Required action making imported users replace the shared import password.
+UPDATE_PASSWORD = "UPDATE_PASSWORD"  # noqa: S105 - an action name, not a password
+
+T = TypeVar("T")
+
+# Turns an exported record into the fields of the create DTO, given the import password.
+CreateFields = Callable[[dict[str, Any], Optional[str]], dict[str, Any]]
+
+
+def _same_fields(record: dict[str, Any], _password: Optional[str]) -> dict[str, Any]:
+    return record
+
+
+def _user_fields(record: dict[str, Any], password: Optional[str]) -> dict[str, Any]:
+    """Exports carry no password: every user gets `password`, and must change it at first login."""
+    if not password:
+        msg = "users are exported without passwords, an import password is needed"
+        raise IAMException(msg)
+    required_actions: list[str] = list(record.get("requiredActions") or ())
+    if UPDATE_PASSWORD not in required_actions:
+        required_actions.append(UPDATE_PASSWORD)
+    return {**record, "password": password, "confirmPassword": password, "requiredActions": required_actions}
+
+
+def _policy_fields(record: dict[str, Any], _password: Optional[str]) -> dict[str, Any]:
+    """Policies are exported with their `type`, and created with it as `level`, in the tenant of their IRN."""
+    fields = {**record, "level": record.get("type")}
+    irn = record.get("irn")
+    if isinstance(irn, str) and "tenantID" not in record:
+        fields["tenantID"] = IRN.of(irn).tenant_id or None
+    return fields
+
+
+def _group_fields(record: dict[str, Any], _password: Optional[str]) -> dict[str, Any]:
+    """Groups are exported with the `path` of their parent, whose ID is its IRN: it is rebuilt from their own."""
+    path = str(record.get("path") or "").strip("/")
+    irn = record.get("irn")
+    if not path or not isinstance(irn, str) or "parentID" in record:
+        return record
+    parent_path, _, parent_name = path.rpartition("/")
+    group = IRN.of(irn)
+    parent = IRN.create(
+        account_id=group.account_id,
+        application=group.application,
+        tenant_id=group.tenant_id,
+        resource_type=group.resource_type,
+        resource_path=parent_path,
+        resource_id=parent_name,
+    )
+    return {**record, "parentID": parent.to_base64()}
+
+
+def _path_depth(line: bytes) -> int:
+    """Number of segments of the `path` of the record on `line`; 0 for lines that do not parse."""
+    try:
+        path = _read_record(line).get("path")
+    except IAMException:
+        return 0
+    return len([segment for segment in path.split("/") if segment]) if isinstance(path, str) else 0
+
+
+class _Entity(NamedTuple):
+    """How to read and create one entity type."""
+
+    client: str
+    create_model: type[IAMCoreBaseModel]
+    create_fields: CreateFields = _same_fields
+    # Field the export is sorted on; it must not change once the entity exists.
+    sort: str = "created"
+    # Whether entities are nested by `path`, so that an import creates parents first.
+    nested: bool = False
+
+
+ENTITIES: dict[str, _Entity] = {
+    "users": _Entity("user", CreateUser, _user_fields),
+    "groups": _Entity("group", CreateGroup, _group_fields, nested=True),
+    "policies": _Entity("policy", CreatePolicy, _policy_fields, sort="name"),
+    "resources": _Entity("resource", CreateResource),
+    "tenants": _Entity("tenant", CreateTenant),
+    "applications": _Entity("application", CreateApplication),
+}
+
+
+class Stats:
+    """Record count and request latencies of a run, safe to update from several threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.records = 0
+        self.failed = 0
+        self.existing = 0
+        self.latencies: list[float] = []
+        self._clock = clock
+        self._started = clock()
+        self._reported = self._started
+        self._lock = threading.Lock()
+
+    def timed(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Wrap `func` to record the latency of every call."""
+
+        def call(*args: Any) -> T:
+            started = self._clock()
+            try:
+                return func(*args)
+            finally:
+                latency = self._clock() - started
+                with self._lock:
+                    self.latencies.append(latency)
+
+        return call
+
+    def percentile(self, fraction: float) -> float:
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, math.ceil(fraction * len(latencies)) - 1)]
+
+    def summary(self, verb: str, entity: str) -> str:
+        elapsed = max(self._clock() - self._started, 1e-9)
+        line = f"{verb} {self.records} {entity} in {elapsed:.1f}s ({self.records / elapsed:.0f}/s)"
+        if self.existing:
+            line += f", {self.existing} already existing"
+        if self.failed:
+            line += f", {self.failed} failed"
+        p50, p95, p100 = (self.percentile(fraction) * 1000 for fraction in (0.5, 0.95, 1.0))
+        return f"{line}; request latency p50 {p50:.0f}ms, p95 {p95:.0f}ms, max {p100:.0f}ms"
+
+    def progress(self, verb: str, entity: str, stream: IO[str]) -> None:
+        """Write the summary to `stream` at most every `PROGRESS_INTERVAL` seconds."""
+        now = self._clock()
+        if now - self._reported >= PROGRESS_INTERVAL:
+            self._reported = now
+            stream.write(self.summary(verb, entity) + "\n")
+
+
+def read_checkpoint(path: Path) -> dict[str, Any]:
+    """The saved checkpoint, or an empty one."""
+    try:
+        checkpoint: dict[str, Any] = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    return checkpoint
+
+
+def write_checkpoint(path: Path, checkpoint: dict[str, Any]) -> None:
+    """Save a checkpoint atomically, so a crash leaves either the old or the new one."""
+    partial = path.with_name(path.name + ".tmp")
+    partial.write_text(json.dumps(checkpoint))
+    partial.replace(path)
+
+
+class NDJSONWriter(threading.Thread):
+    """
+    Background thread writing lines to a file in batches of `CHECKPOINT_EVERY`.
+
+    Each batch is flushed, and written as its own gzip member when compressing, before the
+    checkpoint records the number of lines, the byte offset after it and the IRN of its last
+    entity. Resuming truncates the file back to that offset, so a batch is never half written
+    nor written twice.
+    """
+
+    def __init__(
+        self,
+        output: IO[bytes],
+        *,
+        compress: bool,
+        checkpoint: Optional[Path],
+        written: int = 0,
+    ) -> None:
+        super().__init__(name="iamcore-export-writer", daemon=True)
+        self.output = output
+        self.compress = compress
+        self.checkpoint = checkpoint
+        self.written = written
+        self.error: Optional[BaseException] = None
+        self._lines: queue.Queue[Optional[tuple[bytes, str]]] = queue.Queue(WRITE_QUEUE_SIZE)
+
+    def put(self, line: bytes, irn: str) -> None:
+        self._lines.put((line, irn))
+
+    def finish(self) -> None:
+        """Write the remaining lines and wait for the thread."""
+        self._lines.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+
+    def run(self) -> None:
+        batch: list[tuple[bytes, str]] = []
+        try:
+            while (line := self._lines.get()) is not None:
+                batch.append(line)
+                if len(batch) >= CHECKPOINT_EVERY:
+                    self._write(batch)
+                    batch = []
+            self._write(batch)
+        except BaseException as e:  # noqa: BLE001 - re-raised in `finish`
+            self.error = e
+            # Keep draining so producers never block on a full queue.
+            while self._lines.get() is not None:
+                pass
+
+    def _write(self, batch: list[tuple[bytes, str]]) -> None:
+        if not batch:
+            return
+        data = b"".join(line for line, _ in batch)
+        self.output.write(gzip.compress(data) if self.compress else data)
+        self.output.flush()
+        self.written += len(batch)
+        if self.checkpoint is not None:
+            checkpoint = {"records": self.written, "offset": self.output.tell(), "last": batch[-1][1]}
+            write_checkpoint(self.checkpoint, checkpoint)
+
+
+def export_entities(
+    client: Client,
+    auth_headers: dict[str, str],
+    entity: str,
+    output: str,
+    *,
+    compress: bool = False,
+    concurrency: int = DEFAULT_EXPORT_CONCURRENCY,
+    resume: bool = False,
+    stderr: Optional[IO[str]] = None,
+) -> Stats:
+    """
+    Write every `entity` as one JSON object per line, in the DTO's wire format.
+
+    Pages are prefetched `concurrency` at a time and serialized while a writer thread
+    compresses and writes them. With a file `output`, a checkpoint next to it records progress,
+    and `resume` continues from it instead of starting over. Entities are sorted on a field
+    fixed at creation, so entities created meanwhile come last; a resume first reads the last
+    entity exported again and raises `IAMException` if it moved, e.g. after deletions.
+    """
+    log: IO[str] = stderr or sys.stderr
+    sub_client = getattr(client, ENTITIES[entity].client)
+    search_filter = PaginatedSearchFilter(sort=ENTITIES[entity].sort, sortOrder=SORT_ASCENDING)
+    stats = Stats()
+    to_stdout = output == _STDIO
+    checkpoint = None if to_stdout else Path(output + CHECKPOINT_SUFFIX)
+    saved = read_checkpoint(checkpoint) if checkpoint is not None and resume else {}
+    written = saved.get("records", 0)
+
+    if to_stdout:
+        stream: IO[bytes] = sys.stdout.buffer
+    elif saved:
+        stream = Path(output).open("r+b")  # noqa: SIM115 - closed below
+        stream.truncate(saved["offset"])
+        stream.seek(saved["offset"])
+    else:
+        stream = Path(output).open("wb")  # noqa: SIM115 - closed below
+
+    writer = NDJSONWriter(stream, compress=compress, checkpoint=checkpoint, written=written)
+    writer.start()
+    try:
+        # A resume starts at the last entity exported, to check that it is still in its place.
+        start = max(written - 1, 0)
+        pages = generic_search_all(
+            auth_headers,
+            stats.timed(sub_client.search),
+            search_filter,
+            concurrency=concurrency,
+            start_page=start // SEARCH_ALL_PAGE_SIZE + 1,
+        )
+        entities = itertools.islice(pages, start % SEARCH_ALL_PAGE_SIZE, None)
+        if written:
+            last = next(entities, None)
+            if last is None or str(last.irn) != saved.get("last"):
+                msg = f"the {entity} changed since the checkpoint was written, export them again without --resume"
+                raise IAMException(msg)
+        for item in entities:
+            line = json.dumps(item.model_dump(by_alias=True), default=str).encode() + b"\n"
+            writer.put(line, str(item.irn))
+            stats.records += 1
+            stats.progress("exported", entity, log)
+    finally:
+        try:
+            writer.finish()
+        finally:
+            if not to_stdout:
+                stream.close()
+    if checkpoint is not None:
+        checkpoint.unlink(missing_ok=True)
+    return stats
+
+
+def _is_gzip(source: IO[bytes]) -> bool:
+    """Whether `source` starts like a gzip file, looking ahead without consuming it."""
+    return isinstance(source, io.BufferedReader) and source.peek(len(_GZIP_MAGIC))[: len(_GZIP_MAGIC)] == _GZIP_MAGIC
+
+
+def _read_lines(source: IO[bytes]) -> Iterator[bytes]:
+    if _is_gzip(source):
+        with gzip.open(source) as lines:
+            yield from lines
+    else:
+        yield from source
+
+
+def import_entities(
+    client: Client,
+    auth_headers: dict[str, str],
+    entity: str,
+    source: str,
+    *,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    retry: Optional[RetryPolicy] = None,
+    resume: bool = False,
+    password: Optional[str] = None,
+    stderr: Optional[IO[str]] = None,
+) -> Stats:
+    """
+    Create one `entity` per NDJSON line of `source`, plain or gzip-compressed.
+
+    Lines are mapped to the create DTO (unknown keys, like IDs, are ignored; policies get their
+    `type` as `level`, users get `password`, groups the ID of their parent) and created with up
+    to `concurrency` requests in flight, retrying transient errors with `retry` (a create that
+    reached the server is only resent if `retry.retry_post` is set). Nested entities are read
+    whole and created one `path` depth after the other, so parents exist before their children.
+    Entities that already exist are counted, not failed; other failures are reported on
+    `stderr` with their line number. With a file `source`, a checkpoint next to it records the
+    lines up to the first failure, and `resume` skips them, so failed lines are tried again.
+    """
+    log: IO[str] = stderr or sys.stderr
+    sub_client = getattr(client, ENTITIES[entity].client)
+    model = ENTITIES[entity].create_model
+    create_fields = ENTITIES[entity].create_fields
+    nested = ENTITIES[entity].nested
+    stats = Stats()
+    create = stats.timed(sub_client.create)
+    from_stdin = source == _STDIO
+    checkpoint = None if from_stdin else Path(source + CHECKPOINT_SUFFIX)
+    done = read_checkpoint(checkpoint).get("lines", 0) if checkpoint is not None and resume else 0
+
+    def create_line(_index: int, numbered: tuple[int, bytes]) -> BulkResult:
+        # Results are positioned by line number, as nested entities are not created in file order.
+        number, line = numbered
+        try:
+            params = model.from_dict(create_fields(_read_record(line), password))
+            call_with_retry(retry, create, dict(auth_headers), params, idempotent=False)
+        except IAMConflictException:
+            return BulkResult(number, line, value=_EXISTING)
+        except IAMException as e:
+            return BulkResult(number, line, error=e)
+        return BulkResult(number, line)
+
+    stream = sys.stdin.buffer if from_stdin else Path(source).open("rb")  # noqa: SIM115 - closed below
+    try:
+        lines = itertools.islice(enumerate(_read_lines(stream)), done, None)
+        levels = _by_depth(lines) if nested else [lines]
+        # Lines below `done` all succeeded; later ones may finish out of order. A failed line
+        # holds `done` back, so that a resumed import tries it again.
+        finished: set[int] = set()
+        for level in levels:
+            for result in run_bulk(
+                create_line,
+                level,
+                concurrency=concurrency,
+                on_failure=FailurePolicy.CONTINUE,
+                thread_name_prefix="iamcore-import",
+            ):
+                stats.records += 1
+                if not result.ok:
+                    stats.failed += 1
+                    log.write(f"line {result.position + 1}: {result.error}\n")
+                else:
+                    if result.value == _EXISTING:
+                        stats.existing += 1
+                    finished.add(result.position)
+                while done in finished:
+                    finished.remove(done)
+                    done += 1
+                if checkpoint is not None and stats.records % CHECKPOINT_EVERY == 0:
+                    write_checkpoint(checkpoint, {"lines": done})
+                stats.progress("imported", entity, log)
+    finally:
+        if not from_stdin:
+            stream.close()
+    if checkpoint is not None:
+        write_checkpoint(checkpoint, {"lines": done})
+    return stats
+
+
+def _by_depth(lines: Iterable[tuple[int, bytes]]) -> list[list[tuple[int, bytes]]]:
+    """Numbered lines grouped by the depth of their record's `path`, shallowest first, each in file order."""
+    levels: dict[int, list[tuple[int, bytes]]] = {}
+    for number, line in lines:
+        levels.setdefault(_path_depth(line), []).append((number, line))
+    return [levels[depth] for depth in sorted(levels)]
+
+
+def _read_record(line: bytes) -> dict[str, Any]:
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        msg = f"invalid JSON: {e}"
+        raise IAMException(msg) from e
+    if not isinstance(record, dict):
+        msg = "expected a JSON object"
+        raise IAMException(msg)
+    return cast("dict[str, Any]", record)
+
+
+def _auth_headers(args: argparse.Namespace) -> dict[str, str]:
+    if args.api_key:
+        return get_api_key_auth_headers(args.api_key)
+    if args.token:
+        return {"Authorization": f"Bearer {args.token}"}
+    msg = "no credentials: pass --api-key or --token, or set IAMCORE_API_KEY or IAMCORE_TOKEN"
+    raise SystemExit(msg)
+
+
+def _client(args: argparse.Namespace) -> Client:
+    # Explicit settings override the environment, which provides the others.
+    settings: dict[str, Any] = {"iamcore_url": args.url} if args.url else {}
+    config = BaseConfig(**settings)
+    return Client(
+        config.iamcore_url_str,
+        config.get_iamcore_issuer_url,
+        config.iamcore_client_timeout,
+        pool_maxsize=max(DEFAULT_POOL_MAXSIZE, args.concurrency),
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="iamcore", description="Export and import iamcore entities as NDJSON.")
+    parser.add_argument("--url", default=None, help="iamcore URL (default: IAMCORE_URL)")
+    parser.add_argument("--api-key", default=os.environ.get("IAMCORE_API_KEY"), help="API key")
+    parser.add_argument("--token", default=os.environ.get("IAMCORE_TOKEN"), help="bearer access token")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="write every entity of a type as NDJSON")
+    export.add_argument("entity", choices=sorted(ENTITIES))
+    export.add_argument("-o", "--output", default=_STDIO, help="output file (default: stdout)")
+    export.add_argument("--gzip", action="store_true", help="gzip the output")
+    export.add_argument("--concurrency", type=int, default=DEFAULT_EXPORT_CONCURRENCY, help="pages fetched at once")
+    export.add_argument("--resume", action="store_true", help="continue from the output's checkpoint")
+
+    import_ = commands.add_parser("import", help="create entities from NDJSON, plain or gzipped")
+    import_.add_argument("entity", choices=sorted(ENTITIES))
+    import_.add_argument("-i", "--input", default=_STDIO, help="input file (default: stdin)")
+    import_.add_argument("--concurrency", type=int, default=DEFAULT_BULK_CONCURRENCY, help="creates in flight")
+    import_.add_argument("--retry", action="store_true", help="retry transient errors")
+    import_.add_argument("--resume", action="store_true", help="skip the lines done, from the input's checkpoint")
+    import_.add_argument(
+        "--password",
+        default=os.environ.get("IAMCORE_IMPORT_PASSWORD"),
+        help="initial password of imported users, to be changed at first login",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the `iamcore` console script; returns the exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "import" and args.entity == "users" and not args.password:
+        parser.error("importing users needs --password or IAMCORE_IMPORT_PASSWORD: exports carry no passwords")
+    try:
+        client = _client(args)
+    except ValidationError as e:
+        problems = "; ".join(f"{'.'.join(map(str, error['loc'])).upper()}: {error['msg']}" for error in e.errors())
+        parser.error(f"invalid connection settings ({problems}): pass --url or set IAMCORE_URL")
+    auth_headers = _auth_headers(args)
+    if args.command == "export":
+        stats = export_entities(
+            client,
+            auth_headers,
+            args.entity,
+            args.output,
+            compress=args.gzip,
+            concurrency=args.concurrency,
+            resume=args.resume,
+        )
+        sys.stderr.write(stats.summary("exported", args.entity) + "\n")
+        return 0
+    stats = import_entities(
+        client,
+        auth_headers,
+        args.entity,
+        args.input,
+        concurrency=args.concurrency,
+        retry=RetryPolicy() if args.retry else None,
+        resume=args.resume,
+        password=args.password,
+    )
+    sys.stderr.write(stats.summary("imported", args.entity) + "\n")
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
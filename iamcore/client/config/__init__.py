@@ -6,6 +6,8 @@ from urllib.parse import urljoin
 from pydantic import Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from iamcore.client.base.transport import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_IDLE_TIMEOUT, DEFAULT_POOL_MAXSIZE
+
 DEFAULT_IAMCORE_ISSUER_PATH = "auth/"
 
 
@@ -22,6 +24,21 @@ class BaseConfig(BaseSettings):
     iamcore_url: HttpUrl = Field(description="IAM Core URL")
     iamcore_issuer_url: Optional[HttpUrl] = Field(default=None, description="IAMCore issuer URL")
     iamcore_client_timeout: int = Field(description="IAM Core Client Timeout", default=30, ge=1, le=300)
+    iamcore_client_pool_connections: int = Field(
+        description="Number of per-host connection pools kept by the shared transport",
+        default=DEFAULT_POOL_CONNECTIONS,
+        ge=1,
+    )
+    iamcore_client_pool_maxsize: int = Field(
+        description="Maximum number of keep-alive connections per host",
+        default=DEFAULT_POOL_MAXSIZE,
+        ge=1,
+    )
+    iamcore_client_pool_idle_timeout: float = Field(
+        description="Seconds after which idle pooled connections are dropped",
+        default=DEFAULT_POOL_IDLE_TIMEOUT,
+        gt=0,
+    )
 
     @property
     def iamcore_url_str(self) -> str:
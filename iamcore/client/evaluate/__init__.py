@@ -1,3 +1,18 @@
+from iamcore.client.base.principal import credential_principal
+
+from .cache import DecisionCache
 from .client import Client
+from .dto import EvaluationResult
+from .offline import Discrepancy, OfflineEvaluator, PolicyEngine, PolicySnapshot, download_snapshot
 
-__all__ = ["Client"]
+__all__ = [
+    "Client",
+    "DecisionCache",
+    "Discrepancy",
+    "EvaluationResult",
+    "OfflineEvaluator",
+    "PolicyEngine",
+    "PolicySnapshot",
+    "credential_principal",
+    "download_snapshot",
+]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+
+from iamcore.client.base.principal import PrincipalResolver, credential_principal
+
+DEFAULT_DECISION_CACHE_SIZE = 10_000
+DEFAULT_ALLOW_TTL = 60.0
+DEFAULT_DENY_TTL = 10.0
+
+
+class _Decision(NamedTuple):
+    allowed: bool
+    expires_at: float
+
+
+class DecisionCache:
+    """
+    Thread-safe LRU cache of authorization decisions keyed on (principal, action, IRN).
+
+    Args:
+        max_size: Maximum number of decisions kept; the least recently used are evicted first.
+        allow_ttl: Seconds an "allow" decision stays valid.
+        deny_ttl: Seconds a "deny" decision stays valid. Usually shorter than `allow_ttl`,
+            so that newly granted permissions show up quickly.
+        principal_resolver: Maps auth headers to a principal identity. Defaults to a digest
+            of the presented credential.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_DECISION_CACHE_SIZE,
+        allow_ttl: float = DEFAULT_ALLOW_TTL,
+        deny_ttl: float = DEFAULT_DENY_TTL,
+        principal_resolver: PrincipalResolver = credential_principal,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.allow_ttl = allow_ttl
+        self.deny_ttl = deny_ttl
+        self.principal_resolver = principal_resolver
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._decisions: OrderedDict[tuple[str, str, str], _Decision] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def principal_of(self, auth_headers: dict[str, str]) -> str:
+        """Resolve the principal identity the cache uses for these headers."""
+        return self.principal_resolver(auth_headers)
+
+    def get(self, principal: str, action: str, irn: str) -> Optional[bool]:
+        """Return the cached decision, or `None` when it is unknown or expired."""
+        key = (principal, action, irn)
+        with self._lock:
+            decision = self._decisions.get(key)
+            if decision is None or decision.expires_at <= self._clock():
+                if decision is not None:
+                    del self._decisions[key]
+                self.misses += 1
+                return None
+            self._decisions.move_to_end(key)
+            self.hits += 1
+            return decision.allowed
+
+    def put(self, principal: str, action: str, irn: str, *, allowed: bool) -> None:
+        """Record a decision for the configured allow or deny TTL."""
+        ttl = self.allow_ttl if allowed else self.deny_ttl
+        if ttl <= 0:
+            return
+        key = (principal, action, irn)
+        with self._lock:
+            self._decisions[key] = _Decision(allowed, self._clock() + ttl)
+            self._decisions.move_to_end(key)
+            while len(self._decisions) > self.max_size:
+                self._decisions.popitem(last=False)
+
+    def invalidate_principal(self, principal: str) -> None:
+        """Forget every decision made for a principal, e.g. after its policies changed."""
+        self._invalidate(lambda key: key[0] == principal)
+
+    def invalidate_irn_prefix(self, irn_prefix: str) -> None:
+        """Forget every decision about resources whose IRN starts with `irn_prefix`."""
+        self._invalidate(lambda key: key[2].startswith(irn_prefix))
+
+    def clear(self) -> None:
+        """Forget every decision."""
+        with self._lock:
+            self._decisions.clear()
+
+    def _invalidate(self, predicate: Callable[[tuple[str, str, str]], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._decisions if predicate(key)]:
+                del self._decisions[key]
+
+    def __len__(self) -> int:
+        return len(self._decisions)
@@ -2,31 +2,198 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Optional
 
 from iamcore.client.base.client import HTTPClientWithTimeout
 from iamcore.client.base.models import IamIRNsResponse, PaginatedSearchFilter, generic_search_all
+from iamcore.client.exceptions import IAMForbiddenException
+
+from .dto import EvaluationResult
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
     from iamcore.irn import IRN
 
+    from iamcore.client.base.transport import Transport
+
+    from .cache import DecisionCache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_CHUNK_SIZE = 100
+DEFAULT_BATCH_CONCURRENCY = 4
+
+Decisions = dict[tuple[str, str], bool]
+Chunk = tuple[str, list[str]]
+
+
+def plan_batch(
+    checks: list[tuple[str, IRN]],
+    chunk_size: int,
+    cache: Optional[DecisionCache] = None,
+    principal: str = "",
+) -> tuple[Decisions, list[Chunk]]:
+    """
+    Split checks into decisions already known from the cache and per-action chunks to send.
+
+    Duplicate checks are only sent once.
+    """
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+
+    known: Decisions = {}
+    pending: dict[str, dict[str, None]] = {}
+    for action, irn in checks:
+        resource = str(irn)
+        allowed = cache.get(principal, action, resource) if cache is not None else None
+        if allowed is None:
+            pending.setdefault(action, {})[resource] = None
+        else:
+            known[action, resource] = allowed
+
+    chunks: list[Chunk] = []
+    for action, resources in pending.items():
+        irns = list(resources)
+        chunks.extend((action, irns[i : i + chunk_size]) for i in range(0, len(irns), chunk_size))
+    return known, chunks
+
+
+def chunk_payload(action: str, resources: list[str]) -> str:
+    """Body of the `evaluate/actions` request for one chunk."""
+    payload = {"actions": [action], "irns": resources}
+    logger.debug("Going to evaluate actions: json=%s", payload)
+    return json.dumps(payload)
+
+
+def read_chunk_decisions(action: str, resources: list[str], body: dict[str, Any]) -> Decisions:
+    """
+    Decisions of one chunk from its `evaluate/actions` response, which lists the allowed actions
+    of every IRN. An IRN missing from the response has no allowed action.
+    """
+    allowed: dict[str, list[str]] = body.get("data") or {}
+    return {(action, resource): action in allowed.get(resource, ()) for resource in resources}
+
+
+def collect_batch(
+    checks: list[tuple[str, IRN]],
+    decisions: Decisions,
+    cache: Optional[DecisionCache] = None,
+    principal: str = "",
+) -> list[EvaluationResult]:
+    """Build per-check results in input order, recording the decisions in the cache."""
+    if cache is not None:
+        for (action, resource), allowed in decisions.items():
+            cache.put(principal, action, resource, allowed=allowed)
+    return [EvaluationResult(action=action, irn=irn, allowed=decisions[action, str(irn)]) for action, irn in checks]
+
 
 class Client(HTTPClientWithTimeout):
     """IAMCore evaluation client."""
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[Transport] = None,
+        decision_cache: Optional[DecisionCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
+        self.decision_cache = decision_cache
 
     def evaluate(self, auth_headers: dict[str, str], action: str, resources: list[IRN]) -> None:
+        if self.decision_cache is not None:
+            self._evaluate_cached(self.decision_cache, auth_headers, action, resources)
+            return
+
         payload = {"action": action, "resources": [str(r) for r in resources if r]}
         logger.debug("Going to evaluate resources: json=%s", payload)
         self._post("evaluate", data=json.dumps(payload), headers=auth_headers)
 
+    def _evaluate_cached(
+        self,
+        cache: DecisionCache,
+        auth_headers: dict[str, str],
+        action: str,
+        resources: list[IRN],
+    ) -> None:
+        """Answer from cached decisions and only send the resources with no cached decision."""
+        principal = cache.principal_of(auth_headers)
+        pending: list[str] = []
+        for irn in (str(r) for r in resources if r):
+            allowed = cache.get(principal, action, irn)
+            if allowed is False:
+                msg = f"Access denied (cached decision): {action} on {irn}"
+                raise IAMForbiddenException(msg, status_code=HTTPStatus.FORBIDDEN)
+            if allowed is None:
+                pending.append(irn)
+
+        if not pending:
+            return
+
+        payload = {"action": action, "resources": pending}
+        logger.debug("Going to evaluate resources: json=%s", payload)
+        try:
+            self._post("evaluate", data=json.dumps(payload), headers=auth_headers)
+        except IAMForbiddenException:
+            # A deny on several resources does not say which one was denied.
+            if len(pending) == 1:
+                cache.put(principal, action, pending[0], allowed=False)
+            raise
+
+        for irn in pending:
+            cache.put(principal, action, irn, allowed=True)
+
+    def evaluate_batch(
+        self,
+        auth_headers: dict[str, str],
+        checks: Iterable[tuple[str, IRN]],
+        *,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[EvaluationResult]:
+        """
+        Evaluate many (action, IRN) pairs with few requests.
+
+        Pairs are grouped by action and sent as chunks of up to `chunk_size` resources, with at
+        most `concurrency` chunks in flight. Each chunk is one `evaluate/actions` request, which
+        answers every resource of the chunk, allowed or not.
+
+        Args:
+            auth_headers: Authentication headers for the API call.
+            checks: The (action, IRN) pairs to evaluate.
+            chunk_size: Maximum number of resources per request.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One result per pair, in input order. Denials are reported, not raised.
+        """
+        checks = list(checks)
+        cache = self.decision_cache
+        principal = cache.principal_of(auth_headers) if cache is not None else ""
+        decisions, chunks = plan_batch(checks, chunk_size, cache, principal)
+
+        def evaluate_chunk(chunk: Chunk) -> Decisions:
+            return self._evaluate_chunk(auth_headers, *chunk)
+
+        if concurrency > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+                for chunk_decisions in executor.map(evaluate_chunk, chunks):
+                    decisions.update(chunk_decisions)
+        else:
+            for chunk in chunks:
+                decisions.update(evaluate_chunk(chunk))
+
+        return collect_batch(checks, decisions, cache, principal)
+
+    def _evaluate_chunk(self, auth_headers: dict[str, str], action: str, resources: list[str]) -> Decisions:
+        # The request adds a Content-Type header, so give every chunk its own copy.
+        response = self._post("evaluate/actions", data=chunk_payload(action, resources), headers=dict(auth_headers))
+        return read_chunk_decisions(action, resources, response.json())
+
     def evaluate_actions(self, auth_headers: dict[str, str], actions: list[str], irns: list[IRN]) -> dict[str, Any]:
         payload = {"actions": actions, "irns": [str(r) for r in irns if r]}
         logger.debug("Going to evaluate resources: json=%s", payload)
@@ -50,7 +217,7 @@ class Client(HTTPClientWithTimeout):
             headers=auth_headers,
             params=search_filter.model_dump(by_alias=True, exclude_none=True) if search_filter else None,
         )
-        return IamIRNsResponse(**response.json())
+        return IamIRNsResponse.from_response(response)
 
     def evaluate_all_resources(
         self,
@@ -59,6 +226,8 @@ class Client(HTTPClientWithTimeout):
         application: str,
         action: str,
         resource_type: str,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[IRN, None, None]:
         def search_func(headers: dict[str, str], search_filter: PaginatedSearchFilter) -> IamIRNsResponse:
             return self.evaluate_resources(
@@ -69,4 +238,4 @@ class Client(HTTPClientWithTimeout):
                 search_filter=search_filter,
             )
 
-        return generic_search_all(auth_headers, search_func, None)
+        return generic_search_all(auth_headers, search_func, None, concurrency=concurrency, ordered=ordered)
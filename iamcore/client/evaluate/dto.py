@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from iamcore.irn import IRN
+
+from iamcore.client.base.models import IAMCoreBaseModel
+
+
+class EvaluationResult(IAMCoreBaseModel):
+    """Outcome of a single (action, IRN) check in a batch evaluation."""
+
+    action: str
+    irn: IRN
+    allowed: bool
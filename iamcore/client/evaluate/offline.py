@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Collection, Iterable, Mapping
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, Union
+
+from iamcore.client.base.irn_index import WILDCARD, IRNIndex, IRNLike
+from iamcore.client.exceptions import IAMForbiddenException
+
+from .dto import EvaluationResult
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from iamcore.irn import IRN
+    from typing_extensions import Self
+
+    from iamcore.client.policy.client import Client as PolicyClient
+    from iamcore.client.policy.dto import Policy
+
+    from .client import Client as EvaluateClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 60.0
+
+DENY = "deny"
+
+Attachments = Mapping[str, Collection[str]]
+
+
+class PolicySnapshot(NamedTuple):
+    """
+    Everything the offline engine decides from.
+
+    Attributes:
+        policies: The policies, e.g. from `PolicyClient.search_all`.
+        attachments: Policy IDs (or IRNs) attached to each principal or group, by IRN.
+        memberships: Groups each principal belongs to, by IRN. Their policies apply to it too.
+    """
+
+    policies: list[Policy]
+    attachments: Attachments
+    memberships: Attachments = {}
+
+
+class Discrepancy(NamedTuple):
+    """A check the offline engine and the server decided differently."""
+
+    action: str
+    irn: str
+    offline: bool
+    server: bool
+
+
+class _Actions:
+    """Exact actions and trailing-wildcard prefixes, matched with one set lookup and one `startswith`."""
+
+    __slots__ = ("exact", "match_all", "prefixes")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        exact: set[str] = set()
+        prefixes: set[str] = set()
+        for pattern in patterns:
+            if pattern.endswith(WILDCARD):
+                prefixes.add(pattern[: -len(WILDCARD)])
+            else:
+                exact.add(pattern)
+        self.match_all = "" in prefixes
+        self.exact = frozenset(exact)
+        self.prefixes = tuple(sorted(prefixes))
+
+    def matches(self, action: str) -> bool:
+        return self.match_all or action in self.exact or action.startswith(self.prefixes)
+
+
+class _Statement(NamedTuple):
+    deny: bool
+    actions: _Actions
+    resources: list[IRN]
+
+
+class PolicyEngine:
+    """
+    Local policy decision point built from a `PolicySnapshot`.
+
+    Implements iamcore's evaluation rules: a request is allowed when an "allow" statement of a
+    policy attached to the principal (directly or through one of its groups) matches both the
+    action and the resource, and no "deny" statement does. An explicit deny always wins, and
+    anything not allowed is denied. Actions and IRNs match a statement exactly, or by prefix
+    when the statement's value ends with the `*` wildcard. Statements are indexed per principal
+    in an `IRNIndex`, so a check costs the depth of the IRN, not the number of statements.
+
+    Decisions take no network round trip, but are only as recent as the snapshot.
+    """
+
+    def __init__(self, snapshot: PolicySnapshot) -> None:
+        self.snapshot = snapshot
+        statements: dict[str, list[_Statement]] = {}
+        for policy in snapshot.policies:
+            compiled = [
+                _Statement(
+                    deny=statement.effect.lower() == DENY,
+                    actions=_Actions(statement.actions),
+                    resources=statement.resources,
+                )
+                for statement in policy.statements
+            ]
+            statements[policy.id] = statements[str(policy.irn)] = compiled
+        # Statements applying to each principal, indexed by resource pattern.
+        self._statements: dict[str, IRNIndex[_Statement]] = {}
+        for principal in {*snapshot.attachments, *snapshot.memberships}:
+            holders = [principal, *snapshot.memberships.get(principal, ())]
+            policy_ids = dict.fromkeys(p for holder in holders for p in snapshot.attachments.get(holder, ()))
+            unknown = [p for p in policy_ids if p not in statements]
+            if unknown:
+                logger.warning("Policies %s attached to %s are not in the snapshot", unknown, principal)
+            self._statements[principal] = IRNIndex(
+                (irn, s) for p in policy_ids for s in statements.get(p, ()) for irn in s.resources
+            )
+
+    def is_allowed(self, principal: IRNLike, action: str, irn: IRNLike) -> bool:
+        """Whether `principal` may perform `action` on `irn`."""
+        index = self._statements.get(str(principal))
+        if index is None:
+            return False
+        allowed = False
+        for statement in index.match(irn):
+            if statement.actions.matches(action):
+                if statement.deny:
+                    return False
+                allowed = True
+        return allowed
+
+    def evaluate(self, principal: IRNLike, action: str, resources: Iterable[IRNLike]) -> None:
+        """
+        Offline equivalent of `EvaluateClient.evaluate`.
+
+        Raises:
+            IAMForbiddenException: If `action` is denied on any of the resources.
+        """
+        for irn in resources:
+            if irn and not self.is_allowed(principal, action, irn):
+                msg = f"Access denied (offline decision): {action} on {irn}"
+                raise IAMForbiddenException(msg, status_code=HTTPStatus.FORBIDDEN)
+
+    def evaluate_batch(self, principal: IRNLike, checks: Iterable[tuple[str, IRN]]) -> list[EvaluationResult]:
+        """Offline equivalent of `EvaluateClient.evaluate_batch`: one result per pair, in input order."""
+        return [
+            EvaluationResult(action=action, irn=irn, allowed=self.is_allowed(principal, action, irn))
+            for action, irn in checks
+        ]
+
+    def compare(
+        self,
+        evaluate_client: EvaluateClient,
+        auth_headers: dict[str, str],
+        principal: IRNLike,
+        checks: Iterable[tuple[str, IRN]],
+    ) -> list[Discrepancy]:
+        """
+        Differential check of the engine against the server.
+
+        Evaluates `checks` both offline and with `evaluate_client` on behalf of `principal`,
+        whose credentials `auth_headers` must carry, and returns every pair decided differently.
+        """
+        checks = list(checks)
+        server = evaluate_client.evaluate_batch(auth_headers, checks)
+        return [
+            Discrepancy(result.action, str(result.irn), offline, result.allowed)
+            for result in server
+            if (offline := self.is_allowed(principal, result.action, result.irn)) != result.allowed
+        ]
+
+
+def download_snapshot(
+    policy_client: PolicyClient,
+    auth_headers: dict[str, str],
+    attachments: Union[Attachments, Callable[[], Attachments]],
+    memberships: Union[Attachments, Callable[[], Attachments], None] = None,
+) -> PolicySnapshot:
+    """
+    Build a snapshot from every policy visible with `auth_headers`.
+
+    `attachments` and `memberships` may be callables, called on every download, when they
+    come from elsewhere (a directory, a database) and change over time.
+    """
+    policies = list(policy_client.search_all(auth_headers))
+    if callable(attachments):
+        attachments = attachments()
+    if callable(memberships):
+        memberships = memberships()
+    return PolicySnapshot(policies, attachments, memberships or {})
+
+
+class OfflineEvaluator:
+    """
+    `PolicyEngine` kept in sync with the server by periodically reloading its snapshot.
+
+    Queries are answered by the engine built from the last snapshot loaded; a reload that
+    fails is logged and the previous engine keeps answering. Call `start` to reload every
+    `refresh_interval` seconds on a background thread, and `close` to stop it.
+
+    Args:
+        loader: Returns a fresh snapshot, e.g. a `functools.partial` of `download_snapshot`.
+        refresh_interval: Seconds between background reloads.
+        clock: Wall-clock time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], PolicySnapshot],
+        *,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.engine = PolicyEngine(loader())
+        self.refreshed_at = clock()
+
+    def refresh(self) -> None:
+        """Reload the snapshot now and swap in the engine built from it."""
+        engine = PolicyEngine(self.loader())
+        self.engine = engine
+        self.refreshed_at = self._clock()
+
+    def start(self) -> None:
+        """Start reloading the snapshot in the background."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iamcore-policy-refresh", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self._refresh_quietly()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("Policy snapshot refresh failed, keeping the previous one", exc_info=True)
+
+    def close(self) -> None:
+        """Stop the background reloads."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def is_allowed(self, principal: IRNLike, action: str, irn: IRNLike) -> bool:
+        """See `PolicyEngine.is_allowed`."""
+        return self.engine.is_allowed(principal, action, irn)
+
+    def evaluate(self, principal: IRNLike, action: str, resources: Iterable[IRNLike]) -> None:
+        """See `PolicyEngine.evaluate`."""
+        self.engine.evaluate(principal, action, resources)
+
+    def evaluate_batch(self, principal: IRNLike, checks: Iterable[tuple[str, IRN]]) -> list[EvaluationResult]:
+        """See `PolicyEngine.evaluate_batch`."""
+        return self.engine.evaluate_batch(principal, checks)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -1,22 +1,52 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+import functools
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
 if TYPE_CHECKING:
-    from requests import Response
+    from collections.abc import AsyncGenerator, Mapping
+
+
+class ResponseLike(Protocol):
+    """The part of an HTTP response (`requests` or `httpx`) the SDK relies on."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def json(self) -> Any: ...
 
 
 class IAMException(Exception):
     msg: str
 
-    def __init__(self, msg: str, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        msg: str,
+        status_code: int | None = None,
+        *,
+        attempts: int = 1,
+        elapsed: float | None = None,
+    ) -> None:
         self.msg = msg
         self.status_code = status_code
+        # Set by the retrying transport: how many requests were sent, and how long they took.
+        self.attempts = attempts
+        self.elapsed = elapsed
         super().__init__(msg)
 
     @classmethod
-    def from_response(cls, resp: Response) -> IAMException:
-        """Create an exception instance from a requests.Response object."""
+    def from_response(cls, resp: ResponseLike) -> IAMException:
+        """Create an exception instance from a requests (or httpx) response object."""
         try:
             data = resp.json()
             message = data.get("message") or data.get("detail") or data.get("error", "An unknown error occurred.")
@@ -26,6 +56,15 @@ class IAMException(Exception):
         return cls(message, status_code=resp.status_code)
 
 
+class IAMCircuitOpenException(IAMException):
+    """Raised without sending the request while the circuit of its endpoint is open."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"Circuit for {endpoint} is open, retry in {retry_in:.1f}s")
+
+
 class IAMUnauthorizedException(IAMException): ...
 
 
@@ -70,6 +109,33 @@ class IAMResourceExistsException(IAMResourceException): ...
 
 def err_chain(error: type[IAMException] = IAMException) -> Callable[..., Any]:
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def new_async_gen(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                except IAMException:
+                    raise
+                except Exception as e:
+                    raise error(str(e)) from e
+
+            return new_async_gen
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def new_coro(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except IAMException:
+                    raise
+                except Exception as e:
+                    raise error(str(e)) from e
+
+            return new_coro
+
         def new_func(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
@@ -5,30 +5,33 @@ from typing import TYPE_CHECKING, Optional
 
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import generic_search_all
+from iamcore.client.base.records import RecordPage
 from iamcore.client.exceptions import IAMException, IAMGroupException, err_chain
 
-from .dto import CreateGroup, Group, GroupSearchFilter, IamGroupResponse, IamGroupsResponse
+from .dto import CreateGroup, Group, GroupRecord, GroupSearchFilter, IamGroupResponse, IamGroupsResponse
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
     from iamcore.irn import IRN
 
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core Group API."""
 
     BASE_PATH = "groups"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
 
     @err_chain(IAMGroupException)
     def create(self, auth_headers: dict[str, str], create_group: CreateGroup) -> Group:
         payload = create_group.model_dump_json(by_alias=True, exclude_none=True)
         response = self._post(data=payload, headers=auth_headers)
-        return IamGroupResponse(**response.json()).data
+        return IamGroupResponse.from_response(response).data
 
     @err_chain(IAMGroupException)
     def delete(self, auth_headers: dict[str, str], group_irn: IRN) -> None:
@@ -54,12 +57,44 @@ class Client(HTTPClientWithTimeout):
     ) -> IamGroupsResponse:
         querystring = group_filter.model_dump(by_alias=True, exclude_none=True) if group_filter else None
         response = self._get(headers=headers, params=querystring)
-        return IamGroupsResponse(**response.json())
+        return IamGroupsResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         group_filter: Optional[GroupSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[Group, None, None]:
-        return generic_search_all(auth_headers, self.search, group_filter)
+        return generic_search_all(auth_headers, self.search, group_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMGroupException)
+    def search_records(
+        self,
+        auth_headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+    ) -> RecordPage[GroupRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = group_filter.model_dump(by_alias=True, exclude_none=True) if group_filter else None
+        response = self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, GroupRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        group_filter: Optional[GroupSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> Generator[GroupRecord, None, None]:
+        """Like `search_all`, but yields `GroupRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            group_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from iamcore.irn import IRN
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
+from iamcore.client.base.irn import parse_irn
 from iamcore.client.base.models import IAMCoreBaseModel, PaginatedSearchFilter
+from iamcore.client.base.records import Record
 
 
 class Group(IAMCoreBaseModel):
@@ -24,12 +26,42 @@ class Group(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
 
+class GroupRecord(Record[Group]):
+    """Read-only, unvalidated view of a `Group` for bulk listings."""
+
+    __slots__ = (
+        "created",
+        "display_name",
+        "id",
+        "irn",
+        "metadata",
+        "name",
+        "path",
+        "pool_ids",
+        "tenant_id",
+        "updated",
+    )
+
+    MODEL = Group
+
+    id: str
+    irn: IRN
+    tenant_id: str
+    name: str
+    display_name: str
+    path: str
+    metadata: Optional[dict[str, Any]]
+    pool_ids: Optional[list[str]]
+    created: str
+    updated: str
+
+
 class CreateGroup(IAMCoreBaseModel):
     """Request model for creating a new group."""
 
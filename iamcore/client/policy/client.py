@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
     from requests import Response
 
+    from iamcore.client.base.transport import Transport
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +27,15 @@ class Client(HTTPClientWithTimeout):
 
     BASE_PATH = "policies"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
 
     @err_chain(IAMPolicyException)
     def create(self, auth_headers: dict[str, str], params: CreatePolicy) -> Policy:
         payload_dict = params.model_dump_json(by_alias=True, exclude_none=True)
         response: Response = self._post(data=payload_dict, headers=auth_headers)
-        return IamPolicyResponse(**response.json()).data
+        return IamPolicyResponse.from_response(response).data
 
     @err_chain(IAMPolicyException)
     def delete(self, auth_headers: dict[str, str], policy_id: str) -> None:
@@ -52,12 +54,15 @@ class Client(HTTPClientWithTimeout):
     ) -> IamPoliciesResponse:
         query = policy_filter.model_dump(by_alias=True, exclude_none=True) if policy_filter else None
         response = self._get(headers=headers, params=query)
-        return IamPoliciesResponse(**response.json())
+        return IamPoliciesResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         policy_filter: Optional[PolicySearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[Policy, None, None]:
-        return generic_search_all(auth_headers, self.search, policy_filter)
+        return generic_search_all(auth_headers, self.search, policy_filter, concurrency=concurrency, ordered=ordered)
@@ -4,8 +4,9 @@ import logging
 from typing import Any, Optional
 
 from iamcore.irn import IRN
-from pydantic import Field, field_serializer, field_validator
+from pydantic import Field, ValidationInfo, field_serializer, field_validator
 
+from iamcore.client.base.irn import parse_irn
 from iamcore.client.base.models import IAMCoreBaseModel, PaginatedSearchFilter
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,8 @@ class PolicyStatement(IAMCoreBaseModel):
 
     @field_validator("resources", mode="before")
     @classmethod
-    def validate_resources(cls, v: list[Any]) -> list[IRN]:
-        return [IRN.of(r) if isinstance(r, str) else r for r in v]
+    def validate_resources(cls, v: list[Any], info: ValidationInfo) -> list[IRN]:
+        return [parse_irn(r, info) if isinstance(r, str) else r for r in v]
 
     @field_serializer("resources")
     def serialize_resources(self, value: list[IRN]) -> list[str]:
@@ -42,9 +43,9 @@ class Policy(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
     def to_dict(self) -> dict[str, Any]:
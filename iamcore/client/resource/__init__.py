@@ -7,13 +7,17 @@ from .dto import (
     ResourceSearchFilter,
     UpdateResource,
 )
+from .reconcile import ReconcileAction, ReconcilePlan, ResourceReconciler
 
 __all__ = [
     "Client",
     "CreateResource",
     "IamResourceResponse",
     "IamResourcesResponse",
+    "ReconcileAction",
+    "ReconcilePlan",
     "Resource",
+    "ResourceReconciler",
     "ResourceSearchFilter",
     "UpdateResource",
 ]
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Optional, Union
 
 from iamcore.client.application.client import json
+from iamcore.client.base.bulk import (
+    DEFAULT_DELETE_CHUNK_SIZE,
+    DEFAULT_DELETE_CONCURRENCY,
+    BulkResult,
+    FailurePolicy,
+    raise_first_error,
+    run_chunked,
+)
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import generic_search_all
+from iamcore.client.base.records import RecordPage
+from iamcore.client.base.streaming import generic_stream_all
 from iamcore.client.exceptions import IAMException, IAMResourceException, err_chain
 
 from .dto import (
@@ -12,30 +23,36 @@ from .dto import (
     IamResourceResponse,
     IamResourcesResponse,
     Resource,
+    ResourceRecord,
     ResourceSearchFilter,
     UpdateResource,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
+    import requests
     from iamcore.irn import IRN
 
+    from iamcore.client.base.models import PaginatedSearchFilter
+    from iamcore.client.base.retry import RetryPolicy
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core Resource API."""
 
     BASE_PATH = "resources"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
 
     @err_chain(IAMResourceException)
     def create(self, auth_headers: dict[str, str], params: CreateResource) -> Resource:
         payload = params.model_dump_json(by_alias=True, exclude_none=True)
         response = self._post(data=payload, headers=auth_headers)
-        return IamResourceResponse(**response.json()).data
+        return IamResourceResponse.from_response(response).data
 
     @err_chain(IAMResourceException)
     def update(self, auth_headers: dict[str, str], irn: IRN, params: UpdateResource) -> None:
@@ -49,14 +66,47 @@ class Client(HTTPClientWithTimeout):
                 return
 
             if len(resources_irns) > 1:
-                payload = {"resourceIDs": [r.to_base64() for r in resources_irns if r]}
-                self._post("delete", data=json.dumps(payload), headers=auth_headers)
+                raise_first_error(self.delete_many(auth_headers, [r for r in resources_irns if r]))
                 return
 
             resources_irns = resources_irns[0]
 
         self._delete(resources_irns.to_base64(), headers=auth_headers)
 
+    def delete_many(
+        self,
+        auth_headers: dict[str, str],
+        resources_irns: Iterable[IRN],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Generator[BulkResult, None, None]:
+        """
+        Delete many resources with one request per chunk of `chunk_size` IRNs.
+
+        Up to `concurrency` chunks are in flight, and `resources_irns` is consumed lazily.
+        `on_failure` and `retry` work as in `UserClient.create_many`, per chunk.
+
+        Yields:
+            One `BulkResult` per chunk, as soon as it is done; `item` is the chunk's IRNs.
+        """
+        return run_chunked(
+            functools.partial(self._delete_chunk, dict(auth_headers)),
+            resources_irns,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            on_failure=on_failure,
+            retry=retry,
+            thread_name_prefix="iamcore-delete-resources",
+        )
+
+    @err_chain(IAMResourceException)
+    def _delete_chunk(self, auth_headers: dict[str, str], resources_irns: list[IRN]) -> None:
+        payload = {"resourceIDs": [irn.to_base64() for irn in resources_irns]}
+        self._post("delete", data=json.dumps(payload), headers=auth_headers)
+
     @err_chain(IAMResourceException)
     def search(
         self,
@@ -65,12 +115,60 @@ class Client(HTTPClientWithTimeout):
     ) -> IamResourcesResponse:
         query = resource_filter.model_dump(by_alias=True, exclude_none=True) if resource_filter else None
         response = self._get(headers=auth_headers, params=query)
-        return IamResourcesResponse(**response.json())
+        return IamResourcesResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         resource_filter: Optional[ResourceSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+        stream: bool = False,
     ) -> Generator[Resource, None, None]:
-        return generic_search_all(auth_headers, self.search, resource_filter)
+        """
+        Yield every matching resource, page by page.
+
+        With `stream`, each page is decoded incrementally and items are yielded while it is still
+        downloading, keeping memory bounded by one item. Streamed pages are fetched sequentially.
+        """
+        if stream:
+            if concurrency > 1:
+                msg = "stream cannot be combined with concurrency"
+                raise ValueError(msg)
+            return generic_stream_all(auth_headers, self._stream_search, Resource, resource_filter)
+        return generic_search_all(auth_headers, self.search, resource_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMResourceException)
+    def search_records(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+    ) -> RecordPage[ResourceRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = resource_filter.model_dump(by_alias=True, exclude_none=True) if resource_filter else None
+        response = self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, ResourceRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        resource_filter: Optional[ResourceSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> Generator[ResourceRecord, None, None]:
+        """Like `search_all`, but yields `ResourceRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            resource_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def _stream_search(self, auth_headers: dict[str, str], search_filter: PaginatedSearchFilter) -> requests.Response:
+        query = search_filter.model_dump(by_alias=True, exclude_none=True)
+        return self._get(headers=auth_headers, params=query, stream=True)
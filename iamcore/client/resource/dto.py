@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from iamcore.irn import IRN
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
+from iamcore.client.base.irn import parse_irn
 from iamcore.client.base.models import IAMCoreBaseModel, PaginatedSearchFilter
+from iamcore.client.base.records import Record
 
 
 class Resource(IAMCoreBaseModel):
@@ -28,9 +30,9 @@ class Resource(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
     def to_dict(self) -> dict[str, Any]:
@@ -38,6 +40,44 @@ class Resource(IAMCoreBaseModel):
         return self.model_dump(by_alias=True)
 
 
+class ResourceRecord(Record[Resource]):
+    """Read-only, unvalidated view of a `Resource` for bulk listings."""
+
+    __slots__ = (
+        "application",
+        "created",
+        "description",
+        "display_name",
+        "enabled",
+        "id",
+        "irn",
+        "metadata",
+        "name",
+        "path",
+        "pool_ids",
+        "resource_type",
+        "tenant_id",
+        "updated",
+    )
+
+    MODEL = Resource
+
+    id: str
+    irn: IRN
+    name: str
+    display_name: str
+    description: str
+    path: str
+    tenant_id: str
+    application: str
+    resource_type: str
+    enabled: bool
+    metadata: dict[str, str]
+    pool_ids: Optional[list[str]]
+    created: str
+    updated: str
+
+
 class CreateResource(IAMCoreBaseModel):
     """Request model for creating a new resource."""
 
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from enum import Enum
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from iamcore.irn import IRN
+
+from iamcore.client.base.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_DELETE_CHUNK_SIZE,
+    DEFAULT_DELETE_CONCURRENCY,
+    BulkResult,
+    FailurePolicy,
+    call_with_retry,
+    run_bulk,
+)
+from iamcore.client.base.retry import RetryPolicy
+from iamcore.client.exceptions import IAMException
+
+from .dto import CreateResource, UpdateResource
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+    from .client import Client as ResourceClient
+    from .dto import ResourceRecord, ResourceSearchFilter
+
+# Digest size of the content hashes kept for every current resource.
+HASH_SIZE = 16
+# Marks IRNs of the current state already matched by a desired resource.
+_SEEN = b""
+
+
+class ReconcileAction(str, Enum):
+    """What the reconciler does to a resource."""
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class ReconcilePlan(NamedTuple):
+    """
+    Changes bringing the server to the desired state.
+
+    Attributes:
+        creates: IRNs of the resources to create. The plan holds no create DTOs; `apply` sends
+            each desired resource as it reads it.
+        updates: Resources whose content differs, with the update replacing it.
+        deletes: IRNs of the resources that are no longer desired.
+        unchanged: Number of resources already up to date.
+    """
+
+    creates: list[IRN]
+    updates: list[tuple[IRN, UpdateResource]]
+    deletes: list[IRN]
+    unchanged: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.creates or self.updates or self.deletes)
+
+    def changes(self) -> Iterator[tuple[ReconcileAction, IRN]]:
+        """Every planned change, e.g. to print a dry run."""
+        for irn in self.creates:
+            yield ReconcileAction.CREATE, irn
+        for irn, _ in self.updates:
+            yield ReconcileAction.UPDATE, irn
+        for irn in self.deletes:
+            yield ReconcileAction.DELETE, irn
+
+
+def content_hash(resource: Union[UpdateResource, ResourceRecord]) -> bytes:
+    """Digest of the updatable content of a resource, insensitive to metadata and pool order."""
+    content = [
+        resource.display_name,
+        resource.description,
+        resource.enabled,
+        resource.metadata or {},
+        sorted(resource.pool_ids or ()),
+    ]
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=HASH_SIZE).digest()
+
+
+def desired_update(params: CreateResource) -> UpdateResource:
+    """The update giving a resource the content of `params`; unset fields get their defaults."""
+    return UpdateResource(
+        displayName=params.display_name if params.display_name is not None else params.name,
+        enabled=params.enabled if params.enabled is not None else True,
+        description=params.description or "",
+        metadata=params.metadata or {},
+        poolIDs=params.pool_ids or [],
+    )
+
+
+class _Changes:
+    """Changes found while comparing, recorded as a `ReconcilePlan` without the create DTOs."""
+
+    def __init__(self) -> None:
+        self.creates: list[IRN] = []
+        self.updates: list[tuple[IRN, UpdateResource]] = []
+        self.deletes: list[IRN] = []
+        self.unchanged = 0
+
+    def plan(self) -> ReconcilePlan:
+        return ReconcilePlan(self.creates, self.updates, self.deletes, self.unchanged)
+
+
+class ResourceReconciler:
+    """
+    Make the resources of a scope match a desired state with as few calls as possible.
+
+    The current state is streamed from `ResourceClient.search_all_records` and only a content
+    hash is kept per resource, keyed by IRN, so memory grows with the number of IRNs rather than
+    with full DTOs. Desired resources are then read one by one, lazily, and hashed the same way:
+
+    - resources missing on the server are created,
+    - resources whose display name, description, enabled flag, metadata or pools differ are
+      updated, with unset desired fields compared as their defaults (the name, `""`, `True`,
+      no metadata and no pools),
+    - resources of the scope that are not desired are deleted, in chunks.
+
+    Name, application, tenant, type and path are part of the IRN, so changing any of them means
+    deleting the old resource and creating a new one.
+
+    `apply` sends every create or update as soon as it is found, so a desired resource is only
+    held while its call is in flight, and deletes once the desired state is exhausted.
+
+    Args:
+        client: The resource client.
+        auth_headers: Authorization headers of the calls.
+        account_id: Account of the resources, used to build the IRNs of desired resources.
+        scope: Filter selecting the current state, e.g. one application and resource type.
+            Every resource it matches that is not desired gets deleted.
+        tenant_id: Tenant of desired resources that do not set one.
+    """
+
+    def __init__(
+        self,
+        client: ResourceClient,
+        auth_headers: dict[str, str],
+        account_id: str,
+        scope: ResourceSearchFilter,
+        *,
+        tenant_id: Optional[str] = None,
+    ) -> None:
+        self.client = client
+        self.auth_headers = auth_headers
+        self.account_id = account_id
+        self.scope = scope
+        self.tenant_id = tenant_id or scope.tenant_id
+
+    def irn_of(self, params: CreateResource) -> IRN:
+        """The IRN `params` gets once created."""
+        tenant_id = params.tenant_id or self.tenant_id
+        if not tenant_id:
+            msg = f"no tenant for desired resource {params.name!r}"
+            raise ValueError(msg)
+        return IRN.create(
+            account_id=self.account_id,
+            application=params.application,
+            tenant_id=tenant_id,
+            resource_type=params.resource_type,
+            resource_path=params.path.strip("/"),
+            resource_id=params.name,
+        )
+
+    def in_scope(self, irn: IRN, update: UpdateResource) -> bool:
+        """Whether the resource with this IRN and content is matched by `scope` once written."""
+        scope = self.scope
+        path = irn.resource_path or ""
+        scope_path = (scope.path or "").strip("/")
+        return (
+            (scope.application is None or irn.application == scope.application)
+            and (scope.resource_type is None or irn.resource_type == scope.resource_type)
+            and (scope.tenant_id is None or irn.tenant_id == scope.tenant_id)
+            and (not scope_path or path == scope_path or path.startswith(scope_path + "/"))
+            and (scope.irn is None or str(irn).startswith(scope.irn.rstrip("*")))
+            and (scope.display_name is None or update.display_name == scope.display_name)
+            and (scope.enabled is None or update.enabled == scope.enabled)
+        )
+
+    def current_state(self) -> dict[str, bytes]:
+        """Content hash of every resource of the scope, by IRN."""
+        return {
+            str(record.irn): content_hash(record)
+            for record in self.client.search_all_records(self.auth_headers, self.scope)
+        }
+
+    def plan(self, desired: Iterable[CreateResource]) -> ReconcilePlan:
+        """
+        Compare `desired` with the server without changing anything; this is the dry run.
+
+        Raises:
+            ValueError: If two desired resources have the same IRN, or one is outside `scope`:
+                it would be created again on every run, never being part of the current state.
+        """
+        current = self.current_state()
+        changes = _Changes()
+        for _ in self._compare(desired, current, changes):
+            pass
+        changes.deletes = self._deletes(current)
+        return changes.plan()
+
+    def _compare(
+        self,
+        desired: Iterable[CreateResource],
+        current: dict[str, bytes],
+        changes: _Changes,
+    ) -> Iterator[tuple[ReconcileAction, IRN, Union[CreateResource, UpdateResource]]]:
+        """Compare desired resources one by one, recording them in `changes` and yielding those to send."""
+        for params in desired:
+            irn = self.irn_of(params)
+            key = str(irn)
+            update = desired_update(params)
+            if not self.in_scope(irn, update):
+                msg = f"desired resource {key} is outside the reconciled scope"
+                raise ValueError(msg)
+            current_hash = current.get(key)
+            if current_hash == _SEEN:
+                msg = f"duplicate desired resource {key}"
+                raise ValueError(msg)
+            current[key] = _SEEN
+            if current_hash is None:
+                changes.creates.append(irn)
+                yield ReconcileAction.CREATE, irn, params
+            elif content_hash(update) == current_hash:
+                changes.unchanged += 1
+            else:
+                changes.updates.append((irn, update))
+                yield ReconcileAction.UPDATE, irn, update
+
+    @staticmethod
+    def _deletes(current: dict[str, bytes]) -> list[IRN]:
+        return [IRN.of(key) for key, value in current.items() if value != _SEEN]
+
+    def apply(
+        self,
+        desired: Iterable[CreateResource],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        delete_chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Generator[BulkResult, None, None]:
+        """
+        Compare `desired` with the server and execute the changes in the same pass: creates and
+        updates with up to `concurrency` calls in flight as they are found, then deletes in
+        chunks, like `ResourceClient.delete_many`.
+
+        `on_failure` and `retry` work as in `UserClient.create_many`; with `FailurePolicy.ABORT`
+        a failed create or update also skips the deletes. The checks of `plan` raise as the
+        offending resource is reached, after the changes before it were sent but before any
+        delete; run `plan` first to catch them up front.
+
+        Yields:
+            One `BulkResult` per create or update, whose `item` is `(action, irn)`, then one per
+            delete chunk, whose `item` is `(ReconcileAction.DELETE, irns)`.
+        """
+        return self._apply(
+            desired,
+            _Changes(),
+            concurrency=concurrency,
+            delete_chunk_size=delete_chunk_size,
+            delete_concurrency=delete_concurrency,
+            on_failure=on_failure,
+            retry=retry,
+        )
+
+    def _apply(
+        self,
+        desired: Iterable[CreateResource],
+        changes: _Changes,
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        delete_chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Generator[BulkResult, None, None]:
+        if on_failure != FailurePolicy.RETRY:
+            retry = None
+        elif retry is None:
+            retry = RetryPolicy()
+
+        def change(index: int, item: tuple[ReconcileAction, IRN, Any]) -> BulkResult:
+            action, irn, params = item
+            try:
+                if action == ReconcileAction.CREATE:
+                    call_with_retry(retry, self.client.create, dict(self.auth_headers), params, idempotent=False)
+                else:
+                    call_with_retry(retry, self.client.update, dict(self.auth_headers), irn, params)
+            except IAMException as e:
+                return BulkResult(index, (action, irn), error=e)
+            return BulkResult(index, (action, irn))
+
+        current = self.current_state()
+        failed = False
+        for result in run_bulk(
+            change,
+            self._compare(desired, current, changes),
+            concurrency=concurrency,
+            on_failure=on_failure,
+            thread_name_prefix="iamcore-reconcile",
+        ):
+            failed = failed or not result.ok
+            yield result
+        if failed and on_failure == FailurePolicy.ABORT:
+            return
+        sent = len(changes.creates) + len(changes.updates)
+        changes.deletes = self._deletes(current)
+        for result in self.client.delete_many(
+            self.auth_headers,
+            changes.deletes,
+            chunk_size=delete_chunk_size,
+            concurrency=delete_concurrency,
+            on_failure=on_failure,
+            retry=retry,
+        ):
+            yield result._replace(position=sent + result.position, item=(ReconcileAction.DELETE, result.item))
+
+    def reconcile(
+        self,
+        desired: Iterable[CreateResource],
+        *,
+        dry_run: bool = False,
+        **options: Any,
+    ) -> tuple[ReconcilePlan, list[BulkResult]]:
+        """
+        Plan and, unless `dry_run`, apply the changes in one pass; `options` are passed to `apply`.
+
+        Returns:
+            The plan and the results of its changes, which are empty on a dry run.
+        """
+        if dry_run:
+            return self.plan(desired), []
+        changes = _Changes()
+        results = list(self._apply(desired, changes, **options))
+        return changes.plan(), results
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 from iamcore.client.application.client import json
+from iamcore.client.base.cache import TENANT, TENANT_ISSUER, invalidate, query_scope, read_through
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import generic_search_all
 from iamcore.client.exceptions import IAMException, IAMTenantException, err_chain
@@ -23,36 +24,56 @@ if TYPE_CHECKING:
 
     from iamcore.irn import IRN
 
+    from iamcore.client.base.cache import ReferenceCache
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core Tenant API."""
 
     BASE_PATH = "tenants"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        transport: Optional[Transport] = None,
+        cache: Optional[ReferenceCache] = None,
+    ) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
+        self.cache = cache
+
+    def _invalidate(self) -> None:
+        invalidate(self.cache, TENANT)
+        invalidate(self.cache, TENANT_ISSUER)
 
     @err_chain(IAMTenantException)
     def create(self, auth_headers: dict[str, str], params: CreateTenant) -> Tenant:
         path = "issuer-types/iamcore"
         payload = params.model_dump_json(by_alias=True, exclude_none=True)
         response = self._post(path, data=payload, headers=auth_headers)
-        return IamTenantResponse(**response.json()).data
+        self._invalidate()
+        return IamTenantResponse.from_response(response).data
 
     @err_chain(IAMTenantException)
     def update(self, auth_headers: dict[str, str], irn: IRN, display_name: str) -> None:
         payload = {"displayName": display_name}
         self._put(irn.to_base64(), data=json.dumps(payload), headers=auth_headers)
+        self._invalidate()
 
     @err_chain(IAMTenantException)
     def delete(self, auth_headers: dict[str, str], irn: IRN) -> None:
         self._delete(irn.to_base64(), headers=auth_headers)
+        self._invalidate()
 
     @err_chain(IAMTenantException)
     def get_issuer(self, headers: dict[str, str], params: GetTenantIssuer) -> TenantIssuer:
-        response = self._get("issuers", headers=headers, params=params.to_dict())
-        return IamTenantIssuersResponse(**response.json()).data.pop()
+        def load() -> TenantIssuer:
+            response = self._get("issuers", headers=headers, params=params.to_dict())
+            return IamTenantIssuersResponse.from_response(response).data.pop()
+
+        return read_through(self.cache, TENANT_ISSUER, query_scope(params.to_dict()), headers, load)
 
     @err_chain(IAMTenantException)
     def search(
@@ -61,13 +82,20 @@ class Client(HTTPClientWithTimeout):
         tenant_filter: Optional[GetTenantsFilter] = None,
     ) -> IamTenantsResponse:
         query = tenant_filter.model_dump(by_alias=True, exclude_none=True) if tenant_filter else None
-        response = self._get(headers=headers, params=query)
-        return IamTenantsResponse(**response.json())
+
+        def load() -> IamTenantsResponse:
+            response = self._get(headers=headers, params=query)
+            return IamTenantsResponse.from_response(response)
+
+        return read_through(self.cache, TENANT, query_scope(query), headers, load)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         tenant_filter: Optional[GetTenantsFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
     ) -> Generator[Tenant, None, None]:
-        return generic_search_all(auth_headers, self.search, tenant_filter)
+        return generic_search_all(auth_headers, self.search, tenant_filter, concurrency=concurrency, ordered=ordered)
@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from iamcore.irn import IRN
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
+from iamcore.client.base.irn import parse_irn
 from iamcore.client.base.models import IAMCoreBaseModel, PaginatedSearchFilter
 
 
@@ -24,9 +25,9 @@ class Tenant(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
     def to_dict(self) -> dict[str, Any]:
@@ -47,9 +48,9 @@ class TenantIssuer(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
     def to_dict(self) -> dict[str, Any]:
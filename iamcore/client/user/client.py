@@ -1,27 +1,47 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Optional
 
 from iamcore.client.application.client import json
+from iamcore.client.base.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_DELETE_CHUNK_SIZE,
+    DEFAULT_DELETE_CONCURRENCY,
+    BulkResult,
+    FailurePolicy,
+    PerItem,
+    call_with_retry,
+    for_item,
+    run_bulk,
+    run_chunked,
+)
 from iamcore.client.base.client import HTTPClientWithTimeout, append_path_to_url
 from iamcore.client.base.models import IamIRNResponse, generic_search_all
+from iamcore.client.base.records import RecordPage
+from iamcore.client.base.retry import RetryPolicy
+from iamcore.client.base.streaming import generic_stream_all
 from iamcore.client.exceptions import IAMException, IAMUserException, err_chain
 
-from .dto import CreateUser, IamUserResponse, IamUsersResponse, UpdateUser, User, UserSearchFilter
+from .dto import CreateUser, IamUserResponse, IamUsersResponse, UpdateUser, User, UserRecord, UserSearchFilter
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
+    import requests
     from iamcore.irn import IRN
 
+    from iamcore.client.base.models import PaginatedSearchFilter
+    from iamcore.client.base.transport import Transport
+
 
 class Client(HTTPClientWithTimeout):
     """Client for IAM Core User API."""
 
     BASE_PATH = "users"
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
-        super().__init__(base_url=base_url, timeout=timeout)
+    def __init__(self, base_url: str, timeout: int = 30, transport: Optional[Transport] = None) -> None:
+        super().__init__(base_url=base_url, timeout=timeout, transport=transport)
         self.base_url = append_path_to_url(self.base_url, self.BASE_PATH)
 
     @err_chain(IAMUserException)
@@ -29,17 +49,80 @@ class Client(HTTPClientWithTimeout):
         """Create a new user."""
         data = params.model_dump_json(by_alias=True, exclude_none=True)
         response = self._post(data=data, headers=auth_headers)
-        return IamUserResponse(**response.json()).data
+        return IamUserResponse.from_response(response).data
+
+    def create_many(
+        self,
+        auth_headers: dict[str, str],
+        users: Iterable[CreateUser],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        group_ids: PerItem[list[str]] = None,
+        policy_ids: PerItem[list[str]] = None,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Generator[BulkResult, None, None]:
+        """
+        Create many users, with at most `concurrency` of them in flight.
+
+        Each user is created, then added to `group_ids` and attached to `policy_ids` when
+        given. Both may be a list applying to every user, or a function of the `CreateUser`.
+        `users` is consumed lazily, so it can be a generator over a large file.
+
+        Args:
+            auth_headers: Authentication headers for the API calls.
+            users: The users to create.
+            concurrency: Maximum number of users being provisioned at once.
+            group_ids: Groups to add each created user to.
+            policy_ids: Policies to attach to each created user.
+            on_failure: What to do when a user fails, see `FailurePolicy`.
+            retry: Backoff and statuses used with `FailurePolicy.RETRY`. Only the failed step
+                is retried, so a user is never created twice because adding it to a group failed.
+                The create itself is only resent when it never reached the server, unless
+                `retry.retry_post` is set.
+
+        Yields:
+            One `BulkResult` per user, as soon as it is done, so not in input order. `value` is
+            the created `User`, also when a later step failed; `error` is the exception raised.
+        """
+        if on_failure == FailurePolicy.RETRY and retry is None:
+            retry = RetryPolicy()
+        elif on_failure != FailurePolicy.RETRY:
+            retry = None
+
+        def provision(index: int, params: CreateUser) -> BulkResult:
+            try:
+                user = call_with_retry(retry, self.create, dict(auth_headers), params, idempotent=False)
+            except IAMException as e:
+                return BulkResult(index, params, error=e)
+            try:
+                groups = for_item(group_ids, params)
+                if groups:
+                    call_with_retry(retry, self.add_groups, dict(auth_headers), user.irn, groups)
+                policies = for_item(policy_ids, params)
+                if policies:
+                    call_with_retry(retry, self.policies_attach, dict(auth_headers), user.irn, policies)
+            except IAMException as e:
+                return BulkResult(index, params, user, e)
+            return BulkResult(index, params, user)
+
+        return run_bulk(
+            provision,
+            users,
+            concurrency=concurrency,
+            on_failure=on_failure,
+            thread_name_prefix="iamcore-create-users",
+        )
 
     @err_chain(IAMUserException)
     def get_authenticated(self, auth_headers: dict[str, str]) -> User:
         response = self._get("me", headers=auth_headers)
-        return IamUserResponse(**response.json()).data
+        return IamUserResponse.from_response(response).data
 
     @err_chain(IAMUserException)
     def get_authenticated_irn(self, auth_headers: dict[str, str]) -> IRN:
         response = self._get("me/irn", headers=auth_headers)
-        return IamIRNResponse(**response.json()).data
+        return IamIRNResponse.from_response(response).data
 
     @err_chain(IAMUserException)
     def update(self, auth_headers: dict[str, str], irn: IRN, params: UpdateUser) -> None:
@@ -51,6 +134,40 @@ class Client(HTTPClientWithTimeout):
         data = json.dumps({"userIDS": [user_irn.to_base64()]})
         self._post("delete", data=data, headers=auth_headers)
 
+    def delete_many(
+        self,
+        auth_headers: dict[str, str],
+        user_irns: Iterable[IRN],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        on_failure: FailurePolicy = FailurePolicy.CONTINUE,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Generator[BulkResult, None, None]:
+        """
+        Delete many users with one request per chunk of `chunk_size` IRNs.
+
+        Up to `concurrency` chunks are in flight, and `user_irns` is consumed lazily.
+        `on_failure` and `retry` work as in `create_many`, per chunk.
+
+        Yields:
+            One `BulkResult` per chunk, as soon as it is done; `item` is the chunk's IRNs.
+        """
+        return run_chunked(
+            functools.partial(self._delete_chunk, dict(auth_headers)),
+            user_irns,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            on_failure=on_failure,
+            retry=retry,
+            thread_name_prefix="iamcore-delete-users",
+        )
+
+    @err_chain(IAMUserException)
+    def _delete_chunk(self, auth_headers: dict[str, str], user_irns: list[IRN]) -> None:
+        data = json.dumps({"userIDS": [irn.to_base64() for irn in user_irns]})
+        self._post("delete", data=data, headers=auth_headers)
+
     @err_chain(IAMUserException)
     def policies_attach(self, auth_headers: dict[str, str], user_irn: IRN, policies_ids: list[str]) -> None:
         path = f"{user_irn.to_base64()}/policies/attach"
@@ -77,12 +194,60 @@ class Client(HTTPClientWithTimeout):
     ) -> IamUsersResponse:
         query = user_filter.model_dump(by_alias=True, exclude_none=True) if user_filter else None
         response = self._get(headers=auth_headers, params=query)
-        return IamUsersResponse(**response.json())
+        return IamUsersResponse.from_response(response)
 
     @err_chain(IAMException)
     def search_all(
         self,
         auth_headers: dict[str, str],
         user_filter: Optional[UserSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+        stream: bool = False,
     ) -> Generator[User, None, None]:
-        return generic_search_all(auth_headers, self.search, user_filter)
+        """
+        Yield every matching user, page by page.
+
+        With `stream`, each page is decoded incrementally and items are yielded while it is still
+        downloading, keeping memory bounded by one item. Streamed pages are fetched sequentially.
+        """
+        if stream:
+            if concurrency > 1:
+                msg = "stream cannot be combined with concurrency"
+                raise ValueError(msg)
+            return generic_stream_all(auth_headers, self._stream_search, User, user_filter)
+        return generic_search_all(auth_headers, self.search, user_filter, concurrency=concurrency, ordered=ordered)
+
+    @err_chain(IAMUserException)
+    def search_records(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+    ) -> RecordPage[UserRecord]:
+        """Like `search`, but returns lightweight read-only records built without validation."""
+        query = user_filter.model_dump(by_alias=True, exclude_none=True) if user_filter else None
+        response = self._get(headers=auth_headers, params=query)
+        return RecordPage.from_response(response, UserRecord)
+
+    @err_chain(IAMException)
+    def search_all_records(
+        self,
+        auth_headers: dict[str, str],
+        user_filter: Optional[UserSearchFilter] = None,
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> Generator[UserRecord, None, None]:
+        """Like `search_all`, but yields `UserRecord` objects; call `to_model()` for the full DTO."""
+        return generic_search_all(
+            auth_headers,
+            self.search_records,
+            user_filter,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def _stream_search(self, auth_headers: dict[str, str], search_filter: PaginatedSearchFilter) -> requests.Response:
+        query = search_filter.model_dump(by_alias=True, exclude_none=True)
+        return self._get(headers=auth_headers, params=query, stream=True)
@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from iamcore.irn import IRN
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
+from iamcore.client.base.irn import parse_irn
 from iamcore.client.base.models import IAMCoreBaseModel, PaginatedSearchFilter
+from iamcore.client.base.records import Record
 
 
 class User(IAMCoreBaseModel):
@@ -29,9 +31,9 @@ class User(IAMCoreBaseModel):
 
     @field_validator("irn", mode="before")
     @classmethod
-    def validate_irn_field(cls, v: Any) -> IRN:
+    def validate_irn_field(cls, v: Any, info: ValidationInfo) -> IRN:
         if isinstance(v, str):
-            return IRN.of(v)
+            return parse_irn(v, info)
         return v
 
     def to_dict(self) -> dict[str, Any]:
@@ -39,6 +41,46 @@ class User(IAMCoreBaseModel):
         return self.model_dump(by_alias=True)
 
 
+class UserRecord(Record[User]):
+    """Read-only, unvalidated view of a `User` for bulk listings."""
+
+    __slots__ = (
+        "auth_id",
+        "created",
+        "email",
+        "enabled",
+        "first_name",
+        "id",
+        "irn",
+        "last_name",
+        "metadata",
+        "path",
+        "pool_ids",
+        "required_actions",
+        "tenant_id",
+        "updated",
+        "username",
+    )
+
+    MODEL = User
+
+    id: str
+    irn: IRN
+    created: str
+    updated: str
+    tenant_id: str
+    auth_id: str
+    email: str
+    enabled: bool
+    first_name: Optional[str]
+    last_name: Optional[str]
+    username: str
+    path: str
+    metadata: Optional[dict[str, Any]]
+    required_actions: Optional[list[str]]
+    pool_ids: Optional[list[str]]
+
+
 class CreateUser(IAMCoreBaseModel):
     """Request model for creating a new user."""
 
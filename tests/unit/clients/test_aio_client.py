@@ -0,0 +1,195 @@
+import asyncio
+import json
+from typing import Any, Callable
+
+import httpx
+import pytest
+from iamcore.irn import IRN
+
+from iamcore.client.aio import Client, EvaluateClient, HttpxAsyncTransport, ResourceClient, UserClient
+from iamcore.client.exceptions import IAMForbiddenException, IAMUnauthorizedException, IAMUserException
+from iamcore.client.resource.dto import ResourceSearchFilter
+from iamcore.client.user.dto import User
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+
+USER_DATA = {
+    "id": "user-id",
+    "irn": "irn:rc73dbh7q0:iamcore:::user/johndoe",
+    "created": "2021-10-18T12:27:15.55267632Z",
+    "updated": "2021-10-18T12:27:15.55267632Z",
+    "tenantID": "tenant123",
+    "authID": "auth-uuid-123",
+    "email": "john.doe@example.com",
+    "enabled": True,
+    "username": "johndoe",
+    "path": "/users",
+}
+
+
+def mock_transport(handler: Callable[[httpx.Request], httpx.Response]) -> HttpxAsyncTransport:
+    return HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class TestAsyncClient:
+    """Class-based tests for the asyncio client."""
+
+    def test_client_shares_transport_with_sub_clients(self) -> None:
+        """Test that every async sub-client uses the transport of the top-level client."""
+        transport = mock_transport(lambda _: httpx.Response(200))
+        client = Client(BASE_URL, ISSUER_URL, transport=transport)
+
+        sub_clients = [
+            client.auth,
+            client.api_key,
+            client.application,
+            client.application_resource_type,
+            client.evaluate,
+            client.group,
+            client.policy,
+            client.resource,
+            client.tenant,
+            client.user,
+        ]
+        assert all(sub_client.transport is transport for sub_client in sub_clients)
+        assert client.user.base_url == f"{BASE_URL}/api/v1/users"
+
+    def test_get_authenticated_user(self) -> None:
+        """Test that async methods reuse the sync DTOs."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"data": USER_DATA})
+
+        client = UserClient(BASE_URL, transport=mock_transport(handler))
+
+        result = asyncio.run(client.get_authenticated({"Authorization": "Bearer token"}))
+
+        assert isinstance(result, User)
+        assert str(result.irn) == "irn:rc73dbh7q0:iamcore:::user/johndoe"
+        assert str(requests[0].url) == f"{BASE_URL}/api/v1/users/me"
+        assert requests[0].headers["Authorization"] == "Bearer token"
+        assert requests[0].headers["Content-Type"] == "application/json"
+
+    def test_query_params_match_sync_client(self) -> None:
+        """Test that boolean query values are rendered like the requests-based client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"data": [], "count": 0, "page": 1, "pageSize": 10})
+
+        client = ResourceClient(BASE_URL, transport=mock_transport(handler))
+
+        asyncio.run(client.search({"Authorization": "Bearer token"}, ResourceSearchFilter(enabled=True, page=2)))
+
+        assert requests[0].url.params["enabled"] == "True"
+        assert requests[0].url.params["page"] == "2"
+
+    def test_search_all_is_async_generator(self) -> None:
+        """Test that search_all pages through results as an async generator."""
+        pages: list[dict[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            pages.append(dict(request.url.params))
+            data = [{**USER_DATA, "id": f"user-{page}"}]
+            return httpx.Response(200, json={"data": data, "count": 2, "page": page, "pageSize": 1})
+
+        client = UserClient(BASE_URL, transport=mock_transport(handler))
+
+        async def collect() -> list[User]:
+            return [user async for user in client.search_all({"Authorization": "Bearer token"})]
+
+        users = asyncio.run(collect())
+
+        assert [user.id for user in users] == ["user-1", "user-2"]
+        assert [page["page"] for page in pages] == ["1", "2"]
+        assert pages[0]["pageSize"] == "1000"
+
+    def test_evaluate_posts_payload(self) -> None:
+        """Test that evaluate sends the same payload as the sync client."""
+        bodies: list[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200)
+
+        client = EvaluateClient(BASE_URL, transport=mock_transport(handler))
+        irn = IRN.of("irn:rc73dbh7q0:myapp:tenant1::document/doc1")
+
+        asyncio.run(client.evaluate({"Authorization": "Bearer token"}, "myapp:document:read", [irn]))
+
+        assert bodies == [{"action": "myapp:document:read", "resources": [str(irn)]}]
+
+    def test_evaluate_batch_reports_denials(self) -> None:
+        """Test that evaluate_batch reads per-resource decisions from evaluate/actions like the sync client."""
+        denied = "irn:rc73dbh7q0:myapp:tenant1::document/doc2"
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            payload = json.loads(request.content)
+            allowed = {irn: [] if irn == denied else payload["actions"] for irn in payload["irns"]}
+            return httpx.Response(200, json={"data": allowed})
+
+        client = EvaluateClient(BASE_URL, transport=mock_transport(handler))
+        irns = [IRN.of(f"irn:rc73dbh7q0:myapp:tenant1::document/doc{i}") for i in range(1, 4)]
+
+        results = asyncio.run(
+            client.evaluate_batch({"Authorization": "Bearer token"}, [("myapp:document:read", irn) for irn in irns])
+        )
+
+        assert [r.allowed for r in results] == [True, False, True]
+        assert paths == ["/api/v1/evaluate/actions"]
+
+    def test_error_mapping_reuses_response_handler(self) -> None:
+        """Test that error statuses map to the same exceptions as the sync client."""
+        client = EvaluateClient(
+            BASE_URL,
+            transport=mock_transport(lambda _: httpx.Response(403, json={"message": "Access denied"})),
+        )
+        irn = IRN.of("irn:rc73dbh7q0:myapp:tenant1::document/doc1")
+
+        with pytest.raises(IAMForbiddenException) as excinfo:
+            asyncio.run(client.evaluate({"Authorization": "Bearer token"}, "myapp:document:read", [irn]))
+
+        assert excinfo.value.status_code == 403
+        assert "Access denied" in str(excinfo.value)
+
+    def test_err_chain_wraps_unexpected_errors(self) -> None:
+        """Test that async methods chain unexpected errors into the client exception type."""
+        client = UserClient(BASE_URL, transport=mock_transport(lambda _: httpx.Response(200, json={"data": {}})))
+
+        with pytest.raises(IAMUserException):
+            asyncio.run(client.get_authenticated({"Authorization": "Bearer token"}))
+
+    def test_missing_headers_raise_unauthorized(self) -> None:
+        """Test that requests without authorization headers are rejected locally."""
+        client = UserClient(BASE_URL, transport=mock_transport(lambda _: httpx.Response(200)))
+
+        with pytest.raises(IAMUnauthorizedException, match="Missing authorization headers"):
+            asyncio.run(client.get_authenticated({}))
+
+    def test_search_all_prefetches_pages_concurrently(self) -> None:
+        """Test that concurrent search_all fetches every page and keeps page order."""
+        pages: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            pages.append(page)
+            data = [{**USER_DATA, "id": f"user-{page}"}]
+            return httpx.Response(200, json={"data": data, "count": 4, "page": page, "pageSize": 1})
+
+        client = UserClient(BASE_URL, transport=mock_transport(handler))
+
+        async def collect() -> list[User]:
+            headers = {"Authorization": "Bearer token"}
+            return [user async for user in client.search_all(headers, concurrency=3)]
+
+        users = asyncio.run(collect())
+
+        assert [user.id for user in users] == ["user-1", "user-2", "user-3", "user-4"]
+        assert sorted(pages) == [1, 2, 3, 4]
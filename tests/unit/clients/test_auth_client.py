@@ -0,0 +1,204 @@
+import json
+import threading
+import time
+from urllib.parse import parse_qs
+
+import pytest
+import responses
+
+from iamcore.client.auth import Client, TokenProvider
+from iamcore.client.exceptions import IAMException
+
+ISSUER_URL = "http://localhost:8080/auth"
+TOKEN_URL = f"{ISSUER_URL}/realms/root/protocol/openid-connect/token"
+# Access tokens served one after the other, and a refresh token.
+FIRST = "t1"
+SECOND = "t2"
+REFRESH = "r1"
+
+
+def token_payload(access_token: str, *, expires_in: int = 300, refresh_expires_in: int = 1800) -> dict:
+    return {
+        "access_token": access_token,
+        "expires_in": expires_in,
+        "refresh_expires_in": refresh_expires_in,
+        "refresh_token": f"refresh-{access_token}",
+        "token_type": "Bearer",
+        "not-before-policy": 0,
+        "session_state": "state",
+        "scope": "openid",
+    }
+
+
+def grant_of(call: responses.Call) -> dict[str, list[str]]:
+    return parse_qs(call.request.body)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def client() -> Client:
+    return Client(base_url=ISSUER_URL)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def provider(client: Client, clock: FakeClock) -> TokenProvider:
+    return TokenProvider(
+        client,
+        realm="root",
+        client_id="iamcore",
+        username="admin",
+        password="secret",  # noqa: S106
+        clock=clock,
+    )
+
+
+class TestAuthClient:
+    """Tests for the auth client."""
+
+    @responses.activate
+    def test_get_token_with_refresh_token(self, client: Client) -> None:
+        """Test that the refresh_token grant is sent as a form."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2"), status=200)
+
+        token = client.get_token_with_refresh_token(realm="root", client_id="iamcore", refresh_token=REFRESH)
+
+        assert token.access_token == SECOND
+        assert grant_of(responses.calls[0]) == {
+            "grant_type": ["refresh_token"],
+            "client_id": ["iamcore"],
+            "refresh_token": [REFRESH],
+        }
+
+    @responses.activate
+    def test_get_token_with_refresh_token_rejected(self, client: Client) -> None:
+        """Test that a rejected refresh token surfaces as an IAMException."""
+        responses.add(responses.POST, TOKEN_URL, json={"error": "invalid_grant"}, status=400)
+
+        with pytest.raises(IAMException):
+            client.get_token_with_refresh_token(realm="root", client_id="iamcore", refresh_token=REFRESH)
+
+
+class TestTokenProvider:
+    """Tests for the TokenProvider."""
+
+    @responses.activate
+    def test_token_is_cached(self, provider: TokenProvider, clock: FakeClock) -> None:
+        """Test that a valid token is reused without calling the server."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1"), status=200)
+
+        assert provider.token.access_token == FIRST
+        clock.now = 200
+        assert provider.token.access_token == FIRST
+        assert len(responses.calls) == 1
+        assert grant_of(responses.calls[0])["grant_type"] == ["password"]
+
+    @responses.activate
+    def test_refreshes_before_expiry_with_refresh_token(self, provider: TokenProvider, clock: FakeClock) -> None:
+        """Test that the token is refreshed with the refresh_token grant inside the refresh margin."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1"), status=200)
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2"), status=200)
+
+        assert provider.token.access_token == FIRST
+        clock.now = 275
+        assert provider.token.access_token == SECOND
+
+        refresh = grant_of(responses.calls[1])
+        assert refresh["grant_type"] == ["refresh_token"]
+        assert refresh["refresh_token"] == ["refresh-t1"]
+
+    @responses.activate
+    def test_short_lived_token_margin(self, provider: TokenProvider, clock: FakeClock) -> None:
+        """Test that the refresh margin never exceeds half the token lifetime."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1", expires_in=20), status=200)
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2", expires_in=20), status=200)
+
+        provider.token  # noqa: B018
+        clock.now = 9
+        assert provider.token.access_token == FIRST
+        clock.now = 10
+        assert provider.token.access_token == SECOND
+
+    @responses.activate
+    def test_falls_back_to_password_when_refresh_rejected(self, provider: TokenProvider, clock: FakeClock) -> None:
+        """Test that a rejected refresh token falls back to the password grant."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1"), status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"error": "invalid_grant"}, status=400)
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2"), status=200)
+
+        provider.token  # noqa: B018
+        clock.now = 280
+
+        assert provider.token.access_token == SECOND
+        assert [grant_of(call)["grant_type"] for call in responses.calls] == [
+            ["password"],
+            ["refresh_token"],
+            ["password"],
+        ]
+
+    @responses.activate
+    def test_uses_password_when_refresh_token_expired(self, provider: TokenProvider, clock: FakeClock) -> None:
+        """Test that an expired refresh token is not sent at all."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1", refresh_expires_in=600), status=200)
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2"), status=200)
+
+        provider.token  # noqa: B018
+        clock.now = 1000
+
+        assert provider.token.access_token == SECOND
+        assert grant_of(responses.calls[1])["grant_type"] == ["password"]
+
+    @responses.activate
+    def test_invalidate(self, provider: TokenProvider) -> None:
+        """Test that an invalidated token is fetched again."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1"), status=200)
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t2"), status=200)
+
+        provider.token  # noqa: B018
+        provider.invalidate()
+
+        assert provider.token.access_token == SECOND
+
+    @responses.activate
+    def test_access_headers_are_fresh_dicts(self, provider: TokenProvider) -> None:
+        """Test that callers may mutate the returned headers without affecting later calls."""
+        responses.add(responses.POST, TOKEN_URL, json=token_payload("t1"), status=200)
+
+        headers = provider.access_headers
+        headers["Content-Type"] = "application/json"
+
+        assert provider.access_headers == {"Authorization": "Bearer t1"}
+
+    @responses.activate
+    def test_concurrent_callers_share_one_refresh(self, provider: TokenProvider) -> None:
+        """Test that concurrent callers with a stale token trigger a single token request."""
+
+        def slow_token(_: object) -> tuple[int, dict, str]:
+            time.sleep(0.05)
+            return 200, {}, json.dumps(token_payload("t1"))
+
+        responses.add_callback(responses.POST, TOKEN_URL, callback=slow_token)
+        results: list[str] = []
+
+        def worker() -> None:
+            results.append(provider.token.access_token)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["t1"] * 8
+        assert len(responses.calls) == 1
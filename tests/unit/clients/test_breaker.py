@@ -0,0 +1,163 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import CircuitBreakerPolicy, CircuitBreakerTransport, CircuitEvent, CircuitState, Client
+from iamcore.client.aio import AsyncCircuitBreakerTransport, HttpxAsyncTransport
+from iamcore.client.base.breaker import endpoint_template
+from iamcore.client.base.transport import PooledTransport
+from iamcore.client.exceptions import IAMCircuitOpenException
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+EVALUATE_URL = f"{BASE_URL}/api/v1/evaluate"
+USERS_URL = f"{BASE_URL}/api/v1/users"
+IRN_B64 = IRN.of("irn:rc73dbh7q0:iamcore:4atcicnisg::user/johndoe").to_base64()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def breaker(policy: CircuitBreakerPolicy) -> tuple[CircuitBreakerTransport, FakeClock, list[CircuitEvent]]:
+    clock = FakeClock()
+    events: list[CircuitEvent] = []
+    transport = CircuitBreakerTransport(PooledTransport(), policy, listeners=[events.append], clock=clock)
+    return transport, clock, events
+
+
+class TestEndpointTemplate:
+    """Tests for endpoint_template."""
+
+    def test_identifiers_are_replaced(self) -> None:
+        """Test that IRNs, UUIDs and numbers collapse into one template per endpoint."""
+        assert endpoint_template("post", EVALUATE_URL) == "POST /api/v1/evaluate"
+        assert endpoint_template("get", f"{USERS_URL}/{IRN_B64}/groups") == "GET /api/v1/users/{id}/groups"
+        assert (
+            endpoint_template("put", f"{BASE_URL}/api/v1/policies/0b6f4e4a-9c36-4a4e-8f5e-6f1e3e8a0c11")
+            == "PUT /api/v1/policies/{id}"
+        )
+        assert endpoint_template("get", f"{USERS_URL}/me") == "GET /api/v1/users/me"
+
+
+class TestCircuitBreakerTransport:
+    """Tests for CircuitBreakerTransport."""
+
+    @responses.activate
+    def test_opens_and_fails_fast(self) -> None:
+        """Test that a failing endpoint opens its circuit and later calls are not sent."""
+        responses.add(responses.POST, EVALUATE_URL, status=503)
+        transport, _, events = breaker(CircuitBreakerPolicy(min_calls=4, failure_rate=0.5))
+
+        for _ in range(4):
+            transport.request("POST", EVALUATE_URL)
+        with pytest.raises(IAMCircuitOpenException) as excinfo:
+            transport.request("POST", EVALUATE_URL)
+
+        assert len(responses.calls) == 4
+        assert excinfo.value.endpoint == "POST /api/v1/evaluate"
+        assert excinfo.value.retry_in > 0
+        assert events == [CircuitEvent("POST /api/v1/evaluate", CircuitState.CLOSED, CircuitState.OPEN)]
+
+    @responses.activate
+    def test_circuits_are_per_endpoint(self) -> None:
+        """Test that an open circuit does not affect other endpoints."""
+        responses.add(responses.POST, EVALUATE_URL, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, USERS_URL, status=200)
+        transport, _, _ = breaker(CircuitBreakerPolicy(min_calls=2))
+
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                transport.request("POST", EVALUATE_URL)
+
+        assert transport.request("GET", USERS_URL).status_code == 200
+        with pytest.raises(IAMCircuitOpenException):
+            transport.request("POST", EVALUATE_URL)
+
+    @responses.activate
+    def test_half_open_probe_closes_circuit(self) -> None:
+        """Test that after the open duration a successful probe closes the circuit."""
+        responses.add(responses.POST, EVALUATE_URL, status=500)
+        responses.add(responses.POST, EVALUATE_URL, status=500)
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        transport, clock, events = breaker(CircuitBreakerPolicy(min_calls=1, open_duration=10))
+
+        transport.request("POST", EVALUATE_URL)
+        clock.now = 10
+        transport.request("POST", EVALUATE_URL)
+        with pytest.raises(IAMCircuitOpenException):
+            transport.request("POST", EVALUATE_URL)
+        clock.now = 20
+        transport.request("POST", EVALUATE_URL)
+
+        assert [(e.previous, e.state) for e in events] == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    @responses.activate
+    def test_slow_calls_open_circuit(self) -> None:
+        """Test that latency alone can open the circuit."""
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        clock = FakeClock()
+
+        class SlowTransport(PooledTransport):
+            def request(self, *args: object, **kwargs: object) -> requests.Response:
+                clock.now += 5
+                return super().request(*args, **kwargs)
+
+        policy = CircuitBreakerPolicy(min_calls=3, slow_call_duration=2, slow_call_rate=0.5)
+        transport = CircuitBreakerTransport(SlowTransport(), policy, clock=clock)
+
+        for _ in range(3):
+            transport.request("POST", EVALUATE_URL)
+
+        assert transport.circuits["POST /api/v1/evaluate"].state is CircuitState.OPEN
+
+    @responses.activate
+    def test_client_wraps_transport(self) -> None:
+        """Test that the top-level client installs the breaker with its listener."""
+        responses.add(responses.POST, EVALUATE_URL, status=503)
+        events: list[CircuitEvent] = []
+        client = Client(
+            BASE_URL, ISSUER_URL, circuit_breaker=CircuitBreakerPolicy(min_calls=1), on_circuit_change=events.append
+        )
+
+        assert isinstance(client.transport, CircuitBreakerTransport)
+        client.transport.request("POST", EVALUATE_URL)
+        assert events == [CircuitEvent("POST /api/v1/evaluate", CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+class TestAsyncCircuitBreakerTransport:
+    """Tests for AsyncCircuitBreakerTransport."""
+
+    def test_opens_and_fails_fast(self) -> None:
+        """Test that the async breaker opens on server errors."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(502)
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        transport = AsyncCircuitBreakerTransport(inner, CircuitBreakerPolicy(min_calls=2))
+
+        async def run() -> None:
+            await transport.request("POST", EVALUATE_URL)
+            await transport.request("POST", EVALUATE_URL)
+            await transport.request("POST", EVALUATE_URL)
+
+        with pytest.raises(IAMCircuitOpenException):
+            asyncio.run(run())
+        assert len(sent) == 2
@@ -0,0 +1,143 @@
+import asyncio
+import json
+from typing import cast
+
+import httpx
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import FailurePolicy, RetryPolicy
+from iamcore.client.aio.resource import Client as AsyncResourceClient
+from iamcore.client.aio.transport import HttpxAsyncTransport
+from iamcore.client.base.bulk import chunked
+from iamcore.client.exceptions import IAMException
+from iamcore.client.resource.client import Client as ResourceClient
+from iamcore.client.user.client import Client as UserClient
+
+BASE_URL = "http://localhost:8080"
+USERS_DELETE_URL = f"{BASE_URL}/api/v1/users/delete"
+RESOURCES_DELETE_URL = f"{BASE_URL}/api/v1/resources/delete"
+HEADERS = {"Authorization": "Bearer token"}
+
+
+def user_irns(count: int) -> list[IRN]:
+    return [IRN.of(f"irn:rc73dbh7q0:iamcore:tenant1::user/user{i}") for i in range(count)]
+
+
+def resource_irns(count: int) -> list[IRN]:
+    return [IRN.of(f"irn:rc73dbh7q0:myapp:tenant1::document/doc{i}") for i in range(count)]
+
+
+def delete_callback(key: str, fail_first: int = 0):  # noqa: ANN201
+    """Accept deletes, failing the first `fail_first` requests with 503."""
+    state = {"calls": 0}
+
+    def callback(request: object) -> tuple[int, dict, str]:
+        assert json.loads(cast("responses.PreparedRequest", request).body)[key]
+        state["calls"] += 1
+        if state["calls"] <= fail_first:
+            return 503, {}, json.dumps({"message": "Unavailable"})
+        return 204, {}, ""
+
+    return callback
+
+
+def sent_ids(key: str) -> list[list[str]]:
+    return [json.loads(call.request.body)[key] for call in responses.calls]
+
+
+class TestChunked:
+    """Tests for chunked."""
+
+    def test_splits_lazily(self) -> None:
+        """Test that items are split in order, the last chunk holding the remainder."""
+        assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 2)) == []
+
+    def test_rejects_non_positive_size(self) -> None:
+        """Test that the chunk size must be positive."""
+        with pytest.raises(ValueError, match="chunk size"):
+            list(chunked([1], 0))
+
+
+class TestUserDeleteMany:
+    """Tests for UserClient.delete_many."""
+
+    @responses.activate
+    def test_sends_one_request_per_chunk(self) -> None:
+        """Test that IRNs are deleted in chunks, with one result per chunk."""
+        responses.add_callback(responses.POST, USERS_DELETE_URL, callback=delete_callback("userIDS"))
+        irns = user_irns(250)
+
+        results = list(UserClient(BASE_URL).delete_many(dict(HEADERS), iter(irns), chunk_size=100, concurrency=3))
+
+        assert sorted((r.position, len(r.item), r.ok) for r in results) == [
+            (0, 100, True),
+            (1, 100, True),
+            (2, 50, True),
+        ]
+        assert sorted(id_ for ids in sent_ids("userIDS") for id_ in ids) == sorted(irn.to_base64() for irn in irns)
+
+    @responses.activate
+    def test_reports_failed_chunks(self) -> None:
+        """Test that a failed chunk is reported, and retried with the retry policy."""
+        responses.add_callback(responses.POST, USERS_DELETE_URL, callback=delete_callback("userIDS", fail_first=1))
+        client = UserClient(BASE_URL)
+
+        (failed,) = client.delete_many(dict(HEADERS), user_irns(3))
+        (retried,) = client.delete_many(
+            dict(HEADERS),
+            user_irns(3),
+            on_failure=FailurePolicy.RETRY,
+            retry=RetryPolicy(backoff_base=0),
+        )
+
+        assert failed.error.status_code == 503
+        assert retried.ok
+
+
+class TestResourceDelete:
+    """Tests for the chunked resource deletes."""
+
+    @responses.activate
+    def test_list_delete_is_chunked(self) -> None:
+        """Test that deleting a list of resources no longer sends one unbounded payload."""
+        responses.add_callback(responses.POST, RESOURCES_DELETE_URL, callback=delete_callback("resourceIDs"))
+
+        ResourceClient(BASE_URL).delete(dict(HEADERS), resource_irns(250))
+
+        assert sorted(len(ids) for ids in sent_ids("resourceIDs")) == [50, 100, 100]
+
+    @responses.activate
+    def test_list_delete_raises_first_failure(self) -> None:
+        """Test that every chunk is attempted and the first failure is raised."""
+        responses.add_callback(
+            responses.POST, RESOURCES_DELETE_URL, callback=delete_callback("resourceIDs", fail_first=1)
+        )
+
+        with pytest.raises(IAMException) as excinfo:
+            ResourceClient(BASE_URL).delete(dict(HEADERS), resource_irns(250))
+
+        assert excinfo.value.status_code == 503
+        assert len(responses.calls) == 3
+
+    def test_async_delete_many(self) -> None:
+        """Test that the async client deletes chunks concurrently."""
+        sizes = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            sizes.append(len(json.loads(request.content)["resourceIDs"]))
+            await asyncio.sleep(0.01)
+            return httpx.Response(204)
+
+        transport = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncResourceClient(BASE_URL, transport=transport)
+
+        async def run() -> list:
+            return [r async for r in client.delete_many(dict(HEADERS), resource_irns(5), chunk_size=2)]
+
+        results = asyncio.run(run())
+
+        assert sorted(sizes) == [1, 2, 2]
+        assert all(r.ok for r in results)
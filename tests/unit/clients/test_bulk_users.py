@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Optional, Union, cast
+
+import httpx
+import pytest
+import requests
+import responses
+from iamcore.irn import IRN
+from urllib3.exceptions import NewConnectionError
+
+from iamcore.client import FailurePolicy, RetryPolicy
+from iamcore.client.aio.transport import HttpxAsyncTransport
+from iamcore.client.aio.user import Client as AsyncUserClient
+from iamcore.client.exceptions import IAMException
+from iamcore.client.user.client import Client as UserClient
+from iamcore.client.user.dto import CreateUser
+
+BASE_URL = "http://localhost:8080"
+USERS_URL = f"{BASE_URL}/api/v1/users"
+HEADERS = {"Authorization": "Bearer token"}
+NO_BACKOFF = RetryPolicy(max_attempts=3, backoff_base=0)
+PASSWORD = "securepassword123"  # noqa: S105
+
+
+def create_user(username: str) -> CreateUser:
+    return CreateUser(
+        email=f"{username}@example.com",
+        username=username,
+        password=PASSWORD,
+        confirmPassword=PASSWORD,
+        tenantID="tenant1",
+    )
+
+
+def user_data(username: str) -> dict:
+    irn = f"irn:rc73dbh7q0:iamcore:tenant1::user/{username}"
+    return {
+        "id": IRN.of(irn).to_base64(),
+        "irn": irn,
+        "created": "2021-10-18T12:27:15.55267632Z",
+        "updated": "2021-10-18T12:27:15.55267632Z",
+        "tenantID": "tenant1",
+        "authID": f"auth-{username}",
+        "email": f"{username}@example.com",
+        "enabled": True,
+        "username": username,
+        "path": "/users",
+    }
+
+
+def user_url(username: str, action: str) -> str:
+    irn = IRN.of(f"irn:rc73dbh7q0:iamcore:tenant1::user/{username}")
+    return f"{USERS_URL}/{irn.to_base64()}/{action}"
+
+
+def refused() -> requests.ConnectionError:
+    """The error requests raises when the connection cannot be established."""
+    error = requests.ConnectionError("Connection refused")
+    error.__cause__ = NewConnectionError(None, "Connection refused")
+    return error
+
+
+def create_callback(failures: dict[str, list[Union[int, Exception]]]):  # noqa: ANN201
+    """Create users, answering the queued error statuses or raising the queued errors first for the given usernames."""
+
+    def callback(request: object) -> Union[tuple[int, dict, str], Exception]:
+        username = json.loads(cast("responses.PreparedRequest", request).body)["username"]
+        queued = failures.get(username)
+        if queued:
+            failure = queued.pop(0)
+            if isinstance(failure, Exception):
+                return failure
+            return failure, {}, json.dumps({"message": "Boom"})
+        return 201, {}, json.dumps({"data": user_data(username)})
+
+    return callback
+
+
+def by_index(results: list) -> list:
+    return sorted(results, key=lambda result: result.position)
+
+
+class TestCreateMany:
+    """Tests for UserClient.create_many."""
+
+    @responses.activate
+    def test_creates_users_and_chains_groups_and_policies(self) -> None:
+        """Test that every user is created, added to its groups and attached to the policies."""
+        responses.add_callback(responses.POST, USERS_URL, callback=create_callback({}))
+        names = [f"user{i}" for i in range(20)]
+        for name in names:
+            responses.add(responses.POST, user_url(name, "groups/add"), status=204)
+            responses.add(responses.PUT, user_url(name, "policies/attach"), status=204)
+        client = UserClient(BASE_URL)
+
+        results = list(
+            client.create_many(
+                dict(HEADERS),
+                (create_user(name) for name in names),
+                concurrency=4,
+                group_ids=lambda params: [f"group-{params.username}"],
+                policy_ids=["policy-1"],
+            )
+        )
+
+        assert [r.position for r in by_index(results)] == list(range(20))
+        assert all(r.ok for r in results)
+        assert [r.value.username for r in by_index(results)] == names
+        groups_call = next(c for c in responses.calls if c.request.url == user_url("user3", "groups/add"))
+        assert json.loads(groups_call.request.body) == {"groupIDs": ["group-user3"]}
+        assert len(responses.calls) == 60
+
+    @responses.activate
+    def test_continue_reports_failures(self) -> None:
+        """Test that failures are reported with their index, and the other users are still created."""
+        responses.add_callback(responses.POST, USERS_URL, callback=create_callback({"bad": [409]}))
+        client = UserClient(BASE_URL)
+
+        results = by_index(client.create_many(dict(HEADERS), map(create_user, ["a", "bad", "c"]), concurrency=2))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, IAMException)
+        assert results[1].error.status_code == 409
+        assert results[1].item.username == "bad"
+
+    @responses.activate
+    def test_abort_stops_starting_new_users(self) -> None:
+        """Test that after a failure no new user is started, and earlier ones are still reported."""
+        responses.add_callback(responses.POST, USERS_URL, callback=create_callback({"bad": [400]}))
+        client = UserClient(BASE_URL)
+        names = ["a", "bad", "c", "d", "e"]
+
+        results = by_index(
+            client.create_many(dict(HEADERS), map(create_user, names), concurrency=1, on_failure=FailurePolicy.ABORT)
+        )
+
+        assert [(r.position, r.ok) for r in results] == [(0, True), (1, False)]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_retry_only_retries_the_failed_step(self) -> None:
+        """Test that transient errors are retried per step, and permanent ones are not."""
+        responses.add_callback(
+            responses.POST, USERS_URL, callback=create_callback({"flaky": [refused()], "bad": [409]})
+        )
+        responses.add(responses.POST, user_url("flaky", "groups/add"), status=503)
+        responses.add(responses.POST, user_url("flaky", "groups/add"), status=204)
+        client = UserClient(BASE_URL)
+
+        results = by_index(
+            client.create_many(
+                dict(HEADERS),
+                map(create_user, ["flaky", "bad"]),
+                group_ids=["group-1"],
+                on_failure=FailurePolicy.RETRY,
+                retry=NO_BACKOFF,
+            )
+        )
+
+        assert results[0].ok
+        assert results[1].error.status_code == 409
+        creates = [c for c in responses.calls if c.request.url == USERS_URL]
+        assert len(creates) == 3
+
+    @responses.activate
+    @pytest.mark.parametrize(("retry_post", "creates"), [(False, 1), (True, 2)])
+    def test_create_reaching_the_server_is_not_resent(self, retry_post: bool, creates: int) -> None:
+        """Test that a create which got a response is only retried when the policy allows POST retries."""
+        responses.add_callback(responses.POST, USERS_URL, callback=create_callback({"a": [503]}))
+        client = UserClient(BASE_URL)
+        retry = RetryPolicy(max_attempts=3, backoff_base=0, retry_post=retry_post)
+
+        (result,) = client.create_many(dict(HEADERS), [create_user("a")], on_failure=FailurePolicy.RETRY, retry=retry)
+
+        assert result.ok is retry_post
+        assert len(responses.calls) == creates
+
+    @responses.activate
+    def test_failed_chained_step_keeps_created_user(self) -> None:
+        """Test that a user created before a later step failed is still reported."""
+        responses.add_callback(responses.POST, USERS_URL, callback=create_callback({}))
+        responses.add(responses.PUT, user_url("a", "policies/attach"), status=404, json={"message": "No policy"})
+        client = UserClient(BASE_URL)
+
+        (result,) = client.create_many(dict(HEADERS), [create_user("a")], policy_ids=["missing"])
+
+        assert result.value.username == "a"
+        assert result.error.status_code == 404
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency"):
+            list(UserClient(BASE_URL).create_many(dict(HEADERS), [], concurrency=0))
+
+
+class TestAsyncCreateMany:
+    """Tests for the async UserClient.create_many."""
+
+    def test_creates_users_with_bounded_concurrency(self) -> None:
+        """Test that users are created concurrently, never more than `concurrency` at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            username = json.loads(request.content)["username"]
+            if username == "bad":
+                return httpx.Response(409, json={"message": "Exists"})
+            return httpx.Response(201, json={"data": user_data(username)})
+
+        transport = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncUserClient(BASE_URL, transport=transport)
+        names = [f"user{i}" for i in range(10)] + ["bad"]
+
+        async def run() -> list:
+            return [r async for r in client.create_many(dict(HEADERS), map(create_user, names), concurrency=3)]
+
+        results = by_index(asyncio.run(run()))
+
+        assert peak == 3
+        assert [r.ok for r in results] == [True] * 10 + [False]
+        error: Optional[IAMException] = results[-1].error
+        assert error is not None
+        assert error.status_code == 409
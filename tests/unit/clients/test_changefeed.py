@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import ChangeFeed, ChangeType
+from iamcore.client.base.changefeed import parse_timestamp
+from iamcore.client.user.client import Client as UserClient
+from iamcore.client.user.dto import IamUsersResponse, UserSearchFilter
+
+if TYPE_CHECKING:
+    from iamcore.client.base.models import PaginatedSearchFilter
+
+BASE_URL = "http://localhost:8080"
+USERS_URL = f"{BASE_URL}/api/v1/users"
+HEADERS = {"Authorization": "Bearer token"}
+
+
+def user_data(username: str, updated: str) -> dict:
+    irn = f"irn:rc73dbh7q0:iamcore:tenant1::user/{username}"
+    return {
+        "id": IRN.of(irn).to_base64(),
+        "irn": irn,
+        "created": "2021-10-18T12:27:15.55267632Z",
+        "updated": updated,
+        "tenantID": "tenant1",
+        "authID": f"auth-{username}",
+        "email": f"{username}@example.com",
+        "enabled": True,
+        "username": username,
+        "path": "/users",
+    }
+
+
+class FakeUsers:
+    """In-memory stand-in for `UserClient.search`, recording every filter it is called with."""
+
+    def __init__(self, *users: tuple[str, str]) -> None:
+        self.users = {name: user_data(name, updated) for name, updated in users}
+        self.filters: list[PaginatedSearchFilter] = []
+
+    def set(self, name: str, updated: str) -> None:
+        self.users[name] = user_data(name, updated)
+
+    def search(self, auth_headers: dict[str, str], search_filter: PaginatedSearchFilter) -> IamUsersResponse:
+        self.filters.append(search_filter.model_copy())
+        data = list(self.users.values())
+        if search_filter.sort == "updated":
+            data.sort(key=lambda user: parse_timestamp(user["updated"]), reverse=True)
+        size = search_filter.page_size or len(data)
+        start = ((search_filter.page or 1) - 1) * size
+        return IamUsersResponse.model_validate(
+            {"data": data[start : start + size], "count": len(data), "page": search_filter.page, "pageSize": size}
+        )
+
+
+def watch(users: FakeUsers, **kwargs: object) -> ChangeFeed:
+    feed = ChangeFeed(dict(HEADERS), **kwargs)
+    feed.watch("users", users.search)
+    return feed
+
+
+def changes(events: list) -> list[tuple[str, str]]:
+    return sorted((event.type.value, event.key.rsplit("/", 1)[1]) for event in events)
+
+
+class TestParseTimestamp:
+    """Tests for parse_timestamp."""
+
+    def test_parses_server_formats(self) -> None:
+        """Test that nanoseconds, `Z` and offsets are all understood and comparable."""
+        assert parse_timestamp("2021-10-18T12:27:15.55267632Z") == parse_timestamp("2021-10-18T15:27:15.552676+03:00")
+        assert parse_timestamp("2021-10-18T12:27:15Z") < parse_timestamp("2021-10-18T12:27:15.1Z")
+
+
+class TestChangeFeed:
+    """Tests for ChangeFeed."""
+
+    def test_first_poll_sets_the_baseline(self) -> None:
+        """Test that the first poll is a full sync, silent unless initial events are asked for."""
+        users = FakeUsers(("a", "2024-01-01T00:00:00Z"), ("b", "2024-01-02T00:00:00Z"))
+
+        assert watch(users).poll() == []
+        assert changes(watch(users, emit_initial=True).poll()) == [("added", "a"), ("added", "b")]
+
+    def test_poll_stops_at_the_watermark(self) -> None:
+        """Test that a poll reports new and modified entities and stops paging at older ones."""
+        users = FakeUsers(*((f"old{i}", f"2024-01-01T00:00:0{i}Z") for i in range(10)))
+        feed = watch(users, page_size=2)
+        feed.poll()
+        users.set("old3", "2024-01-03T00:00:00Z")
+        users.set("new", "2024-01-02T00:00:00Z")
+        users.filters.clear()
+
+        events = feed.poll()
+
+        assert changes(events) == [("added", "new"), ("modified", "old3")]
+        assert [(f.sort, f.sort_order, f.page) for f in users.filters] == [
+            ("updated", "desc", 1),
+            ("updated", "desc", 2),
+        ]
+        assert feed.poll() == []
+
+    def test_entities_at_the_watermark_are_not_repeated(self) -> None:
+        """Test that ties with the watermark are only reported when they are new."""
+        users = FakeUsers(("a", "2024-01-01T00:00:00Z"))
+        feed = watch(users)
+        feed.poll()
+        users.set("b", "2024-01-01T00:00:00Z")
+
+        assert changes(feed.poll()) == [("added", "b")]
+        assert feed.poll() == []
+
+    def test_full_sync_reports_removals(self) -> None:
+        """Test that deleted entities are reported by the periodic full sync."""
+        now = [0.0]
+        users = FakeUsers(("a", "2024-01-01T00:00:00Z"), ("b", "2024-01-01T00:00:00Z"))
+        feed = watch(users, full_sync_interval=600, clock=lambda: now[0])
+        feed.poll()
+        del users.users["b"]
+
+        assert feed.poll() == []
+        now[0] = 600
+        (event,) = feed.poll()
+
+        assert event.type is ChangeType.REMOVED
+        assert event.entity is None
+        assert event.key.endswith("user/b")
+
+    def test_listeners(self) -> None:
+        """Test that subscribers get every event until they unsubscribe."""
+        users = FakeUsers(("a", "2024-01-01T00:00:00Z"))
+        feed = watch(users)
+        received = []
+        unsubscribe = feed.subscribe(received.append)
+        feed.poll()
+        users.set("a", "2024-01-02T00:00:00Z")
+        feed.poll()
+        unsubscribe()
+        users.set("a", "2024-01-03T00:00:00Z")
+        feed.poll()
+
+        assert changes(received) == [("modified", "a")]
+
+    def test_watching_does_not_wait_for_a_poll(self) -> None:
+        """Test that the feed is not locked while a poll searches, so sources can be added meanwhile."""
+        users = FakeUsers(("a", "2024-01-01T00:00:00Z"))
+        feed = watch(users)
+        watched = threading.Event()
+
+        def search(auth_headers: dict[str, str], search_filter: PaginatedSearchFilter) -> IamUsersResponse:
+            adding = threading.Thread(target=lambda: (feed.watch("admins", users.search), watched.set()))
+            adding.start()
+            adding.join(timeout=1)
+            return users.search(auth_headers, search_filter)
+
+        feed.watch("users", search)
+        feed.poll()
+
+        assert watched.is_set()
+
+    @responses.activate
+    def test_watches_a_client_search(self) -> None:
+        """Test that a client's search is queried sorted by `updated`, with the watched filter kept."""
+        responses.add(
+            responses.GET,
+            USERS_URL,
+            json={"data": [user_data("a", "2024-01-01T00:00:00Z")], "count": 1, "page": 1, "pageSize": 1000},
+        )
+        responses.add(
+            responses.GET,
+            USERS_URL,
+            json={"data": [user_data("b", "2024-01-02T00:00:00Z")], "count": 2, "page": 1, "pageSize": 100},
+        )
+        feed = ChangeFeed(dict(HEADERS))
+        feed.watch("users", UserClient(BASE_URL).search, UserSearchFilter(tenantID="tenant1"))
+
+        feed.poll()
+        (event,) = feed.poll()
+
+        assert event.entity.username == "b"
+        query = responses.calls[1].request.url
+        assert "sort=updated" in query
+        assert "sortOrder=desc" in query
+        assert "tenantID=tenant1" in query
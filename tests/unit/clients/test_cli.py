@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from typing import TYPE_CHECKING, cast
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import Client
+from iamcore.client.cli import CHECKPOINT_EVERY, ENTITIES, UPDATE_PASSWORD, export_entities, import_entities, main
+from iamcore.client.exceptions import IAMException
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BASE_URL = "http://localhost:8080"
+GROUPS_URL = f"{BASE_URL}/api/v1/groups"
+HEADERS = {"Authorization": "Bearer token"}
+PASSWORD = "Initial-1"  # noqa: S105
+CREATED = "2024-01-01T00:00:00Z"
+
+
+def group_data(name: str, path: str = "/") -> dict:
+    irn = f"irn:rc73dbh7q0:iamcore:tenant1::group{path.rstrip('/')}/{name}"
+    return {
+        "id": IRN.of(irn).to_base64(),
+        "irn": irn,
+        "tenantID": "tenant1",
+        "name": name,
+        "displayName": name.title(),
+        "path": path,
+        "created": "2024-01-01T00:00:00Z",
+        "updated": "2024-01-01T00:00:00Z",
+    }
+
+
+USER = {
+    "id": "dXNlcg==",
+    "irn": "irn:rc73dbh7q0:iamcore:tenant1::user/jdoe",
+    "created": CREATED,
+    "updated": CREATED,
+    "tenantID": "tenant1",
+    "authID": "auth-1",
+    "email": "jdoe@example.com",
+    "enabled": True,
+    "firstName": "John",
+    "username": "jdoe",
+    "path": "/",
+    "requiredActions": ["VERIFY_EMAIL"],
+}
+POLICY = {
+    "id": "cG9saWN5",
+    "irn": "irn:rc73dbh7q0:iamcore:tenant1::policy/readers",
+    "name": "readers",
+    "type": "tenant",
+    "origin": "user",
+    "version": "v1",
+    "statements": [{"effect": "allow", "resources": ["irn:rc73dbh7q0:myapp:tenant1::*"], "actions": ["myapp:*"]}],
+}
+RESOURCE = {
+    "id": "cmVzb3VyY2U=",
+    "irn": "irn:rc73dbh7q0:myapp:tenant1::device/dev/d1",
+    "created": CREATED,
+    "updated": CREATED,
+    "tenantID": "tenant1",
+    "application": "myapp",
+    "name": "d1",
+    "displayName": "Device 1",
+    "path": "/dev",
+    "resourceType": "device",
+    "enabled": True,
+    "description": "",
+    "metadata": {},
+}
+TENANT = {
+    "resourceID": "dGVuYW50",
+    "irn": "irn:rc73dbh7q0:iamcore:tenant1::tenant/tenant1",
+    "tenantID": "tenant1",
+    "name": "tenant1",
+    "displayName": "Tenant 1",
+    "loginTheme": "iamcore",
+    "created": CREATED,
+    "updated": CREATED,
+}
+APPLICATION = {
+    "id": "YXBw",
+    "irn": "irn:rc73dbh7q0:iamcore:::application/myapp",
+    "name": "myapp",
+    "displayName": "My app",
+    "created": CREATED,
+    "updated": CREATED,
+}
+
+
+def pages_callback(total: int, fail_pages: set[int] = frozenset()):  # noqa: ANN201
+    """Serve `total` groups in pages, failing each page in `fail_pages` once."""
+    failing = set(fail_pages)
+
+    def callback(request: object) -> tuple[int, dict, str]:
+        query = parse_qs(urlparse(cast("responses.PreparedRequest", request).url).query)
+        page, size = int(query["page"][0]), int(query["pageSize"][0])
+        if page in failing:
+            failing.remove(page)
+            return 500, {}, json.dumps({"message": "Boom"})
+        names = [f"g{i}" for i in range((page - 1) * size, min(page * size, total))]
+        body = {"data": [group_data(name) for name in names], "count": total, "page": page, "pageSize": size}
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+def client() -> Client:
+    return Client(BASE_URL, f"{BASE_URL}/auth")
+
+
+def exported_names(path: Path) -> list[str]:
+    with gzip.open(path) as lines:
+        return [json.loads(line)["name"] for line in lines]
+
+
+class TestExport:
+    """Tests for the NDJSON export."""
+
+    @responses.activate
+    def test_exports_every_page_gzipped(self, tmp_path: Path) -> None:
+        """Test that every page is written in order, as gzipped NDJSON, and the checkpoint is removed."""
+        responses.add_callback(responses.GET, GROUPS_URL, callback=pages_callback(2500))
+        output = tmp_path / "groups.ndjson.gz"
+
+        stats = export_entities(client(), HEADERS, "groups", str(output), compress=True, concurrency=2)
+
+        assert exported_names(output) == [f"g{i}" for i in range(2500)]
+        assert stats.records == 2500
+        assert len(stats.latencies) == 3
+        assert not (tmp_path / "groups.ndjson.gz.checkpoint").exists()
+
+    @responses.activate
+    def test_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        """Test that a failed export resumes at the checkpointed entity of a sorted search, without duplicates."""
+        responses.add_callback(responses.GET, GROUPS_URL, callback=pages_callback(2500, fail_pages={3}))
+        output = tmp_path / "groups.ndjson.gz"
+
+        with pytest.raises(IAMException):
+            export_entities(client(), HEADERS, "groups", str(output), compress=True)
+        checkpoint = json.loads((tmp_path / "groups.ndjson.gz.checkpoint").read_text())
+        responses.calls.reset()
+        stats = export_entities(client(), HEADERS, "groups", str(output), compress=True, resume=True)
+
+        assert checkpoint["records"] == 2 * CHECKPOINT_EVERY
+        assert checkpoint["last"] == group_data(f"g{2 * CHECKPOINT_EVERY - 1}")["irn"]
+        # The page of the last exported entity is read again, to check it did not move.
+        assert [call.request.params["page"] for call in responses.calls] == ["2", "3"]
+        assert {(call.request.params["sort"], call.request.params["sortOrder"]) for call in responses.calls} == {
+            ("created", "asc")
+        }
+        assert stats.records == 500
+        assert exported_names(output) == [f"g{i}" for i in range(2500)]
+
+    @responses.activate
+    def test_resume_refuses_moved_entities(self, tmp_path: Path) -> None:
+        """Test that a resume fails, keeping the checkpoint, when the last exported entity is no longer in its place."""
+        responses.add_callback(responses.GET, GROUPS_URL, callback=pages_callback(2500, fail_pages={3}))
+        output = tmp_path / "groups.ndjson.gz"
+        checkpoint_path = tmp_path / "groups.ndjson.gz.checkpoint"
+        with pytest.raises(IAMException):
+            export_entities(client(), HEADERS, "groups", str(output), compress=True)
+        checkpoint = json.loads(checkpoint_path.read_text())
+        checkpoint_path.write_text(json.dumps({**checkpoint, "last": group_data("deleted")["irn"]}))
+
+        with pytest.raises(IAMException, match="without --resume"):
+            export_entities(client(), HEADERS, "groups", str(output), compress=True, resume=True)
+
+        assert checkpoint_path.exists()
+        assert exported_names(output) == [f"g{i}" for i in range(2 * CHECKPOINT_EVERY)]
+
+    def test_missing_url_is_a_usage_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that running without --url or IAMCORE_URL exits with a usage message."""
+        monkeypatch.delenv("IAMCORE_URL", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--token", "token", "export", "groups"])
+
+        err = capsys.readouterr().err
+        assert excinfo.value.code == 2
+        assert err.startswith("usage:")
+        assert "IAMCORE_URL: Field required" in err
+
+
+class TestImport:
+    """Tests for the NDJSON import."""
+
+    @responses.activate
+    def test_imports_and_reports(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that lines are created concurrently, existing entities skipped and failures reported."""
+
+        def create(request: object) -> tuple[int, dict, str]:
+            name = json.loads(cast("responses.PreparedRequest", request).body)["name"]
+            if name == "exists":
+                return 409, {}, json.dumps({"message": "Exists"})
+            return 201, {}, json.dumps({"data": group_data(name)})
+
+        responses.add_callback(responses.POST, GROUPS_URL, callback=create)
+        source = tmp_path / "groups.ndjson"
+        lines = [group_data("a"), group_data("exists"), {"displayName": "No name"}, group_data("b")]
+        source.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+        status = main(["--url", BASE_URL, "--token", "token", "import", "groups", "-i", str(source)])
+
+        err = capsys.readouterr().err
+        assert status == 1
+        assert "line 3:" in err
+        assert "imported 4 groups" in err
+        assert "1 already existing, 1 failed" in err
+        posted = sorted(json.loads(call.request.body)["name"] for call in responses.calls)
+        assert posted == ["a", "b", "exists"]
+        assert json.loads((tmp_path / "groups.ndjson.checkpoint").read_text()) == {"lines": 2}
+
+    @responses.activate
+    def test_resume_retries_failed_lines(self, tmp_path: Path) -> None:
+        """Test that the checkpoint stops before a failed line, so resuming creates it, and counts later ones as existing."""
+        failures = [500]
+        created: set[str] = set()
+
+        def create(request: object) -> tuple[int, dict, str]:
+            name = json.loads(cast("responses.PreparedRequest", request).body)["name"]
+            if name == "b" and failures:
+                return failures.pop(), {}, json.dumps({"message": "Boom"})
+            if name in created:
+                return 409, {}, json.dumps({"message": "Exists"})
+            created.add(name)
+            return 201, {}, json.dumps({"data": group_data(name)})
+
+        responses.add_callback(responses.POST, GROUPS_URL, callback=create)
+        source = tmp_path / "groups.ndjson"
+        source.write_text("".join(json.dumps(group_data(name)) + "\n" for name in "abc"))
+
+        first = import_entities(client(), HEADERS, "groups", str(source), concurrency=1, stderr=io.StringIO())
+        second = import_entities(client(), HEADERS, "groups", str(source), resume=True, stderr=io.StringIO())
+
+        assert (first.records, first.failed) == (3, 1)
+        assert (second.records, second.failed, second.existing) == (2, 0, 1)
+        assert json.loads((tmp_path / "groups.ndjson.checkpoint").read_text()) == {"lines": 3}
+
+    @responses.activate
+    def test_groups_are_created_under_their_parent(self, tmp_path: Path) -> None:
+        """Test that groups get the ID of the parent named by their path, and are created after it."""
+        posted: list[str] = []
+
+        def create(request: object) -> tuple[int, dict, str]:
+            body = json.loads(cast("responses.PreparedRequest", request).body)
+            posted.append(body["name"])
+            return 201, {}, json.dumps({"data": group_data(body["name"])})
+
+        responses.add_callback(responses.POST, GROUPS_URL, callback=create)
+        source = tmp_path / "groups.ndjson"
+        lines = [group_data("java", "/dev"), group_data("jvm", "/dev/java"), group_data("dev"), group_data("ops")]
+        source.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+        stats = import_entities(client(), HEADERS, "groups", str(source), concurrency=4, stderr=io.StringIO())
+
+        assert (stats.records, stats.failed) == (4, 0)
+        assert sorted(posted[:2]) == ["dev", "ops"]
+        assert posted[2:] == ["java", "jvm"]
+        bodies = {json.loads(call.request.body)["name"]: json.loads(call.request.body) for call in responses.calls}
+        assert "parentID" not in bodies["dev"]
+        assert bodies["java"]["parentID"] == IRN.of("irn:rc73dbh7q0:iamcore:tenant1::group/dev").to_base64()
+        assert bodies["jvm"]["parentID"] == IRN.of("irn:rc73dbh7q0:iamcore:tenant1::group/dev/java").to_base64()
+        assert json.loads((tmp_path / "groups.ndjson.checkpoint").read_text()) == {"lines": 4}
+
+    def test_users_need_a_password(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that importing users without an initial password is refused up front."""
+        with pytest.raises(SystemExit):
+            main(["--url", BASE_URL, "--token", "token", "import", "users", "-i", str(tmp_path / "users.ndjson")])
+
+        assert "--password" in capsys.readouterr().err
+
+    @responses.activate
+    def test_resume_skips_done_lines(self, tmp_path: Path) -> None:
+        """Test that a resumed import starts after the checkpointed lines, reading gzip input."""
+        responses.add(responses.POST, GROUPS_URL, status=201, json={"data": group_data("c")})
+        source = tmp_path / "groups.ndjson.gz"
+        source.write_bytes(gzip.compress(b"".join(json.dumps(group_data(n)).encode() + b"\n" for n in "abc")))
+        (tmp_path / "groups.ndjson.gz.checkpoint").write_text(json.dumps({"lines": 2}))
+
+        stats = import_entities(client(), HEADERS, "groups", str(source), resume=True, stderr=io.StringIO())
+
+        assert stats.records == 1
+        (call,) = responses.calls
+        assert json.loads(call.request.body)["name"] == "c"
+
+
+class TestRoundTrip:
+    """Tests that every entity type can be exported and imported back."""
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        ("entity", "path", "create_path", "record"),
+        [
+            ("users", "users", "users", USER),
+            ("groups", "groups", "groups", group_data("g1")),
+            ("policies", "policies", "policies", POLICY),
+            ("resources", "resources", "resources", RESOURCE),
+            ("tenants", "tenants", "tenants/issuer-types/iamcore", TENANT),
+            ("applications", "applications", "applications", APPLICATION),
+        ],
+    )
+    def test_export_then_import(self, tmp_path: Path, entity: str, path: str, create_path: str, record: dict) -> None:
+        """Test that an exported record is imported as a valid create request."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/api/v1/{path}",
+            json={"data": [record], "count": 1, "page": 1, "pageSize": 1000},
+        )
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/v1/{create_path}",
+            status=201,
+            json={"data": record},
+            headers={"Location": f"/api/v1/{path}/created"},
+        )
+        output = str(tmp_path / f"{entity}.ndjson")
+        export_entities(client(), HEADERS, entity, output)
+
+        stats = import_entities(client(), HEADERS, entity, output, password=PASSWORD, stderr=io.StringIO())
+
+        assert (stats.records, stats.failed) == (1, 0)
+        body = json.loads(responses.calls[-1].request.body)
+        ENTITIES[entity].create_model.model_validate(body)
+        assert body["name" if "name" in record else "username"] == record.get("name", record.get("username"))
+
+    @responses.activate
+    def test_mapped_fields(self, tmp_path: Path) -> None:
+        """Test that policies get their type as level and tenant, and users the import password to change."""
+        source = tmp_path / "export.ndjson"
+        source.write_text(json.dumps(POLICY) + "\n")
+        responses.add(responses.POST, f"{BASE_URL}/api/v1/policies", status=201, json={"data": POLICY})
+        responses.add(responses.POST, f"{BASE_URL}/api/v1/users", status=201, json={"data": USER})
+
+        import_entities(client(), HEADERS, "policies", str(source), stderr=io.StringIO())
+        source.write_text(json.dumps(USER) + "\n")
+        import_entities(client(), HEADERS, "users", str(source), password=PASSWORD, stderr=io.StringIO())
+
+        policy, user = (json.loads(call.request.body) for call in responses.calls)
+        assert (policy["level"], policy["tenantID"]) == ("tenant", "tenant1")
+        assert user["password"] == user["confirmPassword"] == PASSWORD
+        assert user["requiredActions"] == ["VERIFY_EMAIL", UPDATE_PASSWORD]
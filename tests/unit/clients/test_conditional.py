@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+import responses
+from responses import matchers
+
+from iamcore.client import Client, ConditionalTransport, PooledTransport
+from iamcore.client.aio import AsyncConditionalTransport, HttpxAsyncTransport
+from iamcore.client.aio.policy import Client as AsyncPolicyClient
+from iamcore.client.policy.client import Client as PolicyClient
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+POLICIES_URL = f"{BASE_URL}/api/v1/policies"
+HEADERS = {"Authorization": "Bearer token"}
+POLICIES = {
+    "data": [
+        {
+            "id": "aXJuOnJjNzNkYmg3cTA6aWFtY29yZTo0YXRjaWNuaXNnOjpwb2xpY3kvYWxsb3ctYWxsLWFjdGlvbnMtb24tamVycnk=",
+            "irn": "irn:rc73dbh7q0:iamcore:4atcicnisg::policy/allow-all-actions-on-jerry",
+            "name": "allow-all-actions-on-jerry",
+            "type": "identity",
+            "origin": "api",
+            "version": "1.0.0",
+            "statements": [
+                {
+                    "effect": "allow",
+                    "resources": ["irn:rc73dbh7q0:iamcore:4atcicnisg::user/jerry"],
+                    "actions": ["iamcore:user:*"],
+                }
+            ],
+        }
+    ],
+    "count": 1,
+    "page": 1,
+    "pageSize": 1000,
+}
+
+
+def policy_client() -> PolicyClient:
+    return PolicyClient(BASE_URL, transport=ConditionalTransport(PooledTransport()))
+
+
+class TestConditionalTransport:
+    """Tests for ConditionalTransport."""
+
+    @responses.activate
+    def test_not_modified_reuses_parsed_dto(self) -> None:
+        """Test that a 304 answer returns the kept response and the DTOs already parsed from it."""
+        responses.add(responses.GET, POLICIES_URL, json=POLICIES, headers={"ETag": '"v1"'})
+        responses.add(
+            responses.GET,
+            POLICIES_URL,
+            status=304,
+            match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+        client = policy_client()
+
+        first = list(client.search_all(dict(HEADERS)))
+        second = list(client.search_all(dict(HEADERS)))
+
+        assert second[0] is first[0]
+        assert client.transport.revalidated == 1
+
+    @responses.activate
+    def test_changed_resource_replaces_kept_response(self) -> None:
+        """Test that a 200 answer to a revalidation is returned and kept with its new validators."""
+        responses.add(responses.GET, POLICIES_URL, json=POLICIES, headers={"Last-Modified": "Mon, 01 Jan 2024"})
+        changed = {**POLICIES, "data": [{**POLICIES["data"][0], "name": "renamed"}]}
+        responses.add(responses.GET, POLICIES_URL, json=changed, headers={"ETag": '"v2"'})
+        client = policy_client()
+
+        list(client.search_all(dict(HEADERS)))
+        second = list(client.search_all(dict(HEADERS)))
+
+        assert responses.calls[1].request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+        assert second[0].name == "renamed"
+        assert client.transport.revalidated == 0
+
+    @responses.activate
+    def test_responses_without_validators_are_not_kept(self) -> None:
+        """Test that requests are sent unconditionally when the server sent no validators."""
+        responses.add(responses.GET, POLICIES_URL, json=POLICIES)
+        client = policy_client()
+
+        list(client.search_all(dict(HEADERS)))
+        list(client.search_all(dict(HEADERS)))
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_responses_are_kept_per_credential(self) -> None:
+        """Test that validators kept for one principal are not sent for another."""
+        responses.add(responses.GET, POLICIES_URL, json=POLICIES, headers={"ETag": '"v1"'})
+        client = policy_client()
+
+        list(client.search_all({"Authorization": "Bearer alice"}))
+        list(client.search_all({"Authorization": "Bearer bob"}))
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_caller_validators_pass_through(self) -> None:
+        """Test that a request already carrying conditional headers is left to the caller."""
+        responses.add(responses.GET, POLICIES_URL, status=304)
+        transport = ConditionalTransport(PooledTransport())
+
+        resp = transport.request("GET", POLICIES_URL, headers={"If-None-Match": '"mine"'})
+
+        assert resp.status_code == 304
+
+    @responses.activate
+    def test_kept_responses_are_bounded(self) -> None:
+        """Test that the least recently used responses are dropped first."""
+        for path in ("a", "b", "c"):
+            responses.add(responses.GET, f"{BASE_URL}/{path}", json={}, headers={"ETag": '"v1"'})
+        transport = ConditionalTransport(PooledTransport(), max_entries=2)
+
+        for path in ("a", "b", "c", "a"):
+            transport.request("GET", f"{BASE_URL}/{path}")
+
+        assert "If-None-Match" not in responses.calls[3].request.headers
+
+    def test_client_wraps_transport(self) -> None:
+        """Test that the top-level client revalidates responses when asked to."""
+        client = Client(BASE_URL, ISSUER_URL, conditional_requests=True)
+
+        assert isinstance(client.transport, ConditionalTransport)
+
+
+class TestAsyncConditionalTransport:
+    """Tests for AsyncConditionalTransport."""
+
+    def test_not_modified_reuses_parsed_dto(self) -> None:
+        """Test that a 304 answer returns the kept response and the DTOs already parsed from it."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=POLICIES, headers={"ETag": '"v1"'})
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncPolicyClient(BASE_URL, transport=AsyncConditionalTransport(inner))
+
+        async def run() -> list:
+            return [await client.search(dict(HEADERS)) for _ in range(2)]
+
+        first, second = asyncio.run(run())
+
+        assert seen == [None, '"v1"']
+        assert second is first
@@ -0,0 +1,263 @@
+import json
+from typing import cast
+
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client.evaluate import Client, DecisionCache, credential_principal
+from iamcore.client.exceptions import IAMForbiddenException
+
+BASE_URL = "http://localhost:8080"
+EVALUATE_URL = f"{BASE_URL}/api/v1/evaluate"
+ACTIONS_URL = f"{EVALUATE_URL}/actions"
+AUTH_HEADERS = {"Authorization": "Bearer token"}
+ACTION = "myapp:document:read"
+DOC1 = "irn:rc73dbh7q0:myapp:tenant1::document/doc1"
+DOC2 = "irn:rc73dbh7q0:myapp:tenant1::document/doc2"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDecisionCache:
+    """Tests for the DecisionCache."""
+
+    def test_principal_is_digest_of_credential(self) -> None:
+        """Test that the default principal identity does not expose the credential."""
+        principal = credential_principal(AUTH_HEADERS)
+
+        assert "token" not in principal
+        assert principal == credential_principal({"Authorization": "Bearer token"})
+        assert principal != credential_principal({"Authorization": "Bearer other"})
+        assert principal != credential_principal({"X-iamcore-API-Key": "Bearer token"})
+
+    def test_allow_and_deny_use_separate_ttls(self) -> None:
+        """Test that allow and deny decisions expire independently."""
+        clock = FakeClock()
+        cache = DecisionCache(allow_ttl=60, deny_ttl=5, clock=clock)
+        cache.put("p", ACTION, DOC1, allowed=True)
+        cache.put("p", ACTION, DOC2, allowed=False)
+
+        clock.now = 4
+        assert cache.get("p", ACTION, DOC1) is True
+        assert cache.get("p", ACTION, DOC2) is False
+
+        clock.now = 6
+        assert cache.get("p", ACTION, DOC1) is True
+        assert cache.get("p", ACTION, DOC2) is None
+        assert cache.hits == 3
+        assert cache.misses == 1
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used decision is evicted first."""
+        cache = DecisionCache(max_size=2)
+        cache.put("p", ACTION, "a", allowed=True)
+        cache.put("p", ACTION, "b", allowed=True)
+        cache.get("p", ACTION, "a")
+        cache.put("p", ACTION, "c", allowed=True)
+
+        assert len(cache) == 2
+        assert cache.get("p", ACTION, "a") is True
+        assert cache.get("p", ACTION, "b") is None
+
+    def test_invalidation_hooks(self) -> None:
+        """Test per-principal, per-IRN-prefix and full invalidation."""
+        cache = DecisionCache()
+        cache.put("alice", ACTION, DOC1, allowed=True)
+        cache.put("bob", ACTION, DOC1, allowed=True)
+        cache.put("bob", ACTION, "irn:rc73dbh7q0:otherapp:tenant1::thing/t1", allowed=True)
+
+        cache.invalidate_principal("alice")
+        assert cache.get("alice", ACTION, DOC1) is None
+        assert cache.get("bob", ACTION, DOC1) is True
+
+        cache.invalidate_irn_prefix("irn:rc73dbh7q0:myapp:")
+        assert cache.get("bob", ACTION, DOC1) is None
+        assert cache.get("bob", ACTION, "irn:rc73dbh7q0:otherapp:tenant1::thing/t1") is True
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestEvaluateClientDecisionCache:
+    """Tests for EvaluateClient with a decision cache."""
+
+    @responses.activate
+    def test_allowed_decisions_are_served_from_cache(self) -> None:
+        """Test that repeated checks for the same tuple skip the network."""
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        client = Client(BASE_URL, decision_cache=DecisionCache())
+
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_only_uncached_resources_are_sent(self) -> None:
+        """Test that the request only carries resources without a cached decision."""
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        client = Client(BASE_URL, decision_cache=DecisionCache())
+
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1), IRN.of(DOC2)])
+
+        assert len(responses.calls) == 2
+        payload = json.loads(cast("str", responses.calls[1].request.body))
+        assert payload == {"action": ACTION, "resources": [DOC2]}
+
+    @responses.activate
+    def test_single_resource_deny_is_cached(self) -> None:
+        """Test that a deny for one resource is cached and raised again without a request."""
+        responses.add(responses.POST, EVALUATE_URL, json={"message": "Access denied"}, status=403)
+        client = Client(BASE_URL, decision_cache=DecisionCache())
+
+        with pytest.raises(IAMForbiddenException):
+            client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+        with pytest.raises(IAMForbiddenException) as excinfo:
+            client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+
+        assert len(responses.calls) == 1
+        assert excinfo.value.status_code == 403
+
+    @responses.activate
+    def test_multi_resource_deny_is_not_cached(self) -> None:
+        """Test that an ambiguous deny over several resources is not attributed to any of them."""
+        responses.add(responses.POST, EVALUATE_URL, json={"message": "Access denied"}, status=403)
+        cache = DecisionCache()
+        client = Client(BASE_URL, decision_cache=cache)
+
+        with pytest.raises(IAMForbiddenException):
+            client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1), IRN.of(DOC2)])
+
+        assert len(cache) == 0
+
+    @responses.activate
+    def test_decisions_are_scoped_to_principal(self) -> None:
+        """Test that one principal's decision is never reused for another."""
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        client = Client(BASE_URL, decision_cache=DecisionCache())
+
+        client.evaluate({"Authorization": "Bearer alice"}, ACTION, [IRN.of(DOC1)])
+        client.evaluate({"Authorization": "Bearer bob"}, ACTION, [IRN.of(DOC1)])
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_without_cache_every_call_hits_network(self) -> None:
+        """Test that caching is opt-in."""
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        client = Client(BASE_URL)
+
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+        client.evaluate(dict(AUTH_HEADERS), ACTION, [IRN.of(DOC1)])
+
+        assert len(responses.calls) == 2
+
+
+def actions_callback(denied: set[str]):  # noqa: ANN201
+    """Answer `evaluate/actions` with every requested action allowed, except on the denied resources."""
+
+    def callback(request: object) -> tuple[int, dict, str]:
+        payload = json.loads(cast("responses.PreparedRequest", request).body)
+        allowed = {irn: [] if irn in denied else payload["actions"] for irn in payload["irns"]}
+        return 200, {}, json.dumps({"data": allowed})
+
+    return callback
+
+
+class TestEvaluateBatch:
+    """Tests for EvaluateClient.evaluate_batch."""
+
+    @responses.activate
+    def test_allowed_chunk_answers_all_pairs(self) -> None:
+        """Test that an allowed chunk answers every pair with one request."""
+        responses.add_callback(responses.POST, ACTIONS_URL, callback=actions_callback(set()))
+        client = Client(BASE_URL)
+        irns = [IRN.of(f"irn:rc73dbh7q0:myapp:tenant1::document/doc{i}") for i in range(10)]
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), [(ACTION, irn) for irn in irns])
+
+        assert len(responses.calls) == 1
+        assert [r.irn for r in results] == irns
+        assert all(r.allowed for r in results)
+
+    @responses.activate
+    def test_denied_resources_are_reported(self) -> None:
+        """Test that one request per action answers every resource, and denials are reported instead of raised."""
+        responses.add_callback(responses.POST, ACTIONS_URL, callback=actions_callback({DOC2}))
+        client = Client(BASE_URL)
+        checks = [(ACTION, IRN.of(DOC1)), (ACTION, IRN.of(DOC2)), ("myapp:document:update", IRN.of(DOC2))]
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), checks, concurrency=1)
+
+        assert [(r.action, str(r.irn), r.allowed) for r in results] == [
+            (ACTION, DOC1, True),
+            (ACTION, DOC2, False),
+            ("myapp:document:update", DOC2, False),
+        ]
+        sent = [json.loads(cast("str", call.request.body)) for call in responses.calls]
+        assert sent == [
+            {"actions": [ACTION], "irns": [DOC1, DOC2]},
+            {"actions": ["myapp:document:update"], "irns": [DOC2]},
+        ]
+
+    @responses.activate
+    def test_mostly_denied_chunk_is_one_request(self) -> None:
+        """Test that a chunk costs one request however many of its resources are denied."""
+        irns = [f"irn:rc73dbh7q0:myapp:tenant1::document/doc{i}" for i in range(50)]
+        responses.add_callback(responses.POST, ACTIONS_URL, callback=actions_callback(set(irns[1:])))
+        client = Client(BASE_URL)
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), [(ACTION, IRN.of(irn)) for irn in irns])
+
+        assert len(responses.calls) == 1
+        assert [r.allowed for r in results] == [True] + [False] * 49
+
+    @responses.activate
+    def test_resource_missing_from_response_is_denied(self) -> None:
+        """Test that a resource the response says nothing about counts as denied."""
+        responses.add(responses.POST, ACTIONS_URL, json={"data": {DOC1: [ACTION]}})
+        client = Client(BASE_URL)
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), [(ACTION, IRN.of(DOC1)), (ACTION, IRN.of(DOC2))])
+
+        assert [r.allowed for r in results] == [True, False]
+
+    @responses.activate
+    def test_chunks_and_duplicates(self) -> None:
+        """Test that resources are chunked and duplicate pairs are only sent once."""
+        responses.add_callback(responses.POST, ACTIONS_URL, callback=actions_callback(set()))
+        client = Client(BASE_URL)
+        irns = [IRN.of(f"irn:rc73dbh7q0:myapp:tenant1::document/doc{i}") for i in range(5)]
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), [(ACTION, irn) for irn in irns * 2], chunk_size=2)
+
+        assert len(results) == 10
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_batch_uses_and_fills_decision_cache(self) -> None:
+        """Test that cached decisions are not sent and new decisions are cached."""
+        responses.add_callback(responses.POST, ACTIONS_URL, callback=actions_callback({DOC2}))
+        cache = DecisionCache()
+        client = Client(BASE_URL, decision_cache=cache)
+        principal = cache.principal_of(AUTH_HEADERS)
+        cache.put(principal, ACTION, DOC1, allowed=True)
+
+        results = client.evaluate_batch(dict(AUTH_HEADERS), [(ACTION, IRN.of(DOC1)), (ACTION, IRN.of(DOC2))])
+
+        assert [r.allowed for r in results] == [True, False]
+        assert len(responses.calls) == 1
+        assert cache.get(principal, ACTION, DOC2) is False
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            Client(BASE_URL).evaluate_batch(dict(AUTH_HEADERS), [(ACTION, IRN.of(DOC1))], chunk_size=0)
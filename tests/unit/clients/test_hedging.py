@@ -0,0 +1,181 @@
+import asyncio
+import itertools
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+import requests
+
+from iamcore.client import Client, HedgePolicy, HedgingTransport
+from iamcore.client.aio import AsyncHedgingTransport, HttpxAsyncTransport
+from iamcore.client.base.hedging import is_hedgeable
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+EVALUATE_URL = f"{BASE_URL}/api/v1/evaluate"
+USERS_URL = f"{BASE_URL}/api/v1/users"
+
+
+class ScriptedTransport:
+    """Sync transport answering after the given delays, in call order."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+        self.calls = 0
+        self.threads: list[str] = []
+        self.closed: list[requests.Response] = []
+        self._lock = threading.Lock()
+
+    def request(self, *_: object, **__: object) -> requests.Response:
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+            self.threads.append(threading.current_thread().name)
+        time.sleep(self.delays[index] if index < len(self.delays) else 0)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = str(index)
+        resp.close = lambda: self.closed.append(resp)
+        return resp
+
+    def close(self) -> None: ...
+
+
+def ticking_clock(latency: float) -> Callable[[], float]:
+    """Clock advancing by `latency` at every reading, so each request measures `latency`."""
+    return itertools.count(step=latency).__next__
+
+
+def warmed_up(inner: ScriptedTransport, policy: HedgePolicy, latency: float, **kwargs: Any) -> HedgingTransport:
+    """A hedging transport that has measured `latency` for enough evaluate requests, and a fresh `inner`."""
+    transport = HedgingTransport(inner, policy, clock=ticking_clock(latency), **kwargs)
+    delays = inner.delays
+    inner.delays = []
+    for _ in range(policy.min_samples):
+        transport.request("POST", EVALUATE_URL)
+    inner.delays, inner.calls, inner.threads = delays, 0, []
+    return transport
+
+
+def wait_until(condition: Callable[[], object], timeout: float = 2) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestHedgingTransport:
+    """Tests for HedgingTransport."""
+
+    def test_hedgeable_requests(self) -> None:
+        """Test that only read-only requests are hedged."""
+        assert is_hedgeable("GET", f"{USERS_URL}/me")
+        assert is_hedgeable("POST", EVALUATE_URL)
+        assert is_hedgeable("POST", f"{EVALUATE_URL}/actions")
+        assert not is_hedgeable("POST", USERS_URL)
+        assert not is_hedgeable("DELETE", f"{USERS_URL}/abc")
+
+    def test_slow_request_is_hedged(self) -> None:
+        """Test that a request slower than the usual latency gets a duplicate that wins."""
+        inner = ScriptedTransport([0.5, 0])
+        transport = warmed_up(inner, HedgePolicy(max_extra_load=1), 0.01)
+
+        resp = transport.request("POST", EVALUATE_URL)
+
+        assert resp.reason == "1"
+        assert transport.hedged == 1
+        wait_until(lambda: inner.closed)
+        assert [r.reason for r in inner.closed] == ["0"]
+
+    def test_fast_request_is_not_hedged(self) -> None:
+        """Test that no duplicate is sent when the response comes in time."""
+        inner = ScriptedTransport([0])
+        transport = warmed_up(inner, HedgePolicy(), 0.5)
+
+        transport.request("POST", EVALUATE_URL)
+
+        assert inner.calls == 1
+        assert transport.hedged == 0
+
+    def test_no_hedging_without_latency_history(self) -> None:
+        """Test that endpoints are not hedged until enough latencies are known."""
+        inner = ScriptedTransport([0.05])
+        transport = HedgingTransport(inner, HedgePolicy(min_delay=0))
+
+        transport.request("POST", EVALUATE_URL)
+
+        assert inner.calls == 1
+
+    def test_extra_load_is_capped(self) -> None:
+        """Test that hedges stay within the configured share of requests."""
+        inner = ScriptedTransport([0.05] * 100)
+        transport = warmed_up(inner, HedgePolicy(percentile=0.5, max_extra_load=0.25), 0.001)
+
+        for _ in range(8):
+            transport.request("POST", EVALUATE_URL)
+
+        assert transport.hedged == 2
+
+    def test_requests_without_hedge_budget_use_caller_thread(self) -> None:
+        """Test that a request that could not be hedged is not handed to a worker thread."""
+        inner = ScriptedTransport([0.05, 0, 0])
+        transport = warmed_up(inner, HedgePolicy(max_extra_load=0.1), 0.001)
+
+        transport.request("POST", EVALUATE_URL)
+        transport.request("POST", EVALUATE_URL)
+
+        assert transport.hedged == 1
+        assert inner.threads[2] == threading.current_thread().name
+
+    def test_busy_workers_do_not_queue_requests(self) -> None:
+        """Test that requests beyond `max_workers` are sent from their caller instead of waiting."""
+        inner = ScriptedTransport([0.3, 0])
+        transport = warmed_up(inner, HedgePolicy(), 1, max_workers=1)
+        slow = threading.Thread(target=transport.request, args=("POST", EVALUATE_URL))
+        slow.start()
+        wait_until(lambda: inner.calls)
+
+        started = time.monotonic()
+        transport.request("POST", EVALUATE_URL)
+
+        assert time.monotonic() - started < 0.3
+        assert inner.threads[1] == threading.current_thread().name
+        slow.join()
+
+    def test_client_wraps_transport(self) -> None:
+        """Test that the top-level client installs hedging when asked to."""
+        client = Client(BASE_URL, ISSUER_URL, hedging=HedgePolicy(percentile=0.99))
+
+        assert isinstance(client.transport, HedgingTransport)
+        assert client.transport.policy.percentile == 0.99
+
+
+class TestAsyncHedgingTransport:
+    """Tests for AsyncHedgingTransport."""
+
+    def test_slow_request_is_hedged(self) -> None:
+        """Test that the duplicate's response is used and the slow attempt cancelled."""
+        calls: list[int] = []
+        warming_up = True
+
+        async def handler(_: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if not warming_up and len(calls) == 1:
+                await asyncio.sleep(1)
+            return httpx.Response(200, json={"attempt": len(calls)})
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        transport = AsyncHedgingTransport(inner, HedgePolicy(max_extra_load=1), clock=ticking_clock(0.01))
+
+        async def run() -> httpx.Response:
+            nonlocal warming_up
+            for _ in range(transport.policy.min_samples):
+                await transport.request("POST", EVALUATE_URL)
+            warming_up = False
+            calls.clear()
+            return await transport.request("POST", EVALUATE_URL)
+
+        resp = asyncio.run(run())
+
+        assert resp.json() == {"attempt": 2}
+        assert transport.hedged == 1
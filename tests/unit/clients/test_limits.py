@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+import responses
+
+from iamcore.client import ADMIN, EVALUATE, Client, EndpointLimit, LimitedTransport, RetryPolicy, RetryTransport
+from iamcore.client.aio import AsyncLimitedTransport, HttpxAsyncTransport
+from iamcore.client.base.limits import AIMDLimit, TokenBucket, endpoint_family
+from iamcore.client.base.transport import PooledTransport
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+USERS_URL = f"{BASE_URL}/api/v1/users"
+EVALUATE_URL = f"{BASE_URL}/api/v1/evaluate"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestLimits:
+    """Tests for the token bucket, AIMD limit and endpoint families."""
+
+    def test_endpoint_family(self) -> None:
+        """Test that evaluation endpoints are told apart from admin CRUD."""
+        assert endpoint_family(EVALUATE_URL) == EVALUATE
+        assert endpoint_family(f"{EVALUATE_URL}/actions") == EVALUATE
+        assert endpoint_family(f"{USERS_URL}/me") == ADMIN
+        assert endpoint_family(f"{BASE_URL}/api/v1/evaluated-things") == ADMIN
+
+    def test_token_bucket_spaces_requests(self) -> None:
+        """Test that the bucket allows a burst, then one request per 1/rate seconds."""
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+        clock.now += 1
+        assert bucket.reserve() == 0
+
+    def test_aimd_limit(self) -> None:
+        """Test that overload shrinks the limit and successes grow it back, within bounds."""
+        limit = AIMDLimit(10, min_limit=2, backoff_ratio=0.5)
+
+        limit.update(overloaded=True)
+        assert limit.limit == 5
+        for _ in range(5):
+            limit.update(overloaded=True)
+        assert limit.limit == 2
+
+        for _ in range(100):
+            limit.update(overloaded=False)
+        assert limit.limit == 10
+
+    def test_unknown_family_is_rejected(self) -> None:
+        """Test that a typo in a family name fails loudly."""
+        with pytest.raises(ValueError, match="evalute"):
+            LimitedTransport(PooledTransport(), {"evalute": EndpointLimit(rate=1)})
+
+
+class TestLimitedTransport:
+    """Tests for LimitedTransport."""
+
+    @responses.activate
+    def test_rate_is_per_family(self) -> None:
+        """Test that only the limited family waits for tokens."""
+        responses.add(responses.GET, USERS_URL, status=200)
+        responses.add(responses.POST, EVALUATE_URL, status=200)
+        clock = FakeClock()
+        transport = LimitedTransport(
+            PooledTransport(), {ADMIN: EndpointLimit(rate=2, burst=1)}, sleep=clock.sleep, clock=clock
+        )
+
+        for _ in range(5):
+            transport.request("POST", EVALUATE_URL)
+        assert clock.now == 0
+
+        for _ in range(3):
+            transport.request("GET", USERS_URL)
+        assert clock.now == pytest.approx(1)
+
+    @responses.activate
+    def test_overload_shrinks_concurrency(self) -> None:
+        """Test that 429 responses and timeouts lower the family's concurrency limit."""
+        responses.add(responses.GET, USERS_URL, status=429)
+        responses.add(responses.GET, USERS_URL, body=requests.Timeout("slow"))
+        responses.add(responses.GET, USERS_URL, status=200)
+        transport = LimitedTransport(PooledTransport(), {ADMIN: EndpointLimit(max_concurrency=10, backoff_ratio=0.5)})
+
+        assert transport.request("GET", USERS_URL).status_code == 429
+        with pytest.raises(requests.Timeout):
+            transport.request("GET", USERS_URL)
+        transport.request("GET", USERS_URL)
+
+        state = transport.families[ADMIN]
+        assert state.concurrency.limit == 2
+        assert state.in_flight == 0
+
+    def test_concurrency_is_capped(self) -> None:
+        """Test that no more than the limit of requests are in flight at once."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        class SlowTransport:
+            def request(self, *_: object, **__: object) -> requests.Response:
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.01)
+                with lock:
+                    in_flight.pop()
+                resp = requests.Response()
+                resp.status_code = 200
+                return resp
+
+        transport = LimitedTransport(SlowTransport(), {ADMIN: EndpointLimit(max_concurrency=2)})
+        threads = [threading.Thread(target=transport.request, args=("GET", USERS_URL)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(peak) == 8
+        assert max(peak) <= 2
+
+    def test_client_wraps_transport(self) -> None:
+        """Test that the limiter is shared by every sub-client and sits under the retries."""
+        client = Client(
+            BASE_URL,
+            ISSUER_URL,
+            limits={EVALUATE: EndpointLimit(rate=100), ADMIN: EndpointLimit(rate=10, max_concurrency=4)},
+            retry=RetryPolicy(),
+        )
+
+        assert isinstance(client.transport, RetryTransport)
+        assert isinstance(client.transport.transport, LimitedTransport)
+        assert set(client.transport.transport.families) == {EVALUATE, ADMIN}
+        assert client.user.transport is client.evaluate.transport
+
+
+class TestAsyncLimitedTransport:
+    """Tests for AsyncLimitedTransport."""
+
+    def test_overload_shrinks_concurrency(self) -> None:
+        """Test that 503s lower the concurrency limit and slots are released."""
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        transport = AsyncLimitedTransport(inner, {EVALUATE: EndpointLimit(max_concurrency=4, backoff_ratio=0.5)})
+
+        async def run() -> None:
+            await asyncio.gather(*(transport.request("POST", EVALUATE_URL) for _ in range(3)))
+
+        asyncio.run(run())
+
+        state = transport.families[EVALUATE]
+        assert state.concurrency.limit == 1
+        assert state.in_flight == 0
@@ -0,0 +1,195 @@
+import json
+import threading
+from typing import cast
+
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import OfflineEvaluator, PolicyEngine, PolicySnapshot
+from iamcore.client.evaluate import Client as EvaluateClient
+from iamcore.client.evaluate import download_snapshot
+from iamcore.client.exceptions import IAMForbiddenException
+from iamcore.client.policy.client import Client as PolicyClient
+from iamcore.client.policy.dto import Policy
+
+BASE_URL = "http://localhost:8080"
+EVALUATE_URL = f"{BASE_URL}/api/v1/evaluate/actions"
+POLICIES_URL = f"{BASE_URL}/api/v1/policies"
+HEADERS = {"Authorization": "Bearer jerry"}
+JERRY = "irn:rc73dbh7q0:iamcore:tenant1::user/jerry"
+TOM = "irn:rc73dbh7q0:iamcore:tenant1::user/tom"
+EDITORS = "irn:rc73dbh7q0:iamcore:tenant1::group/editors"
+DOCS = "irn:rc73dbh7q0:myapp:tenant1::document"
+
+
+def policy(name: str, *statements: tuple[str, list[str], list[str]]) -> dict:
+    return {
+        "id": f"{name}-id",
+        "irn": f"irn:rc73dbh7q0:iamcore:tenant1::policy/{name}",
+        "name": name,
+        "type": "identity",
+        "origin": "api",
+        "version": "1.0.0",
+        "statements": [
+            {"effect": effect, "resources": resources, "actions": actions} for effect, resources, actions in statements
+        ],
+    }
+
+
+POLICIES = [
+    policy("read-docs", ("allow", [f"{DOCS}/*"], ["myapp:document:read"])),
+    policy("no-secrets", ("deny", [f"{DOCS}/secret/*"], ["myapp:document:*"])),
+    policy("edit-docs", ("allow", [f"{DOCS}/*"], ["myapp:document:*"])),
+    policy("admin", ("allow", ["*"], ["*"])),
+]
+SNAPSHOT = PolicySnapshot(
+    policies=[Policy.model_validate(p) for p in POLICIES],
+    attachments={
+        JERRY: ["read-docs-id", "irn:rc73dbh7q0:iamcore:tenant1::policy/no-secrets"],
+        EDITORS: ["edit-docs-id"],
+    },
+    memberships={TOM: [EDITORS]},
+)
+
+
+class TestPolicyEngine:
+    """Tests for PolicyEngine."""
+
+    def test_allow_requires_matching_action_and_resource(self) -> None:
+        """Test that a statement only allows actions and resources it matches, by exact value or prefix."""
+        engine = PolicyEngine(SNAPSHOT)
+
+        assert engine.is_allowed(JERRY, "myapp:document:read", IRN.of(f"{DOCS}/doc1"))
+        assert not engine.is_allowed(JERRY, "myapp:document:update", f"{DOCS}/doc1")
+        assert not engine.is_allowed(JERRY, "myapp:document:read", "irn:rc73dbh7q0:myapp:tenant2::document/doc1")
+
+    def test_explicit_deny_wins(self) -> None:
+        """Test that a matching deny statement overrides any allow."""
+        engine = PolicyEngine(SNAPSHOT)
+
+        assert not engine.is_allowed(JERRY, "myapp:document:read", f"{DOCS}/secret/plans")
+
+    def test_group_policies_apply_to_members(self) -> None:
+        """Test that policies attached to a group apply to its members, and unknown principals are denied."""
+        engine = PolicyEngine(SNAPSHOT)
+
+        assert engine.is_allowed(TOM, "myapp:document:delete", f"{DOCS}/secret/plans")
+        assert not engine.is_allowed("irn:rc73dbh7q0:iamcore:tenant1::user/nobody", "myapp:document:read", DOCS)
+
+    def test_match_all_wildcard(self) -> None:
+        """Test that `*` matches every action and resource."""
+        engine = PolicyEngine(SNAPSHOT._replace(attachments={JERRY: ["admin-id"]}))
+
+        assert engine.is_allowed(JERRY, "anything:at:all", "irn:other:app:::thing/x")
+
+    def test_evaluate_raises_on_deny(self) -> None:
+        """Test that `evaluate` mirrors the server client and raises on the first denied resource."""
+        engine = PolicyEngine(SNAPSHOT)
+
+        engine.evaluate(JERRY, "myapp:document:read", [IRN.of(f"{DOCS}/doc1")])
+        with pytest.raises(IAMForbiddenException) as excinfo:
+            engine.evaluate(JERRY, "myapp:document:read", [f"{DOCS}/doc1", f"{DOCS}/secret/plans"])
+        assert excinfo.value.status_code == 403
+
+    def test_evaluate_batch(self) -> None:
+        """Test that batch results come back in input order."""
+        engine = PolicyEngine(SNAPSHOT)
+        checks = [("myapp:document:read", IRN.of(f"{DOCS}/{name}")) for name in ("a", "secret/b", "c")]
+
+        assert [r.allowed for r in engine.evaluate_batch(JERRY, checks)] == [True, False, True]
+
+
+def stand_in_server(allowed: set[tuple[str, str]]):  # noqa: ANN201
+    """`evaluate/actions` endpoint of a stand-in server allowing exactly the given (action, IRN) pairs."""
+
+    def callback(request: object) -> tuple[int, dict, str]:
+        payload = json.loads(cast("responses.PreparedRequest", request).body)
+        data = {irn: [action for action in payload["actions"] if (action, irn) in allowed] for irn in payload["irns"]}
+        return 200, {}, json.dumps({"data": data})
+
+    return callback
+
+
+class TestDifferential:
+    """Differential tests of PolicyEngine against a stand-in evaluate endpoint."""
+
+    @responses.activate
+    def test_agrees_with_server(self) -> None:
+        """Test that no discrepancy is reported when the server decides like the engine."""
+        checks = [
+            (action, IRN.of(f"{DOCS}/{name}"))
+            for action in ("myapp:document:read", "myapp:document:update")
+            for name in ("doc1", "secret/plans")
+        ]
+        allowed = {("myapp:document:read", f"{DOCS}/doc1")}
+        responses.add_callback(responses.POST, EVALUATE_URL, callback=stand_in_server(allowed))
+
+        discrepancies = PolicyEngine(SNAPSHOT).compare(EvaluateClient(BASE_URL), dict(HEADERS), JERRY, checks)
+
+        assert discrepancies == []
+
+    @responses.activate
+    def test_reports_discrepancies(self) -> None:
+        """Test that pairs decided differently by the server are reported."""
+        checks = [("myapp:document:read", IRN.of(f"{DOCS}/doc1")), ("myapp:document:read", IRN.of(f"{DOCS}/doc2"))]
+        allowed = {("myapp:document:read", f"{DOCS}/doc1")}
+        responses.add_callback(responses.POST, EVALUATE_URL, callback=stand_in_server(allowed))
+
+        discrepancies = PolicyEngine(SNAPSHOT).compare(EvaluateClient(BASE_URL), dict(HEADERS), JERRY, checks)
+
+        assert [(d.irn, d.offline, d.server) for d in discrepancies] == [(f"{DOCS}/doc2", True, False)]
+
+
+class TestOfflineEvaluator:
+    """Tests for OfflineEvaluator."""
+
+    @responses.activate
+    def test_download_snapshot(self) -> None:
+        """Test that a snapshot holds every policy visible to the caller and the current attachments."""
+        responses.add(
+            responses.GET,
+            POLICIES_URL,
+            json={"data": POLICIES, "count": len(POLICIES), "page": 1, "pageSize": 1000},
+        )
+
+        snapshot = download_snapshot(PolicyClient(BASE_URL), dict(HEADERS), lambda: {JERRY: ["read-docs-id"]})
+
+        assert [p.name for p in snapshot.policies] == [p["name"] for p in POLICIES]
+        assert PolicyEngine(snapshot).is_allowed(JERRY, "myapp:document:read", f"{DOCS}/secret/plans")
+
+    def test_refresh_swaps_engine(self) -> None:
+        """Test that a refresh picks up new attachments and a failed one keeps the previous engine."""
+        snapshots = [SNAPSHOT, SNAPSHOT._replace(attachments={JERRY: ["admin-id"]})]
+        failed = threading.Event()
+
+        def loader() -> PolicySnapshot:
+            if snapshots:
+                return snapshots.pop(0)
+            failed.set()
+            msg = "server unreachable"
+            raise ConnectionError(msg)
+
+        evaluator = OfflineEvaluator(loader, refresh_interval=0.01)
+        assert not evaluator.is_allowed(JERRY, "myapp:document:delete", f"{DOCS}/doc1")
+
+        evaluator.refresh()
+        assert evaluator.is_allowed(JERRY, "myapp:document:delete", f"{DOCS}/doc1")
+
+        with evaluator:
+            assert failed.wait(2)
+        assert evaluator.is_allowed(JERRY, "myapp:document:delete", f"{DOCS}/doc1")
+
+    def test_background_refresh(self) -> None:
+        """Test that started evaluators reload their snapshot periodically until closed."""
+        loaded = threading.Event()
+        loads = []
+
+        def loader() -> PolicySnapshot:
+            loads.append(1)
+            if len(loads) > 1:
+                loaded.set()
+            return SNAPSHOT
+
+        with OfflineEvaluator(loader, refresh_interval=0.01):
+            assert loaded.wait(5)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import FailurePolicy, ResourceReconciler
+from iamcore.client.resource.client import Client
+from iamcore.client.resource.dto import CreateResource, ResourceSearchFilter
+from iamcore.client.resource.reconcile import ReconcileAction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BASE_URL = "http://localhost:8080"
+RESOURCES_URL = f"{BASE_URL}/api/v1/resources"
+HEADERS = {"Authorization": "Bearer token"}
+ACCOUNT = "rc73dbh7q0"
+TENANT = "tenant1"
+SCOPE = ResourceSearchFilter(application="myapp", resource_type="device", tenant_id=TENANT)
+
+
+def irn(name: str) -> str:
+    return f"irn:{ACCOUNT}:myapp:{TENANT}::device/dev/{name}"
+
+
+def desired(name: str, display_name: Optional[str] = None, **kwargs: object) -> CreateResource:
+    fields = {"name": name, "application": "myapp", "path": "/dev", "resourceType": "device", **kwargs}
+    return CreateResource(displayName=display_name, **fields)
+
+
+def resource_data(name: str, display_name: Optional[str] = None, metadata: Optional[dict] = None) -> dict:
+    return {
+        "id": IRN.of(irn(name)).to_base64(),
+        "irn": irn(name),
+        "created": "2022-10-25T22:22:17.390631+03:00",
+        "updated": "2022-10-25T22:22:17.390631+03:00",
+        "tenantID": TENANT,
+        "application": "myapp",
+        "name": name,
+        "displayName": display_name or name,
+        "path": "/dev",
+        "resourceType": "device",
+        "enabled": True,
+        "description": "",
+        "metadata": metadata or {},
+        "poolIDs": [],
+    }
+
+
+def mock_current(*resources: dict) -> None:
+    responses.add(
+        responses.GET,
+        RESOURCES_URL,
+        json={"data": list(resources), "count": len(resources), "page": 1, "pageSize": 1000},
+    )
+
+
+def reconciler(scope: ResourceSearchFilter = SCOPE) -> ResourceReconciler:
+    return ResourceReconciler(Client(BASE_URL), dict(HEADERS), ACCOUNT, scope)
+
+
+class TestResourceReconciler:
+    """Tests for ResourceReconciler."""
+
+    @responses.activate
+    def test_plan_is_minimal(self) -> None:
+        """Test that only missing, changed and undesired resources are planned."""
+        mock_current(
+            resource_data("same", metadata={"a": "1", "b": "2"}),
+            resource_data("changed", display_name="Old"),
+            resource_data("gone"),
+        )
+
+        plan = reconciler().plan(
+            [
+                desired("same", metadata={"b": "2", "a": "1"}),
+                desired("changed", display_name="New"),
+                desired("new"),
+            ]
+        )
+
+        assert sorted((action.value, str(i)) for action, i in plan.changes()) == [
+            ("create", irn("new")),
+            ("delete", irn("gone")),
+            ("update", irn("changed")),
+        ]
+        assert plan.unchanged == 1
+        assert plan.updates[0][1].display_name == "New"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_dry_run_changes_nothing(self) -> None:
+        """Test that a dry run only reads the current state."""
+        mock_current(resource_data("gone"))
+
+        plan, results = reconciler().reconcile([desired("new")], dry_run=True)
+
+        assert not plan.empty
+        assert results == []
+        assert [call.request.method for call in responses.calls] == ["GET"]
+
+    @responses.activate
+    def test_reconcile_applies_plan(self) -> None:
+        """Test that creates and updates are sent one by one and deletes in chunks."""
+        mock_current(resource_data("changed", display_name="Old"), *(resource_data(f"gone{i}") for i in range(5)))
+        responses.add(responses.POST, RESOURCES_URL, status=201, json={"data": resource_data("new")})
+        responses.add(responses.PATCH, f"{RESOURCES_URL}/{IRN.of(irn('changed')).to_base64()}", status=204)
+        responses.add(responses.POST, f"{RESOURCES_URL}/delete", status=204)
+
+        plan, results = reconciler().reconcile(
+            [desired("changed", display_name="New"), desired("new")], delete_chunk_size=2
+        )
+
+        assert all(result.ok for result in results)
+        assert sorted(result.position for result in results) == [0, 1, 2, 3, 4]
+        assert [result.item[0] for result in results].count(ReconcileAction.DELETE) == 3
+        deleted = [
+            json.loads(c.request.body)["resourceIDs"] for c in responses.calls if c.request.url.endswith("delete")
+        ]
+        assert sorted(len(ids) for ids in deleted) == [1, 2, 2]
+        assert len(plan.deletes) == 5
+
+    @responses.activate
+    def test_apply_streams_desired_resources(self) -> None:
+        """Test that creates are sent while the desired state is still being read."""
+        mock_current()
+        responses.add(responses.POST, RESOURCES_URL, status=201, json={"data": resource_data("new")})
+        sent_before_read: list[int] = []
+
+        def catalog() -> Iterator[CreateResource]:
+            for i in range(5):
+                sent_before_read.append(len(responses.calls) - 1)
+                yield desired(f"new{i}")
+
+        results = list(reconciler().apply(catalog(), concurrency=1))
+
+        assert len(results) == 5
+        assert sent_before_read[-1] == 4
+
+    @responses.activate
+    def test_rejected_resource_stops_before_deletes(self) -> None:
+        """Test that a desired resource rejected midway raises before anything is deleted."""
+        mock_current(resource_data("gone"))
+        responses.add(responses.POST, RESOURCES_URL, status=201, json={"data": resource_data("new")})
+
+        with pytest.raises(ValueError, match="duplicate"):
+            list(reconciler().apply([desired("new"), desired("new")], concurrency=1))
+
+        assert not any(c.request.url.endswith("delete") for c in responses.calls)
+
+    @responses.activate
+    def test_abort_skips_deletes(self) -> None:
+        """Test that with ABORT, a failed create leaves the undesired resources in place."""
+        mock_current(resource_data("gone"))
+        responses.add(responses.POST, RESOURCES_URL, status=409, json={"message": "Exists"})
+
+        _, results = reconciler().reconcile([desired("new")], on_failure=FailurePolicy.ABORT)
+
+        (result,) = results
+        assert result.error.status_code == 409
+        assert not any(c.request.url.endswith("delete") for c in responses.calls)
+
+    @responses.activate
+    def test_rejects_duplicates(self) -> None:
+        """Test that two desired resources with the same IRN are rejected."""
+        mock_current()
+
+        with pytest.raises(ValueError, match="duplicate"):
+            reconciler().plan([desired("a"), desired("a", display_name="A")])
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "outside",
+        [
+            desired("a", application="otherapp"),
+            desired("a", tenantID="tenant2"),
+            desired("a", path="/prod"),
+            desired("a", enabled=False),
+        ],
+    )
+    def test_rejects_resources_outside_scope(self, outside: CreateResource) -> None:
+        """Test that a desired resource the scope would not match is rejected instead of recreated on every run."""
+        mock_current()
+
+        with pytest.raises(ValueError, match="outside the reconciled scope"):
+            reconciler(SCOPE.model_copy(update={"enabled": True, "path": "/dev"})).plan([outside])
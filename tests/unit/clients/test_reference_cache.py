@@ -0,0 +1,252 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import responses
+from iamcore.irn import IRN
+
+from iamcore.client import Client, MemoryCacheBackend, ReferenceCache
+from iamcore.client.aio.application import Client as AsyncAppClient
+from iamcore.client.aio.transport import HttpxAsyncTransport
+from iamcore.client.application.client import Client as AppClient
+from iamcore.client.application_resource_type.client import Client as AppResourceTypeClient
+from iamcore.client.application_resource_type.dto import CreateApplicationResourceType
+from iamcore.client.base.cache import APPLICATION, TENANT_ISSUER, CacheEntry
+from iamcore.client.tenant.client import Client as TenantClient
+from iamcore.client.tenant.dto import GetTenantIssuer
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+HEADERS = {"Authorization": "Bearer token"}
+APP_IRN = IRN.of("irn:rc73dbh7q0:iamcore:::application/myapp")
+APP_URL = f"{BASE_URL}/api/v1/applications/{APP_IRN.to_base64()}"
+APPLICATION_DATA = {
+    "id": APP_IRN.to_base64(),
+    "irn": str(APP_IRN),
+    "name": "myapp",
+    "displayName": "My App",
+    "created": "2021-10-18T12:27:15.55267632Z",
+    "updated": "2021-10-18T12:27:15.55267632Z",
+}
+ISSUER = {
+    "id": "issuer-id",
+    "irn": "irn:rc73dbh7q0:iamcore:4atcicnisg::issuer/iamcore",
+    "name": "iamcore",
+    "type": "iamcore",
+    "url": "http://localhost:8080/auth/realms/tenant",
+    "loginURL": "http://localhost:8080/auth/realms/tenant/login",
+    "clientID": "client",
+}
+RESOURCE_TYPE = {
+    "id": "type-id",
+    "irn": "irn:rc73dbh7q0:iamcore:::application-resource-type/myapp/document",
+    "type": "document",
+    "description": "Documents",
+    "actionPrefix": "document",
+    "operations": ["read"],
+    "created": "2021-10-18T12:27:15.55267632Z",
+    "updated": "2021-10-18T12:27:15.55267632Z",
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestReferenceCache:
+    """Tests for ReferenceCache."""
+
+    def test_fresh_entries_are_served_from_cache(self) -> None:
+        """Test that a fresh entry is returned without calling the loader again."""
+        cache = ReferenceCache(clock=FakeClock())
+        calls = []
+
+        def load() -> str:
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, load) == "value"
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, load) == "value"
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_are_per_principal(self) -> None:
+        """Test that different credentials never share an entry."""
+        cache = ReferenceCache()
+
+        cache.get_or_load(APPLICATION, "a/", {"Authorization": "Bearer alice"}, lambda: "alice")
+
+        assert cache.get_or_load(APPLICATION, "a/", {"Authorization": "Bearer bob"}, lambda: "bob") == "bob"
+
+    def test_per_entity_ttls(self) -> None:
+        """Test that each entity type expires after its own TTL, and a TTL of 0 disables caching."""
+        clock = FakeClock()
+        cache = ReferenceCache(ttls={APPLICATION: 10, TENANT_ISSUER: 0}, stale_ttl=0, clock=clock)
+
+        cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "old")
+        clock.now += 11
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "new") == "new"
+
+        cache.get_or_load(TENANT_ISSUER, "t", HEADERS, lambda: "old")
+        assert cache.get_or_load(TENANT_ISSUER, "t", HEADERS, lambda: "new") == "new"
+
+    def test_stale_entry_is_served_while_refreshing(self) -> None:
+        """Test stale-while-revalidate: the stale value is returned and replaced in the background."""
+        clock = FakeClock()
+        cache = ReferenceCache(ttls={APPLICATION: 10}, stale_ttl=60, clock=clock)
+        cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "old")
+        clock.now += 11
+
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "new") == "old"
+        key = cache.key(APPLICATION, "a/", HEADERS)
+        deadline = time.monotonic() + 2
+        while getattr(cache.backend.get(key), "value", None) != "new" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "newer") == "new"
+
+    def test_concurrent_misses_share_one_load(self) -> None:
+        """Test stampede protection: many threads missing the same entry load it once."""
+        cache = ReferenceCache()
+        calls = []
+        release = threading.Event()
+
+        def load() -> str:
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(cache.get_or_load, APPLICATION, "a/", HEADERS, load) for _ in range(8)]
+            while cache.misses < 8:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+
+    def test_failed_loads_are_not_cached(self) -> None:
+        """Test that an error reaches the caller and the next call loads again."""
+        cache = ReferenceCache()
+
+        def fail() -> str:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load(APPLICATION, "a/", HEADERS, fail)
+        assert cache.get_or_load(APPLICATION, "a/", HEADERS, lambda: "value") == "value"
+
+    def test_memory_backend_is_lru_bounded(self) -> None:
+        """Test that the least recently used entries are evicted first."""
+        backend = MemoryCacheBackend(max_size=2)
+        entry = CacheEntry("v", 0, 0)
+        backend.set("a", entry)
+        backend.set("b", entry)
+        backend.get("a")
+        backend.set("c", entry)
+
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert len(backend) == 2
+
+
+class TestCachedClients:
+    """Tests for the read-through cache in the reference data clients."""
+
+    @responses.activate
+    def test_application_get_is_cached_and_invalidated(self) -> None:
+        """Test that `get` is cached until the same client attaches policies to the application."""
+        responses.add(responses.GET, APP_URL, json={"data": APPLICATION_DATA})
+        responses.add(responses.PUT, f"{APP_URL}/policies/attach", status=204)
+        client = AppClient(BASE_URL, cache=ReferenceCache())
+
+        first = client.get(dict(HEADERS), APP_IRN)
+        assert client.get(dict(HEADERS), APP_IRN) is first
+        assert len(responses.calls) == 1
+
+        client.policies_attach(dict(HEADERS), APP_IRN, ["policy"])
+        client.get(dict(HEADERS), APP_IRN)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_tenant_issuer_is_invalidated_by_tenant_updates(self) -> None:
+        """Test that updating a tenant drops cached issuers."""
+        tenant_irn = IRN.of("irn:rc73dbh7q0:iamcore:4atcicnisg::tenant/4atcicnisg")
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/api/v1/tenants/issuers",
+            json={"data": [ISSUER], "count": 1, "page": 1, "pageSize": 100},
+        )
+        responses.add(responses.PUT, f"{BASE_URL}/api/v1/tenants/{tenant_irn.to_base64()}", status=204)
+        client = TenantClient(BASE_URL, cache=ReferenceCache())
+        params = GetTenantIssuer(account="rc73dbh7q0", tenant_id="4atcicnisg")
+
+        client.get_issuer(dict(HEADERS), params)
+        client.get_issuer(dict(HEADERS), params)
+        assert len(responses.calls) == 1
+
+        client.update(dict(HEADERS), tenant_irn, "Renamed")
+        client.get_issuer(dict(HEADERS), params)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_resource_type_search_all_is_cached(self) -> None:
+        """Test that `search_all` results are cached and dropped when a resource type is created."""
+        responses.add(
+            responses.GET,
+            f"{APP_URL}/resource-types",
+            json={"data": [RESOURCE_TYPE], "count": 1, "page": 1, "pageSize": 100},
+        )
+        responses.add(
+            responses.POST,
+            f"{APP_URL}/resource-types",
+            status=201,
+            headers={"Location": "/api/v1/applications/x/resource-types/new"},
+        )
+        client = AppResourceTypeClient(BASE_URL, cache=ReferenceCache())
+
+        assert [t.type for t in client.search_all(dict(HEADERS), APP_IRN)] == ["document"]
+        assert [t.type for t in client.search_all(dict(HEADERS), APP_IRN)] == ["document"]
+        assert len(responses.calls) == 1
+
+        client.create(dict(HEADERS), APP_IRN, CreateApplicationResourceType(type="folder", operations=["read"]))
+        list(client.search_all(dict(HEADERS), APP_IRN))
+        assert len(responses.calls) == 3
+
+    def test_client_shares_cache(self) -> None:
+        """Test that the top-level client hands one cache to the reference data clients."""
+        cache = ReferenceCache()
+        client = Client(BASE_URL, ISSUER_URL, reference_cache=cache)
+
+        assert client.tenant.cache is cache
+        assert client.application.cache is cache
+        assert client.application_resource_type.cache is cache
+
+    def test_async_application_get_is_cached(self) -> None:
+        """Test that concurrent async misses share one request and later calls hit the cache."""
+        calls = []
+
+        async def handler(_: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": APPLICATION_DATA})
+
+        transport = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncAppClient(BASE_URL, transport=transport, cache=ReferenceCache())
+
+        async def run() -> None:
+            await asyncio.gather(*(client.get(dict(HEADERS), APP_IRN) for _ in range(5)))
+            await client.get(dict(HEADERS), APP_IRN)
+
+        asyncio.run(run())
+
+        assert len(calls) == 1
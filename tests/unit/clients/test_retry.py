@@ -0,0 +1,267 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import requests
+import responses
+
+from iamcore.client import Client
+from iamcore.client.aio import AsyncRetryTransport, HttpxAsyncTransport
+from iamcore.client.base.retry import RetryBudget, RetryPolicy, RetryTransport, parse_retry_after
+from iamcore.client.base.transport import PooledTransport
+from iamcore.client.exceptions import IAMException
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+URL = f"{BASE_URL}/api/v1/users"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def retry_transport(policy: RetryPolicy, budget: RetryBudget = None) -> tuple[RetryTransport, FakeClock]:
+    clock = FakeClock()
+    transport = RetryTransport(
+        PooledTransport(),
+        policy,
+        budget or RetryBudget(),
+        sleep=clock.sleep,
+        clock=clock,
+    )
+    return transport, clock
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy and Retry-After parsing."""
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        """Test that backoff stays within the doubling, capped ceiling."""
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, rng=random.Random(1))
+
+        for attempt, ceiling in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+            assert 0 <= policy.backoff(attempt) <= ceiling
+
+    def test_idempotent_methods(self) -> None:
+        """Test that only idempotent methods are retried unless POST is opted in."""
+        assert RetryPolicy().allows_method("GET")
+        assert RetryPolicy().allows_method("delete")
+        assert not RetryPolicy().allows_method("POST")
+        assert RetryPolicy(retry_post=True).allows_method("POST")
+
+    def test_parse_retry_after(self) -> None:
+        """Test both Retry-After forms."""
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("7") == 7
+        assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now) == 30
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryTransport:
+    """Tests for RetryTransport."""
+
+    @responses.activate
+    def test_retries_transient_status(self) -> None:
+        """Test that a 503 is retried and the eventual success is returned."""
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, status=200)
+        transport, _ = retry_transport(RetryPolicy())
+
+        resp = transport.request("GET", URL)
+
+        assert resp.status_code == 200
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_honors_retry_after(self) -> None:
+        """Test that the wait is at least what Retry-After asks for."""
+        responses.add(responses.GET, URL, status=429, headers={"Retry-After": "5"})
+        responses.add(responses.GET, URL, status=200)
+        transport, clock = retry_transport(RetryPolicy(backoff_base=0.1))
+
+        transport.request("GET", URL)
+
+        assert clock.now >= 5
+
+    @responses.activate
+    def test_long_retry_after_is_not_waited_for(self) -> None:
+        """Test that a Retry-After beyond the policy's limit ends the retries."""
+        responses.add(responses.GET, URL, status=503, headers={"Retry-After": "600"})
+        transport, _ = retry_transport(RetryPolicy(max_retry_after=60))
+
+        with pytest.raises(IAMException) as excinfo:
+            transport.request("GET", URL)
+
+        assert len(responses.calls) == 1
+        assert excinfo.value.attempts == 1
+
+    @responses.activate
+    def test_exhausted_attempts_are_annotated(self) -> None:
+        """Test that the raised exception carries the attempt count and elapsed time."""
+        responses.add(responses.GET, URL, json={"message": "Unavailable"}, status=503)
+        transport, _ = retry_transport(RetryPolicy(max_attempts=3, backoff_base=1))
+
+        with pytest.raises(IAMException, match="Unavailable") as excinfo:
+            transport.request("GET", URL)
+
+        assert len(responses.calls) == 3
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.attempts == 3
+        assert excinfo.value.elapsed is not None
+        assert excinfo.value.elapsed <= 3
+
+    @responses.activate
+    @pytest.mark.parametrize("final_status", [404, 409, 500])
+    def test_final_error_after_retries_is_annotated(self, final_status: int) -> None:
+        """Test that a non-retryable error ending a retried request carries the attempts too."""
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, json={"message": "Nope"}, status=final_status)
+        transport, _ = retry_transport(RetryPolicy(backoff_base=1))
+
+        with pytest.raises(IAMException, match="Nope") as excinfo:
+            transport.request("GET", URL)
+
+        assert excinfo.value.status_code == final_status
+        assert excinfo.value.attempts == 3
+        assert excinfo.value.elapsed is not None
+
+    @responses.activate
+    def test_not_modified_after_retries_is_returned(self) -> None:
+        """Test that a 304 ending a retried request is handed back for the conditional transport."""
+        responses.add(responses.GET, URL, status=503)
+        responses.add(responses.GET, URL, status=304)
+
+        resp = retry_transport(RetryPolicy(backoff_base=0))[0].request("GET", URL)
+
+        assert resp.status_code == 304
+
+    @responses.activate
+    def test_unretried_overload_does_not_refill_budget(self) -> None:
+        """Test that a retryable status on a request that may not be resent is not counted as a success."""
+        responses.add(responses.POST, URL, status=503)
+        budget = RetryBudget(max_tokens=4, token_ratio=1)
+        budget.record_failure()
+
+        retry_transport(RetryPolicy(), budget)[0].request("POST", URL)
+
+        assert budget.tokens == 3
+
+    @responses.activate
+    def test_post_is_not_retried_by_default(self) -> None:
+        """Test that POST responses are handed back untouched unless opted in."""
+        responses.add(responses.POST, URL, status=503)
+        responses.add(responses.POST, URL, status=201)
+
+        resp = retry_transport(RetryPolicy())[0].request("POST", URL)
+        assert resp.status_code == 503
+
+        resp = retry_transport(RetryPolicy(retry_post=True))[0].request("POST", URL)
+        assert resp.status_code == 201
+
+    @responses.activate
+    def test_retries_connection_errors(self) -> None:
+        """Test that connection resets are retried, and reported once attempts run out."""
+        responses.add(responses.GET, URL, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, URL, status=200)
+        transport, _ = retry_transport(RetryPolicy())
+
+        assert transport.request("GET", URL).status_code == 200
+
+        responses.replace(responses.GET, URL, body=requests.ConnectionError("reset"))
+        with pytest.raises(IAMException, match="failed after 2 attempt") as excinfo:
+            retry_transport(RetryPolicy(max_attempts=2))[0].request("GET", URL)
+        assert excinfo.value.attempts == 2
+
+    @responses.activate
+    def test_connection_errors_on_post_propagate(self) -> None:
+        """Test that a non-idempotent request is never resent after a connection error."""
+        responses.add(responses.POST, URL, body=requests.ConnectionError("reset"))
+
+        with pytest.raises(requests.ConnectionError):
+            retry_transport(RetryPolicy())[0].request("POST", URL)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_budget_stops_retries(self) -> None:
+        """Test that retries stop once the shared budget is drained."""
+        responses.add(responses.GET, URL, status=503)
+        budget = RetryBudget(max_tokens=4, token_ratio=1)
+        transport, _ = retry_transport(RetryPolicy(max_attempts=10), budget)
+
+        with pytest.raises(IAMException) as excinfo:
+            transport.request("GET", URL)
+
+        # Tokens go 4 -> 3 -> 2: the second failure leaves the bucket half full.
+        assert excinfo.value.attempts == 2
+        budget.record_success()
+        assert budget.tokens == 3
+
+    def test_client_wraps_transport(self) -> None:
+        """Test that the top-level client opts into retries for every sub-client."""
+        budget = RetryBudget()
+        client = Client(BASE_URL, ISSUER_URL, retry=RetryPolicy(max_attempts=5), retry_budget=budget)
+
+        assert isinstance(client.transport, RetryTransport)
+        assert client.transport.policy.max_attempts == 5
+        assert client.transport.budget is budget
+        assert client.user.transport is client.transport
+
+    @responses.activate
+    def test_sub_client_sees_annotated_exception(self) -> None:
+        """Test that retried failures surface through the sub-clients with their attempt count."""
+        responses.add(responses.GET, f"{URL}/me", json={"message": "Busy"}, status=503)
+        client = Client(BASE_URL, ISSUER_URL, retry=RetryPolicy(backoff_base=0), retry_budget=RetryBudget())
+        with pytest.raises(IAMException) as excinfo:
+            client.user.get_authenticated({"Authorization": "Bearer token"})
+
+        assert excinfo.value.attempts == 3
+
+
+class TestAsyncRetryTransport:
+    """Tests for AsyncRetryTransport."""
+
+    def test_retries_transient_failures(self) -> None:
+        """Test that httpx transport errors and 503s are retried."""
+        outcomes = [httpx.ConnectError("reset"), httpx.Response(503), httpx.Response(200)]
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        async def no_sleep(_: float) -> None: ...
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        transport = AsyncRetryTransport(inner, RetryPolicy(), RetryBudget(), sleep=no_sleep)
+
+        resp = asyncio.run(transport.request("GET", URL))
+
+        assert resp.status_code == 200
+        assert outcomes == []
+
+    def test_final_error_after_retries_is_annotated(self) -> None:
+        """Test that a non-retryable error ending a retried request carries the attempts."""
+        outcomes = [httpx.Response(503), httpx.Response(404, json={"message": "Nope"})]
+
+        async def no_sleep(_: float) -> None: ...
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: outcomes.pop(0))))
+        transport = AsyncRetryTransport(inner, RetryPolicy(), RetryBudget(), sleep=no_sleep)
+
+        with pytest.raises(IAMException, match="Nope") as excinfo:
+            asyncio.run(transport.request("GET", URL))
+
+        assert excinfo.value.status_code == 404
+        assert excinfo.value.attempts == 2
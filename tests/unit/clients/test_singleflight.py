@@ -0,0 +1,202 @@
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests
+
+from iamcore.client import Client, SingleFlightTransport
+from iamcore.client.aio import AsyncSingleFlightTransport, HttpxAsyncTransport
+from iamcore.client.aio.user import Client as AsyncUserClient
+from iamcore.client.exceptions import IAMException, IAMUserException
+from iamcore.client.user.client import Client as UserClient
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+USER = {
+    "id": "aXJuOnJjNzNkYmg3cTA6aWFtY29yZTo6OmFwcGxpY2F0aW9uL215YXBw",
+    "irn": "irn:rc73dbh7q0:iamcore:::user/johndoe",
+    "created": "2021-10-18T12:27:15.55267632Z",
+    "updated": "2021-10-18T12:27:15.55267632Z",
+    "tenantID": "tenant123",
+    "authID": "auth-uuid-123",
+    "email": "john.doe@example.com",
+    "enabled": True,
+    "firstName": "John",
+    "lastName": "Doe",
+    "username": "johndoe",
+    "path": "/users",
+}
+
+
+class GatedTransport:
+    """Sync transport holding every request until `release` is set."""
+
+    def __init__(self, status: int = 200, body: object = None) -> None:
+        self.status = status
+        self.body = body if body is not None else {"data": USER}
+        self.calls = 0
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def request(self, *_: object, **__: object) -> requests.Response:
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        resp = requests.Response()
+        resp.status_code = self.status
+        resp.raw = io.BytesIO(json.dumps(self.body).encode())
+        return resp
+
+    def close(self) -> None: ...
+
+
+class CountingSingleFlight(SingleFlightTransport):
+    """Single-flight transport counting the requests that reached it."""
+
+    def __init__(self, transport: GatedTransport) -> None:
+        super().__init__(transport)
+        self.entered = 0
+        self._count_lock = threading.Lock()
+
+    def request(self, *args: object, **kwargs: object) -> requests.Response:
+        with self._count_lock:
+            self.entered += 1
+        return super().request(*args, **kwargs)
+
+
+def call_concurrently(transport: CountingSingleFlight, calls: list, count: int = 10) -> list:
+    """Run `count` of each call on threads, releasing the transport once they all reached it."""
+    with ThreadPoolExecutor(count * len(calls)) as pool:
+        futures = [pool.submit(*call) for call in calls * count]
+        while transport.entered < len(futures):
+            threading.Event().wait(0.001)
+        # Let the last callers get past the in-flight lookup before the flight lands.
+        threading.Event().wait(0.05)
+        transport.transport.release.set()
+        return [f.exception() or f.result() for f in futures]
+
+
+class TestSingleFlightTransport:
+    """Tests for SingleFlightTransport."""
+
+    def test_identical_gets_share_one_call_and_result(self) -> None:
+        """Test that concurrent identical GETs send one request and get the same parsed DTO."""
+        inner = GatedTransport()
+        transport = CountingSingleFlight(inner)
+        client = UserClient(BASE_URL, transport=transport)
+
+        users = call_concurrently(transport, [(client.get_authenticated, {"Authorization": "Bearer token"})])
+
+        assert inner.calls == 1
+        assert all(user is users[0] for user in users)
+        assert users[0].email == "john.doe@example.com"
+
+    def test_errors_reach_every_caller(self) -> None:
+        """Test that an error response is raised to every coalesced caller."""
+        inner = GatedTransport(status=500, body={"message": "Boom"})
+        transport = CountingSingleFlight(inner)
+        client = UserClient(BASE_URL, transport=transport)
+
+        errors = call_concurrently(transport, [(client.get_authenticated, {"Authorization": "Bearer token"})])
+
+        assert inner.calls == 1
+        assert all(isinstance(e, IAMException) and e.status_code == 500 for e in errors)
+
+    def test_different_credentials_are_not_coalesced(self) -> None:
+        """Test that requests with different auth headers are sent separately."""
+        inner = GatedTransport()
+        transport = CountingSingleFlight(inner)
+        client = UserClient(BASE_URL, transport=transport)
+
+        call_concurrently(
+            transport,
+            [
+                (client.get_authenticated, {"Authorization": "Bearer alice"}),
+                (client.get_authenticated, {"Authorization": "Bearer bob"}),
+            ],
+            count=3,
+        )
+
+        assert inner.calls == 2
+
+    def test_later_calls_start_a_new_flight(self) -> None:
+        """Test that a landed response is not reused."""
+        inner = GatedTransport()
+        inner.release.set()
+        transport = SingleFlightTransport(inner)
+
+        transport.request("GET", f"{BASE_URL}/api/v1/users/me")
+        transport.request("GET", f"{BASE_URL}/api/v1/users/me")
+
+        assert inner.calls == 2
+
+    def test_non_get_requests_pass_through(self) -> None:
+        """Test that writes are never coalesced."""
+        inner = GatedTransport()
+        inner.release.set()
+        transport = SingleFlightTransport(inner)
+
+        transport.request("POST", f"{BASE_URL}/api/v1/users", data="{}")
+        transport.request("POST", f"{BASE_URL}/api/v1/users", data="{}")
+
+        assert inner.calls == 2
+
+    def test_client_wraps_transport(self) -> None:
+        """Test that the top-level client coalesces requests when asked to."""
+        client = Client(BASE_URL, ISSUER_URL, single_flight=True)
+
+        assert isinstance(client.transport, SingleFlightTransport)
+
+
+class TestAsyncSingleFlightTransport:
+    """Tests for AsyncSingleFlightTransport."""
+
+    def test_identical_gets_share_one_call_and_result(self) -> None:
+        """Test that concurrent identical GETs send one request and get the same parsed DTO."""
+        calls = []
+
+        async def handler(_: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": USER})
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncUserClient(BASE_URL, transport=AsyncSingleFlightTransport(inner))
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(client.get_authenticated({"Authorization": "Bearer token"}) for _ in range(10))
+            )
+
+        users = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(user is users[0] for user in users)
+
+    def test_errors_reach_every_caller(self) -> None:
+        """Test that a transport error is raised to every coalesced caller."""
+
+        async def handler(_: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            msg = "reset"
+            raise httpx.ConnectError(msg)
+
+        inner = HttpxAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        client = AsyncUserClient(BASE_URL, transport=AsyncSingleFlightTransport(inner))
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(client.get_authenticated({"Authorization": "Bearer token"}) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(run())
+
+        assert len(errors) == 3
+        for error in errors:
+            with pytest.raises(IAMUserException, match="reset"):
+                raise error
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from iamcore.irn import IRN
+
+from iamcore.client import ChangeFeed, SnapshotStore
+from iamcore.client.base.changefeed import parse_timestamp
+from iamcore.client.group.dto import Group, IamGroupsResponse
+from iamcore.client.policy.dto import IamPoliciesResponse, Policy
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from iamcore.client.base.models import PaginatedSearchFilter
+
+HEADERS = {"Authorization": "Bearer token"}
+TENANT = "irn:rc73dbh7q0:iamcore:tenant1"
+
+
+def group_data(name: str, updated: str) -> dict:
+    irn = f"{TENANT}::group/{name}"
+    return {
+        "id": IRN.of(irn).to_base64(),
+        "irn": irn,
+        "tenantID": "tenant1",
+        "name": name,
+        "displayName": name.title(),
+        "path": "/",
+        "created": "2024-01-01T00:00:00.123456789Z",
+        "updated": updated,
+    }
+
+
+def policy_data(name: str, actions: list[str]) -> dict:
+    irn = f"{TENANT}::policy/{name}"
+    return {
+        "id": IRN.of(irn).to_base64(),
+        "irn": irn,
+        "name": name,
+        "type": "tenant",
+        "origin": "user",
+        "version": "v1",
+        "statements": [{"effect": "allow", "resources": ["irn:rc73dbh7q0:myapp:tenant1::*"], "actions": actions}],
+    }
+
+
+class FakeSearch:
+    """In-memory stand-in for a client's `search`, counting the entities it returns."""
+
+    def __init__(self, response: type, *items: dict) -> None:
+        self.response = response
+        self.items = {item["name"]: item for item in items}
+        self.returned = 0
+
+    def __call__(self, auth_headers: dict[str, str], search_filter: PaginatedSearchFilter) -> Any:
+        data = list(self.items.values())
+        if search_filter.sort == "updated":
+            data.sort(key=lambda item: parse_timestamp(item["updated"]), reverse=True)
+        size = search_filter.page_size or len(data)
+        start = ((search_filter.page or 1) - 1) * size
+        page = data[start : start + size]
+        self.returned += len(page)
+        return self.response.model_validate(
+            {"data": page, "count": len(data), "page": search_filter.page, "pageSize": size}
+        )
+
+
+def dumped(models: list) -> list[str]:
+    return sorted(model.model_dump_json(by_alias=True, exclude={"irn"}) + str(model.irn) for model in models)
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore."""
+
+    def test_round_trips_dtos(self, tmp_path: Path) -> None:
+        """Test that stored entities are read back as the same DTOs, across connections."""
+        groups = [Group.model_validate(group_data(name, "2024-01-02T00:00:00Z")) for name in ("a", "b")]
+        policy = Policy.model_validate(policy_data("p", ["myapp:*"]))
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            store.replace("groups", groups)
+            store.replace("policies", [policy])
+
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            loaded = store.load("groups", Group)
+            (loaded_policy,) = store.load("policies", Policy)
+            missing = store.get("groups", f"{TENANT}::group/missing", Group)
+
+        assert dumped(loaded) == dumped(groups)
+        assert str(loaded_policy.statements[0].resources[0]) == "irn:rc73dbh7q0:myapp:tenant1::*"
+        assert missing is None
+
+    def test_warm_start_revalidates_incrementally(self, tmp_path: Path) -> None:
+        """Test that a warm start reads from disk, and the feed only fetches and stores changes."""
+        search = FakeSearch(IamGroupsResponse, *(group_data(f"g{i}", f"2024-01-01T00:00:0{i}Z") for i in range(5)))
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            assert len(store.track(ChangeFeed(HEADERS), "groups", search, Group)) == 5
+        search.returned = 0
+
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            feed = ChangeFeed(HEADERS, page_size=2)
+            groups = store.track(feed, "groups", search, Group)
+            assert search.returned == 0
+            search.items["g2"] = group_data("g2", "2024-01-02T00:00:00Z")
+            feed.poll()
+
+            assert len(groups) == 5
+            assert search.returned == 4
+            assert store.versions("groups")[f"{TENANT}::group/g2"] == "2024-01-02T00:00:00Z"
+
+    def test_full_sync_removes_deleted_entities(self, tmp_path: Path) -> None:
+        """Test that entities deleted on the server are removed from the store by the full sync."""
+        search = FakeSearch(
+            IamGroupsResponse, group_data("a", "2024-01-01T00:00:00Z"), group_data("b", "2024-01-01T00:00:00Z")
+        )
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            feed = ChangeFeed(HEADERS, full_sync_interval=0)
+            store.track(feed, "groups", search, Group)
+            del search.items["b"]
+            feed.poll()
+
+            assert [group.name for group in store.load("groups", Group)] == ["a"]
+
+    def test_empty_kind_is_not_fetched_again(self, tmp_path: Path) -> None:
+        """Test that a kind stored empty is loaded from disk on a warm start, not fetched again."""
+        search = FakeSearch(IamGroupsResponse)
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            assert store.track(ChangeFeed(HEADERS), "groups", search, Group) == []
+        search.items["a"] = group_data("a", "2024-01-01T00:00:00Z")
+
+        with SnapshotStore(tmp_path / "snapshot.db") as store:
+            assert store.track(ChangeFeed(HEADERS), "groups", search, Group) == []
+            assert search.returned == 0
+
+    def test_stale_warm_start_syncs_fully_on_first_poll(self, tmp_path: Path) -> None:
+        """Test that entities deleted since an old snapshot are removed by the first poll, not an hour later."""
+        now = [0.0]
+        search = FakeSearch(
+            IamGroupsResponse, group_data("a", "2024-01-01T00:00:00Z"), group_data("b", "2024-01-01T00:00:00Z")
+        )
+        with SnapshotStore(tmp_path / "snapshot.db", clock=lambda: now[0]) as store:
+            store.track(ChangeFeed(HEADERS), "groups", search, Group)
+        del search.items["b"]
+        now[0] = 7200
+
+        with SnapshotStore(tmp_path / "snapshot.db", clock=lambda: now[0]) as store:
+            feed = ChangeFeed(HEADERS, full_sync_interval=3600)
+            store.track(feed, "groups", search, Group)
+            (event,) = feed.poll()
+
+            assert event.key == f"{TENANT}::group/b"
+            assert [group.name for group in store.load("groups", Group)] == ["a"]
+
+    def test_full_syncs_keep_a_later_warm_start_incremental(self, tmp_path: Path) -> None:
+        """Test that a worker started after `full_sync_interval` skips the full search when a full sync ran since."""
+        now = [0.0]
+        search = FakeSearch(IamGroupsResponse, group_data("a", "2024-01-01T00:00:00Z"))
+        with SnapshotStore(tmp_path / "snapshot.db", clock=lambda: now[0]) as store:
+            store.track(ChangeFeed(HEADERS), "groups", search, Group)
+            now[0] = 7000
+            feed = ChangeFeed(HEADERS, full_sync_interval=3600)
+            store.track(feed, "groups", search, Group)
+            feed.poll()
+            assert store.synced_at("groups") == 7000
+        now[0] = 7200
+        search.returned = 0
+
+        with SnapshotStore(tmp_path / "snapshot.db", clock=lambda: now[0]) as store:
+            feed = ChangeFeed(HEADERS, full_sync_interval=3600, page_size=1)
+            store.track(feed, "groups", search, Group)
+            assert feed.poll() == []
+
+        assert search.returned == 1
+
+    def test_full_sync_of_an_untracked_kind_is_not_recorded(self) -> None:
+        """Test that feed sources the store never held whole are not marked complete."""
+        search = FakeSearch(IamGroupsResponse, group_data("a", "2024-01-01T00:00:00Z"))
+        with SnapshotStore(":memory:") as store:
+            feed = ChangeFeed(HEADERS)
+            store.track(feed, "groups", search, Group)
+            feed.watch("users", search)
+            feed.poll()
+
+            assert store.synced_at("users") is None
+
+    def test_entities_without_updated_are_compared_by_content(self) -> None:
+        """Test that policies, which carry no `updated`, are revalidated by content digest."""
+        search = FakeSearch(IamPoliciesResponse, policy_data("p", ["myapp:read"]), policy_data("q", ["myapp:read"]))
+        with SnapshotStore(":memory:") as store:
+            feed = ChangeFeed(HEADERS)
+            store.track(feed, "policies", search, Policy)
+            assert feed.poll() == []
+            search.items["q"] = policy_data("q", ["myapp:*"])
+            (event,) = feed.poll()
+
+            assert event.key == f"{TENANT}::policy/q"
+            stored = store.get("policies", f"{TENANT}::policy/q", Policy)
+            assert stored is not None
+            assert stored.statements[0].actions == ["myapp:*"]
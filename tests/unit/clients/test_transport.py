@@ -0,0 +1,111 @@
+import pytest
+import responses
+from requests.adapters import HTTPAdapter
+
+from iamcore.client import Client
+from iamcore.client.base.client import HTTPClientWithTimeout
+from iamcore.client.base.transport import PooledTransport
+
+BASE_URL = "http://localhost:8080"
+ISSUER_URL = "http://localhost:8080/auth"
+
+
+class TestPooledTransport:
+    """Class-based tests for PooledTransport."""
+
+    def test_transport_mounts_pooled_adapter(self) -> None:
+        """Test that the session mounts an adapter sized by the pool settings."""
+        transport = PooledTransport(pool_connections=3, pool_maxsize=25)
+
+        adapter = transport.session.get_adapter(BASE_URL)
+
+        for host in ("a", "b", "c", "d"):
+            adapter.poolmanager.connection_from_host(f"{host}.example.com")
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert len(adapter.poolmanager.pools) == 3
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 25
+
+    @responses.activate
+    def test_transport_reuses_session_between_requests(self) -> None:
+        """Test that consecutive requests go through the same session."""
+        responses.add(responses.GET, f"{BASE_URL}/ping", status=200)
+        transport = PooledTransport()
+        session = transport.session
+
+        transport.request("GET", f"{BASE_URL}/ping")
+        transport.request("GET", f"{BASE_URL}/ping")
+
+        assert transport.session is session
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_transport_recycles_session_after_idle_timeout(self) -> None:
+        """Test that the pooled session is replaced once it has been idle for too long."""
+        responses.add(responses.GET, f"{BASE_URL}/ping", status=200)
+        now = [0.0]
+        transport = PooledTransport(idle_timeout=10, clock=lambda: now[0])
+        session = transport.session
+        now[0] = 11
+
+        transport.request("GET", f"{BASE_URL}/ping")
+
+        assert transport.session is not session
+
+    @responses.activate
+    def test_transport_without_idle_timeout_keeps_session(self) -> None:
+        """Test that idle recycling can be disabled."""
+        responses.add(responses.GET, f"{BASE_URL}/ping", status=200)
+        now = [0.0]
+        transport = PooledTransport(idle_timeout=None, clock=lambda: now[0])
+        session = transport.session
+        now[0] = 3600
+
+        transport.request("GET", f"{BASE_URL}/ping")
+
+        assert transport.session is session
+
+    def test_http_client_creates_own_transport_by_default(self) -> None:
+        """Test that a standalone client gets a pooled transport of its own."""
+        client = HTTPClientWithTimeout(base_url=BASE_URL)
+
+        assert isinstance(client.transport, PooledTransport)
+
+    def test_iamcore_client_shares_transport_with_sub_clients(self) -> None:
+        """Test that every sub-client of the top-level client uses one transport."""
+        client = Client(BASE_URL, ISSUER_URL, pool_maxsize=32)
+
+        sub_clients = [
+            client.auth,
+            client.api_key,
+            client.application,
+            client.application_resource_type,
+            client.evaluate,
+            client.group,
+            client.policy,
+            client.resource,
+            client.tenant,
+            client.user,
+        ]
+        assert isinstance(client.transport, PooledTransport)
+        assert client.transport.pool_maxsize == 32
+        assert all(sub_client.transport is client.transport for sub_client in sub_clients)
+
+    def test_iamcore_client_reads_pool_settings_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the IAMCORE_CLIENT_POOL_* variables apply to the settings not passed explicitly."""
+        monkeypatch.setenv("IAMCORE_CLIENT_POOL_MAXSIZE", "40")
+        monkeypatch.setenv("IAMCORE_CLIENT_POOL_IDLE_TIMEOUT", "5")
+
+        client = Client(BASE_URL, ISSUER_URL, pool_idle_timeout=20)
+
+        assert isinstance(client.transport, PooledTransport)
+        assert client.transport.pool_maxsize == 40
+        assert client.transport.idle_timeout == 20
+
+    def test_iamcore_client_accepts_custom_transport(self) -> None:
+        """Test that a caller-provided transport is plugged into every sub-client."""
+        transport = PooledTransport(pool_maxsize=2)
+
+        with Client(BASE_URL, ISSUER_URL, transport=transport) as client:
+            assert client.transport is transport
+            assert client.user.transport is transport
@@ -18,6 +18,7 @@ from iamcore.client.user.dto import (
     IamUsersResponse,
     UpdateUser,
     User,
+    UserRecord,
     UserSearchFilter,
 )
 
@@ -452,6 +453,74 @@ class TestUserClient:
         assert responses.calls[0].request.method == "GET"
         assert responses.calls[0].request.url == f"{expected_url}?page=1&pageSize=1000"
 
+    @responses.activate
+    def test_search_all_users_stream(self) -> None:
+        """Test that streamed search yields users across pages, with the count after the data."""
+        expected_url = f"{self.expected_base_url}"
+
+        def page_body(page: int) -> str:
+            user = {
+                "id": f"user-{page}",
+                "irn": f"irn:rc73dbh7q0:iamcore:::user/user{page}",
+                "created": "2021-10-18T12:27:15.55267632Z",
+                "updated": "2021-10-18T12:27:15.55267632Z",
+                "tenantID": "tenant123",
+                "authID": "auth-uuid-123",
+                "email": f"user{page}@example.com",
+                "enabled": True,
+                "username": f"user{page}",
+                "path": "/users",
+            }
+            return json.dumps({"data": [user], "page": page, "pageSize": 1, "count": 2})
+
+        responses.add(responses.GET, expected_url, body=page_body(1), status=200)
+        responses.add(responses.GET, expected_url, body=page_body(2), status=200)
+
+        auth_headers = {"Authorization": "Bearer token"}
+        results = list(self.client.search_all(auth_headers, stream=True))
+
+        assert [user.username for user in results] == ["user1", "user2"]
+        assert all(isinstance(user, User) for user in results)
+        assert [call.request.url for call in responses.calls] == [
+            f"{expected_url}?page=1&pageSize=1000",
+            f"{expected_url}?page=2&pageSize=1000",
+        ]
+
+    @responses.activate
+    def test_search_all_records(self) -> None:
+        """Test that search_all_records yields read-only records convertible to users."""
+        expected_url = f"{self.expected_base_url}"
+        user = {
+            "id": "user-1",
+            "irn": "irn:rc73dbh7q0:iamcore:::user/johndoe",
+            "created": "2021-10-18T12:27:15.55267632Z",
+            "updated": "2021-10-18T12:27:15.55267632Z",
+            "tenantID": "tenant123",
+            "authID": "auth-uuid-123",
+            "email": "john.doe@example.com",
+            "enabled": True,
+            "username": "johndoe",
+            "path": "/users",
+        }
+        responses.add(
+            responses.GET,
+            expected_url,
+            json={"data": [user], "count": 1, "page": 1, "pageSize": 1},
+            status=200,
+        )
+
+        results = list(self.client.search_all_records({"Authorization": "Bearer token"}))
+
+        assert [record.username for record in results] == ["johndoe"]
+        assert isinstance(results[0], UserRecord)
+        assert results[0].to_model().email == "john.doe@example.com"
+        assert responses.calls[0].request.url == f"{expected_url}?page=1&pageSize=1000"
+
+    def test_search_all_stream_rejects_concurrency(self) -> None:
+        """Test that streaming cannot be combined with concurrent page prefetching."""
+        with pytest.raises(IAMException, match="stream cannot be combined"):
+            self.client.search_all({"Authorization": "Bearer token"}, stream=True, concurrency=4)
+
     @responses.activate
     def test_create_user_bad_request_error(self) -> None:
         """Test create_user raises IAMBedRequestException for 400 Bad Request."""
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Optional
 from unittest.mock import Mock
 
 import pytest
 from iamcore.irn import IRN
-from pydantic import Field
+from pydantic import Field, ValidationError
 
 from iamcore.client.base.models import (
     SEARCH_ALL_PAGE_SIZE,
@@ -52,6 +53,21 @@ class TestIAMCoreBaseModel:
         assert model.my_field == "test_value"
         assert model.optional_field == 123
 
+    def test_from_response_parses_raw_bytes(self) -> None:
+        """Test model creation straight from the response body bytes."""
+        response = Mock(content=b'{"myField": "test_value", "optionalField": 123}')
+        model = self.SimpleModel.from_response(response)
+        assert model.my_field == "test_value"
+        assert model.optional_field == 123
+        response.json.assert_not_called()
+
+    def test_from_response_leaves_validation_errors_to_err_chain(self) -> None:
+        """Test that invalid bodies raise ValidationError, for err_chain to map per client."""
+        with pytest.raises(ValidationError):
+            self.SimpleModel.from_response(Mock(content=b'{"optionalField": 123}'))
+        with pytest.raises(ValidationError):
+            self.SimpleModel.from_response(Mock(content=b"not json"))
+
     def test_to_dict_with_aliasing(self) -> None:
         """Test model conversion to a dict uses camelCase aliases."""
         kwargs = {"my_field": "test", "optional_field": 456}
@@ -195,3 +211,62 @@ class TestGenericSearchAll:
         assert isinstance(called_filter, PaginatedSearchFilter)
         assert called_filter.page == 1
         assert called_filter.page_size == SEARCH_ALL_PAGE_SIZE
+
+    @staticmethod
+    def _paged_search(total_items: int, page_size: int, delays: Optional[dict[int, float]] = None) -> Mock:
+        """Build a search function serving `total_items` IRNs, optionally slowing down some pages."""
+        irns = [f"irn:rc73dbh7q0:iamcore:4atcicnisg::user/org1/{i}" for i in range(1, total_items + 1)]
+
+        def search(_: dict[str, str], search_filter: PaginatedSearchFilter) -> IamIRNsResponse:
+            page = search_filter.page or 1
+            time.sleep((delays or {}).get(page, 0))
+            data = irns[(page - 1) * page_size : page * page_size]
+            return IamIRNsResponse(data=data, count=total_items, page=page, pageSize=page_size)
+
+        return Mock(side_effect=search)
+
+    def test_concurrent_prefetch_yields_in_page_order(self) -> None:
+        """Test that concurrent prefetching keeps page order by default."""
+        mock_search_func = self._paged_search(total_items=50, page_size=10, delays={2: 0.05})
+
+        results_list = list(generic_search_all({}, mock_search_func, None, concurrency=4))
+
+        expected = [f"irn:rc73dbh7q0:iamcore:4atcicnisg::user/org1/{i}" for i in range(1, 51)]
+        assert [str(irn) for irn in results_list] == expected
+        assert mock_search_func.call_count == 5
+        assert sorted(call[0][1].page for call in mock_search_func.call_args_list) == [1, 2, 3, 4, 5]
+
+    def test_concurrent_prefetch_unordered_yields_as_pages_arrive(self) -> None:
+        """Test that unordered mode does not wait for slow pages before yielding faster ones."""
+        mock_search_func = self._paged_search(total_items=30, page_size=10, delays={2: 0.2})
+
+        results_list = list(generic_search_all({}, mock_search_func, None, concurrency=2, ordered=False))
+
+        pages = [int(str(irn).rsplit("/", 1)[1]) // 10 + 1 for irn in results_list[::10]]
+        assert len(results_list) == 30
+        assert pages == [1, 3, 2]
+
+    def test_concurrent_prefetch_does_not_mutate_filter(self) -> None:
+        """Test that concurrent requests get their own filter copies."""
+        mock_search_func = self._paged_search(total_items=25, page_size=10)
+        search_filter = PaginatedSearchFilter(sort="name")
+
+        list(generic_search_all({}, mock_search_func, search_filter, concurrency=3))
+
+        filters = [call[0][1] for call in mock_search_func.call_args_list]
+        assert search_filter.page is None
+        assert all(f.sort == "name" for f in filters)
+        assert sorted(f.page for f in filters) == [1, 2, 3]
+
+    def test_concurrent_prefetch_propagates_page_errors(self) -> None:
+        """Test that a failing page surfaces to the consumer."""
+        search = self._paged_search(total_items=30, page_size=10)
+
+        def failing_search(headers: dict[str, str], search_filter: PaginatedSearchFilter) -> IamIRNsResponse:
+            if search_filter.page == 3:
+                msg = "page 3 failed"
+                raise IAMException(msg)
+            return search(headers, search_filter)
+
+        with pytest.raises(IAMException, match="page 3 failed"):
+            list(generic_search_all({}, failing_search, None, concurrency=2))
@@ -117,3 +117,16 @@ class TestBaseConfig:
 
         assert config.iamcore_url_str == "https://api.example.com/"
         assert config.get_iamcore_issuer_url == "https://api.example.com/auth/"
+
+    def test_config_pool_settings_from_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test connection pool settings loading from environment variables."""
+        monkeypatch.setenv("IAMCORE_URL", "https://api.example.com")
+        monkeypatch.setenv("IAMCORE_CLIENT_POOL_CONNECTIONS", "4")
+        monkeypatch.setenv("IAMCORE_CLIENT_POOL_MAXSIZE", "50")
+        monkeypatch.setenv("IAMCORE_CLIENT_POOL_IDLE_TIMEOUT", "15.5")
+
+        config = BaseConfig()
+
+        assert config.iamcore_client_pool_connections == 4
+        assert config.iamcore_client_pool_maxsize == 50
+        assert config.iamcore_client_pool_idle_timeout == 15.5
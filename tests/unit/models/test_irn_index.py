@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from iamcore.irn import IRN
+
+from iamcore.client import IRNIndex
+from iamcore.client.base.irn_index import irn_segments
+from iamcore.client.base.models import IamIRNsResponse
+from iamcore.client.policy.dto import PolicyStatement
+
+TENANT = "irn:rc73dbh7q0:myapp:tenant1"
+DOC1 = f"{TENANT}::document/folder/doc1"
+DOC2 = f"{TENANT}::document/folder/doc2"
+DRAFT = f"{TENANT}::document/drafts/d1"
+OTHER = "irn:rc73dbh7q0:myapp:tenant2::document/folder/doc1"
+
+
+class TestIRNSegments:
+    """Tests for irn_segments."""
+
+    def test_splits_tokens_and_path(self) -> None:
+        """Test that IRNs split on tokens first, then on the resource path."""
+        assert irn_segments(IRN.of(DOC1)) == [
+            "irn",
+            "rc73dbh7q0",
+            "myapp",
+            "tenant1",
+            "",
+            "document",
+            "folder",
+            "doc1",
+        ]
+
+    def test_keeps_wildcards(self) -> None:
+        """Test that wildcard IRNs end with their wildcard segment."""
+        assert irn_segments(f"{TENANT}:*") == ["irn", "rc73dbh7q0", "myapp", "tenant1", "*"]
+        assert irn_segments("*") == ["*"]
+
+
+class TestIRNIndex:
+    """Tests for IRNIndex."""
+
+    def test_match_exact_and_wildcards(self) -> None:
+        """Test that an IRN matches itself and every wildcard pattern covering it."""
+        index = IRNIndex(
+            [
+                (DOC1, "exact"),
+                (f"{TENANT}::document/*", "documents"),
+                (f"{TENANT}::document/fold*", "partial"),
+                (f"{TENANT}:*", "tenant"),
+                ("irn:rc73dbh7q0:*", "account"),
+                ("*", "all"),
+                (DOC2, "other document"),
+                (f"{TENANT}::document/drafts/*", "drafts"),
+            ]
+        )
+
+        assert sorted(index.match(IRN.of(DOC1))) == sorted(
+            ["exact", "documents", "partial", "tenant", "account", "all"]
+        )
+        assert sorted(index.match(OTHER)) == ["account", "all"]
+        assert len(index) == 8
+
+    def test_wildcards_do_not_match_their_parent(self) -> None:
+        """Test that `.../*` only matches IRNs below it, and that prefixes must match whole segments."""
+        index = IRNIndex([(f"{TENANT}::document/folder/*", 1)])
+
+        assert not index.matches(f"{TENANT}::document/folder")
+        assert not index.matches(f"{TENANT}::document/folder2/doc1")
+        assert index.matches(DOC1)
+
+    def test_of_statements(self) -> None:
+        """Test indexing policy statements by their resource patterns."""
+        read = PolicyStatement(effect="allow", resources=[IRN.of(f"{TENANT}::document/*")], actions=["read"])
+        drafts = PolicyStatement(effect="deny", resources=[IRN.of(f"{TENANT}::document/drafts/*")], actions=["*"])
+        index = IRNIndex.of_statements([read, drafts])
+
+        assert index.match(DOC1) == [read]
+        assert index.match(DRAFT) == [read, drafts]
+
+    def test_under(self) -> None:
+        """Test listing the IRNs at or below a prefix."""
+        response = IamIRNsResponse.model_validate(
+            {"data": [DOC1, DOC2, DRAFT, OTHER], "count": 4, "page": 1, "pageSize": 100}
+        )
+        index = IRNIndex.of(response.data)
+
+        assert sorted(map(str, index.under(f"{TENANT}::document/folder"))) == [DOC1, DOC2]
+        assert sorted(map(str, index.under(f"{TENANT}::document/*"))) == sorted([DOC1, DOC2, DRAFT])
+        assert sorted(map(str, index.under(f"{TENANT}::document/dr*"))) == [DRAFT]
+        assert list(index.under("irn:rc73dbh7q0:myapp:tenant3:*")) == []
+
+    def test_filter(self) -> None:
+        """Test filtering IRNs, or objects holding one, by the patterns they match."""
+        index = IRNIndex.of([f"{TENANT}::document/folder/*"])
+        statements = [
+            PolicyStatement(effect="allow", resources=[IRN.of(irn)], actions=["read"]) for irn in (DOC1, DRAFT)
+        ]
+
+        assert [str(irn) for irn in index.filter([IRN.of(DOC1), IRN.of(DRAFT), IRN.of(OTHER)])] == [DOC1]
+        assert list(index.filter(statements, key=lambda s: s.resources[0])) == statements[:1]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from base64 import b64encode
+
+import pytest
+import responses
+from iamcore.irn import IRN, IRNException
+
+from iamcore.client import Client
+from iamcore.client.base.irn import LazyIRN, lazy_irns_context
+from iamcore.client.base.models import IamIRNsResponse
+from iamcore.client.user.dto import User
+
+RAW_IRN = "irn:rc73dbh7q0:myapp:tenant1::document/folder/doc1"
+BASE_URL = "http://localhost:8080"
+USER_DATA = {
+    "id": "user-1",
+    "irn": "irn:rc73dbh7q0:iamcore:::user/johndoe",
+    "created": "2021-10-18T12:27:15Z",
+    "updated": "2021-10-18T12:27:15Z",
+    "tenantID": "tenant1",
+    "authID": "auth-1",
+    "email": "john@example.com",
+    "enabled": True,
+    "username": "johndoe",
+    "path": "/",
+}
+
+
+class TestLazyIRN:
+    """Tests for LazyIRN."""
+
+    def test_is_an_irn(self) -> None:
+        """Test that a lazy IRN can be used wherever an IRN is expected."""
+        assert isinstance(LazyIRN(RAW_IRN), IRN)
+
+    def test_str_does_not_parse(self) -> None:
+        """Test that the raw string is returned without parsing."""
+        irn = LazyIRN(RAW_IRN)
+
+        assert str(irn) == RAW_IRN
+        assert "_IRN__account_id" not in vars(irn)
+
+    def test_attributes_parse_once(self) -> None:
+        """Test that the first attribute access parses and later ones reuse the result."""
+        irn = LazyIRN(RAW_IRN)
+
+        assert irn.account_id == "rc73dbh7q0"
+        assert "_IRN__account_id" in vars(irn)
+        assert irn.application == "myapp"
+        assert irn.tenant_id == "tenant1"
+        assert irn.resource_type == "document"
+        assert irn.resource_path == "folder"
+        assert irn.resource_id == "doc1"
+
+    def test_to_base64_matches_and_is_cached(self) -> None:
+        """Test that the base64 form matches the eager IRN and is computed once."""
+        irn = LazyIRN(RAW_IRN)
+
+        assert irn.to_base64() == IRN.of(RAW_IRN).to_base64()
+        assert irn.to_base64() is irn.to_base64()
+
+    def test_accepts_base64(self) -> None:
+        """Test that a base64-encoded IRN is accepted like IRN.of does."""
+        irn = LazyIRN(b64encode(RAW_IRN.encode()).decode())
+
+        assert str(irn) == RAW_IRN
+        assert irn.resource_id == "doc1"
+
+    def test_malformed_irn_raises_on_access(self) -> None:
+        """Test that validation of a malformed IRN is deferred to first access."""
+        irn = LazyIRN("irn:rc73dbh7q0:myapp:")
+
+        with pytest.raises(IRNException):
+            _ = irn.account_id
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = LazyIRN(RAW_IRN).missing
+
+
+class TestLazyIrnOption:
+    """Tests for the per-call and per-client opt-in used by the DTO validators."""
+
+    def test_eager_by_default(self) -> None:
+        """Test that DTOs parse IRNs eagerly unless asked otherwise."""
+        user = User.model_validate(USER_DATA)
+
+        assert type(user.irn) is IRN
+
+    def test_validation_context(self) -> None:
+        """Test that response DTOs validated with the lazy context hold lazy IRNs."""
+        response = IamIRNsResponse.model_validate(
+            {"data": [RAW_IRN], "count": 1, "page": 1, "pageSize": 1}, context=lazy_irns_context()
+        )
+        user = User.model_validate_json(json.dumps(USER_DATA), context=lazy_irns_context())
+
+        assert isinstance(response.data[0], LazyIRN)
+        assert isinstance(user.irn, LazyIRN)
+        assert user.irn.resource_id == "johndoe"
+
+    @responses.activate
+    def test_client_option_is_scoped_to_the_client(self) -> None:
+        """Test that only the client created with `lazy_irns` returns lazy IRNs."""
+        responses.add(responses.GET, f"{BASE_URL}/api/v1/users/me", json={"data": USER_DATA})
+        headers = {"Authorization": "Bearer token"}
+
+        lazy = Client(BASE_URL, f"{BASE_URL}/auth", lazy_irns=True).user.get_authenticated(headers)
+        eager = Client(BASE_URL, f"{BASE_URL}/auth").user.get_authenticated(headers)
+
+        assert isinstance(lazy.irn, LazyIRN)
+        assert type(eager.irn) is IRN
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from iamcore.irn import IRN
+
+from iamcore.client.base.irn import LazyIRN
+from iamcore.client.base.records import Record, RecordPage
+from iamcore.client.group.dto import Group, GroupRecord
+from iamcore.client.resource.dto import Resource, ResourceRecord
+from iamcore.client.user.dto import User, UserRecord
+
+USER_DATA: dict[str, Any] = {
+    "id": "user-1",
+    "irn": "irn:rc73dbh7q0:iamcore:::user/johndoe",
+    "created": "2021-10-18T12:27:15Z",
+    "updated": "2021-10-18T12:27:15Z",
+    "tenantID": "tenant1",
+    "authID": "auth-1",
+    "email": "john@example.com",
+    "enabled": True,
+    "firstName": "John",
+    "username": "johndoe",
+    "path": "/",
+    "metadata": {"team": "core"},
+}
+
+
+class TestRecord:
+    """Tests for the slotted read-only records."""
+
+    def test_attributes_match_dto(self) -> None:
+        """Test that a record exposes the DTO's attribute names and values."""
+        record = UserRecord.from_data(USER_DATA)
+        user = User.model_validate(USER_DATA)
+
+        for name in User.model_fields:
+            if name != "irn":
+                assert getattr(record, name) == getattr(user, name)
+        assert isinstance(record.irn, LazyIRN)
+        assert str(record.irn) == str(user.irn)
+
+    def test_is_compact_and_read_only(self) -> None:
+        """Test that records have no instance dict and reject assignment."""
+        record = UserRecord.from_data(USER_DATA)
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError, match="read-only"):
+            record.email = "other@example.com"  # type: ignore[misc]
+        with pytest.raises(AttributeError, match="read-only"):
+            del record.email
+
+    def test_equality_and_hash(self) -> None:
+        """Test that records with the same fields are equal and hash alike, whatever their IRN objects."""
+        record = UserRecord.from_data(USER_DATA)
+        same = UserRecord.from_data(json.loads(json.dumps(USER_DATA)))
+        other = UserRecord.from_data({**USER_DATA, "email": "jane@example.com"})
+
+        assert record == same
+        assert hash(record) == hash(same)
+        assert record != other
+        assert len({record, same, other}) == 2
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.copy, copy.deepcopy, lambda record: pickle.loads(pickle.dumps(record))],  # noqa: S301
+    )
+    def test_copy_and_pickle(self, clone: Any) -> None:
+        """Test that records survive copying and pickling, e.g. to a worker process."""
+        record = UserRecord.from_data(USER_DATA)
+
+        cloned = clone(record)
+
+        assert type(cloned) is UserRecord
+        assert cloned == record
+        assert isinstance(cloned.irn, LazyIRN)
+        assert cloned.irn.resource_id == "johndoe"
+
+    def test_to_model(self) -> None:
+        """Test that a record converts to the full DTO in one call."""
+        user = UserRecord.from_data(USER_DATA).to_model()
+
+        assert isinstance(user, User)
+        assert user.first_name == "John"
+        assert isinstance(user.irn, IRN)
+        assert user.irn.resource_id == "johndoe"
+
+    @pytest.mark.parametrize(("record_type", "model"), [(ResourceRecord, Resource), (GroupRecord, Group)])
+    def test_slots_cover_model_fields(self, record_type: type[Record[Any]], model: type[Any]) -> None:
+        """Test that every record lists exactly its DTO's fields."""
+        assert set(record_type.__slots__) == set(model.model_fields)
+
+    def test_slots_must_match_model(self) -> None:
+        """Test that a record with missing fields is rejected when defined."""
+        with pytest.raises(TypeError, match="must list exactly the fields"):
+
+            class PartialRecord(Record[User]):
+                __slots__ = ("id",)
+                MODEL = User
+
+
+class TestRecordPage:
+    """Tests for RecordPage."""
+
+    def test_from_response(self) -> None:
+        """Test that a page body is decoded into records and paging fields."""
+        body = {"data": [USER_DATA, USER_DATA], "count": 5, "page": 1, "pageSize": 2}
+
+        page = RecordPage.from_response(Mock(content=json.dumps(body).encode()), UserRecord)
+
+        assert [record.username for record in page.data] == ["johndoe", "johndoe"]
+        assert (page.count, page.page, page.page_size) == (5, 1, 2)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from iamcore.client.base.streaming import iter_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def split(document: bytes, chunk_size: int) -> list[bytes]:
+    return [document[i : i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+
+def consume(chunks: Iterable[bytes], key: str = "data") -> tuple[list[Any], dict[str, Any]]:
+    fields: dict[str, Any] = {}
+
+    def drain() -> Iterator[bytes]:
+        nonlocal fields
+        fields = yield from iter_json_array(chunks, key)
+
+    items = [json.loads(item) for item in drain()]
+    return items, fields
+
+
+DOCUMENT = {
+    "page": 1,
+    "data": [
+        {"name": 'tricky "quoted" } ] name', "metadata": {"nested": [1, 2, {"deep": None}]}},
+        {"name": "escaped \\\\ backslash", "tags": []},
+        "plain string",
+        42,
+        True,
+        None,
+    ],
+    "count": 6,
+    "pageSize": 1000,
+}
+
+
+class TestIterJsonArray:
+    """Tests for the incremental JSON array splitter."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10_000])
+    def test_items_and_fields_for_any_chunking(self, chunk_size: int) -> None:
+        """Test that items and fields are the same however the body is chunked."""
+        document = json.dumps(DOCUMENT, indent=2).encode()
+
+        items, fields = consume(split(document, chunk_size))
+
+        assert items == DOCUMENT["data"]
+        assert fields == {"page": 1, "count": 6, "pageSize": 1000}
+
+    def test_count_before_data(self) -> None:
+        """Test that fields preceding the array are returned as well."""
+        items, fields = consume([b'{"count": 2, "data": [{"a": 1}, {"a": 2}]}'])
+
+        assert items == [{"a": 1}, {"a": 2}]
+        assert fields == {"count": 2}
+
+    def test_empty_array(self) -> None:
+        """Test an empty data array."""
+        assert consume([b'{"data": [], "count": 0}']) == ([], {"count": 0})
+
+    def test_items_are_yielded_before_the_body_ends(self) -> None:
+        """Test that an item is available as soon as its bytes have arrived."""
+        splitter = iter_json_array(iter([b'{"data": [{"a": 1}, ', b'{"a": 2}]}']))
+
+        assert next(splitter) == b'{"a": 1}'
+
+    def test_truncated_document(self) -> None:
+        """Test that a body ending mid-document is reported."""
+        with pytest.raises(ValueError, match="ended prematurely"):
+            consume([b'{"data": [{"a": 1}, {"a"'])
+
+    def test_not_an_object(self) -> None:
+        """Test that a body that is not a JSON object is rejected."""
+        with pytest.raises(ValueError, match="Unexpected"):
+            consume([b"[1, 2]"])